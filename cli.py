@@ -156,6 +156,9 @@ def cmd_add(args: argparse.Namespace) -> int:
                 image_vision_enabled=getattr(args, "image_vision", None),
                 workers=getattr(args, "workers", None),
                 embedding_workers=getattr(args, "embedding_workers", None),
+                stream=getattr(args, "stream", None),
+                extract_executor=getattr(args, "extract_executor", None),
+                fingerprint=getattr(args, "fingerprint", None),
             )
         )
         return 0
@@ -166,6 +169,49 @@ def cmd_add(args: argparse.Namespace) -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
+class _AnswerPreview:
+    """Live view of streamed answer tokens on a terminal; erased on close so the final answer replaces it."""
+
+    def __init__(self, out: Any) -> None:
+        self._out = out
+        self._parts: list[str] = []
+        self._closed = False
+
+    def write(self, text: str) -> None:
+        if self._closed or not text:
+            return
+        self._parts.append(text)
+        self._out.write(text)
+        self._out.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        text = "".join(self._parts)
+        if not text:
+            return
+        import shutil
+
+        cols = max(1, shutil.get_terminal_size().columns)
+        rows = sum(max(1, -(-len(line) // cols)) for line in text.split("\n"))
+        # Back to column 0 of the first preview row, then clear to the end of the screen.
+        self._out.write("\r" + (f"\x1b[{rows - 1}A" if rows > 1 else "") + "\x1b[J")
+        self._out.flush()
+
+
+def _ask_answer_stream(quiet: bool) -> _AnswerPreview | None:
+    """Stream answer tokens only to an interactive terminal (LLMLIBRARIAN_ASK_STREAM=0 turns it off)."""
+    if quiet or os.environ.get("LLMLIBRARIAN_ASK_STREAM", "").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    try:
+        if not sys.stdout.isatty():
+            return None
+    except Exception:
+        return None
+    return _AnswerPreview(sys.stdout)
+
+
 def cmd_ask(args: argparse.Namespace) -> int:
     """Query an archetype's collection or unified llmli collection (default) via Ollama."""
     from query.core import run_ask, QueryPolicyError
@@ -189,6 +235,7 @@ def cmd_ask(args: argparse.Namespace) -> int:
     if query is None:
         print("Error: empty or invalid query (or too long).", file=sys.stderr)
         return 1
+    answer_stream = _ask_answer_stream(bool(getattr(args, "quiet", False)))
     try:
         out = run_ask(
             archetype,
@@ -204,10 +251,14 @@ def cmd_ask(args: argparse.Namespace) -> int:
             explain=getattr(args, "explain", False),
             force=getattr(args, "force", False),
             explicit_unified=bool(getattr(args, "unified", False)),
+            answer_stream=answer_stream,
         )
     except QueryPolicyError as e:
         print(str(e), file=sys.stderr)
         return int(getattr(e, "exit_code", 2) or 2)
+    finally:
+        if answer_stream is not None:
+            answer_stream.close()
     print(out)
     return 0
 
@@ -261,6 +312,7 @@ def cmd_index(args: argparse.Namespace) -> int:
             log_path=getattr(args, "log", None),
             mode=getattr(args, "mode", "normal"),
             follow_symlinks=getattr(args, "follow_symlinks", False),
+            extract_executor=getattr(args, "extract_executor", None),
         )
         return 0
     except KeyError as e:
@@ -597,6 +649,52 @@ def cmd_reindex_names(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_reindex_export_manifest(args: argparse.Namespace) -> int:
+    """Write the manifest store out in the legacy llmli_file_manifest.json shape."""
+    from file_registry import export_file_manifest_json
+
+    out = export_file_manifest_json(_db_path(args), getattr(args, "out", None))
+    print(f"Wrote {out}")
+    return 0
+
+
+def cmd_cache_stats(args: argparse.Namespace) -> int:
+    """Show embedding cache size, entries per model, and lifetime hit rate."""
+    from embedding_cache import embedding_cache_stats
+
+    stats = embedding_cache_stats(_db_path(args))
+    if getattr(args, "json", False):
+        print(json.dumps(stats, indent=2))
+        return 0
+    lookups = stats["hits"] + stats["misses"]
+    hit_rate = f"{100.0 * stats['hits'] / lookups:.1f}%" if lookups else "n/a"
+    print(f"Embedding cache: {stats['path']}{'' if stats['enabled'] else ' (disabled)'}")
+    print(
+        f"  {stats['entries']} entries, {stats['bytes'] / (1024 * 1024):.1f} MB on disk "
+        f"(cap {stats['max_bytes'] / (1024 * 1024):.0f} MB)"
+    )
+    print(f"  hits={stats['hits']} misses={stats['misses']} hit_rate={hit_rate}")
+    for row in stats["models"]:
+        print(f"  {row['model']} [{row['dim']}d]: {row['entries']} entries, {row['live_bytes'] / (1024 * 1024):.1f} MB")
+    return 0
+
+
+def cmd_cache_prune(args: argparse.Namespace) -> int:
+    """Evict least recently used embeddings down to the cap (or --max-mb), or drop them all with --all."""
+    from embedding_cache import prune_embedding_cache
+
+    max_mb = getattr(args, "max_mb", None)
+    result = prune_embedding_cache(
+        _db_path(args),
+        max_bytes=int(max_mb * 1024 * 1024) if max_mb is not None else None,
+        model=getattr(args, "model", None),
+        clear=bool(getattr(args, "all", False)),
+    )
+    freed = max(0, result["bytes_before"] - result["bytes_after"])
+    print(f"Removed {result['removed']} entries; freed {freed / (1024 * 1024):.1f} MB.")
+    return 0
+
+
 def cmd_eval_adversarial(args: argparse.Namespace) -> int:
     """Run synthetic adversarial trustfulness evaluation and emit score report."""
     from llmli_evals.adversarial import run_adversarial_eval, format_report_table
@@ -644,6 +742,9 @@ def main() -> int:
     p_add.add_argument("--image-vision", action="store_true", default=None, help="Enable multimodal image summaries for this silo (default: off unless previously enabled)")
     p_add.add_argument("--workers", type=int, help="Override file/extraction worker count for this run")
     p_add.add_argument("--embedding-workers", type=int, help="Override embedding worker count for this run")
+    p_add.add_argument("--stream", action="store_true", default=None, help="Write chunks as batches fill instead of holding the whole silo in memory")
+    p_add.add_argument("--extract-executor", choices=["thread", "process"], help="File extraction pool (default: thread, or LLMLIBRARIAN_EXTRACT_EXECUTOR)")
+    p_add.add_argument("--fingerprint", choices=["prefix", "full"], help="Change-detection hash: first 8 KB (default) or whole file (or LLMLIBRARIAN_FINGERPRINT)")
     p_add.add_argument("--silo", dest="silo", help=argparse.SUPPRESS)
     p_add.add_argument("--display-name", dest="display_name", help=argparse.SUPPRESS)
     p_add.set_defaults(db=None)
@@ -682,6 +783,7 @@ def main() -> int:
     p_index.add_argument("--log", help="Log file path (or set LLMLIBRARIAN_LOG=1)")
     p_index.add_argument("--mode", choices=["fast", "normal", "deep"], default="normal")
     p_index.add_argument("--follow-symlinks", action="store_true", help="Follow symlinks in config folders")
+    p_index.add_argument("--extract-executor", choices=["thread", "process"], help="File extraction pool (default: thread, or LLMLIBRARIAN_EXTRACT_EXECUTOR)")
     p_index.set_defaults(_run=cmd_index)
 
     # remove <silo>
@@ -748,6 +850,21 @@ def main() -> int:
     reindex_in_arg = p_reindex_names.add_argument("--in", dest="in_silo", action="append", metavar="SILO", help="Restrict to silo (repeatable)")
     reindex_in_arg.completer = _silo_completer  # type: ignore[attr-defined]
     p_reindex_names.set_defaults(_run=cmd_reindex_names)
+    p_reindex_export = reindex_sub.add_parser("export-manifest", help="Export the manifest as JSON (legacy llmli_file_manifest.json shape)")
+    p_reindex_export.add_argument("--out", metavar="PATH", help="Output file (default: <db>/llmli_file_manifest.export.json)")
+    p_reindex_export.set_defaults(_run=cmd_reindex_export_manifest)
+
+    # cache stats | cache prune [--max-mb N] [--model M] [--all]
+    p_cache = sub.add_parser("cache", help="Inspect or prune the on-disk embedding cache")
+    cache_sub = p_cache.add_subparsers(dest="cache_subcommand", required=True)
+    p_cache_stats = cache_sub.add_parser("stats", help="Entries, size, and hit rate per embedding model")
+    p_cache_stats.add_argument("--json", action="store_true", help="Print stats as JSON")
+    p_cache_stats.set_defaults(_run=cmd_cache_stats)
+    p_cache_prune = cache_sub.add_parser("prune", help="Evict least recently used embeddings and compact the vector files")
+    p_cache_prune.add_argument("--max-mb", type=float, metavar="MB", help="Target size (default: LLMLIBRARIAN_EMBED_CACHE_MAX_MB or 2048)")
+    p_cache_prune.add_argument("--model", metavar="NAME", help="Only evict entries for this embedding model")
+    p_cache_prune.add_argument("--all", action="store_true", help="Drop every entry in scope")
+    p_cache_prune.set_defaults(_run=cmd_cache_prune)
 
     # eval-adversarial [--model M] [--out report.json] [--limit N]
     p_eval = sub.add_parser("eval-adversarial", help="Run synthetic adversarial trustfulness eval")
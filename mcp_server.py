@@ -131,6 +131,10 @@ _server_lock_fd: int | None = None
 _server_lock_path: Path | None = None
 _SERVER_STARTED_AT: str | None = None
 
+# Startup warmup of the embedding model and cross-encoder (see _start_model_warmup).
+_warmup_lock = threading.Lock()
+_warmup_state: dict = {"status": "not_started"}
+
 
 def _package_version() -> str:
     try:
@@ -383,6 +387,12 @@ def _mcp_chroma_lock(operation: str, write: bool = False):
     try:
         yield
     finally:
+        if write:
+            # Cached retrievals are keyed by index generation; drop them outright so a
+            # write landing in the same mtime tick as a cached read cannot be missed.
+            from query.result_cache import invalidate_retrieve_cache
+
+            invalidate_retrieve_cache()
         _chroma_lock.release()
 
 # Last background reindex outcome per silo (for health / debugging).
@@ -566,6 +576,28 @@ def _collect_health_summary(*, include_audit: bool = False) -> dict:
         out["active_background_jobs"] = dict(_active_background_jobs)
         out["last_background_reindex"] = dict(_last_reindex_outcome)
 
+    with _warmup_lock:
+        out["model_warmup"] = dict(_warmup_state)
+    try:
+        from embeddings import query_embedding_cache_info
+
+        out["query_embedding_cache"] = query_embedding_cache_info()
+    except Exception:
+        pass
+    try:
+        from query.result_cache import retrieve_cache_info
+
+        out["retrieve_cache"] = retrieve_cache_info()
+    except Exception:
+        pass
+    try:
+        from reranker import is_reranker_enabled, rerank_cache_info
+
+        if is_reranker_enabled():
+            out["rerank_cache"] = rerank_cache_info()
+    except Exception:
+        pass
+
     return out
 
 
@@ -1017,7 +1049,7 @@ def multi_query_knowledge(
     rebuilt — treat zero/thin chunks as unknown, not as absence of evidence, and
     retry once it finishes.
     """
-    from query.core import run_retrieve
+    from query.core import run_retrieve_many
     if not Path(_DB_PATH).is_dir():
         return {**_db_missing_error(), "queries": queries, "total_chunks": 0, "chunks": []}
     seen: set[str] = set()
@@ -1025,30 +1057,34 @@ def multi_query_knowledge(
     errors: list[str] = []
     busy = False
     write_states: list[dict] = []
-    for q in queries:
-        try:
-            with _mcp_chroma_lock("multi_query_knowledge"):
-                res = run_retrieve(
-                    query=q,
-                    silo=silo,
-                    n_results=n_results,
-                    section=section,
-                    doc_type=doc_type,
-                    db_path=_DB_PATH,
-                    config_path=_CONFIG_PATH,
-                )
-            if res.get("write_in_progress"):
-                write_states.append(res["write_in_progress"])
-            for chunk in res.get("chunks", []):
-                key = (chunk.get("text") or "")[:200]
-                if key and key not in seen:
-                    seen.add(key)
-                    chunk["query"] = q
-                    all_chunks.append(chunk)
-        except Exception as e:
-            if _is_lock_timeout(e):
+    # One lock, one batched embed + multi-row Chroma query for every angle.
+    try:
+        with _mcp_chroma_lock("multi_query_knowledge"):
+            results = run_retrieve_many(
+                queries=queries,
+                silo=silo,
+                n_results=n_results,
+                section=section,
+                doc_type=doc_type,
+                db_path=_DB_PATH,
+                config_path=_CONFIG_PATH,
+            )
+    except Exception as e:
+        results = [e] * len(queries)
+    for q, res in zip(queries, results):
+        if isinstance(res, BaseException):
+            if _is_lock_timeout(res):
                 busy = True
-            errors.append(f"{q!r}: {type(e).__name__}: {e}")
+            errors.append(f"{q!r}: {type(res).__name__}: {res}")
+            continue
+        if res.get("write_in_progress"):
+            write_states.append(res["write_in_progress"])
+        for chunk in res.get("chunks", []):
+            key = (chunk.get("text") or "")[:200]
+            if key and key not in seen:
+                seen.add(key)
+                chunk["query"] = q
+                all_chunks.append(chunk)
     all_chunks.sort(key=lambda c: c.get("score") or 0, reverse=True)
     truncated = len(all_chunks) > max_total_chunks
     if truncated:
@@ -1594,10 +1630,10 @@ def repair_silo(silo: str, confirm: bool = False) -> dict:
         _release_chroma()
 
 
-def _resolve_silo_under_path(silo: str, path: str) -> tuple[str | None, str | None, dict | None]:
-    """Resolve silo slug and validate that path is inside the silo's registered source.
+def _resolve_silo_root(silo: str) -> tuple[str | None, Path | None, dict | None]:
+    """Resolve silo slug and its registered source folder.
 
-    Returns (slug, abs_path, error_dict). If error_dict is non-None, return it as the tool result.
+    Returns (slug, silo_root, error_dict). If error_dict is non-None, return it as the tool result.
     """
     from pathlib import Path as _Path
     from state import list_silos as _list_silos, resolve_silo_to_slug
@@ -1613,16 +1649,59 @@ def _resolve_silo_under_path(silo: str, path: str) -> tuple[str | None, str | No
     silo_root = info.get("path") or ""
     if not silo_root:
         return (None, None, {"status": "error", "error": "silo has no registered source path"})
+    return (slug, _Path(silo_root).resolve(), None)
+
+
+def _path_under_silo_root(path: str, silo_root_p: Path) -> tuple[str | None, dict | None]:
+    from pathlib import Path as _Path
+
     abs_p = _Path(path).expanduser().resolve()
-    silo_root_p = _Path(silo_root).resolve()
     try:
         abs_p.relative_to(silo_root_p)
     except ValueError:
-        return (None, None, {
+        return (None, {
             "status": "error",
             "error": f"path is not under silo source: path={abs_p} silo_root={silo_root_p}",
         })
-    return (slug, str(abs_p), None)
+    return (str(abs_p), None)
+
+
+def _resolve_silo_under_path(silo: str, path: str) -> tuple[str | None, str | None, dict | None]:
+    """Resolve silo slug and validate that path is inside the silo's registered source.
+
+    Returns (slug, abs_path, error_dict). If error_dict is non-None, return it as the tool result.
+    """
+    slug, silo_root_p, err = _resolve_silo_root(silo)
+    if err:
+        return (None, None, err)
+    abs_path, err = _path_under_silo_root(path, silo_root_p)
+    if err:
+        return (None, None, err)
+    return (slug, abs_path, None)
+
+
+def _refresh_silo_artifacts(slug: str, changed: list[str]) -> dict | None:
+    """Recompile artifacts for just the changed sources; None when the silo has artifacts off or nothing changed."""
+    if not changed:
+        return None
+    from artifacts import compile_artifacts_for_silo
+    from state import list_silos as _list_silos
+
+    info = next((s for s in _list_silos(_DB_PATH) if s.get("slug") == slug), None)
+    if not info or not info.get("path"):
+        return None
+    try:
+        result = compile_artifacts_for_silo(
+            db_path=_DB_PATH,
+            parent_slug=slug,
+            source_path=info["path"],
+            display_name=info.get("display_name"),
+            changed_sources=changed,
+        )
+    except Exception as e:
+        _logger.exception("artifact refresh failed silo=%s files=%d", slug, len(changed))
+        return {"status": "error", "parent_silo": slug, "error": f"{type(e).__name__}: {e}"}
+    return None if result.get("status") == "disabled" else result
 
 
 @mcp.tool()
@@ -1656,7 +1735,11 @@ def update_file(silo: str, path: str, confirm: bool = False) -> dict:
                 silo_slug=slug,
                 allow_cloud=True,  # path was already validated under the registered silo root
             )
-        return {"status": status, "silo": slug, "path": resolved}
+            artifact_result = _refresh_silo_artifacts(slug, [resolved] if status in ("updated", "removed") else [])
+        out = {"status": status, "silo": slug, "path": resolved}
+        if artifact_result is not None:
+            out["artifact_result"] = artifact_result
+        return out
     except Exception as e:
         _logger.exception("update_file failed silo=%s path=%s", slug, abs_path)
         err_msg = f"{type(e).__name__}: {e}"
@@ -1697,7 +1780,11 @@ def remove_file(silo: str, path: str, confirm: bool = False) -> dict:
                 db_path=_DB_PATH,
                 silo_slug=slug,
             )
-        return {"status": status, "silo": slug, "path": resolved}
+            artifact_result = _refresh_silo_artifacts(slug, [resolved] if status == "removed" else [])
+        out = {"status": status, "silo": slug, "path": resolved}
+        if artifact_result is not None:
+            out["artifact_result"] = artifact_result
+        return out
     except Exception as e:
         _logger.exception("remove_file failed silo=%s path=%s", slug, abs_path)
         err_msg = f"{type(e).__name__}: {e}"
@@ -1709,6 +1796,75 @@ def remove_file(silo: str, path: str, confirm: bool = False) -> dict:
         _release_chroma()
 
 
+@mcp.tool()
+def update_files(
+    silo: str,
+    paths: list[str] | None = None,
+    removed: list[str] | None = None,
+    confirm: bool = False,
+) -> dict:
+    """
+    Use when: applying many file changes inside one existing silo at once (watcher drain, branch switch).
+    Do not use when: onboarding/updating a full folder (`add_silo`) or fixing corruption (`repair_silo`).
+    Pairs with: `update_file` / `remove_file` for single paths and `watch_coverage`.
+
+    Batch form of `update_file` + `remove_file`: `paths` are re-indexed (or removed if gone),
+    `removed` are dropped. Files are extracted in parallel, then chunks, manifest, tax ledger,
+    and silo counts are committed in one writer session. Synchronous.
+    Every path must resolve under the silo's registered source folder; paths that do not
+    are reported per path and the rest still run.
+    Requires confirm=True (safety guard).
+    """
+    if not confirm:
+        return {
+            "status": "not_started",
+            "message": "Pass confirm=True to update the files.",
+        }
+    slug, silo_root_p, err = _resolve_silo_root(silo)
+    if err:
+        return err
+    results: list[dict] = []
+    update_paths: list[str] = []
+    remove_paths: list[str] = []
+    for bucket, raw_paths in ((update_paths, paths or []), (remove_paths, removed or [])):
+        for raw in raw_paths:
+            abs_path, path_err = _path_under_silo_root(raw, silo_root_p)
+            if path_err:
+                results.append({"path": str(raw), **path_err})
+            else:
+                bucket.append(abs_path)
+    if not update_paths and not remove_paths:
+        return {"status": "completed", "silo": slug, "results": results}
+    try:
+        with _mcp_chroma_lock("update_files", write=True):
+            from ingest import update_files as _update_files
+
+            outcomes = _update_files(
+                update_paths,
+                db_path=_DB_PATH,
+                silo_slug=slug,
+                allow_cloud=True,  # paths were already validated under the registered silo root
+                removals=remove_paths,
+            )
+            artifact_result = _refresh_silo_artifacts(
+                slug, [path_str for status, path_str in outcomes if status in ("updated", "removed")]
+            )
+        results.extend({"path": path_str, "status": status} for status, path_str in outcomes)
+        out = {"status": "completed", "silo": slug, "results": results}
+        if artifact_result is not None:
+            out["artifact_result"] = artifact_result
+        return out
+    except Exception as e:
+        _logger.exception("update_files failed silo=%s files=%d", slug, len(update_paths) + len(remove_paths))
+        err_msg = f"{type(e).__name__}: {e}"
+        from state import append_last_failures
+
+        append_last_failures(_DB_PATH, [{"path": p, "error": err_msg} for p in update_paths + remove_paths])
+        return {"status": "error", "error": err_msg}
+    finally:
+        _release_chroma()
+
+
 @mcp.tool()
 def add_silo(
     path: str,
@@ -1956,6 +2112,53 @@ async def healthz(_: Request) -> Response:
     })
 
 
+def _warm_models() -> None:
+    """Load the query embedding model and (when enabled) the cross-encoder.
+
+    Each step records its own outcome; a failure only means the first real
+    query pays the load instead.
+    """
+    import time
+
+    from embeddings import warm_embedding_function
+    from reranker import is_reranker_enabled, warm_reranker
+
+    started = time.perf_counter()
+    steps: dict[str, str] = {}
+    with _warmup_lock:
+        _warmup_state.update({"status": "running", "steps": steps})
+    for name, enabled, fn in (
+        ("embedding", True, warm_embedding_function),
+        ("reranker", is_reranker_enabled(), warm_reranker),
+    ):
+        if not enabled:
+            steps[name] = "skipped"
+            continue
+        try:
+            fn()
+            steps[name] = "ok"
+        except Exception as e:
+            steps[name] = f"error: {type(e).__name__}: {e}"
+    with _warmup_lock:
+        _warmup_state.update({
+            "status": "done",
+            "steps": dict(steps),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        })
+
+
+def _start_model_warmup() -> threading.Thread | None:
+    """Warm models on a daemon thread so the transport is up immediately.
+    LLMLIBRARIAN_MCP_WARMUP=0 disables it (e.g. short-lived stdio sessions on small machines)."""
+    if not _env_bool("LLMLIBRARIAN_MCP_WARMUP", True):
+        with _warmup_lock:
+            _warmup_state.update({"status": "disabled"})
+        return None
+    t = threading.Thread(target=_warm_models, name="llmli-warmup", daemon=True)
+    t.start()
+    return t
+
+
 def _client_app_name() -> str | None:
     """Best-effort name of the MCP client that spawned this stdio server.
 
@@ -2021,6 +2224,12 @@ if __name__ == "__main__":
     if auth_provider is not None:
         mcp.auth = auth_provider
 
+    # A PDF truncated while mapped raises SIGBUS; read PDFs instead of mapping them
+    # so a repair or re-index run in this process cannot take the server down.
+    os.environ.setdefault("LLMLIBRARIAN_PDF_MMAP", "0")
+
+    _start_model_warmup()
+
     if transport == "stdio":
         mcp.run(transport="stdio")
     else:
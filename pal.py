@@ -19,6 +19,7 @@ import re
 from contextlib import contextmanager
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from typing import Callable
 
 PAL_HOME = Path(os.environ.get("PAL_HOME", os.path.expanduser("~/.pal")))
 REGISTRY_PATH = PAL_HOME / "registry.json"
@@ -236,6 +237,11 @@ def _watch_lock_path(db_path: str | Path, silo_slug: str) -> Path:
     return WATCH_LOCKS_DIR / f"{safe_slug}-{digest}.pid"
 
 
+def _watch_stop_request_path(lock_path: Path) -> Path:
+    """Control file asking the watch hub that holds lock_path to stop watching that silo."""
+    return lock_path.with_suffix(".stop")
+
+
 def _iter_watch_locks() -> list[Path]:
     if not WATCH_LOCKS_DIR.exists():
         return []
@@ -311,6 +317,7 @@ def _acquire_silo_pid_lock(
     db_path: str | Path,
     silo_slug: str,
     root_path: Path | None = None,
+    hub: bool = False,
 ) -> tuple[Path | None, str | None]:
     lock_path = _watch_lock_path(db_path, silo_slug)
     lock_path.parent.mkdir(parents=True, exist_ok=True)
@@ -338,6 +345,8 @@ def _acquire_silo_pid_lock(
             "argv_hash": hashlib.sha1(" ".join(sys.argv).encode("utf-8")).hexdigest()[:12],
             "pal_version": _detect_pal_version(),
         }
+        if hub:
+            payload["hub"] = True
         try:
             fd = os.open(str(lock_path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
         except FileExistsError:
@@ -460,6 +469,7 @@ def _build_watch_status_record(lock_path: Path) -> dict:
         "user": data.get("user"),
         "process_uid": process_uid,
         "silo": data.get("silo"),
+        "hub": bool(data.get("hub")),
         "root_path": data.get("root_path"),
         "db_path": data.get("db_path"),
         "started_at": started_at,
@@ -572,6 +582,9 @@ def _stop_watch_process(record: dict, timeout: float = 3.0) -> dict:
         except Exception:
             pass
 
+    if record.get("hub"):
+        return _stop_hub_silo(lock_path, pid_i, out, timeout)
+
     command = _process_command_signature(pid_i)
     if not _is_watch_process_command(command):
         out.update({
@@ -621,6 +634,33 @@ def _stop_watch_process(record: dict, timeout: float = 3.0) -> dict:
     return out
 
 
+def _stop_hub_silo(lock_path: Path, pid: int, out: dict, timeout: float) -> dict:
+    """Ask the watch hub to drop one silo: signaling it would stop every silo it watches."""
+    request = _watch_stop_request_path(lock_path)
+    try:
+        request.touch()
+    except Exception as exc:
+        out.update({"status": "signal_error", "message": f"Failed to write stop request: {exc}"})
+        return out
+    deadline = time.time() + max(timeout, 0.0)
+    while True:
+        if _read_watch_lock_pid(lock_path) != pid:
+            out.update({
+                "status": "stopped",
+                "lock_removed": True,
+                "message": "Watch hub stopped watching this silo; its other silos keep running.",
+            })
+            return out
+        if time.time() >= deadline:
+            break
+        time.sleep(0.1)
+    out.update({
+        "status": "still_running",
+        "message": "Watch hub has not released the silo yet; the stop request stays queued.",
+    })
+    return out
+
+
 def _prune_stale_locks(records: list[dict]) -> dict:
     removed = 0
     failed: list[str] = []
@@ -1547,6 +1587,51 @@ def _watch_mcp_wait_seconds() -> float:
         return 120.0
 
 
+def _watch_batch_max() -> int:
+    """Most queued paths sent in one `update_files` MCP call from a watcher drain.
+
+    Configurable via LLMLIBRARIAN_WATCH_BATCH_MAX; 1 turns batching off and
+    restores one `update_file` / `remove_file` call per path. Defaults to 500.
+    """
+    raw = os.environ.get("LLMLIBRARIAN_WATCH_BATCH_MAX")
+    if raw is None:
+        return 500
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return 500
+
+
+def _watch_max_interval(interval: float) -> float:
+    """Longest reconcile interval an idle watcher backs off to.
+
+    A pass that finds nothing doubles the wait, up to LLMLIBRARIAN_WATCH_MAX_INTERVAL
+    seconds (default 600, never below the base interval); any change resets it.
+    """
+    raw = os.environ.get("LLMLIBRARIAN_WATCH_MAX_INTERVAL")
+    try:
+        value = float(raw) if raw is not None else 600.0
+    except ValueError:
+        value = 600.0
+    return max(float(interval), value)
+
+
+def _watch_full_rescan_seconds() -> float:
+    """Seconds between full reconcile passes (every file stat'ed and checked against
+    the manifest); passes in between only re-list directories whose mtime changed.
+
+    Configurable via LLMLIBRARIAN_WATCH_FULL_RESCAN; 0 makes every pass full.
+    Defaults to 3600.
+    """
+    raw = os.environ.get("LLMLIBRARIAN_WATCH_FULL_RESCAN")
+    if raw is None:
+        return 3600.0
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return 3600.0
+
+
 def _mcp_healthcheck_wait(timeout: float, poll: float = 3.0) -> tuple[bool, str]:
     """Poll _mcp_healthcheck until it succeeds or `timeout` seconds elapse."""
     ok, msg = _mcp_healthcheck()
@@ -1598,18 +1683,19 @@ class SiloWatcher:
         label: str = "this folder",
         startup_message: str | None = None,
         exclude_patterns: list[str] | None = None,
+        observer: object | None = None,
     ) -> None:
-        if Observer is None:
+        if Observer is None and observer is None:
             raise RuntimeError("watchdog is not installed. Install `watchdog` to use watch mode.")
         _ensure_src_on_path()
         from ingest.watch_scan import (
             _read_file_manifest,
             _load_limits_config,
-            collect_files,
             should_index,
             ADD_DEFAULT_INCLUDE,
             ADD_DEFAULT_EXCLUDE,
         )
+        from ingest.watch_snapshot import scan_tree, snapshot_path
         from state import get_silo_exclude_patterns
 
         self.root = root.resolve()
@@ -1627,7 +1713,7 @@ class SiloWatcher:
         }
         self._read_manifest = _read_file_manifest
         self._load_limits_config = _load_limits_config
-        self._collect_files = collect_files
+        self._scan_tree = scan_tree
         self._should_index = should_index
         self._include = ADD_DEFAULT_INCLUDE
         self._exclude = _merge_path_patterns(
@@ -1635,12 +1721,16 @@ class SiloWatcher:
             get_silo_exclude_patterns(self.db_path, self.silo_slug),
             exclude_patterns,
         )
-        self._observer = Observer()
+        # A WatchHub passes its shared observer; a standalone watcher owns one.
+        self._observer = observer if observer is not None else Observer()
         self._handler = _SiloEventHandler(self)
         self._queue: dict[str, dict[str, object]] = {}
         self._queue_lock = threading.Lock()
         self._stop = threading.Event()
         self._lock = threading.Lock()
+        self._snapshot_path = snapshot_path(PAL_HOME / "watch_state", self.silo_slug)
+        self._snapshot: dict[str, object] | None = None
+        self._events_seen = False
         self._logger = self._build_logger()
 
     def _build_logger(self) -> logging.Logger:
@@ -1694,6 +1784,7 @@ class SiloWatcher:
             return
         if not self._should_index(str(p), self._include, self._exclude):
             return
+        self._events_seen = True
         self._queue_action(str(p), "update")
 
     def enqueue_delete(self, path: str) -> None:
@@ -1711,20 +1802,59 @@ class SiloWatcher:
         # the same exclude/include rules as enqueue_update.
         if not self._should_index(str(p), self._include, self._exclude):
             return
+        self._events_seen = True
         self._queue_action(str(p), "delete")
 
-    def _drain_due(self, now: float | None = None) -> int:
+    def _apply_single(self, path: str, action: str) -> dict:
+        tool = "remove_file" if action == "delete" else "update_file"
+        try:
+            return _mcp_call_sync(tool, silo=self.silo_slug, path=path, confirm=True)
+        except Exception as exc:
+            return {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
+
+    def _apply_due(self, due: list[tuple[str, str, int]]) -> list[tuple[str, str, int, dict]]:
+        """Send due actions to MCP: one `update_files` call per batch, so a branch
+        switch is one writer session instead of one per file. A batch the server
+        rejects (older server, transport error) falls back to per-path calls."""
+        batch_max = _watch_batch_max()
+        if len(due) <= 1 or batch_max <= 1:
+            return [(path, action, attempts, self._apply_single(path, action)) for path, action, attempts in due]
+        out: list[tuple[str, str, int, dict]] = []
+        for i in range(0, len(due), batch_max):
+            chunk = due[i:i + batch_max]
+            try:
+                res = _mcp_call_sync(
+                    "update_files",
+                    silo=self.silo_slug,
+                    paths=[path for path, action, _a in chunk if action != "delete"],
+                    removed=[path for path, action, _a in chunk if action == "delete"],
+                    confirm=True,
+                )
+            except Exception:
+                res = {}
+            if res.get("status") != "completed":
+                out.extend((path, action, attempts, self._apply_single(path, action)) for path, action, attempts in chunk)
+                continue
+            by_path = {str(r.get("path") or ""): r for r in res.get("results") or [] if isinstance(r, dict)}
+            for path, action, attempts in chunk:
+                out.append(
+                    (path, action, attempts, by_path.get(path) or {"status": "error", "error": "missing from update_files result"})
+                )
+        return out
+
+    def _drain_due(self, now: float | None = None, limit: int | None = None) -> int:
+        """Apply due queue entries; with limit, only the `limit` longest-waiting ones."""
         if now is None:
             now = time.time()
         due: list[tuple[str, str, int]] = []
         with self._queue_lock:
-            for path, meta in list(self._queue.items()):
-                due_at = float(meta.get("due_at") or 0.0)
-                action = str(meta.get("action") or "update")
-                attempts = int(meta.get("attempts") or 0)
-                if now >= due_at:
-                    due.append((path, action, attempts))
-                    del self._queue[path]
+            ready = [(path, meta) for path, meta in self._queue.items() if now >= float(meta.get("due_at") or 0.0)]
+            if limit is not None and len(ready) > limit:
+                ready.sort(key=lambda item: float(item[1].get("due_at") or 0.0))
+                ready = ready[:limit]
+            for path, meta in ready:
+                due.append((path, str(meta.get("action") or "update"), int(meta.get("attempts") or 0)))
+                del self._queue[path]
         if not due:
             return 0
         started = time.perf_counter()
@@ -1733,12 +1863,7 @@ class SiloWatcher:
         skipped = 0
         errors: list[tuple[str, str]] = []
         with self._lock:
-            for path, action, attempts in due:
-                tool = "remove_file" if action == "delete" else "update_file"
-                try:
-                    res = _mcp_call_sync(tool, silo=self.silo_slug, path=path, confirm=True)
-                except Exception as exc:
-                    res = {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
+            for path, action, attempts, res in self._apply_due(due):
                 status = str(res.get("status") or "")
                 if status in ("updated", "removed", "unchanged", "skipped"):
                     if action == "delete":
@@ -1785,60 +1910,97 @@ class SiloWatcher:
         )
         return processed
 
+    def _drain_logged(self, limit: int | None = None) -> int:
+        try:
+            return self._drain_due(limit=limit)
+        except Exception as exc:
+            self._log(f"{self.label}: queue loop error: {exc}")
+            _ensure_src_on_path()
+            from watch_telemetry import EVENT_QUEUE_LOOP_ERROR, emit_watch_event
+
+            emit_watch_event(
+                self._logger,
+                EVENT_QUEUE_LOOP_ERROR,
+                silo=self.silo_slug,
+                error=f"{type(exc).__name__}: {exc}",
+            )
+            return 0
+
     def _process_loop(self) -> None:
         while not self._stop.is_set():
-            try:
-                self._drain_due()
-            except Exception as exc:
-                self._log(f"{self.label}: queue loop error: {exc}")
-                _ensure_src_on_path()
-                from watch_telemetry import EVENT_QUEUE_LOOP_ERROR, emit_watch_event
-
-                emit_watch_event(
-                    self._logger,
-                    EVENT_QUEUE_LOOP_ERROR,
-                    silo=self.silo_slug,
-                    error=f"{type(exc).__name__}: {exc}",
-                )
+            self._drain_logged()
             self._stop.wait(0.2)
 
-    def _reconcile_once(self) -> tuple[int, int, int]:
+    def _reconcile_once(self, full: bool | None = None) -> tuple[int, int, int]:
+        """Queue whatever the observer missed; returns (updates, removes, skipped).
+
+        A full pass stats every file and diffs against the manifest. Otherwise only
+        directories whose mtime changed since the persisted snapshot are re-listed
+        and diffed against it. full=None picks a full pass when there is no usable
+        snapshot or the last full pass is older than _watch_full_rescan_seconds().
+        """
+        _ensure_src_on_path()
+        from ingest.watch_snapshot import SNAPSHOT_VERSION, load_snapshot, save_snapshot, scan_params_key, snapshot_files
+
         max_file_bytes, max_depth, _max_archive_bytes, _max_files_per_zip, _max_extracted = self._load_limits_config()
-        file_list = self._collect_files(
+        params = scan_params_key(self._include, self._exclude, max_depth, max_file_bytes)
+        if self._snapshot is None or self._snapshot.get("params") != params:
+            self._snapshot = load_snapshot(self._snapshot_path, self.root, params)
+        previous = self._snapshot
+        last_full = float(previous.get("full_scan_at") or 0.0) if previous else 0.0
+        if full is None:
+            rescan_s = _watch_full_rescan_seconds()
+            full = previous is None or not rescan_s or time.time() - last_full >= rescan_s
+        prev_dirs = previous.get("dirs") if previous else None
+        dirs, changed, removed = self._scan_tree(
             self.root,
             self._include,
             self._exclude,
             max_depth,
             max_file_bytes,
-            follow_symlinks=False,
+            prev_dirs,
+            full=full,
         )
-        current: dict[str, tuple[float, int]] = {}
-        for p, _k in file_list:
-            try:
-                p_res = p.resolve()
-                stat = p_res.stat()
-                current[str(p_res)] = (stat.st_mtime, stat.st_size)
-            except OSError:
-                continue
-
-        manifest = self._read_manifest(self.db_path)
-        silo_manifest = (manifest.get("silos") or {}).get(self.silo_slug, {})
-        manifest_files = (silo_manifest.get("files") or {}) if isinstance(silo_manifest, dict) else {}
 
         queued_updates = 0
         queued_removes = 0
         skipped = 0
-        if isinstance(manifest_files, dict):
-            for path_str in list(manifest_files.keys()):
-                if path_str not in current:
-                    self._queue_action(path_str, "delete")
-                    queued_removes += 1
-        for path_str, (mtime, size) in current.items():
-            prev = manifest_files.get(path_str) if isinstance(manifest_files, dict) else None
-            if prev and prev.get("mtime") == mtime and prev.get("size") == size:
-                continue
-            self._queue_action(path_str, "update")
-            queued_updates += 1
+        if full:
+            current = snapshot_files(dirs)
+            manifest = self._read_manifest(self.db_path, silos=[self.silo_slug])
+            silo_manifest = (manifest.get("silos") or {}).get(self.silo_slug, {})
+            manifest_files = (silo_manifest.get("files") or {}) if isinstance(silo_manifest, dict) else {}
+            if isinstance(manifest_files, dict):
+                for path_str in list(manifest_files.keys()):
+                    if path_str not in current:
+                        self._queue_action(path_str, "delete")
+                        queued_removes += 1
+            for path_str, (mtime, size) in current.items():
+                prev = manifest_files.get(path_str) if isinstance(manifest_files, dict) else None
+                if prev and prev.get("mtime") == mtime and prev.get("size") == size:
+                    continue
+                self._queue_action(path_str, "update")
+                queued_updates += 1
+        else:
+            for path_str in removed:
+                self._queue_action(path_str, "delete")
+                queued_removes += 1
+            for path_str in changed:
+                self._queue_action(path_str, "update")
+                queued_updates += 1
+
+        if full or changed or removed or dirs != prev_dirs:
+            self._snapshot = {
+                "version": SNAPSHOT_VERSION,
+                "root": str(self.root),
+                "params": params,
+                "full_scan_at": time.time() if full else last_full,
+                "dirs": dirs,
+            }
+            try:
+                save_snapshot(self._snapshot_path, self._snapshot)
+            except OSError as exc:
+                self._logger.info(f"{self.label}: could not persist watch snapshot: {exc}")
         return (queued_updates, queued_removes, skipped)
 
     def _emit_reconcile_event(
@@ -1863,21 +2025,31 @@ class SiloWatcher:
             duration_ms=duration_ms,
         )
 
+    def _reconcile_pass(self) -> bool:
+        """One logged reconcile; True when it queued work or observer events arrived since the last one."""
+        events_seen, self._events_seen = self._events_seen, False
+        started = time.perf_counter()
+        queued_updates, queued_removes, skipped = self._reconcile_once()
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        if queued_updates or queued_removes or skipped:
+            self._log(
+                f"Check for missed changes: +{queued_updates} queued, -{queued_removes} queued, {skipped} skipped"
+            )
+        self._emit_reconcile_event(queued_updates, queued_removes, skipped, duration_ms)
+        return bool(queued_updates or queued_removes or events_seen)
+
+    def _next_reconcile_delay(self, delay: float, active: bool) -> float:
+        # Idle trees back off to _watch_max_interval(); a queued change or observer event resets.
+        if active:
+            return self.interval
+        return min(delay * 2, _watch_max_interval(self.interval))
+
     def _reconcile_loop(self) -> None:
-        while not self._stop.is_set():
-            time.sleep(self.interval)
-            if self._stop.is_set():
-                break
-            started = time.perf_counter()
-            queued_updates, queued_removes, skipped = self._reconcile_once()
-            duration_ms = int((time.perf_counter() - started) * 1000)
-            if queued_updates or queued_removes or skipped:
-                self._log(
-                    f"Check for missed changes: +{queued_updates} queued, -{queued_removes} queued, {skipped} skipped"
-                )
-            self._emit_reconcile_event(queued_updates, queued_removes, skipped, duration_ms)
+        delay = self.interval
+        while not self._stop.wait(delay):
+            delay = self._next_reconcile_delay(delay, self._reconcile_pass())
 
-    def run(self) -> None:
+    def _announce(self) -> None:
         if self.startup_message:
             self._log(self.startup_message)
         else:
@@ -1896,20 +2068,16 @@ class SiloWatcher:
             debounce=self.debounce,
             db_path=self.db_path,
         )
+
+    def run(self) -> None:
+        self._announce()
         self._observer.schedule(self._handler, str(self.root), recursive=True)
         self._observer.start()
         worker = threading.Thread(target=self._process_loop, daemon=True)
         recon = threading.Thread(target=self._reconcile_loop, daemon=True)
         worker.start()
         recon.start()
-        started = time.perf_counter()
-        queued_updates, queued_removes, skipped = self._reconcile_once()
-        duration_ms = int((time.perf_counter() - started) * 1000)
-        if queued_updates or queued_removes or skipped:
-            self._log(
-                f"Check for missed changes: +{queued_updates} queued, -{queued_removes} queued, {skipped} skipped"
-            )
-        self._emit_reconcile_event(queued_updates, queued_removes, skipped, duration_ms)
+        self._reconcile_pass()
         try:
             while not self._stop.is_set():
                 time.sleep(1.0)
@@ -1952,6 +2120,239 @@ def _run_watcher(watcher: SiloWatcher, db_path: str | Path, silo_slug: str) -> i
     return 0
 
 
+class WatchHub:
+    """Every registered silo's SiloWatcher in one process.
+
+    One watchdog observer carries a watch per silo root. One worker drains the
+    silos' queues round-robin, at most _watch_batch_max() paths per silo per turn,
+    so a large change in one silo cannot starve the others and every index write
+    goes through a single MCP writer session at a time. Reconcile passes run one
+    silo at a time on the hub thread, each on its own adaptive schedule. The
+    silo set follows the pal and llmli registries: watchers are added and
+    removed as sources are pulled or removed, without a restart.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        interval: float = jobsrt.SERVICE_INTERVAL_DEFAULT,
+        debounce: float = jobsrt.SERVICE_DEBOUNCE_DEFAULT,
+        jobs_fn: Callable[[], list[jobsrt.JobSpec]] | None = None,
+        observer: object | None = None,
+    ) -> None:
+        if Observer is None and observer is None:
+            raise RuntimeError("watchdog is not installed. Install `watchdog` to use watch mode.")
+        self.db_path = str(db_path)
+        self.interval = float(interval)
+        self.debounce = float(debounce)
+        self._jobs_fn = jobs_fn or self._registry_jobs
+        self._observer = observer if observer is not None else Observer()
+        self._watchers: dict[str, SiloWatcher] = {}
+        self._watches: dict[str, object] = {}
+        self._locks: dict[str, Path] = {}
+        # Silos whose lock another process holds, retried every tick until it is released.
+        self._blocked: dict[str, jobsrt.JobSpec] = {}
+        # Silos dropped by `pal pull --stop`; not restarted until they leave the registry.
+        self._stopped: set[str] = set()
+        self._next_reconcile: dict[str, float] = {}
+        self._delays: dict[str, float] = {}
+        self._watchers_lock = threading.Lock()
+        self._registry_stamp: tuple[int, ...] | None = None
+        self._turn = 0
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _registry_jobs(self) -> list[jobsrt.JobSpec]:
+        manager = jobsrt.supported_service_manager() or "systemd"
+        jobs, _warnings = _derive_watch_jobs_for_daemon(manager, db_path=self.db_path)
+        return jobs
+
+    def _registry_changed(self) -> bool:
+        stamp: list[int] = []
+        for path in (REGISTRY_PATH, _llmli_registry_path(self.db_path)):
+            try:
+                stamp.append(path.stat().st_mtime_ns)
+            except OSError:
+                stamp.append(0)
+        if tuple(stamp) == self._registry_stamp:
+            return False
+        self._registry_stamp = tuple(stamp)
+        return True
+
+    def watched_slugs(self) -> list[str]:
+        with self._watchers_lock:
+            return sorted(self._watchers)
+
+    def sync_watchers(self) -> None:
+        """Start watchers for new silos and stop those no longer registered."""
+        desired = {job.slug: job for job in self._jobs_fn() if job.enabled}
+        for slug in [s for s in self.watched_slugs() if s not in desired]:
+            self._remove_watcher(slug)
+        self._stopped &= set(desired)
+        self._blocked = {slug: job for slug, job in self._blocked.items() if slug in desired}
+        for slug, job in desired.items():
+            if slug not in self._watchers and slug not in self._stopped:
+                self._add_watcher(job)
+
+    def retry_blocked(self) -> None:
+        """Start silos whose lock was held, e.g. once a foreground `pal pull <path> --watch` exits."""
+        for job in list(self._blocked.values()):
+            if self._stop.is_set():
+                return
+            self._add_watcher(job)
+
+    def apply_stop_requests(self) -> None:
+        """Drop silos named by `pal pull --stop` (a stop file next to their lock)."""
+        with self._watchers_lock:
+            locks = dict(self._locks)
+        for slug, lock_path in locks.items():
+            request = _watch_stop_request_path(lock_path)
+            if not request.exists():
+                continue
+            self._stopped.add(slug)
+            self._remove_watcher(slug)
+            request.unlink(missing_ok=True)
+
+    def _add_watcher(self, job: jobsrt.JobSpec) -> None:
+        root = Path(job.source_path)
+        lock_path, lock_error = _acquire_silo_pid_lock(self.db_path, job.slug, root_path=root, hub=True)
+        if lock_error:
+            # Another process (e.g. a foreground `pal pull <path> --watch`) owns it; retried every tick.
+            if job.slug not in self._blocked:
+                print(lock_error, file=sys.stderr)
+            self._blocked[job.slug] = job
+            return
+        self._blocked.pop(job.slug, None)
+        _watch_stop_request_path(lock_path).unlink(missing_ok=True)
+        try:
+            watcher = SiloWatcher(
+                root,
+                self.db_path,
+                interval=self.interval,
+                debounce=self.debounce,
+                silo_slug=job.slug,
+                label=job.slug,
+                observer=self._observer,
+            )
+            watch = self._observer.schedule(watcher._handler, str(watcher.root), recursive=True)
+        except Exception as exc:
+            _release_silo_pid_lock(lock_path)
+            print(f"Error: unable to watch silo '{job.slug}': {exc}", file=sys.stderr)
+            return
+        watcher._announce()
+        with self._watchers_lock:
+            self._watchers[job.slug] = watcher
+            self._watches[job.slug] = watch
+            self._locks[job.slug] = lock_path
+            self._next_reconcile[job.slug] = 0.0
+            self._delays[job.slug] = self.interval
+
+    def _remove_watcher(self, slug: str) -> None:
+        with self._watchers_lock:
+            watcher = self._watchers.pop(slug, None)
+            watch = self._watches.pop(slug, None)
+            lock_path = self._locks.pop(slug, None)
+            self._next_reconcile.pop(slug, None)
+            self._delays.pop(slug, None)
+        if watcher is not None:
+            watcher.stop()
+        if watch is not None:
+            try:
+                self._observer.unschedule(watch)
+            except Exception:
+                pass
+        _release_silo_pid_lock(lock_path)
+        print(f"Stopped watching silo '{slug}'.")
+
+    def drain_once(self) -> int:
+        """One fair turn: each silo drains up to the batch size, starting one further along each time."""
+        with self._watchers_lock:
+            watchers = [self._watchers[slug] for slug in sorted(self._watchers)]
+        if not watchers:
+            return 0
+        start = self._turn % len(watchers)
+        self._turn += 1
+        limit = _watch_batch_max()
+        return sum(w._drain_logged(limit=limit) for w in watchers[start:] + watchers[:start])
+
+    def reconcile_due(self, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        with self._watchers_lock:
+            due = [slug for slug, at in sorted(self._next_reconcile.items()) if at <= now]
+        for slug in due:
+            if self._stop.is_set():
+                return
+            watcher = self._watchers.get(slug)
+            if watcher is None:
+                continue
+            active = watcher._reconcile_pass()
+            with self._watchers_lock:
+                if slug not in self._delays:
+                    continue
+                delay = watcher._next_reconcile_delay(self._delays[slug], active)
+                self._delays[slug] = delay
+                self._next_reconcile[slug] = time.monotonic() + delay
+
+    def _drain_loop(self) -> None:
+        while not self._stop.is_set():
+            self.drain_once()
+            self._stop.wait(0.2)
+
+    def run(self) -> None:
+        self._registry_changed()
+        self.sync_watchers()
+        print(
+            f"Watching {len(self._watchers)} silo(s) (check every {int(self.interval)}s, "
+            f"wait {self.debounce}s after edits). Ctrl+C to stop."
+        )
+        self._observer.start()
+        worker = threading.Thread(target=self._drain_loop, daemon=True)
+        worker.start()
+        try:
+            while not self._stop.is_set():
+                if self._registry_changed():
+                    self.sync_watchers()
+                self.apply_stop_requests()
+                self.retry_blocked()
+                self.reconcile_due()
+                self._stop.wait(1.0)
+        finally:
+            self._stop.set()
+            for slug in self.watched_slugs():
+                self._remove_watcher(slug)
+            self._observer.stop()
+            self._observer.join()
+
+
+def _run_watch_hub(hub: WatchHub) -> int:
+    previous_handlers: dict[int, object] = {}
+
+    def _request_stop(_signum, _frame) -> None:
+        hub.stop()
+
+    for sig_name in ("SIGINT", "SIGTERM"):
+        sig = getattr(signal, sig_name, None)
+        if sig is None:
+            continue
+        try:
+            previous_handlers[sig] = signal.signal(sig, _request_stop)
+        except Exception:
+            continue
+    try:
+        hub.run()
+    except KeyboardInterrupt:
+        hub.stop()
+    finally:
+        for sig, previous in previous_handlers.items():
+            try:
+                signal.signal(sig, previous)
+            except Exception:
+                pass
+    return 0
+
+
 def _record_source_path(path: Path) -> None:
     reg = _read_registry()
     bookmarks = reg.get("bookmarks", [])
@@ -2139,6 +2540,25 @@ def _pull_watch_path_mode(
                 os.environ[key] = previous
 
 
+def _pull_watch_all_mode(interval: float, debounce: float) -> int:
+    """`pal pull --watch` without PATH: one WatchHub process for every indexed source."""
+    if Observer is None:
+        print("Error: watchdog is not installed. Install `watchdog` to use --watch.", file=sys.stderr)
+        return 1
+    ok, msg = _mcp_healthcheck_wait(_watch_mcp_wait_seconds())
+    if not ok:
+        print(
+            f"Error: --watch requires the shared MCP server to be running. {msg}\n"
+            "Start it (e.g. via the systemd unit in README) and retry.",
+            file=sys.stderr,
+        )
+        return 1
+    _set_process_title("watch", "all")
+    _apply_watch_process_env()
+    db_path = os.environ.get("LLMLIBRARIAN_DB", _DEFAULT_DB)
+    return _run_watch_hub(WatchHub(db_path, interval=interval, debounce=debounce))
+
+
 def _argv_requests_watch_pull(argv: list[str]) -> bool:
     args = [str(a).strip() for a in argv if str(a).strip()]
     if not args or args[0] != "pull":
@@ -2244,6 +2664,139 @@ def _build_pull_env(status_file_path: str, *, quiet_subprocess: bool = True) ->
     return out
 
 
+def _pull_concurrency() -> int:
+    """Silos `pal pull` (all) indexes at once in one process.
+
+    Configurable via LLMLIBRARIAN_PULL_CONCURRENCY. Crawl, extraction and embedding
+    overlap across silos; the write phase stays one silo at a time. Defaults to 2;
+    1 pulls silos one after another. Forced to 1 when embeddings run on MPS.
+    """
+    raw = os.environ.get("LLMLIBRARIAN_PULL_CONCURRENCY")
+    if raw is None:
+        return 2
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return 2
+
+
+def _pull_isolated() -> bool:
+    """LLMLIBRARIAN_PULL_ISOLATE=1 runs each silo of `pal pull` (all) in its own `llmli add` subprocess."""
+    return _parse_env_bool(os.environ.get("LLMLIBRARIAN_PULL_ISOLATE")) is True
+
+
+def _pull_order(bookmarks: list[dict], db_path: str | Path) -> list[dict]:
+    """Bookmarks in pull order: never-indexed first, then most indexed files, then least recently updated.
+
+    Starting the big silos first lets the small ones fill in around them instead of
+    one large silo running alone at the end of the pass.
+    """
+    registry = _read_llmli_registry(db_path)
+
+    def _key(src: dict) -> tuple[int, int, str]:
+        slug = _resolve_llmli_silo_by_path(registry, Path(src["path"]))
+        entry = registry.get(slug) if slug else None
+        if not isinstance(entry, dict) or not entry.get("updated"):
+            return (0, 0, "")
+        return (1, -int(entry.get("files_indexed") or 0), str(entry.get("updated")))
+
+    return sorted(bookmarks, key=_key)
+
+
+def _pull_one_subprocess(request) -> tuple[int, str | None]:
+    """Run one `llmli add` subprocess for request; returns (files_indexed, error)."""
+    from orchestration.ingest import llmli_add_argv
+
+    import tempfile
+    status_file = tempfile.NamedTemporaryFile(prefix="llmli_status_", delete=False)
+    status_file_path = status_file.name
+    status_file.close()
+    env = _build_pull_env(status_file_path, quiet_subprocess=False)
+    cli_path, _src = _resolve_llmli_paths()
+    cmd = [sys.executable, str(cli_path)] + llmli_add_argv(request)
+    r = subprocess.run(cmd, env=env)
+    code = r.returncode
+
+    files_indexed = 0
+    try:
+        with open(status_file_path, "r", encoding="utf-8") as f:
+            status = json.load(f)
+        files_indexed = status.get("files_indexed") or 0
+    except Exception:
+        pass
+    try:
+        os.unlink(status_file_path)
+    except Exception:
+        pass
+    return files_indexed, (f"exit {code}" if code != 0 else None)
+
+
+def _pull_in_process(
+    jobs: list[tuple[str, object]],
+    concurrency: int,
+    on_start: Callable[[int], None],
+    on_done: Callable[[int, int, str | None], None],
+) -> None:
+    """Index every (name, IngestRequest) job in this process.
+
+    Each silo's run_add opens its own writer client, so the Chroma flock is released
+    whenever no silo is indexing and a peer `llmli add` or MCP write can get in
+    between silos (silos running side by side share it through the flock's in-process
+    reentrancy); the embedding model is still loaded once, from the process-wide
+    cache. Up to `concurrency` silos crawl, extract and embed at once; a silo's write
+    phase, from run_add's pre-write hook until run_add returns, holds a process lock,
+    so Chroma, manifest and registry writes stay one silo at a time. Artifact
+    compilation opens its own client, so it runs after every silo's writer has closed.
+    """
+    import dataclasses
+    from concurrent.futures import ThreadPoolExecutor
+
+    from orchestration.ingest import compile_ingest_artifacts, run_ingest
+
+    if concurrency > 1:
+        try:
+            from embeddings import _best_device
+
+            if _best_device(batch_size=64) == "mps":
+                concurrency = 1
+        except Exception:
+            pass
+
+    write_gate = threading.Lock()
+    results: list[object] = [None] * len(jobs)
+
+    def _pull_one(idx: int) -> None:
+        _name, request = jobs[idx]
+        holding = [False]
+
+        def _enter_write_phase() -> None:
+            write_gate.acquire()
+            holding[0] = True
+
+        on_start(idx)
+        error: str | None = None
+        files_indexed = 0
+        try:
+            result = run_ingest(
+                dataclasses.replace(request, pre_write_hook=_enter_write_phase, compile_artifacts=False)
+            )
+            results[idx] = result
+            files_indexed = result.files_indexed
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        finally:
+            if holding[0]:
+                write_gate.release()
+        on_done(idx, files_indexed, error)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="pal-pull") as pool:
+        for future in [pool.submit(_pull_one, idx) for idx in range(len(jobs))]:
+            future.result()
+    for (_name, request), result in zip(jobs, results):
+        if result is not None:
+            result.artifact_result = compile_ingest_artifacts(request, result)
+
+
 def pull_all_sources(
     full: bool = False,
     allow_cloud: bool = False,
@@ -2253,35 +2806,23 @@ def pull_all_sources(
     workers: int | None = None,
     embedding_workers: int | None = None,
 ) -> int:
-    """Pull all registered sources. Returns exit code."""
+    """Pull all registered sources in one process (one subprocess each with LLMLIBRARIAN_PULL_ISOLATE=1). Returns exit code."""
     reg = _read_registry()
     bookmarks = reg.get("bookmarks", [])
     if not bookmarks:
         print("No registered folders. Use: pal pull <path>", file=sys.stderr)
         return 1
     _ensure_src_on_path()
-    from orchestration.ingest import IngestRequest, llmli_add_argv
+    from orchestration.ingest import IngestRequest
 
-    import tempfile
     is_tty = sys.stderr.isatty()
-    total = len(bookmarks)
-    fail_count = 0
-    updated_silos: list[str] = []
-    failed_silos: list[str] = []
-    for idx, src in enumerate(bookmarks, 1):
-        path = src.get("path")
-        if not path:
-            continue
-        name = src.get("name") or Path(path).name
-        if is_tty:
-            sys.stderr.write("\033[2K\r")
-            sys.stderr.flush()
-        print(f"\n=== pal pull (all) [{idx}/{total}] {name} ===", file=sys.stderr, flush=True)
-        print(f"    path: {path}", file=sys.stderr, flush=True)
-
-        llmli_args = llmli_add_argv(
+    db_path = _resolved_db_path()
+    jobs = [
+        (
+            src.get("name") or Path(src["path"]).name,
             IngestRequest(
-                path=path,
+                path=src["path"],
+                db_path=db_path,
                 incremental=not full,
                 allow_cloud=allow_cloud,
                 follow_symlinks=follow_symlinks,
@@ -2289,51 +2830,60 @@ def pull_all_sources(
                 image_vision_enabled=image_vision,
                 workers=workers,
                 embedding_workers=embedding_workers,
-            )
+            ),
         )
+        for src in _pull_order([src for src in bookmarks if src.get("path")], db_path)
+    ]
+    total = len(jobs)
+    outcomes: dict[int, tuple[int, str | None]] = {}
+    print_lock = threading.Lock()
+
+    def _on_start(idx: int) -> None:
+        name, request = jobs[idx]
+        with print_lock:
+            if is_tty:
+                sys.stderr.write("\033[2K\r")
+                sys.stderr.flush()
+            print(f"\n=== pal pull (all) [{idx + 1}/{total}] {name} ===", file=sys.stderr, flush=True)
+            print(f"    path: {request.path}", file=sys.stderr, flush=True)
+
+    def _on_done(idx: int, files_indexed: int, error: str | None) -> None:
+        name = jobs[idx][0]
+        outcomes[idx] = (files_indexed, error)
+        with print_lock:
+            if error is not None:
+                print(f"--- pal pull (all): {name} FAILED ({error}) ---\n", file=sys.stderr, flush=True)
+            elif files_indexed > 0:
+                print(f"--- pal pull (all): {name} done (+{files_indexed} files) ---\n", file=sys.stderr, flush=True)
+            else:
+                print(f"--- pal pull (all): {name} done (up to date) ---\n", file=sys.stderr, flush=True)
 
-        status_file = tempfile.NamedTemporaryFile(prefix="llmli_status_", delete=False)
-        status_file_path = status_file.name
-        status_file.close()
-        env = _build_pull_env(status_file_path, quiet_subprocess=False)
-        cli_path, _src = _resolve_llmli_paths()
-        cmd = [sys.executable, str(cli_path)] + llmli_args
-        r = subprocess.run(cmd, env=env)
-        code = r.returncode
-
-        files_indexed = 0
-        try:
-            with open(status_file_path, "r", encoding="utf-8") as f:
-                status = json.load(f)
-            files_indexed = status.get("files_indexed") or 0
-        except Exception:
-            pass
-        try:
-            os.unlink(status_file_path)
-        except Exception:
-            pass
-
-        if code != 0:
-            fail_count += 1
-            failed_silos.append(name)
-            print(f"--- pal pull (all): {name} FAILED (exit {code}) ---\n", file=sys.stderr, flush=True)
-        elif files_indexed > 0:
-            updated_silos.append(f"{name} ({files_indexed} files)")
-            print(f"--- pal pull (all): {name} done (+{files_indexed} files) ---\n", file=sys.stderr, flush=True)
-        else:
-            print(f"--- pal pull (all): {name} done (up to date) ---\n", file=sys.stderr, flush=True)
+    if _pull_isolated():
+        for idx, (_name, request) in enumerate(jobs):
+            _on_start(idx)
+            _on_done(idx, *_pull_one_subprocess(request))
+    elif jobs:
+        _pull_in_process(jobs, _pull_concurrency(), _on_start, _on_done)
 
     if is_tty:
         sys.stderr.write("\033[2K\r")
         sys.stderr.flush()
 
+    updated_silos: list[str] = []
+    failed_silos: list[str] = []
+    for idx, (name, _request) in enumerate(jobs):
+        files_indexed, error = outcomes.get(idx, (0, "not run"))
+        if error is not None:
+            failed_silos.append(name)
+        elif files_indexed > 0:
+            updated_silos.append(f"{name} ({files_indexed} files)")
     if updated_silos:
         print(f"Updated: {', '.join(updated_silos)}")
     if failed_silos:
         print(f"Failed: {', '.join(failed_silos)}", file=sys.stderr)
     if not updated_silos and not failed_silos:
         print("All silos up to date.")
-    return 0 if fail_count == 0 else 1
+    return 0 if not failed_silos else 1
 
 
 def _daemon_workdir() -> str:
@@ -2456,6 +3006,14 @@ def _derive_watch_jobs_for_daemon(manager: str, db_path: str | Path | None = Non
     )
 
 
+def _watch_multiplex_enabled() -> bool:
+    """One hub service for every silo (default) instead of one service per silo.
+
+    LLMLIBRARIAN_WATCH_MULTIPLEX=0 restores per-silo `pal pull <path> --watch` units.
+    """
+    return os.environ.get("LLMLIBRARIAN_WATCH_MULTIPLEX", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
 def _sync_daemon_services(emit_output: bool = True) -> int:
     existing = _daemon_metadata()
     if not existing:
@@ -2467,9 +3025,13 @@ def _sync_daemon_services(emit_output: bool = True) -> int:
     jobsrt.write_daemon_metadata(PAL_HOME, refreshed)
     db_path = str(refreshed["db_path"])
     jobs, warnings = _derive_watch_jobs_for_daemon(manager_name, db_path=db_path)
+    service_jobs = jobs
+    if _watch_multiplex_enabled():
+        hub = jobsrt.watch_hub_job(jobs, pal_home=PAL_HOME, manager=manager_name)
+        service_jobs = [hub] if hub is not None else []
     manager = jobsrt.PlatformManager(manager_name)
     result = manager.sync(
-        jobs,
+        service_jobs,
         python_executable=str(refreshed["python_executable"]),
         pal_path=str(refreshed["pal_path"]),
         workdir=str(refreshed["workdir"]),
@@ -2952,7 +3514,7 @@ def install_command(
 @app.command("pull", help="Index a folder (or refresh all).")
 def pull_command(
     path: str | None = typer.Argument(None, metavar="PATH", help="Folder to index. Omit to refresh all."),
-    watch: bool = typer.Option(False, "--watch", help="Stay running and sync changes live."),
+    watch: bool = typer.Option(False, "--watch", help="Stay running and sync changes live (all indexed sources when PATH is omitted)."),
     status: bool = typer.Option(False, "--status", help="Show watcher status (all, or only PATH when provided)."),
     stop: str | None = typer.Option(None, "--stop", metavar="TARGET", help="Stop watcher by pid, silo slug/display name, or watched path.", autocompletion=_complete_silo),
     json_output: bool = typer.Option(False, "--json", help="Emit machine-readable JSON for --status/--stop."),
@@ -3009,8 +3571,11 @@ def pull_command(
         print("Blank --prompt is not allowed. Use --clear-prompt to remove an override.", file=sys.stderr)
         raise typer.Exit(code=2)
     if watch and not path:
-        print("--watch requires PATH. Use: pal pull <path> --watch", file=sys.stderr)
-        raise typer.Exit(code=2)
+        if full or image_vision_requested is not None or workers is not None or embedding_workers is not None:
+            print("--watch without PATH watches every indexed source; it cannot be combined with --full/--image-vision/--workers.", file=sys.stderr)
+            raise typer.Exit(code=2)
+        _exit(_pull_watch_all_mode(interval, debounce))
+        return
     if watch and path:
         _exit(
             _pull_watch_path_mode(
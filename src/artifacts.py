@@ -6,11 +6,14 @@ import re
 from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 from chroma_client import get_client, release, writer_client
 from chroma_lock import chroma_shared_lock
+from chunk_counts import open_chunk_counts
 from constants import LLMLI_COLLECTION
+from ingest import _sidecar_write
+from lexical_index import open_lexical_index
 from state import get_silo_artifact_compile, set_silo_artifact_compile, update_silo
 
 _MONEY_RE = re.compile(r"\$?\d[\d,]*(?:\.\d+)?\s*(?:billion|million|thousand|bn|mm|m|k)?", re.IGNORECASE)
@@ -35,8 +38,24 @@ def artifacts_enabled_for_silo(slug: str, source_path: str | Path) -> bool:
     return slug in allow or slug_lower in {a.lower() for a in allow} or path_name in {a.lower() for a in allow}
 
 
-def _load_parent_rows(db_path: str, parent_slug: str) -> list[dict[str, Any]]:
+def _origin_where(silo: str, sources: list[str]) -> dict[str, Any]:
+    """Rows of ``silo`` belonging to ``sources``: the file itself, or every member of a zip archive."""
+    return {
+        "$and": [
+            {"silo": silo},
+            {"$or": [{"source": {"$in": sources}}, {"zip_path": {"$in": sources}}]},
+        ]
+    }
+
+
+def _row_origin(meta: dict[str, Any]) -> str:
+    # Archive members are refreshed as a unit, keyed by the archive path run_add reports.
+    return str(meta.get("zip_path") or meta.get("source") or "")
+
+
+def _load_parent_rows(db_path: str, parent_slug: str, sources: list[str] | None = None) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
+    where = {"silo": parent_slug} if sources is None else _origin_where(parent_slug, sources)
     _PAGE = 200
     try:
         with chroma_shared_lock(db_path):
@@ -44,7 +63,7 @@ def _load_parent_rows(db_path: str, parent_slug: str) -> list[dict[str, Any]]:
             offset = 0
             while True:
                 result = coll.get(
-                    where={"silo": parent_slug},
+                    where=where,
                     include=["documents", "metadatas", "ids"],
                     limit=_PAGE,
                     offset=offset,
@@ -108,7 +127,9 @@ def _extract_artifact_rows(
     *,
     max_facts: int,
     max_input_chars: int,
-) -> tuple[list[tuple[str, str, dict[str, Any]]], dict[str, int], bool]:
+) -> tuple[list[tuple[str, str, dict[str, Any]]], dict[str, int], bool, int]:
+    """Artifact rows for rows in source order, within max_facts facts and max_input_chars
+    characters of input. Returns (rows, kind counts, truncated, input characters read)."""
     out: list[tuple[str, str, dict[str, Any]]] = []
     kind_counts: Counter[str] = Counter()
     consumed = 0
@@ -118,11 +139,14 @@ def _extract_artifact_rows(
         doc = str(row.get("doc") or "").strip()
         if not doc:
             continue
-        consumed += len(doc)
-        if consumed > max_input_chars:
+        if consumed + len(doc) > max_input_chars:
             truncated = True
             break
         kind = _classify_artifact_kind(doc)
+        if kind is not None and len(out) >= max_facts:
+            truncated = True
+            break
+        consumed += len(doc)
         if kind is None:
             continue
         meta = dict(row.get("meta") or {})
@@ -145,12 +169,11 @@ def _extract_artifact_rows(
             "doc_type": "artifact",
             "indexed_at": datetime.now(timezone.utc).isoformat(),
         }
+        if meta.get("zip_path"):
+            artifact_meta["zip_path"] = str(meta["zip_path"])
         out.append((chunk_id, artifact_doc, artifact_meta))
         kind_counts[kind] += 1
-        if len(out) >= max_facts:
-            truncated = True
-            break
-    return out, dict(kind_counts), truncated
+    return out, dict(kind_counts), truncated, consumed
 
 
 def _write_artifact_rows(db_path: str, artifact_slug: str, rows: list[tuple[str, str, dict[str, Any]]]) -> int:
@@ -163,20 +186,90 @@ def _write_artifact_rows(db_path: str, artifact_slug: str, rows: list[tuple[str,
                 documents=[r[1] for r in rows],
                 metadatas=[r[2] for r in rows],
             )
+
+    def _reindex(ix: Any) -> None:
+        ix.reset_silo(artifact_slug)
+        ix.add(rows)
+
+    _sidecar_write(open_lexical_index(db_path), [artifact_slug], _reindex)
+    _sidecar_write(
+        open_chunk_counts(db_path), [artifact_slug], lambda counts: counts.rebuild_silo(artifact_slug, [r[2] for r in rows])
+    )
     return len(rows)
 
 
+def _replace_artifact_sources(
+    db_path: str,
+    artifact_slug: str,
+    rows_by_source: dict[str, list[tuple[str, str, dict[str, Any]]]],
+) -> int:
+    """
+    Swap in the artifact rows of just these sources. IDs are content-derived, so rows that
+    survive an edit keep their ID and embedding; only dropped IDs are deleted and only new
+    IDs are added. Returns the number of rows added.
+    """
+    sources = sorted(rows_by_source)
+    if not sources:
+        return 0
+    rows = [row for source in sources for row in rows_by_source[source]]
+    wanted = {r[0] for r in rows}
+    with writer_client(str(Path(db_path).resolve())) as client:
+        coll = client.get_or_create_collection(name=LLMLI_COLLECTION)
+        existing = set(coll.get(where=_origin_where(artifact_slug, sources), include=[]).get("ids") or [])
+        stale = sorted(existing - wanted)
+        if stale:
+            coll.delete(ids=stale)
+        fresh = [r for r in rows if r[0] not in existing]
+        if fresh:
+            coll.add(
+                ids=[r[0] for r in fresh],
+                documents=[r[1] for r in fresh],
+                metadatas=[r[2] for r in fresh],
+            )
+
+    def _reindex(ix: Any) -> None:
+        for source in sources:
+            ix.delete_source(artifact_slug, source)
+        ix.add(rows)
+
+    def _recount(counts: Any) -> None:
+        for source in sources:
+            counts.forget_source(artifact_slug, source)
+        counts.add(r[2] for r in rows)
+
+    _sidecar_write(open_lexical_index(db_path), [artifact_slug], _reindex)
+    _sidecar_write(open_chunk_counts(db_path), [artifact_slug], _recount)
+    return len(fresh)
+
+
+def _compile_fingerprint(sources: dict[str, dict[str, Any]]) -> str:
+    h = hashlib.sha256()
+    for source in sorted(sources):
+        h.update(f"{source}|{sources[source].get('fingerprint') or ''}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
 def compile_artifacts_for_silo(
     *,
     db_path: str | Path,
     parent_slug: str,
     source_path: str | Path,
     display_name: str | None = None,
+    changed_sources: Iterable[str] | None = None,
 ) -> dict[str, Any]:
     """
     Compile artifacts for one parent silo.
 
     Scheduling policy: call only *after* run_add returns (option b).
+
+    Artifacts are extracted per source (a file, or a zip archive as a whole) and the
+    registry keeps each source's fingerprint, so only sources whose chunks changed are
+    re-extracted and swapped in by artifact ID. changed_sources (from run_add's
+    on_sources_changed, or the file a single-file update touched) limits the pass to
+    those sources; None reloads the whole silo. The fact and input caps are silo-wide:
+    unchanged sources keep what they already used and changed sources share the rest in
+    source order. A full pass that finds changes also re-extracts sources that were cut
+    short, so budget freed by an edit or removal is handed back out.
     """
     db = str(Path(db_path).resolve())
     source = str(Path(source_path).resolve())
@@ -186,26 +279,100 @@ def compile_artifacts_for_silo(
     max_facts = max(1, int(os.environ.get("LLMLIBRARIAN_ARTIFACT_MAX_FACTS", "80") or "80"))
     max_input_chars = max(2000, int(os.environ.get("LLMLIBRARIAN_ARTIFACT_MAX_INPUT_CHARS", "180000") or "180000"))
     artifact_slug = f"{parent_slug}-artifacts"
-    rows = _load_parent_rows(db, parent_slug)
-    fingerprint = _fingerprint_rows(rows)
-
     existing = get_silo_artifact_compile(db, parent_slug) or {}
-    if existing.get("fingerprint") == fingerprint:
-        return {
-            "status": "unchanged",
-            "parent_silo": parent_slug,
-            "artifact_silo": artifact_slug,
-            "fingerprint": fingerprint,
+    prior = existing.get("sources")
+    prior_sources: dict[str, dict[str, Any]] | None = dict(prior) if isinstance(prior, dict) else None
+    # State from before the budgets were silo-wide has no input_chars to charge: recompile.
+    if prior_sources is not None and any("input_chars" not in (e or {}) for e in prior_sources.values()):
+        prior_sources = None
+    unchanged = {
+        "status": "unchanged",
+        "parent_silo": parent_slug,
+        "artifact_silo": artifact_slug,
+        "fingerprint": existing.get("fingerprint"),
+    }
+
+    # Per-source diffing needs the previous per-source state; without it, recompile everything.
+    incremental = changed_sources is not None and prior_sources is not None
+    if incremental:
+        targets = sorted({str(s) for s in changed_sources or () if s})
+        if not targets:
+            return unchanged
+        rows = _load_parent_rows(db, parent_slug, sources=targets)
+    else:
+        targets = []
+        rows = _load_parent_rows(db, parent_slug)
+        if prior_sources is None and existing.get("fingerprint") == _fingerprint_rows(rows):
+            return unchanged
+
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for row in rows:
+        grouped.setdefault(_row_origin(row.get("meta") or {}), []).append(row)
+    # Sources with no parent rows left were removed: their artifacts go too.
+    for gone in targets if incremental else list(prior_sources or {}):
+        grouped.setdefault(gone, [])
+
+    sources_state = dict(prior_sources or {})
+    dirty: dict[str, list[dict[str, Any]]] = {}
+    for origin, origin_rows in grouped.items():
+        if not origin_rows:
+            if origin in sources_state:
+                dirty[origin] = origin_rows
+            continue
+        if (sources_state.get(origin) or {}).get("fingerprint") != _fingerprint_rows(origin_rows):
+            dirty[origin] = origin_rows
+    if prior_sources is not None and not dirty:
+        return unchanged
+    if not incremental:
+        for origin, origin_rows in grouped.items():
+            if origin_rows and (sources_state.get(origin) or {}).get("truncated"):
+                dirty[origin] = origin_rows
+
+    facts_left = max_facts
+    chars_left = max_input_chars
+    for origin, entry in sources_state.items():
+        if origin not in dirty:
+            facts_left -= int(entry.get("artifacts") or 0)
+            chars_left -= int(entry.get("input_chars") or 0)
+
+    rows_by_source: dict[str, list[tuple[str, str, dict[str, Any]]]] = {}
+    for origin in sorted(dirty):
+        origin_rows = dirty[origin]
+        if not origin_rows:
+            sources_state.pop(origin, None)
+            rows_by_source[origin] = []
+            continue
+        if facts_left > 0 and chars_left > 0:
+            extracted, kinds, was_truncated, used_chars = _extract_artifact_rows(
+                parent_slug,
+                artifact_slug,
+                origin_rows,
+                max_facts=facts_left,
+                max_input_chars=chars_left,
+            )
+        else:
+            extracted, kinds, was_truncated, used_chars = [], {}, True, 0
+        facts_left -= len(extracted)
+        chars_left -= used_chars
+        rows_by_source[origin] = extracted
+        sources_state[origin] = {
+            "fingerprint": _fingerprint_rows(origin_rows),
+            "artifacts": len(extracted),
+            "input_chars": used_chars,
+            "kind_counts": kinds,
+            "truncated": bool(was_truncated),
         }
 
-    artifact_rows, kind_counts, truncated = _extract_artifact_rows(
-        parent_slug,
-        artifact_slug,
-        rows,
-        max_facts=max_facts,
-        max_input_chars=max_input_chars,
-    )
-    written = _write_artifact_rows(db, artifact_slug, artifact_rows)
+    if prior_sources is None:
+        written = _write_artifact_rows(db, artifact_slug, [r for rs in rows_by_source.values() for r in rs])
+    else:
+        written = _replace_artifact_sources(db, artifact_slug, rows_by_source)
+    kind_counts: Counter[str] = Counter()
+    for entry in sources_state.values():
+        kind_counts.update({k: int(v) for k, v in (entry.get("kind_counts") or {}).items()})
+    total = sum(int(entry.get("artifacts") or 0) for entry in sources_state.values())
+    truncated = any(entry.get("truncated") for entry in sources_state.values())
+    fingerprint = _compile_fingerprint(sources_state)
     now_iso = datetime.now(timezone.utc).isoformat()
 
     # Keep artifact silo visible and queryable in the same registry model.
@@ -213,8 +380,8 @@ def compile_artifacts_for_silo(
         db,
         artifact_slug,
         source,
-        files_indexed=max(1, written) if written else 0,
-        chunks_count=written,
+        files_indexed=max(1, total) if total else 0,
+        chunks_count=total,
         updated_iso=now_iso,
         display_name=(f"{display_name or parent_slug} artifacts").strip(),
     )
@@ -224,10 +391,11 @@ def compile_artifacts_for_silo(
         {
             "fingerprint": fingerprint,
             "at": now_iso,
-            "kind_counts": kind_counts,
+            "kind_counts": dict(kind_counts),
             "artifact_silo": artifact_slug,
             "status": "completed",
             "truncated": bool(truncated),
+            "sources": sources_state,
         },
     )
     return {
@@ -236,6 +404,7 @@ def compile_artifacts_for_silo(
         "artifact_silo": artifact_slug,
         "fingerprint": fingerprint,
         "chunks_written": written,
-        "kind_counts": kind_counts,
+        "sources_refreshed": len(dirty),
+        "kind_counts": dict(kind_counts),
         "truncated": bool(truncated),
     }
@@ -0,0 +1,277 @@
+"""
+Per-silo chunk counters maintained alongside Chroma writes.
+
+``update_silo_counts`` and ``op_inspect_silo`` used to read every row of a silo
+out of Chroma just to count it, which made saving one file in a large silo
+cost a full-silo read. ``_batch_add`` and the source/silo deletes now keep a
+count per (silo, source) here, with the source's doc_type, extension,
+zip_path and file_hash, so totals and breakdowns are small GROUP BYs.
+
+Store: ``llmli_chunk_counts.sqlite3`` (WAL) next to the Chroma DB. A silo is
+``ready`` once its counts are known to be exact: rebuilt from empty (``add
+--full``, repair) or recounted from Chroma by ``recount_silo`` (done lazily the
+first time ``update_silo_counts`` sees the silo). Readers fall back to a
+Chroma scan for silos that are not ready.
+"""
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Any, ContextManager, Iterable
+
+from sqlite_store import connect_store, write_txn
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS count_silos (
+    silo TEXT PRIMARY KEY,
+    ready INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS source_counts (
+    silo TEXT NOT NULL,
+    source TEXT NOT NULL,
+    doc_type TEXT NOT NULL DEFAULT '',
+    ext TEXT NOT NULL DEFAULT '',
+    zip_path TEXT NOT NULL DEFAULT '',
+    file_hash TEXT NOT NULL DEFAULT '',
+    chunks INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (silo, source)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_source_counts_zip ON source_counts(silo, zip_path);
+"""
+_PAGE_SIZE = 1000
+
+
+def _counts_db_path(db_path: str | Path) -> Path:
+    p = Path(db_path).resolve()
+    if p.is_dir():
+        return p / "llmli_chunk_counts.sqlite3"
+    return p.parent / "llmli_chunk_counts.sqlite3"
+
+
+def _counts_conn(path: Path, *, create: bool = True) -> ContextManager[sqlite3.Connection | None]:
+    return connect_store(path, _SCHEMA, create=create)
+
+
+def _write_txn(path: Path) -> ContextManager[sqlite3.Connection]:
+    return write_txn(path, _SCHEMA)
+
+
+def _source_ext(source: str) -> str:
+    # Archive members are recorded as "<zip> > <member>"; count them by the member's type.
+    return Path(source.rsplit(" > ", 1)[-1]).suffix.lower()
+
+
+def _rows_from_metas(metas: Iterable[dict[str, Any] | None]) -> dict[tuple[str, str], list[Any]]:
+    """{(silo, source): [doc_type, ext, zip_path, file_hash, chunks]} for metas carrying a silo."""
+    rows: dict[tuple[str, str], list[Any]] = {}
+    for meta in metas:
+        m = meta or {}
+        silo = str(m.get("silo") or "")
+        if not silo:
+            continue
+        source = str(m.get("source") or "")
+        row = rows.get((silo, source))
+        if row is None:
+            rows[(silo, source)] = [
+                str(m.get("doc_type") or ""),
+                _source_ext(source),
+                str(m.get("zip_path") or ""),
+                str(m.get("file_hash") or ""),
+                1,
+            ]
+        else:
+            row[4] += 1
+    return rows
+
+
+def _upsert(conn: sqlite3.Connection, rows: dict[tuple[str, str], list[Any]]) -> None:
+    conn.executemany(
+        "INSERT INTO source_counts(silo, source, doc_type, ext, zip_path, file_hash, chunks) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(silo, source) DO UPDATE SET chunks = chunks + excluded.chunks, "
+        "doc_type = excluded.doc_type, ext = excluded.ext, zip_path = excluded.zip_path, "
+        "file_hash = CASE WHEN excluded.file_hash != '' THEN excluded.file_hash ELSE file_hash END",
+        [(silo, source, *row) for (silo, source), row in rows.items()],
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO count_silos(silo, ready) VALUES (?, 0)",
+        [(silo,) for silo in {silo for silo, _source in rows}],
+    )
+
+
+class ChunkCounts:
+    """Counters for every silo in one DB. Each call opens its own connection."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+    def add(self, metas: Iterable[dict[str, Any] | None]) -> int:
+        """Count newly written chunks (one metadata dict per chunk)."""
+        rows = _rows_from_metas(metas)
+        if not rows:
+            return 0
+        with _write_txn(self.path) as conn:
+            _upsert(conn, rows)
+        return sum(row[4] for row in rows.values())
+
+    def refresh_sources(self, metas: Iterable[dict[str, Any] | None]) -> None:
+        """Take doc_type and file_hash from re-stamped chunks of already counted sources; counts stay."""
+        rows = _rows_from_metas(metas)
+        if not rows or not self.path.exists():
+            return
+        with _write_txn(self.path) as conn:
+            conn.executemany(
+                "UPDATE source_counts SET doc_type = ?, "
+                "file_hash = CASE WHEN ? != '' THEN ? ELSE file_hash END "
+                "WHERE silo = ? AND source = ?",
+                [(row[0], row[3], row[3], silo, source) for (silo, source), row in rows.items()],
+            )
+
+    def subtract(self, silo: str, source: str, n: int) -> None:
+        if n <= 0 or not self.path.exists():
+            return
+        with _write_txn(self.path) as conn:
+            conn.execute(
+                "UPDATE source_counts SET chunks = MAX(0, chunks - ?) WHERE silo = ? AND source = ?",
+                (int(n), silo, source),
+            )
+            conn.execute("DELETE FROM source_counts WHERE silo = ? AND source = ? AND chunks <= 0", (silo, source))
+
+    def subtract_metas(self, metas: Iterable[dict[str, Any] | None]) -> None:
+        for (silo, source), row in _rows_from_metas(metas).items():
+            self.subtract(silo, source, row[4])
+
+    def forget_source(self, silo: str, source: str) -> None:
+        """Drop a file's counts, including archive members recorded under ``zip_path``."""
+        if not self.path.exists():
+            return
+        with _write_txn(self.path) as conn:
+            conn.execute(
+                "DELETE FROM source_counts WHERE silo = ? AND (source = ? OR zip_path = ?)",
+                (silo, source, source),
+            )
+
+    def reset_silo(self, silo: str, *, ready: bool = True) -> None:
+        """Zero a silo. ``ready`` marks the counts exact, i.e. Chroma's rows were wiped too."""
+        with _write_txn(self.path) as conn:
+            conn.execute("DELETE FROM source_counts WHERE silo = ?", (silo,))
+            conn.execute(
+                "INSERT INTO count_silos(silo, ready) VALUES (?, ?) "
+                "ON CONFLICT(silo) DO UPDATE SET ready = excluded.ready",
+                (silo, 1 if ready else 0),
+            )
+
+    def rebuild_silo(self, silo: str, metas: Iterable[dict[str, Any] | None]) -> None:
+        """Replace a silo's counts with those of ``metas`` (every chunk it holds) and mark it ready."""
+        rows = {key: row for key, row in _rows_from_metas(metas).items() if key[0] == silo}
+        with _write_txn(self.path) as conn:
+            conn.execute("DELETE FROM source_counts WHERE silo = ?", (silo,))
+            _upsert(conn, rows)
+            conn.execute(
+                "INSERT INTO count_silos(silo, ready) VALUES (?, 1) ON CONFLICT(silo) DO UPDATE SET ready = 1",
+                (silo,),
+            )
+
+    def recount_silo(self, collection: Any, silo: str) -> None:
+        """Rebuild a silo's counts from a paged metadata scan of ``collection``."""
+        metas: list[dict[str, Any] | None] = []
+        offset = 0
+        while True:
+            page = collection.get(where={"silo": silo}, include=["metadatas"], limit=_PAGE_SIZE, offset=offset)
+            got = list((page or {}).get("metadatas") or [])
+            metas.extend(got)
+            if len(got) < _PAGE_SIZE:
+                break
+            offset += len(got)
+        self.rebuild_silo(silo, metas)
+
+    def drop_silo(self, silo: str) -> None:
+        if not self.path.exists():
+            return
+        with _write_txn(self.path) as conn:
+            conn.execute("DELETE FROM source_counts WHERE silo = ?", (silo,))
+            conn.execute("DELETE FROM count_silos WHERE silo = ?", (silo,))
+
+    def mark_stale(self, silos: Iterable[str] | None = None) -> None:
+        """Treat these silos (all when None) as unknown until they are recounted."""
+        if not self.path.exists():
+            return
+        with _write_txn(self.path) as conn:
+            if silos is None:
+                conn.execute("UPDATE count_silos SET ready = 0")
+            else:
+                conn.executemany("UPDATE count_silos SET ready = 0 WHERE silo = ?", [(s,) for s in silos])
+
+    def is_ready(self, silo: str) -> bool:
+        with _counts_conn(self.path, create=False) as conn:
+            if conn is None:
+                return False
+            row = conn.execute("SELECT ready FROM count_silos WHERE silo = ?", (silo,)).fetchone()
+        return bool(row and row[0])
+
+    def chunk_total(self, silo: str) -> int | None:
+        """The silo's chunk count, or None when it is not ready."""
+        with _counts_conn(self.path, create=False) as conn:
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT s.ready, COALESCE(SUM(c.chunks), 0) FROM count_silos s "
+                "LEFT JOIN source_counts c ON c.silo = s.silo WHERE s.silo = ? GROUP BY s.silo",
+                (silo,),
+            ).fetchone()
+        if not row or not row[0]:
+            return None
+        return int(row[1])
+
+    def silo_totals(self) -> dict[str, dict[str, Any]]:
+        """{silo: {"chunks", "files", "by_doc_type"}} for every ready silo."""
+        out: dict[str, dict[str, Any]] = {}
+        with _counts_conn(self.path, create=False) as conn:
+            if conn is None:
+                return out
+            for (silo,) in conn.execute("SELECT silo FROM count_silos WHERE ready = 1"):
+                out[silo] = {"chunks": 0, "files": 0, "by_doc_type": {}}
+            for silo, doc_type, files, chunks in conn.execute(
+                "SELECT c.silo, c.doc_type, COUNT(*), SUM(c.chunks) FROM source_counts c "
+                "JOIN count_silos s ON s.silo = c.silo AND s.ready = 1 "
+                "WHERE c.chunks > 0 GROUP BY c.silo, c.doc_type"
+            ):
+                entry = out[silo]
+                entry["chunks"] += int(chunks or 0)
+                entry["files"] += int(files or 0)
+                entry["by_doc_type"][doc_type or "other"] = int(chunks or 0)
+        return out
+
+    def silo_breakdown(self, silo: str) -> dict[str, Any] | None:
+        """Totals plus per-source, per-doc_type and per-extension chunk counts, or None when not ready."""
+        with _counts_conn(self.path, create=False) as conn:
+            if conn is None:
+                return None
+            row = conn.execute("SELECT ready FROM count_silos WHERE silo = ?", (silo,)).fetchone()
+            if not row or not row[0]:
+                return None
+            sources = conn.execute(
+                "SELECT source, doc_type, ext, file_hash, chunks FROM source_counts "
+                "WHERE silo = ? AND chunks > 0 ORDER BY chunks DESC, source",
+                (silo,),
+            ).fetchall()
+        by_doc_type: Counter[str] = Counter()
+        by_ext: Counter[str] = Counter()
+        for _source, doc_type, ext, _hash, chunks in sources:
+            by_doc_type[doc_type or "other"] += chunks
+            by_ext[ext or "(none)"] += chunks
+        return {
+            "chunks": sum(r[4] for r in sources),
+            "files": len(sources),
+            "sources": [
+                {"source": source, "doc_type": doc_type, "file_hash": file_hash, "chunks": chunks}
+                for source, doc_type, _ext, file_hash, chunks in sources
+            ],
+            "by_doc_type": dict(by_doc_type),
+            "by_extension": dict(by_ext),
+        }
+
+
+def open_chunk_counts(db_path: str | Path | None) -> ChunkCounts | None:
+    if db_path is None:
+        return None
+    return ChunkCounts(_counts_db_path(db_path))
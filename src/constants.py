@@ -58,6 +58,8 @@ CHUNK_OVERLAP = 150
 # Ingestion
 ADD_BATCH_SIZE = 256
 MAX_WORKERS = 8
+# Streaming add: ceiling on extracted-but-unwritten chunk text held in memory.
+INGEST_MAX_INFLIGHT_MB = 256
 
 # Query defaults
 DEFAULT_N_RESULTS = 12
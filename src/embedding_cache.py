@@ -0,0 +1,402 @@
+"""
+Persistent embedding cache keyed by (model, dimension, chunk hash).
+
+A rename, a moved tree, ``add --full``, or a file whose chunks mostly did not
+change all re-embed text that was embedded before. ``_batch_add`` asks this
+cache first and only sends the misses to the embedding function.
+
+Layout under ``<db>/llmli_embedding_cache/``:
+  - ``index.sqlite3`` (WAL): (model, dim, chunk_hash) -> slot in the vector
+    file, plus ``last_used`` for LRU eviction and hit/miss counters.
+  - ``<model>-<dim>.f32``: raw float32 rows, read through ``numpy.memmap``.
+
+Every read and append runs inside BEGIN IMMEDIATE, so concurrent writers (CLI
+add, MCP server, watcher) never hand out the same slot and never read a file
+mid-compaction. When the vector files outgrow LLMLIBRARIAN_EMBED_CACHE_MAX_MB
+(default 2048) the least recently used rows are dropped and the files are
+compacted. LLMLIBRARIAN_EMBED_CACHE=0 disables the cache.
+"""
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, ContextManager
+
+import numpy as np
+
+from sqlite_store import connect_store, immediate_txn
+
+CACHE_DIRNAME = "llmli_embedding_cache"
+DEFAULT_MAX_MB = 2048
+# Prune to this fraction of the cap so every append after a prune does not
+# trigger another one.
+_PRUNE_HEADROOM = 0.9
+_SQL_IN_CHUNK = 500
+_COMPACT_ROWS = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    chunk_hash TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (model, dim, chunk_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_lru ON embeddings(last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def embedding_cache_enabled() -> bool:
+    raw = os.environ.get("LLMLIBRARIAN_EMBED_CACHE", "1").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def embedding_cache_max_bytes() -> int:
+    try:
+        mb = float(os.environ.get("LLMLIBRARIAN_EMBED_CACHE_MAX_MB", DEFAULT_MAX_MB))
+    except (TypeError, ValueError):
+        mb = DEFAULT_MAX_MB
+    return max(0, int(mb * 1024 * 1024))
+
+
+def text_key(text: str) -> str:
+    """Same digest as ingest ``_chunk_hash``: sha256 of the text, first 16 hex chars."""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _cache_dir(db_path: str | Path) -> Path:
+    p = Path(db_path).resolve()
+    if p.is_dir():
+        return p / CACHE_DIRNAME
+    return p.parent / CACHE_DIRNAME
+
+
+def _vector_file(root: Path, model: str, dim: int) -> Path:
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model).strip("_")[:48] or "model"
+    digest = hashlib.sha256(model.encode("utf-8")).hexdigest()[:8]
+    return root / f"{slug}-{digest}-{int(dim)}.f32"
+
+
+def _cache_conn(root: Path, *, create: bool = True) -> ContextManager[sqlite3.Connection | None]:
+    return connect_store(root / "index.sqlite3", _SCHEMA, create=create)
+
+
+def _bump_counters(conn: sqlite3.Connection, hits: int, misses: int) -> None:
+    for name, delta in (("hits", hits), ("misses", misses)):
+        if delta:
+            conn.execute(
+                "INSERT INTO counters(name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (name, delta),
+            )
+
+
+def _read_rows(path: Path, dim: int, slots: list[int]) -> np.ndarray | None:
+    row_bytes = 4 * dim
+    try:
+        rows = path.stat().st_size // row_bytes
+    except OSError:
+        return None
+    if not rows or max(slots) >= rows:
+        return None
+    mm = np.memmap(path, dtype=np.float32, mode="r", shape=(rows, dim))
+    try:
+        return np.array(mm[np.asarray(slots, dtype=np.int64)])
+    finally:
+        del mm
+
+
+def _append_rows(path: Path, vectors: np.ndarray) -> int:
+    """Append rows and return the slot of the first one. A torn tail from a crashed
+    writer is truncated first so slots stay aligned."""
+    row_bytes = 4 * vectors.shape[1]
+    with open(path, "ab") as f:
+        size = f.tell()
+        if size % row_bytes:
+            size -= size % row_bytes
+            f.truncate(size)
+            f.seek(size)
+        f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        f.flush()
+    return size // row_bytes
+
+
+class EmbeddingCache:
+    """Cache for one embedding model. Safe to share across embedding threads."""
+
+    def __init__(self, root: Path, model: str, *, max_bytes: int | None = None) -> None:
+        self.root = Path(root)
+        self.model = model
+        self.max_bytes = embedding_cache_max_bytes() if max_bytes is None else max(0, int(max_bytes))
+        self.dim: int | None = None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Return cached vectors for the keys that have one; marks them recently used."""
+        wanted = list(dict.fromkeys(k for k in keys if k))
+        if not wanted:
+            return {}
+        found: list[tuple[str, int, int]] = []
+        out: dict[str, np.ndarray] = {}
+        with _cache_conn(self.root) as conn:
+            assert conn is not None
+            with immediate_txn(conn):
+                for i in range(0, len(wanted), _SQL_IN_CHUNK):
+                    part = wanted[i : i + _SQL_IN_CHUNK]
+                    marks = ",".join("?" * len(part))
+                    found.extend(
+                        conn.execute(
+                            f"SELECT chunk_hash, dim, slot FROM embeddings WHERE model = ? AND chunk_hash IN ({marks})",
+                            [self.model, *part],
+                        ).fetchall()
+                    )
+                dim = self.dim
+                if dim is None and found:
+                    dims = [row[1] for row in found]
+                    dim = max(set(dims), key=dims.count)
+                found = [row for row in found if row[1] == dim]
+                if found and dim:
+                    vectors = _read_rows(_vector_file(self.root, self.model, dim), dim, [row[2] for row in found])
+                    if vectors is not None:
+                        out = {row[0]: vectors[i] for i, row in enumerate(found)}
+                        with self._lock:
+                            self.dim = dim
+                        now = time.time()
+                        conn.executemany(
+                            "UPDATE embeddings SET last_used = ? WHERE model = ? AND dim = ? AND chunk_hash = ?",
+                            [(now, self.model, dim, key) for key in out],
+                        )
+                _bump_counters(conn, len(out), len(wanted) - len(out))
+        return out
+
+    def store(self, keys: list[str], vectors: Any) -> int:
+        """Append vectors for keys not cached yet. Returns how many rows were written."""
+        arr = np.asarray(vectors, dtype=np.float32)
+        if arr.ndim != 2 or arr.shape[0] != len(keys) or not arr.shape[1]:
+            return 0
+        dim = int(arr.shape[1])
+        with self._lock:
+            self.dim = dim
+        picked: dict[str, int] = {}
+        for idx, key in enumerate(keys):
+            if key and key not in picked:
+                picked[key] = idx
+        if not picked:
+            return 0
+        written = 0
+        with _cache_conn(self.root) as conn:
+            assert conn is not None
+            with immediate_txn(conn):
+                existing: set[str] = set()
+                wanted = list(picked)
+                for i in range(0, len(wanted), _SQL_IN_CHUNK):
+                    part = wanted[i : i + _SQL_IN_CHUNK]
+                    marks = ",".join("?" * len(part))
+                    existing.update(
+                        row[0]
+                        for row in conn.execute(
+                            f"SELECT chunk_hash FROM embeddings WHERE model = ? AND dim = ? AND chunk_hash IN ({marks})",
+                            [self.model, dim, *part],
+                        )
+                    )
+                fresh = [(key, idx) for key, idx in picked.items() if key not in existing]
+                if fresh:
+                    first = _append_rows(
+                        _vector_file(self.root, self.model, dim),
+                        arr[[idx for _key, idx in fresh]],
+                    )
+                    now = time.time()
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings(model, dim, chunk_hash, slot, last_used) VALUES (?, ?, ?, ?, ?)",
+                        [(self.model, dim, key, first + n, now) for n, (key, _idx) in enumerate(fresh)],
+                    )
+                    written = len(fresh)
+        if written and self.max_bytes and _vector_bytes(self.root) > self.max_bytes:
+            prune_embedding_cache_dir(self.root, max_bytes=int(self.max_bytes * _PRUNE_HEADROOM))
+        return written
+
+    def embed(self, docs: list[str], embedding_fn: Callable[[list[str]], Any]) -> list[Any]:
+        """Embed docs, computing only the ones not already cached. Cache I/O errors
+        fall back to embedding everything; they never fail the ingest."""
+        keys = [text_key(doc) for doc in docs]
+        try:
+            cached = self.lookup(keys)
+        except (sqlite3.Error, OSError, ValueError):
+            cached = {}
+        miss_idx = [i for i, key in enumerate(keys) if key not in cached]
+        with self._lock:
+            self.hits += len(docs) - len(miss_idx)
+            self.misses += len(miss_idx)
+        if not miss_idx:
+            return [cached[key] for key in keys]
+        computed = embedding_fn([docs[i] for i in miss_idx])
+        arr = np.asarray(computed, dtype=np.float32)
+        if cached and (arr.ndim != 2 or arr.shape[1] != len(next(iter(cached.values())))):
+            # Same model name, different output width: the cached rows are stale.
+            return list(embedding_fn(docs))
+        try:
+            self.store([keys[i] for i in miss_idx], arr)
+        except (sqlite3.Error, OSError, ValueError):
+            pass
+        out: list[Any] = [cached.get(key) for key in keys]
+        for n, i in enumerate(miss_idx):
+            out[i] = computed[n]
+        return out
+
+
+def open_embedding_cache(db_path: str | Path, embedding_fn: Any | None) -> EmbeddingCache | None:
+    """Cache for the model behind ``embedding_fn``, or None when disabled or there is no ef."""
+    if embedding_fn is None or not embedding_cache_enabled():
+        return None
+    from embeddings import embedding_model_id
+
+    return EmbeddingCache(_cache_dir(db_path), embedding_model_id(embedding_fn))
+
+
+def _vector_bytes(root: Path) -> int:
+    total = 0
+    try:
+        for p in root.glob("*.f32"):
+            try:
+                total += p.stat().st_size
+            except OSError:
+                pass
+    except OSError:
+        pass
+    return total
+
+
+def _compact(conn: sqlite3.Connection, root: Path) -> None:
+    """Rewrite each vector file with only its live rows, renumbering slots.
+    Files with no live rows (or for evicted models) are removed."""
+    keep: set[Path] = set()
+    for model, dim in conn.execute("SELECT DISTINCT model, dim FROM embeddings").fetchall():
+        path = _vector_file(root, model, dim)
+        rows = conn.execute(
+            "SELECT chunk_hash, slot FROM embeddings WHERE model = ? AND dim = ? ORDER BY slot",
+            (model, dim),
+        ).fetchall()
+        row_bytes = 4 * dim
+        try:
+            available = path.stat().st_size // row_bytes
+        except OSError:
+            available = 0
+        dangling = [key for key, slot in rows if slot >= available]
+        if dangling:
+            conn.executemany(
+                "DELETE FROM embeddings WHERE model = ? AND dim = ? AND chunk_hash = ?",
+                [(model, dim, key) for key in dangling],
+            )
+            rows = [(key, slot) for key, slot in rows if slot < available]
+        if not rows:
+            continue
+        keep.add(path)
+        if len(rows) == available and rows[-1][1] == available - 1:
+            continue
+        tmp = path.with_suffix(".f32.tmp")
+        mm = np.memmap(path, dtype=np.float32, mode="r", shape=(available, dim))
+        try:
+            with open(tmp, "wb") as out:
+                for i in range(0, len(rows), _COMPACT_ROWS):
+                    part = [slot for _key, slot in rows[i : i + _COMPACT_ROWS]]
+                    out.write(np.ascontiguousarray(mm[np.asarray(part, dtype=np.int64)]).tobytes())
+                out.flush()
+                os.fsync(out.fileno())
+        finally:
+            del mm
+        os.replace(tmp, path)
+        conn.executemany(
+            "UPDATE embeddings SET slot = ? WHERE model = ? AND dim = ? AND chunk_hash = ?",
+            [(n, model, dim, key) for n, (key, _slot) in enumerate(rows)],
+        )
+    for p in root.glob("*.f32"):
+        if p not in keep:
+            try:
+                p.unlink()
+            except OSError:
+                pass
+
+
+def prune_embedding_cache_dir(
+    root: Path,
+    *,
+    max_bytes: int | None = None,
+    model: str | None = None,
+    clear: bool = False,
+) -> dict[str, Any]:
+    """Evict least recently used rows until live vectors fit in ``max_bytes``, then compact.
+
+    ``model`` limits eviction to one model; ``clear`` drops every row in scope.
+    """
+    root = Path(root)
+    before = _vector_bytes(root)
+    removed = 0
+    with _cache_conn(root, create=False) as conn:
+        if conn is None:
+            return {"removed": 0, "bytes_before": before, "bytes_after": before}
+        with immediate_txn(conn):
+            scope, params = ("WHERE model = ?", [model]) if model else ("", [])
+            if clear:
+                removed = conn.execute(f"DELETE FROM embeddings {scope}", params).rowcount
+            elif max_bytes is not None:
+                removed = conn.execute(
+                    "DELETE FROM embeddings WHERE rowid IN ("
+                    " SELECT rowid FROM ("
+                    "  SELECT rowid, SUM(dim * 4) OVER (ORDER BY last_used DESC, rowid DESC) AS running"
+                    f"  FROM embeddings {scope}"
+                    " ) WHERE running > ?"
+                    ")",
+                    [*params, max(0, int(max_bytes))],
+                ).rowcount
+            _compact(conn, root)
+    return {"removed": max(0, removed), "bytes_before": before, "bytes_after": _vector_bytes(root)}
+
+
+def prune_embedding_cache(
+    db_path: str | Path,
+    *,
+    max_bytes: int | None = None,
+    model: str | None = None,
+    clear: bool = False,
+) -> dict[str, Any]:
+    """Prune the cache under ``db_path`` (default cap: LLMLIBRARIAN_EMBED_CACHE_MAX_MB)."""
+    if max_bytes is None and not clear:
+        max_bytes = embedding_cache_max_bytes()
+    return prune_embedding_cache_dir(_cache_dir(db_path), max_bytes=max_bytes, model=model, clear=clear)
+
+
+def embedding_cache_stats(db_path: str | Path) -> dict[str, Any]:
+    """Entry counts, bytes on disk, and lifetime hit/miss counters."""
+    root = _cache_dir(db_path)
+    stats: dict[str, Any] = {
+        "path": str(root),
+        "enabled": embedding_cache_enabled(),
+        "max_bytes": embedding_cache_max_bytes(),
+        "bytes": _vector_bytes(root),
+        "entries": 0,
+        "hits": 0,
+        "misses": 0,
+        "models": [],
+    }
+    with _cache_conn(root, create=False) as conn:
+        if conn is None:
+            return stats
+        for model, dim, count in conn.execute(
+            "SELECT model, dim, COUNT(*) FROM embeddings GROUP BY model, dim ORDER BY model, dim"
+        ):
+            stats["models"].append({"model": model, "dim": dim, "entries": count, "live_bytes": count * dim * 4})
+            stats["entries"] += count
+        for name, value in conn.execute("SELECT name, value FROM counters"):
+            if name in ("hits", "misses"):
+                stats[name] = int(value)
+    return stats
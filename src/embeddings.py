@@ -18,9 +18,12 @@ Other env vars:
   - LLMLIBRARIAN_LARGE_INGEST_FILE_THRESHOLD -> during `add`/`pull`, if the file list is at least this
     many entries and auto device would be MPS, pin embeddings to CPU so parallel workers (default 8)
     are safe. Set to 0 to disable. Default: 400.
+  - LLMLIBRARIAN_QUERY_EMBED_CACHE_SIZE -> entries in the in-process query embedding LRU used by
+                                        embed_query (default: 512; 0 disables)
 """
 import os
 import threading
+from collections import OrderedDict
 from typing import Any
 
 # Empirically measured crossover on Apple M-series: MPS beats CPU at ~24+ texts per batch.
@@ -33,6 +36,14 @@ _DEFAULT_MPS_THRESHOLD = 24
 _ef_cache: dict[tuple, Any] = {}
 _ef_cache_lock = threading.Lock()
 
+# Query embeddings keyed by (model id, normalized query text). Agents re-ask
+# near-identical questions and fan one question out into sub-queries; a hit
+# skips the encoder entirely.
+_DEFAULT_QUERY_CACHE_SIZE = 512
+_query_cache: "OrderedDict[tuple[str, str], list[float]]" = OrderedDict()
+_query_cache_lock = threading.Lock()
+_query_cache_stats = {"hits": 0, "misses": 0}
+
 
 def _mps_threshold() -> int:
     try:
@@ -142,6 +153,101 @@ def get_embedding_function(batch_size: int | None = None, device: str | None = N
         return ef
 
 
+def embedding_model_id(ef: Any) -> str:
+    """Stable name for the model behind `ef` (e.g. "sentence_transformer:all-mpnet-base-v2").
+
+    Used as the embedding cache key, so it must change whenever the vectors would.
+    """
+    kind = ""
+    name_fn = getattr(ef, "name", None)
+    if callable(name_fn):
+        try:
+            kind = str(name_fn() or "")
+        except Exception:
+            kind = ""
+    model = getattr(ef, "model_name", None) or getattr(ef, "MODEL_NAME", None)
+    if not isinstance(model, str) or not model:
+        model = type(ef).__name__
+    ident = f"{kind}:{model}" if kind and kind != model else model
+    if getattr(ef, "normalize_embeddings", False) is True:
+        ident += "+norm"
+    return ident
+
+
+def _query_cache_size() -> int:
+    try:
+        return max(0, int(os.environ.get("LLMLIBRARIAN_QUERY_EMBED_CACHE_SIZE", _DEFAULT_QUERY_CACHE_SIZE)))
+    except (TypeError, ValueError):
+        return _DEFAULT_QUERY_CACHE_SIZE
+
+
+def _normalize_query(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def embed_query(text: str, ef: Any | None = None) -> list[float]:
+    """Embedding for one (already expanded) query string, served from an LRU when seen before.
+
+    Pass the collection's ef so the vector matches what the collection was built with;
+    the cache key includes embedding_model_id(ef), so switching models never returns
+    a stale vector.
+    """
+    return embed_queries([text], ef)[0]
+
+
+def embed_queries(texts: list[str], ef: Any | None = None) -> list[list[float]]:
+    """Batch form of embed_query: cache hits are served from the LRU and every miss
+    goes through a single ef call."""
+    if ef is None:
+        ef = get_embedding_function(batch_size=max(1, len(texts)))
+    model_id = embedding_model_id(ef)
+    normalized = [_normalize_query(t) for t in texts]
+    size = _query_cache_size()
+    out: list[list[float] | None] = [None] * len(texts)
+    if size:
+        with _query_cache_lock:
+            for i, norm in enumerate(normalized):
+                cached = _query_cache.get((model_id, norm))
+                if cached is not None:
+                    _query_cache.move_to_end((model_id, norm))
+                    _query_cache_stats["hits"] += 1
+                    out[i] = cached
+    missing = list(dict.fromkeys(norm for i, norm in enumerate(normalized) if out[i] is None))
+    if missing:
+        vectors = [[float(x) for x in row] for row in ef(missing)]
+        if len(vectors) != len(missing) or any(not v for v in vectors):
+            raise ValueError("embedding function returned an empty vector")
+        fresh = dict(zip(missing, vectors))
+        with _query_cache_lock:
+            _query_cache_stats["misses"] += len(missing)
+            if size:
+                for norm, vector in fresh.items():
+                    _query_cache[(model_id, norm)] = vector
+                while len(_query_cache) > size:
+                    _query_cache.popitem(last=False)
+        for i, norm in enumerate(normalized):
+            if out[i] is None:
+                out[i] = fresh[norm]
+    return [v for v in out if v is not None]
+
+
+def query_embedding_cache_info() -> dict[str, int]:
+    with _query_cache_lock:
+        return {
+            "size": len(_query_cache),
+            "max_size": _query_cache_size(),
+            "hits": _query_cache_stats["hits"],
+            "misses": _query_cache_stats["misses"],
+        }
+
+
+def warm_embedding_function() -> None:
+    """Load the query-time embedding model and run one encode, so the first real
+    query does not pay the model load. Bypasses the query cache."""
+    ef = get_embedding_function(batch_size=1)
+    ef(["warmup"])
+
+
 def validate_embedding_dimension(collection: Any, ef: Any) -> None:
     """Raise a clear error if `ef` would produce vectors of a different
     dimension than what's already stored in `collection`.
@@ -193,6 +299,10 @@ def validate_embedding_dimension(collection: Any, ef: Any) -> None:
 
 
 def _reset_ef_cache_for_tests() -> None:
-    """Drop the cached embedding functions. Test-only helper."""
+    """Drop the cached embedding functions and query embeddings. Test-only helper."""
     with _ef_cache_lock:
         _ef_cache.clear()
+    with _query_cache_lock:
+        _query_cache.clear()
+        _query_cache_stats["hits"] = 0
+        _query_cache_stats["misses"] = 0
@@ -1,49 +1,58 @@
 """
 File manifest state and derived file registry indexes.
 
-``llmli_file_manifest.json`` is the source of truth for indexed files. The
-legacy hash registry shape (``{"by_hash": ...}``) is derived from the manifest
-for callers that need fast content-hash lookup.
+The manifest lives in ``llmli_file_manifest.sqlite3`` (WAL): one row per
+indexed file keyed by (silo, path), with indexed ``hash`` and ``name_date``
+columns and the full entry as JSON. Single-file updates are row upserts rather
+than a rewrite of every silo. The dict shape (``{"silos": {slug: {"path",
+"files": {path: entry}}}}``) is still what ``_read_file_manifest`` returns and
+what ``_update_file_manifest`` callbacks mutate.
+
+``llmli_file_manifest.json`` is the legacy form. When one is present (first run
+after upgrade, an older llmli process, a restored backup) it replaces the store
+and is renamed to ``.migrated``. ``export_file_manifest_json`` writes the same
+shape for external readers.
+
+Each call opens the store (the schema runs once per process) unless a
+``manifest_session`` is active on the thread; then the session's one
+connection is reused, since an ingest pass makes several manifest calls per file.
+
+The legacy hash registry shape (``{"by_hash": ...}``) is answered from the
+``hash`` index for callers that need fast content-hash lookup.
 """
 import json
 import os
+import sqlite3
 import sys
 import tempfile
-from contextlib import contextmanager
+import threading
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Any, Iterator
-
-try:
-    import fcntl  # type: ignore[import-not-found]
-except ImportError:
-    fcntl = None  # type: ignore[assignment]
-
-_derived_registry_cache: dict[str, tuple[int, int, dict]] = {}
+from typing import Any, Iterable, Iterator
+
+from sqlite_store import connect_store, immediate_txn
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS manifest_silos (
+    silo TEXT PRIMARY KEY,
+    path TEXT NOT NULL DEFAULT '',
+    extra TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS manifest_files (
+    silo TEXT NOT NULL,
+    path TEXT NOT NULL,
+    hash TEXT NOT NULL DEFAULT '',
+    name_date TEXT,
+    entry TEXT NOT NULL,
+    PRIMARY KEY (silo, path)
+);
+CREATE INDEX IF NOT EXISTS idx_manifest_files_hash ON manifest_files(hash);
+CREATE INDEX IF NOT EXISTS idx_manifest_files_name_date ON manifest_files(name_date);
+"""
 
 
 # --- Low-level helpers ---
 
-def _registry_lock_path(registry_path: Path) -> Path:
-    if registry_path.suffix:
-        return registry_path.with_suffix(registry_path.suffix + ".lock")
-    return registry_path.with_name(registry_path.name + ".lock")
-
-
-@contextmanager
-def _registry_lock(registry_path: Path) -> Iterator[None]:
-    if fcntl is None:
-        yield
-        return
-    lock_path = _registry_lock_path(registry_path)
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(lock_path, "a", encoding="utf-8") as lock_file:
-        fcntl.flock(lock_file, fcntl.LOCK_EX)
-        try:
-            yield
-        finally:
-            fcntl.flock(lock_file, fcntl.LOCK_UN)
-
-
 def _atomic_write_json(path: Path, data: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path: Path | None = None
@@ -65,44 +74,422 @@ def _atomic_write_json(path: Path, data: dict) -> None:
 # --- File manifest (per-silo file mtime/size tracking) ---
 
 def _file_manifest_path(db_path: str | Path) -> Path:
+    """Legacy JSON manifest; imported into the store when present."""
     p = Path(db_path).resolve()
     if p.is_dir():
         return p / "llmli_file_manifest.json"
     return p.parent / "llmli_file_manifest.json"
 
 
-def _read_file_manifest(db_path: str | Path) -> dict:
-    path = _file_manifest_path(db_path)
-    if not path.exists():
-        return {"silos": {}}
+def _file_manifest_db_path(db_path: str | Path) -> Path:
+    p = Path(db_path).resolve()
+    if p.is_dir():
+        return p / "llmli_file_manifest.sqlite3"
+    return p.parent / "llmli_file_manifest.sqlite3"
+
+
+def _entry_row(silo: str, path_str: str, meta: dict[str, Any]) -> tuple[str, str, str, str | None, str]:
+    name_date = meta.get("name_date")
+    return (
+        silo,
+        path_str,
+        str(meta.get("hash") or ""),
+        name_date if isinstance(name_date, str) and name_date else None,
+        json.dumps(meta, ensure_ascii=False),
+    )
+
+
+def _replace_all(conn: sqlite3.Connection, manifest: dict) -> None:
+    conn.execute("DELETE FROM manifest_files")
+    conn.execute("DELETE FROM manifest_silos")
+    silos = manifest.get("silos") or {}
+    if not isinstance(silos, dict):
+        return
+    for silo, silo_entry in silos.items():
+        if not isinstance(silo_entry, dict):
+            continue
+        _upsert_silo_row(conn, str(silo), silo_entry)
+        files = silo_entry.get("files") or {}
+        if not isinstance(files, dict):
+            continue
+        conn.executemany(
+            "INSERT OR REPLACE INTO manifest_files (silo, path, hash, name_date, entry) VALUES (?, ?, ?, ?, ?)",
+            [_entry_row(str(silo), str(p), meta) for p, meta in files.items() if isinstance(meta, dict)],
+        )
+
+
+def _upsert_silo_row(conn: sqlite3.Connection, silo: str, silo_entry: dict[str, Any]) -> None:
+    extra = {k: v for k, v in silo_entry.items() if k not in ("path", "files")}
+    conn.execute(
+        "INSERT INTO manifest_silos (silo, path, extra) VALUES (?, ?, ?) "
+        "ON CONFLICT(silo) DO UPDATE SET path = excluded.path, extra = excluded.extra",
+        (silo, str(silo_entry.get("path") or ""), json.dumps(extra, ensure_ascii=False)),
+    )
+
+
+def _import_legacy_json(conn: sqlite3.Connection, json_path: Path) -> None:
+    """Replace the store with a JSON manifest found on disk, then retire the file.
+
+    Renaming it to ``.migrated`` keeps a copy for rollback without leaving a stale
+    file that would be imported again; a new JSON file only appears when an older
+    llmli (or a restore) writes one, and that write is the newer state.
+    """
+    if not json_path.exists():
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            conn.execute("ROLLBACK")
+            return
+        except Exception as e:
+            conn.execute("ROLLBACK")
+            print(f"[llmli] file manifest read failed: {json_path}: {e}; keeping store.", file=sys.stderr)
+            return
+        if isinstance(data, dict) and "silos" in data:
+            _replace_all(conn, data)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if not isinstance(data, dict) or "silos" not in data:
+        os.replace(json_path, json_path.with_name(json_path.name + ".migrated"))
+    except OSError:
+        pass
+
+
+class _ManifestSession:
+    def __init__(self, stack: ExitStack) -> None:
+        self.stack = stack
+        self.conn: sqlite3.Connection | None = None
+
+
+_sessions = threading.local()
+
+
+@contextmanager
+def manifest_session(db_path: str | Path) -> Iterator[None]:
+    """Reuse one manifest connection for every manifest call this thread makes
+    until exit. The connection opens on first use; nested sessions share it."""
+    store = str(_file_manifest_db_path(db_path))
+    active: dict[str, _ManifestSession] = _sessions.__dict__.setdefault("active", {})
+    if store in active:
+        yield
+        return
+    with ExitStack() as stack:
+        active[store] = _ManifestSession(stack)
+        try:
+            yield
+        finally:
+            active.pop(store, None)
+
+
+@contextmanager
+def _manifest_conn(db_path: str | Path, *, create: bool = True) -> Iterator[sqlite3.Connection | None]:
+    """Open the manifest store (WAL, autocommit off), or reuse the thread's
+    ``manifest_session`` connection. Yields None when it does not exist yet,
+    there is no legacy JSON to import, and ``create`` is False.
+
+    The legacy JSON check stays on every call (one stat): an older llmli
+    process may write that file while this one runs."""
+    store = _file_manifest_db_path(db_path)
+    json_path = _file_manifest_path(db_path)
+    session = getattr(_sessions, "active", {}).get(str(store))
+    conn = session.conn if session is not None else None
+    if conn is None:
+        if not store.exists() and not create and not json_path.exists():
+            yield None
+            return
+        if session is None:
+            with connect_store(store, _SCHEMA) as conn:
+                _import_legacy_json(conn, json_path)
+                yield conn
+            return
+        conn = session.conn = session.stack.enter_context(connect_store(store, _SCHEMA))
+    _import_legacy_json(conn, json_path)
+    yield conn
+
+
+def _silo_entry_from_row(path: str, extra: str) -> dict[str, Any]:
+    entry: dict[str, Any] = {"path": path}
+    try:
+        loaded = json.loads(extra or "{}")
+        if isinstance(loaded, dict):
+            entry.update(loaded)
+    except ValueError:
+        pass
+    entry["files"] = {}
+    return entry
+
+
+def _read_file_manifest(db_path: str | Path, silos: Iterable[str] | None = None) -> dict:
+    """Return the manifest in its dict shape; ``silos`` restricts it to those slugs."""
+    wanted = None if silos is None else [str(s) for s in silos]
+    try:
+        with _manifest_conn(db_path, create=False) as conn:
+            if conn is None:
                 return {"silos": {}}
-            return data
-    except Exception as e:
-        print(f"[llmli] file manifest read failed: {path}: {e}; using empty.", file=sys.stderr)
+            return _read_manifest_conn(conn, wanted)
+    except sqlite3.Error as e:
+        print(f"[llmli] file manifest read failed: {_file_manifest_db_path(db_path)}: {e}; using empty.", file=sys.stderr)
         return {"silos": {}}
 
 
+def _read_manifest_conn(conn: sqlite3.Connection, silos: list[str] | None = None) -> dict:
+    out: dict[str, dict[str, Any]] = {}
+    silo_filter = ""
+    params: list[str] = []
+    if silos is not None:
+        if not silos:
+            return {"silos": out}
+        silo_filter = f" WHERE silo IN ({','.join('?' * len(silos))})"
+        params = silos
+    for silo, path, extra in conn.execute(
+        f"SELECT silo, path, extra FROM manifest_silos{silo_filter} ORDER BY rowid", params
+    ):
+        out[silo] = _silo_entry_from_row(path, extra)
+    for silo, path_str, entry in conn.execute(
+        f"SELECT silo, path, entry FROM manifest_files{silo_filter} ORDER BY rowid", params
+    ):
+        silo_entry = out.setdefault(silo, {"path": "", "files": {}})
+        try:
+            silo_entry["files"][path_str] = json.loads(entry)
+        except ValueError:
+            continue
+    return {"silos": out}
+
+
 def _write_file_manifest(db_path: str | Path, data: dict) -> None:
-    path = _file_manifest_path(db_path)
+    """Replace the whole manifest with ``data``."""
     try:
-        _atomic_write_json(path, data)
-        _derived_registry_cache.pop(str(path), None)
+        with _manifest_conn(db_path) as conn:
+            assert conn is not None
+            with conn:
+                _replace_all(conn, data)
     except Exception as e:
-        print(f"[llmli] file manifest write failed: {path}: {e}", file=sys.stderr)
+        print(f"[llmli] file manifest write failed: {_file_manifest_db_path(db_path)}: {e}", file=sys.stderr)
         raise
     _retire_legacy_registry(db_path)
 
 
-def _update_file_manifest(db_path: str | Path, update_fn: Any) -> None:
-    path = _file_manifest_path(db_path)
-    with _registry_lock(path):
-        manifest = _read_file_manifest(db_path)
-        update_fn(manifest)
-        _write_file_manifest(db_path, manifest)
+def _update_file_manifest(db_path: str | Path, update_fn: Any, silos: Iterable[str] | None = None) -> None:
+    """Read-modify-write under one IMMEDIATE transaction; only changed rows are written.
+
+    With ``silos``, ``update_fn`` sees (and may change) only those silos; the rest
+    of the manifest is neither read nor touched.
+    """
+    scope = None if silos is None else [str(s) for s in silos]
+    with _manifest_conn(db_path) as conn:
+        assert conn is not None
+        with immediate_txn(conn):
+            manifest = _read_manifest_conn(conn, scope)
+            before = {
+                (silo, path_str): json.dumps(meta, ensure_ascii=False)
+                for silo, silo_entry in manifest["silos"].items()
+                for path_str, meta in silo_entry["files"].items()
+            }
+            update_fn(manifest)
+            _apply_manifest_diff(conn, before, manifest, scope)
+    _retire_legacy_registry(db_path)
+
+
+def _apply_manifest_diff(
+    conn: sqlite3.Connection,
+    before: dict[tuple[str, str], str],
+    manifest: dict,
+    scope: list[str] | None = None,
+) -> None:
+    silos = manifest.get("silos") or {}
+    if not isinstance(silos, dict):
+        silos = {}
+    if scope is not None:
+        silos = {k: v for k, v in silos.items() if str(k) in scope}
+    kept_silos: list[str] = []
+    seen: set[tuple[str, str]] = set()
+    upserts: list[tuple[str, str, str, str | None, str]] = []
+    for silo, silo_entry in silos.items():
+        if not isinstance(silo_entry, dict):
+            continue
+        silo = str(silo)
+        kept_silos.append(silo)
+        _upsert_silo_row(conn, silo, silo_entry)
+        files = silo_entry.get("files") or {}
+        if not isinstance(files, dict):
+            continue
+        for path_str, meta in files.items():
+            if not isinstance(meta, dict):
+                continue
+            row = _entry_row(silo, str(path_str), meta)
+            seen.add((silo, row[1]))
+            if before.get((silo, row[1])) != row[4]:
+                upserts.append(row)
+    if upserts:
+        conn.executemany(
+            "INSERT INTO manifest_files (silo, path, hash, name_date, entry) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(silo, path) DO UPDATE SET hash = excluded.hash, name_date = excluded.name_date, "
+            "entry = excluded.entry",
+            upserts,
+        )
+    removed = [key for key in before if key not in seen]
+    if removed:
+        conn.executemany("DELETE FROM manifest_files WHERE silo = ? AND path = ?", removed)
+    dropped = [s for s in (scope if scope is not None else _all_silos(conn)) if s not in kept_silos]
+    if dropped:
+        conn.executemany("DELETE FROM manifest_silos WHERE silo = ?", [(s,) for s in dropped])
+
+
+def _all_silos(conn: sqlite3.Connection) -> list[str]:
+    return [row[0] for row in conn.execute("SELECT silo FROM manifest_silos")]
+
+
+# --- Row-level manifest access (O(1) per file) ---
+
+def _ensure_silo_row(conn: sqlite3.Connection, silo: str, silo_path: str | None) -> None:
+    """Create the silo row if missing; fill its root path only when still empty."""
+    conn.execute(
+        "INSERT INTO manifest_silos (silo, path) VALUES (?, ?) "
+        "ON CONFLICT(silo) DO UPDATE SET path = excluded.path "
+        "WHERE manifest_silos.path = '' AND excluded.path != ''",
+        (silo, silo_path or ""),
+    )
+
+
+def _get_manifest_file(db_path: str | Path, silo: str, path_str: str) -> dict[str, Any] | None:
+    with _manifest_conn(db_path, create=False) as conn:
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT entry FROM manifest_files WHERE silo = ? AND path = ?", (silo, path_str)
+        ).fetchone()
+    if not row:
+        return None
+    try:
+        entry = json.loads(row[0])
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _get_manifest_files(db_path: str | Path, silo: str, paths: Iterable[str]) -> dict[str, dict[str, Any]]:
+    """Entries for the given paths of ``silo`` (missing paths are left out)."""
+    wanted = list(dict.fromkeys(str(p) for p in paths))
+    out: dict[str, dict[str, Any]] = {}
+    if not wanted:
+        return out
+    with _manifest_conn(db_path, create=False) as conn:
+        if conn is None:
+            return out
+        for i in range(0, len(wanted), 500):
+            part = wanted[i:i + 500]
+            for path_str, entry in conn.execute(
+                f"SELECT path, entry FROM manifest_files WHERE silo = ? AND path IN ({','.join('?' * len(part))})",
+                [silo, *part],
+            ):
+                try:
+                    loaded = json.loads(entry)
+                except ValueError:
+                    continue
+                if isinstance(loaded, dict):
+                    out[path_str] = loaded
+    return out
+
+
+def _apply_manifest_file_changes(
+    db_path: str | Path,
+    silo: str,
+    *,
+    upserts: dict[str, dict[str, Any]],
+    deletes: Iterable[str] = (),
+    silo_path: str | None = None,
+) -> None:
+    """Upsert and delete many entries of one silo in a single transaction."""
+    delete_keys = [(silo, str(p)) for p in deletes]
+    with _manifest_conn(db_path) as conn:
+        assert conn is not None
+        with conn:
+            _ensure_silo_row(conn, silo, silo_path)
+            if upserts:
+                conn.executemany(
+                    "INSERT INTO manifest_files (silo, path, hash, name_date, entry) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(silo, path) DO UPDATE SET hash = excluded.hash, name_date = excluded.name_date, "
+                    "entry = excluded.entry",
+                    [_entry_row(silo, path_str, entry) for path_str, entry in upserts.items()],
+                )
+            if delete_keys:
+                conn.executemany("DELETE FROM manifest_files WHERE silo = ? AND path = ?", delete_keys)
+
+
+def _upsert_manifest_file(
+    db_path: str | Path,
+    silo: str,
+    path_str: str,
+    entry: dict[str, Any],
+    *,
+    silo_path: str | None = None,
+) -> None:
+    """Insert or replace one file entry; creates the silo row if it is new."""
+    with _manifest_conn(db_path) as conn:
+        assert conn is not None
+        with conn:
+            _ensure_silo_row(conn, silo, silo_path)
+            conn.execute(
+                "INSERT INTO manifest_files (silo, path, hash, name_date, entry) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(silo, path) DO UPDATE SET hash = excluded.hash, name_date = excluded.name_date, "
+                "entry = excluded.entry",
+                _entry_row(silo, path_str, entry),
+            )
+
+
+def _delete_manifest_files(
+    db_path: str | Path,
+    silo: str,
+    paths: Iterable[str],
+    *,
+    silo_path: str | None = None,
+) -> int:
+    """Delete file entries for ``silo``; returns how many rows existed."""
+    keys = [(silo, str(p)) for p in paths]
+    if not keys:
+        return 0
+    with _manifest_conn(db_path) as conn:
+        assert conn is not None
+        with conn:
+            if silo_path is not None:
+                _ensure_silo_row(conn, silo, silo_path)
+            before = conn.total_changes
+            conn.executemany("DELETE FROM manifest_files WHERE silo = ? AND path = ?", keys)
+            return conn.total_changes - before
+
+
+def _remove_manifest_silo(db_path: str | Path, silo: str) -> None:
+    with _manifest_conn(db_path, create=False) as conn:
+        if conn is None:
+            return
+        with conn:
+            conn.execute("DELETE FROM manifest_files WHERE silo = ?", (silo,))
+            conn.execute("DELETE FROM manifest_silos WHERE silo = ?", (silo,))
+
+
+def _file_manifest_export_path(db_path: str | Path) -> Path:
+    p = Path(db_path).resolve()
+    if p.is_dir():
+        return p / "llmli_file_manifest.export.json"
+    return p.parent / "llmli_file_manifest.export.json"
+
+
+def export_file_manifest_json(db_path: str | Path, dest: str | Path | None = None) -> Path:
+    """Write the manifest in the legacy JSON shape for external readers.
+
+    The default target is ``llmli_file_manifest.export.json``: a file named
+    ``llmli_file_manifest.json`` would be taken for a legacy write and imported.
+    """
+    target = Path(dest).resolve() if dest is not None else _file_manifest_export_path(db_path)
+    with _manifest_conn(db_path) as conn:
+        assert conn is not None
+        _atomic_write_json(target, _read_manifest_conn(conn))
+    return target
 
 
 def manifest_file_entry(
@@ -177,50 +564,61 @@ def _registry_from_manifest(manifest: dict) -> dict:
     return {"by_hash": by_hash}
 
 
-def _manifest_cache_key(path: Path) -> tuple[int, int]:
-    try:
-        st = path.stat()
-    except OSError:
-        return (0, 0)
-    return (st.st_mtime_ns, st.st_size)
-
-
 def _read_file_registry(db_path: str | Path) -> dict:
-    """Return the legacy registry shape, derived from the file manifest."""
-    manifest_path = _file_manifest_path(db_path)
-    cache_key = _manifest_cache_key(manifest_path)
-    path_key = str(manifest_path)
-    cached = _derived_registry_cache.get(path_key)
-    if cached and cached[0] == cache_key[0] and cached[1] == cache_key[1]:
-        return cached[2]
-    reg = _registry_from_manifest(_read_file_manifest(db_path))
-    _derived_registry_cache[path_key] = (cache_key[0], cache_key[1], reg)
-    return reg
+    """Return the legacy registry shape, read from the manifest's hash column."""
+    by_hash: dict[str, list[dict[str, str]]] = {}
+    with _manifest_conn(db_path, create=False) as conn:
+        if conn is None:
+            return {"by_hash": by_hash}
+        for file_hash, silo, path_str in conn.execute(
+            "SELECT hash, silo, path FROM manifest_files WHERE hash != '' ORDER BY rowid"
+        ):
+            by_hash.setdefault(file_hash, []).append({"silo": silo, "path": path_str})
+    return {"by_hash": by_hash}
 
 
 def _file_registry_get(db_path: str | Path, file_hash: str) -> list[dict]:
     """Return list of {silo, path} that have indexed this hash.
 
-    This is the one lookup the derived index exists for: "is this content
-    already indexed anywhere?", which the manifest cannot answer without a full
-    scan. Everything else reads the manifest directly.
+    This is the one lookup the hash index exists for: "is this content
+    already indexed anywhere?" — an indexed query rather than a manifest scan.
     """
-    reg = _read_file_registry(db_path)
-    return list(reg.get("by_hash", {}).get(file_hash, []))
+    if not file_hash:
+        return []
+    with _manifest_conn(db_path, create=False) as conn:
+        if conn is None:
+            return []
+        rows = conn.execute(
+            "SELECT silo, path FROM manifest_files WHERE hash = ? ORDER BY rowid", (file_hash,)
+        ).fetchall()
+    return [{"silo": silo, "path": path_str} for silo, path_str in rows]
+
+
+def sample_paths_by_silo(db_path: str | Path, limit: int) -> dict[str, list[str]]:
+    """First ``limit`` paths per silo in path order, read off the (silo, path) key."""
+    out: dict[str, list[str]] = {}
+    with _manifest_conn(db_path, create=False) as conn:
+        if conn is None:
+            return out
+        for silo, path_str in conn.execute(
+            "SELECT silo, path FROM ("
+            " SELECT silo, path, ROW_NUMBER() OVER (PARTITION BY silo ORDER BY path) AS rn"
+            " FROM manifest_files"
+            ") WHERE rn <= ? ORDER BY silo, path",
+            (int(limit),),
+        ):
+            out.setdefault(silo, []).append(path_str)
+    return out
 
 
 def get_paths_by_silo(db_path: str | Path) -> dict[str, set[str]]:
     """Build catalog: silo -> set of indexed paths from the manifest."""
-    manifest = _read_file_manifest(db_path)
-    silos = manifest.get("silos") or {}
     by_silo: dict[str, set[str]] = {}
-    if not isinstance(silos, dict):
-        return by_silo
-    for silo, silo_entry in silos.items():
-        if not isinstance(silo_entry, dict):
-            continue
-        files = silo_entry.get("files") or {}
-        if not isinstance(files, dict):
-            continue
-        by_silo.setdefault(str(silo), set()).update(str(path_str) for path_str in files.keys())
+    with _manifest_conn(db_path, create=False) as conn:
+        if conn is None:
+            return by_silo
+        for (silo,) in conn.execute("SELECT silo FROM manifest_silos ORDER BY rowid"):
+            by_silo.setdefault(silo, set())
+        for silo, path_str in conn.execute("SELECT silo, path FROM manifest_files"):
+            by_silo.setdefault(silo, set()).add(path_str)
     return by_silo
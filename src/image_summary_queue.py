@@ -0,0 +1,271 @@
+"""
+Background queue for ingest-time image summaries.
+
+ImageProcessor used to call the vision model inline for every image whose OCR
+signal asked for an eager summary, so a file worker blocked for seconds per photo
+and, with keep_alive=0, Ollama reloaded the model each time. run_add now has the
+workers return the OCR-only placeholder (the summary chunk carries a
+``vision_summary_key``) and submits the summary here; the chunk writer writes
+that image's placeholder rows and updates them in place when the summary lands,
+so extraction runs at OCR speed and the image is searchable meanwhile.
+
+Layout under ``<db>/image_artifacts/``:
+  - ``summary_queue/<key>.json``: one file per pending job (source path and OCR
+    text), removed once the job has run. Jobs left by an interrupted run are
+    resumed when the next queue opens for the DB, one at a time and only while
+    no submitted job is pending, so a run never waits behind an earlier run's
+    backlog. Their summaries land in the cache, which query-time enrichment and
+    the next index of those images read.
+  - ``summary_cache/<key>.json``: summary and model per image content hash, so a
+    duplicate image or a re-index never summarizes the same bytes twice.
+
+While other jobs are pending the model is called with keep_alive
+LLMLIBRARIAN_VISION_KEEP_ALIVE; the job that drains the queue passes 0 so the
+model unloads as before.
+
+Env:
+  - LLMLIBRARIAN_VISION_QUEUE       -> 0 restores inline summaries in the file workers
+  - LLMLIBRARIAN_VISION_CONCURRENCY -> concurrent summary requests per DB (default: 1)
+  - LLMLIBRARIAN_VISION_KEEP_ALIVE  -> Ollama keep_alive while jobs are pending (default: 5m)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import processors
+
+QUEUE_DIRNAME = "summary_queue"
+CACHE_DIRNAME = "summary_cache"
+_ARTIFACT_DIRNAME = "image_artifacts"
+_DEFAULT_CONCURRENCY = 1
+_DEFAULT_KEEP_ALIVE = "5m"
+
+SummaryResult = tuple[str, str]
+
+_queues: dict[str, "ImageSummaryQueue"] = {}
+_queues_lock = threading.Lock()
+
+
+def vision_queue_enabled() -> bool:
+    raw = os.environ.get("LLMLIBRARIAN_VISION_QUEUE", "1").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def _vision_concurrency() -> int:
+    """Concurrent vision requests per DB (LLMLIBRARIAN_VISION_CONCURRENCY, default 1)."""
+    try:
+        return max(1, int(os.environ.get("LLMLIBRARIAN_VISION_CONCURRENCY", _DEFAULT_CONCURRENCY)))
+    except (TypeError, ValueError):
+        return _DEFAULT_CONCURRENCY
+
+
+def _vision_keep_alive() -> str | int:
+    """keep_alive while more jobs are pending (LLMLIBRARIAN_VISION_KEEP_ALIVE, default 5m); bare numbers are seconds."""
+    raw = os.environ.get("LLMLIBRARIAN_VISION_KEEP_ALIVE", "").strip()
+    if not raw:
+        return _DEFAULT_KEEP_ALIVE
+    try:
+        return int(raw)
+    except ValueError:
+        return raw
+
+
+def image_content_key(data: bytes) -> str:
+    """sha256 of the image bytes: the cache and job key."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _artifact_dir(db_path: str | Path) -> Path:
+    return Path(db_path).expanduser().resolve() / _ARTIFACT_DIRNAME
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        try:
+            tmp.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def read_cached_summary(db_path: str | Path, key: str) -> SummaryResult | None:
+    """(summary, model) cached for key under the configured vision model, or None."""
+    if not db_path or not key:
+        return None
+    record = _read_json(_artifact_dir(db_path) / CACHE_DIRNAME / f"{key}.json")
+    if not record:
+        return None
+    summary = str(record.get("summary") or "").strip()
+    model = str(record.get("vision_model") or "")
+    if not summary or model != processors._configured_vision_model():
+        return None
+    return summary, model
+
+
+def write_cached_summary(db_path: str | Path, key: str, summary: str, model: str) -> None:
+    """Best effort: a read-only or full DB directory only costs a future re-summary."""
+    if not db_path or not key or not (summary or "").strip():
+        return
+    try:
+        _write_json(
+            _artifact_dir(db_path) / CACHE_DIRNAME / f"{key}.json",
+            {"summary": summary.strip(), "vision_model": model},
+        )
+    except OSError:
+        pass
+
+
+class ImageSummaryQueue:
+    """
+    Vision summaries for one DB on a bounded thread pool.
+
+    submit() returns a Future of (summary, model): already resolved on a cache hit,
+    shared by every submit of the same key while the job is pending. A job whose
+    file changed since extraction, or whose vision call fails, raises from the
+    Future; the caller keeps the deferred placeholder for query-time enrichment.
+    Resumed jobs wait in a backlog that only runs while nothing submitted is pending.
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = str(Path(db_path).expanduser().resolve())
+        self._queue_dir = _artifact_dir(self.db_path) / QUEUE_DIRNAME
+        self._executor = ThreadPoolExecutor(max_workers=_vision_concurrency(), thread_name_prefix="llmli-vision")
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future] = {}
+        self._backlog: dict[str, tuple[str, str]] = {}
+        self._refs = 0
+
+    def submit(self, key: str, source_path: str, visible_text: str = "") -> Future:
+        with self._lock:
+            self._backlog.pop(key, None)
+            future = self._futures.get(key)
+            if future is not None:
+                return future
+        cached = read_cached_summary(self.db_path, key)
+        if cached is not None:
+            done: Future = Future()
+            done.set_result(cached)
+            return done
+        job_path = self._queue_dir / f"{key}.json"
+        _write_json(job_path, {"key": key, "source_path": source_path, "visible_text": visible_text or ""})
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._futures[key] = self._executor.submit(
+                    self._run, key, source_path, visible_text or "", job_path
+                )
+        return future
+
+    def resume_pending(self) -> int:
+        """Backlog the job files left by an interrupted run; returns how many."""
+        try:
+            job_paths = sorted(self._queue_dir.glob("*.json"))
+        except OSError:
+            return 0
+        resumed = 0
+        for job_path in job_paths:
+            job = _read_json(job_path)
+            if not job or not job.get("key") or not job.get("source_path"):
+                job_path.unlink(missing_ok=True)
+                continue
+            with self._lock:
+                if str(job["key"]) not in self._futures:
+                    self._backlog[str(job["key"])] = (str(job["source_path"]), str(job.get("visible_text") or ""))
+            resumed += 1
+        self._start_backlog()
+        return resumed
+
+    def _start_backlog(self) -> None:
+        """Start the next backlogged job if nothing submitted is pending."""
+        with self._lock:
+            if self._futures or not self._backlog:
+                return
+            key = next(iter(self._backlog))
+            source_path, visible_text = self._backlog.pop(key)
+            job_path = self._queue_dir / f"{key}.json"
+            try:
+                self._futures[key] = self._executor.submit(self._run, key, source_path, visible_text, job_path)
+            except RuntimeError:
+                pass  # shut down: the job file stays for the next run
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._futures) + len(self._backlog)
+
+    def _run(self, key: str, source_path: str, visible_text: str, job_path: Path) -> SummaryResult:
+        try:
+            data = Path(source_path).read_bytes()
+            if image_content_key(data) != key:
+                raise processors.ImageExtractionError(f"{source_path} changed since it was queued for a summary.")
+            with self._lock:
+                others = len(self._futures) - 1 + len(self._backlog)
+            keep_alive = _vision_keep_alive() if others > 0 else 0
+            summary, model = processors._summarize_image_with_vision_model(
+                data, source_path, visible_text, keep_alive=keep_alive
+            )
+            write_cached_summary(self.db_path, key, summary, model)
+            return summary, model
+        finally:
+            job_path.unlink(missing_ok=True)
+            with self._lock:
+                self._futures.pop(key, None)
+            self._start_backlog()
+
+    def close(self) -> None:
+        """Drop one reference; the last one cancels jobs not yet started (their files stay queued)."""
+        with _queues_lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            if _queues.get(self.db_path) is self:
+                del _queues[self.db_path]
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def open_image_summary_queue(db_path: str | Path) -> ImageSummaryQueue | None:
+    """
+    The DB's shared queue (None when LLMLIBRARIAN_VISION_QUEUE=0); pair with close().
+
+    Concurrent run_add calls on one DB share it, so the concurrency limit is per DB.
+    The first open backlogs the jobs an interrupted run left behind.
+    """
+    if not vision_queue_enabled():
+        return None
+    root = str(Path(db_path).expanduser().resolve())
+    with _queues_lock:
+        queue = _queues.get(root)
+        fresh = queue is None
+        if queue is None:
+            queue = _queues[root] = ImageSummaryQueue(root)
+        queue._refs += 1
+    if fresh:
+        queue.resume_pending()
+    return queue
+
+
+def _reset_image_summary_queues_for_tests() -> None:
+    """Shut down every open queue. Test-only helper."""
+    with _queues_lock:
+        queues = list(_queues.values())
+        _queues.clear()
+    for queue in queues:
+        queue._executor.shutdown(wait=True, cancel_futures=True)
+
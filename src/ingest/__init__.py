@@ -11,18 +11,24 @@ import hashlib
 import io
 import json
 import csv
+import mmap
 import os
 import re
 import shutil
 import sys
 import tempfile
+import threading
 import traceback
 import zipfile
+import zlib
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from stat import S_ISREG
+from typing import Any, Callable, Iterator
 
 # Chunk tuple: (id, document, metadata)
 ChunkTuple = tuple[str, str, dict[str, Any]]
@@ -36,6 +42,7 @@ from constants import (
     CHUNK_OVERLAP,
     ADD_BATCH_SIZE,
     MAX_WORKERS,
+    INGEST_MAX_INFLIGHT_MB,
 )
 
 from chroma_client import get_client, release as release_chroma_client, writer_client
@@ -45,18 +52,26 @@ except Exception:
     tqdm = None  # type: ignore[assignment]
 
 from embeddings import get_embedding_function, validate_embedding_dimension
+from embedding_cache import open_embedding_cache
+from chunk_counts import open_chunk_counts
+from lexical_index import open_lexical_index
 from image_embeddings import (
     ensure_image_embedding_adapter_ready,
     image_collection_name,
     image_embedding_backend_name,
 )
 from file_registry import (
+    _apply_manifest_file_changes,
+    _delete_manifest_files,
     _file_manifest_path,
+    _get_manifest_file,
+    _get_manifest_files,
     _read_file_manifest,
     _write_file_manifest,
     _update_file_manifest,
     _file_registry_get,
     get_paths_by_silo,
+    manifest_session,
 )
 from load_config import load_config, get_archetype
 from style import bold, dim, label_style, success_style, warn_style, status_line, clear_status_line
@@ -235,6 +250,142 @@ def get_file_hash(path: Path) -> str:
     return hasher.hexdigest()
 
 
+FINGERPRINT_MODES = ("prefix", "full")
+_FINGERPRINT_READ_BYTES = 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _full_file_hasher() -> tuple[str, Callable[[], Any]]:
+    """(tag, factory) for whole-file fingerprints: BLAKE3, then xxh3-128, then stdlib BLAKE2b."""
+    try:
+        import blake3  # type: ignore[import-not-found]
+
+        return ("b3", blake3.blake3)
+    except ImportError:
+        pass
+    try:
+        import xxhash  # type: ignore[import-not-found]
+
+        return ("xxh3", xxhash.xxh3_128)
+    except ImportError:
+        pass
+    return ("b2", lambda: hashlib.blake2b(digest_size=16))
+
+
+def _resolve_fingerprint_mode(requested: str | None = None, prev_hash: str = "") -> str:
+    """'prefix' (get_file_hash) or 'full' (whole file).
+
+    Explicit argument, then LLMLIBRARIAN_FINGERPRINT, then whatever produced the
+    manifest's previous hash (full fingerprints carry a '<algo>:' tag), so a silo
+    added with --fingerprint full keeps it for watcher updates.
+    """
+    raw = requested or os.environ.get("LLMLIBRARIAN_FINGERPRINT")
+    if raw:
+        mode = raw.strip().lower()
+        if mode not in FINGERPRINT_MODES:
+            raise ValueError(f"Unknown fingerprint mode {raw!r} (expected one of: {', '.join(FINGERPRINT_MODES)})")
+        return mode
+    return "full" if ":" in (prev_hash or "") else "prefix"
+
+
+def get_file_fingerprint(path: Path, mode: str = "prefix") -> str:
+    """Content identity for change detection. 'prefix' is get_file_hash; 'full' reads the
+    whole file in 1 MiB sequential blocks, so edits past the first 8 KB are seen too."""
+    if mode != "full":
+        return get_file_hash(path)
+    tag, factory = _full_file_hasher()
+    hasher = factory()
+    try:
+        with open(path, "rb", buffering=0) as f:
+            while True:
+                block = f.read(_FINGERPRINT_READ_BYTES)
+                if not block:
+                    break
+                hasher.update(block)
+    except OSError:
+        return ""
+    return f"{tag}:{hasher.hexdigest()}"
+
+
+def _manifest_stat_fields(st: os.stat_result) -> dict[str, Any]:
+    """Stat signature stored per manifest entry (mtime/size stay for existing readers)."""
+    return {
+        "mtime": st.st_mtime,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "ctime_ns": st.st_ctime_ns,
+        "ino": st.st_ino,
+    }
+
+
+def _stat_signature_matches(prev: dict[str, Any] | None, st: os.stat_result) -> bool:
+    """True when (mtime_ns, size, inode, ctime_ns) all match the manifest entry.
+
+    ctime moves on every content write and on utime(), so a full match means the
+    file was not touched and needs no fingerprint. Entries written before these
+    fields existed never match and fall back to fingerprinting.
+    """
+    if not prev or prev.get("mtime_ns") is None or prev.get("ctime_ns") is None or prev.get("ino") is None:
+        return False
+    return (
+        prev.get("mtime_ns") == st.st_mtime_ns
+        and prev.get("size") == st.st_size
+        and prev.get("ino") == st.st_ino
+        and prev.get("ctime_ns") == st.st_ctime_ns
+    )
+
+
+# (path, kind, resolved, stat, fingerprint, unchanged); resolved/stat are None when stat failed.
+FileProbe = tuple[Path, str, Path | None, os.stat_result | None, str, bool]
+
+
+def _probe_files(
+    files: list[tuple[Path, str]],
+    manifest_files: dict[str, Any],
+    *,
+    incremental: bool,
+    workers: int,
+    fingerprint: str | None = None,
+) -> list[FileProbe]:
+    """Stat-first change detection for the run_add pre-pass, run on a thread pool.
+
+    Files whose stat signature matches the manifest are reported unchanged without
+    being opened; only the rest are fingerprinted. Non-regular files are dropped.
+    Results keep the input order.
+    """
+
+    def _probe(item: tuple[Path, str]) -> FileProbe | None:
+        p, k = item
+        try:
+            p_res = p.resolve()
+            st = p_res.stat()
+        except OSError:
+            return (p, k, None, None, "", False)
+        if not S_ISREG(st.st_mode):
+            return None
+        prev = manifest_files.get(str(p_res)) if incremental else None
+        if not isinstance(prev, dict):
+            prev = None
+        if prev and _stat_signature_matches(prev, st):
+            return (p, k, p_res, st, str(prev.get("hash") or ""), True)
+        h = get_file_fingerprint(p_res, _resolve_fingerprint_mode(fingerprint, str((prev or {}).get("hash") or "")))
+        # Unchanged stat, but still confirm the content hash: an edit that preserves
+        # both mtime and size would otherwise be skipped. The manifest entry is the
+        # hash record, so this is a local compare rather than a registry lookup.
+        unchanged = bool(
+            prev
+            and prev.get("mtime") == st.st_mtime
+            and prev.get("size") == st.st_size
+            and (not h or prev.get("hash") == h)
+        )
+        return (p, k, p_res, st, h, unchanged)
+
+    if not files:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(files))), thread_name_prefix="llmli-scan") as executor:
+        return [r for r in executor.map(_probe, files) if r is not None]
+
+
 def _log_event(level: str, message: str, **fields: Any) -> None:
     """Structured log line for ingest errors. Writes JSON to stderr."""
     normalized_level = str(level or "INFO").upper()
@@ -353,18 +504,55 @@ def _chunk_params() -> tuple[int, int]:
     return (size, overlap)
 
 
-def chunk_text(text: str, size: int | None = None, overlap: int | None = None) -> list[tuple[str, int]]:
-    """Returns list of (chunk_text, line_start). line_start is 1-based approximate. Uses env LLMLIBRARIAN_CHUNK_* when size/overlap not passed."""
+CHUNKING_MODES = ("lines", "anchored")
+# anchored mode: a line whose crc32 is 0 mod this is a boundary candidate (~1 in 8 lines),
+# so text without blank lines or headings still resynchronizes shortly after an edit.
+_ANCHOR_LINE_MODULUS = 8
+_HEADING_RE = re.compile(r"^(#{1,6}\s|={3,}\s*$|-{3,}\s*$)")
+
+
+def _chunking_mode() -> str:
+    """LLMLIBRARIAN_CHUNKING: lines (default, greedy packing) or anchored (content-defined boundaries)."""
+    mode = os.environ.get("LLMLIBRARIAN_CHUNKING", "lines").strip().lower()
+    return mode if mode in CHUNKING_MODES else "lines"
+
+
+def _is_chunk_anchor(line: str, next_line: str | None) -> bool:
+    """Content-defined boundary after `line`: paragraph break, next line is a heading, or a hash hit.
+    Depends only on the text around the cut, never on its offset in the file."""
+    if not line.strip():
+        return True
+    if next_line is not None and _HEADING_RE.match(next_line):
+        return True
+    return zlib.crc32(line.encode("utf-8", "surrogatepass")) % _ANCHOR_LINE_MODULUS == 0
+
+
+def chunk_text(
+    text: str,
+    size: int | None = None,
+    overlap: int | None = None,
+    mode: str | None = None,
+) -> list[tuple[str, int]]:
+    """Returns list of (chunk_text, line_start). line_start is 1-based approximate. Uses env LLMLIBRARIAN_CHUNK_* when size/overlap not passed.
+
+    mode "lines" packs lines greedily up to size, so an insertion shifts every later boundary.
+    mode "anchored" closes a chunk once it holds size/2 chars and reaches a content-defined
+    anchor (see _is_chunk_anchor), or at size regardless: after an edit, boundaries
+    realign at the next anchor and the rest of the file chunks exactly as before.
+    """
     if size is None or overlap is None:
         psize, poverlap = _chunk_params()
         size = size if size is not None else psize
         overlap = overlap if overlap is not None else poverlap
+    anchored = (mode or _chunking_mode()) == "anchored"
+    min_anchor_len = size // 2
     if not text.strip():
         return []
     lines = text.split("\n")
     result: list[tuple[str, int]] = []
     current: list[str] = []
     current_len = 0
+    carried_len = 0
     line_start = 1
     for i, line in enumerate(lines):
         line_num = i + 1
@@ -373,6 +561,7 @@ def chunk_text(text: str, size: int | None = None, overlap: int | None = None) -
                 result.append(("\n".join(current), line_start))
                 current = []
                 current_len = 0
+                carried_len = 0
             n = len(line)
             start = 0
             while start < n:
@@ -388,7 +577,11 @@ def chunk_text(text: str, size: int | None = None, overlap: int | None = None) -
             continue
         current.append(line)
         current_len += len(line) + 1
-        if current_len >= size:
+        if current_len >= size or (
+            anchored
+            and current_len - carried_len >= min_anchor_len
+            and _is_chunk_anchor(line, lines[i + 1] if i + 1 < len(lines) else None)
+        ):
             chunk = "\n".join(current)
             result.append((chunk, line_start))
             # overlap: keep last few lines
@@ -400,8 +593,15 @@ def chunk_text(text: str, size: int | None = None, overlap: int | None = None) -
                 if overlap_len >= overlap and j > 0:
                     line_start = line_num - len(overlap_lines) + 1
                     break
+            else:
+                if anchored:
+                    # Carrying the whole chunk would re-emit it at the next anchor.
+                    overlap_lines = []
+                    overlap_len = 0
             current = overlap_lines
             current_len = overlap_len
+            # Anchored cuts count only new text toward size/2, so the carry alone never closes a chunk.
+            carried_len = overlap_len
             if not current:
                 line_start = line_num + 1
     if current:
@@ -425,8 +625,11 @@ from processors import (
     ExtractedImage,
     ImageRegion,
     ExtractedText,
+    _build_image_summary_text,
     ensure_vision_model_ready,
+    set_ocr_process_share,
 )
+from image_summary_queue import ImageSummaryQueue, open_image_summary_queue
 from tax.ledger import extract_tax_rows_from_chunks, replace_tax_rows_for_sources
 
 _pdf_proc = PDFProcessor()
@@ -535,7 +738,7 @@ def _chunk_metadata_only(
 ) -> list[ChunkTuple]:
     """One chunk with filename/path/mtime only; content_extracted=0 so file is not silently ignored."""
     doc = f"{format_label}: {Path(source_path).name} (content not extracted; install {install_hint} for text extraction.)"
-    cid = _stable_chunk_id(source_path, mtime, 0)
+    cid = _content_chunk_id(source_path, None, _chunk_hash(doc), 0)
     meta: dict = {
         "source": source_path,
         "source_path": source_path,
@@ -603,8 +806,10 @@ def _chunk_hash(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
 
 
-def _stable_chunk_id(source_path: str, mtime: float, chunk_index: int) -> str:
-    key = f"{source_path}|{mtime}|{chunk_index}"
+def _content_chunk_id(source_path: str, page: int | None, chunk_hash: str, occurrence: int) -> str:
+    """Id that survives edits elsewhere in the file: same text at the same source keeps its id.
+    occurrence numbers repeated chunks (identical boilerplate paragraphs) within one file."""
+    key = f"{source_path}|{'' if page is None else page}|{chunk_hash}|{occurrence}"
     return hashlib.sha256(key.encode("utf-8")).hexdigest()[:20]
 
 
@@ -661,14 +866,18 @@ def _chunks_from_content(
     chunks_with_lines = chunk_text(clean_text)
 
     out: list[ChunkTuple] = []
-    for i, (chunk, line_s) in enumerate(chunks_with_lines):
-        cid = _stable_chunk_id(source_path, mtime, i)
+    occurrences: dict[str, int] = {}
+    for chunk, line_s in chunks_with_lines:
+        chunk_hash = _chunk_hash(chunk)
+        occurrence = occurrences.get(chunk_hash, 0)
+        occurrences[chunk_hash] = occurrence + 1
+        cid = _content_chunk_id(source_path, page, chunk_hash, occurrence)
         section = section_by_line.get(line_s, current_section if not section_by_line else "")
         meta: dict = {
             "source": source_path,
             "source_path": source_path,
             "mtime": mtime,
-            "chunk_hash": _chunk_hash(chunk),
+            "chunk_hash": chunk_hash,
             "file_id": file_id,
             "line_start": line_s,
             "is_local": _is_local(source_path),
@@ -749,7 +958,8 @@ def _chunks_from_image_result(
         }
     )
     summary_meta = {k: v for k, v in summary_meta.items() if v is not None}
-    out.append((_stable_chunk_id(source_path, mtime, 0), summary_text, summary_meta))
+    # Keyed by image content + region, so a touch or a backfilled summary keeps the ids.
+    out.append((_content_chunk_id(source_path, None, parent_image_id, 0), summary_text, summary_meta))
 
     for idx, region in enumerate(result.regions, start=1):
         region_text = (region.text or "").strip()
@@ -775,7 +985,7 @@ def _chunks_from_image_result(
         if region_extra:
             region_meta.update({k: v for k, v in region_extra.items() if v is not None})
         region_meta = {k: v for k, v in region_meta.items() if v is not None}
-        out.append((_stable_chunk_id(source_path, mtime, idx), doc, region_meta))
+        out.append((_content_chunk_id(source_path, None, parent_image_id, idx), doc, region_meta))
     return out
 
 
@@ -816,12 +1026,131 @@ def _image_vector_from_chunks(
         "image_embedding_backend": image_embedding_backend_name(),
         "needs_vision_enrichment": meta.get("needs_vision_enrichment"),
         "summary_status": meta.get("summary_status"),
+        "vision_summary_key": meta.get("vision_summary_key"),
         "is_local": meta.get("is_local"),
     }
     vector_meta = {k: v for k, v in vector_meta.items() if v is not None}
     return (_image_vector_id(parent_image_id), source_path, doc, vector_meta)
 
 
+def _strip_summary_key_chunks(chunks: list[ChunkTuple]) -> list[ChunkTuple]:
+    return [(cid, doc, {k: v for k, v in meta.items() if k != "vision_summary_key"}) for cid, doc, meta in chunks]
+
+
+def _strip_summary_key_vectors(vectors: list[ImageVectorTuple]) -> list[ImageVectorTuple]:
+    return [
+        (vid, vpath, vdoc, {k: v for k, v in vmeta.items() if k != "vision_summary_key"})
+        for vid, vpath, vdoc, vmeta in vectors
+    ]
+
+
+def _backfill_image_summary(
+    chunks: list[ChunkTuple],
+    vectors: list[ImageVectorTuple],
+    *,
+    summary: str | None,
+    vision_model: str | None,
+    visible_text: str,
+    db_path: str | Path | None = None,
+) -> tuple[list[ChunkTuple], list[ImageVectorTuple]]:
+    """
+    Finish chunks (and image vector rows) extracted with a queued summary.
+
+    With a summary, the summary chunk and the full-frame region get its text and every
+    row becomes summary_status "eager", as if it had been summarized inline; the
+    image artifact is updated to match. Without one (the job failed) the rows keep
+    the deferred placeholder for query-time enrichment. Either way the
+    vision_summary_key is dropped.
+    """
+    if not summary:
+        return _strip_summary_key_chunks(chunks), _strip_summary_key_vectors(vectors)
+    summary_doc = _build_image_summary_text(summary, visible_text)
+    finished = {"summary_status": "eager", "needs_vision_enrichment": False, "vision_model": vision_model}
+    out_chunks: list[ChunkTuple] = []
+    relpaths: set[str] = set()
+    for cid, doc, meta in chunks:
+        meta = {k: v for k, v in meta.items() if k != "vision_summary_key"}
+        source_path = str(meta.get("source") or "")
+        record_type = str(meta.get("record_type") or "")
+        if record_type == "image_summary":
+            doc = summary_doc
+        elif record_type == "image_region" and meta.get("region_role") == "full_frame_summary":
+            doc = f"Image region: full_frame_summary\n{summary}"
+        meta.update({k: v for k, v in finished.items() if v is not None})
+        meta["chunk_hash"] = _chunk_hash(doc)
+        meta["doc_type"] = _image_doc_type_from_text(source_path, summary_doc, visible_text)
+        if meta.get("image_artifact_relpath"):
+            relpaths.add(str(meta["image_artifact_relpath"]))
+        out_chunks.append((cid, doc, meta))
+    out_vectors: list[ImageVectorTuple] = []
+    for vid, vpath, _vdoc, vmeta in vectors:
+        vmeta = {k: v for k, v in vmeta.items() if k != "vision_summary_key"}
+        vmeta.update({k: v for k, v in finished.items() if v is not None})
+        out_vectors.append((vid, vpath, summary_doc, vmeta))
+    for relpath in relpaths:
+        artifact = _read_image_artifact(db_path, relpath)
+        if not artifact:
+            continue
+        artifact["summary"] = summary
+        artifact["summary_status"] = "eager"
+        artifact["vision_model"] = vision_model or None
+        for region in artifact.get("regions") or []:
+            if isinstance(region, dict) and region.get("role") == "full_frame_summary":
+                region["text"] = summary
+                region["needs_vision_enrichment"] = False
+        _update_image_artifact(db_path, relpath, artifact)
+    return out_chunks, out_vectors
+
+
+def _update_image_summary_rows(
+    collection: Any,
+    image_collection: Any | None,
+    chunks: list[ChunkTuple],
+    vectors: list[ImageVectorTuple],
+    *,
+    embedding_fn: Any | None = None,
+    embedding_cache: Any | None = None,
+    lexical_index: Any | None = None,
+    chunk_counts: Any | None = None,
+) -> None:
+    """
+    Rewrite already written image rows with their backfilled summary, in place.
+
+    Chunk ids do not depend on the summary text, so the placeholder rows are updated
+    (new text re-embedded, metadata and lexical postings replaced) rather than deleted
+    and re-added. Image vectors keep their image embedding; only text and metadata change.
+    """
+    if chunks:
+        ids = [c[0] for c in chunks]
+        docs = [c[1] for c in chunks]
+        metas = [c[2] for c in chunks]
+        if embedding_fn is not None:
+            embeddings = embedding_cache.embed(docs, embedding_fn) if embedding_cache is not None else embedding_fn(docs)
+            collection.update(ids=ids, documents=docs, metadatas=metas, embeddings=embeddings)
+        else:
+            collection.update(ids=ids, documents=docs, metadatas=metas)
+        silos = {str((m or {}).get("silo") or "") for m in metas}
+
+        def _reindex(ix: Any) -> None:
+            ix.delete_ids(ids)
+            ix.add(zip(ids, docs, metas))
+
+        _sidecar_write(lexical_index, silos, _reindex)
+        _sidecar_write(chunk_counts, silos, lambda counts: counts.refresh_sources(metas))
+    if vectors and image_collection is not None:
+        vids = [row[0] for row in vectors]
+        stored = image_collection.get(ids=vids, include=["embeddings"])
+        by_id = dict(zip(stored.get("ids") or [], stored.get("embeddings") if stored.get("embeddings") is not None else []))
+        rows = [row for row in vectors if row[0] in by_id]
+        if rows:
+            image_collection.update(
+                ids=[row[0] for row in rows],
+                documents=[row[2] for row in rows],
+                metadatas=[row[3] for row in rows],
+                embeddings=[by_id[row[0]] for row in rows],
+            )
+
+
 def _chunks_from_csv_text(
     file_id: str,
     text: str,
@@ -841,6 +1170,7 @@ def _chunks_from_csv_text(
 
     header = [h.strip() for h in (rows[0] or [])]
     out: list[ChunkTuple] = []
+    occurrences: dict[str, int] = {}
     # Data rows start at line 2 in the file.
     for i, row in enumerate(rows[1:], start=2):
         if not any((c or "").strip() for c in row):
@@ -852,12 +1182,15 @@ def _chunks_from_csv_text(
             pairs = [f"c{j + 1}={cells[j]}" for j in range(len(cells))]
         # Keep chunks compact/structured for retrieval.
         doc = f"CSV row {i - 1}: " + " | ".join(pairs)
-        cid = _stable_chunk_id(source_path, mtime, i - 1)
+        chunk_hash = _chunk_hash(doc)
+        occurrence = occurrences.get(chunk_hash, 0)
+        occurrences[chunk_hash] = occurrence + 1
+        cid = _content_chunk_id(source_path, None, chunk_hash, occurrence)
         meta: dict[str, Any] = {
             "source": source_path,
             "source_path": source_path,
             "mtime": mtime,
-            "chunk_hash": _chunk_hash(doc),
+            "chunk_hash": chunk_hash,
             "file_id": file_id,
             "line_start": i,
             "row_number": i - 1,
@@ -1130,6 +1463,13 @@ def _chunks_from_pdf_pages(
     )
     doc_type = content_type if content_type != "other" else _doc_type_from_path(source_path)
     out: list[ChunkTuple] = []
+    occurrences: dict[tuple[int, str], int] = {}
+
+    def _page_chunk_id(page_num: int, chunk_hash: str) -> str:
+        occurrence = occurrences.get((page_num, chunk_hash), 0)
+        occurrences[(page_num, chunk_hash)] = occurrence + 1
+        return _content_chunk_id(source_path, page_num, chunk_hash, occurrence)
+
     for page in pages:
         page_extra_meta: dict[str, Any] = {}
         if isinstance(page, ExtractedPage):
@@ -1143,14 +1483,15 @@ def _chunks_from_pdf_pages(
         if _should_extract_transcript_rows(source_path, page_text, doc_type):
             transcript_rows = _extract_transcript_rows(page_text, source_path=source_path)
             if transcript_rows:
-                for row_index, row in enumerate(transcript_rows, start=1):
+                for row in transcript_rows:
                     doc = _format_transcript_row_doc(row)
-                    chunk_id = _stable_chunk_id(source_path, mtime, page_num * 1000 + row_index)
+                    chunk_hash = _chunk_hash(doc)
+                    chunk_id = _page_chunk_id(page_num, chunk_hash)
                     meta: dict[str, Any] = {
                         "source": source_path,
                         "source_path": source_path,
                         "mtime": mtime,
-                        "chunk_hash": _chunk_hash(doc),
+                        "chunk_hash": chunk_hash,
                         "file_id": file_id,
                         "page": page_num,
                         "is_local": _is_local(source_path),
@@ -1172,12 +1513,13 @@ def _chunks_from_pdf_pages(
                         meta.update(page_extra_meta)
                     out.append((chunk_id, doc, meta))
                 continue
-        chunk_id = _stable_chunk_id(source_path, mtime, page_num)
+        chunk_hash = _chunk_hash(page_text)
+        chunk_id = _page_chunk_id(page_num, chunk_hash)
         meta = {
             "source": source_path,
             "source_path": source_path,
             "mtime": mtime,
-            "chunk_hash": _chunk_hash(page_text),
+            "chunk_hash": chunk_hash,
             "file_id": file_id,
             "page": page_num,
             "is_local": _is_local(source_path),
@@ -1300,6 +1642,36 @@ def _verify_batch_write(collection: Any, ids_b: list[str]) -> None:
         )
 
 
+def _sidecar_write(sidecar: Any | None, silos: Any, write: Callable[[Any], Any]) -> None:
+    """Apply one write to a store kept beside Chroma (lexical index, chunk counts).
+    Neither is the source of truth, so a failure is logged and the silos (all when
+    None) are marked stale: readers fall back to Chroma until they are rebuilt."""
+    if sidecar is None:
+        return
+    try:
+        write(sidecar)
+    except Exception as e:
+        _log_event("WARN", "Sidecar index update failed", store=type(sidecar).__name__, error=str(e))
+        try:
+            sidecar.mark_stale(silos)
+        except Exception:
+            pass
+
+
+def _record_written_batch(
+    lexical_index: Any | None,
+    chunk_counts: Any | None,
+    ids: list[str],
+    docs: list[str],
+    metas: list[Any],
+) -> None:
+    if lexical_index is None and chunk_counts is None:
+        return
+    silos = {str((m or {}).get("silo") or "") for m in metas} - {""}
+    _sidecar_write(lexical_index, silos, lambda ix: ix.add(zip(ids, docs, metas)))
+    _sidecar_write(chunk_counts, silos, lambda counts: counts.add(metas))
+
+
 def _batch_add(
     collection: Any,
     chunks: list[ChunkTuple],
@@ -1308,12 +1680,26 @@ def _batch_add(
     log_line: Any = None,
     embedding_fn: Any | None = None,
     embedding_workers: int = 1,
+    quiet: bool = False,
+    embedding_cache: Any | None = None,
+    lexical_index: Any | None = None,
+    chunk_counts: Any | None = None,
 ) -> None:
-    """Add chunks to collection in batches. Progress printed so you can see where it hangs (embedding)."""
+    """Add chunks to collection in batches. Progress printed so you can see where it hangs (embedding).
+
+    quiet=True drops the per-batch lines; the streaming writer reports its own progress.
+    With an embedding_cache (and embedding_fn), vectors for already-seen chunk text are
+    read from the cache and only the misses are embedded; the add then passes embeddings=.
+    Each written batch is also added to lexical_index (BM25) and chunk_counts when given.
+    """
     if not chunks:
         return
+    embed = embedding_fn
+    if embedding_cache is not None and embedding_fn is not None:
+        def embed(docs: list[str]) -> Any:
+            return embedding_cache.embed(docs, embedding_fn)
     total_batches = (len(chunks) + batch_size - 1) // batch_size
-    use_tqdm = _should_use_tqdm()
+    use_tqdm = _should_use_tqdm() and not quiet
     iterator = range(0, len(chunks), batch_size)
     pbar = None
     if use_tqdm:
@@ -1323,7 +1709,7 @@ def _batch_add(
         for i in iterator:
             batch = chunks[i : i + batch_size]
             batch_num = i // batch_size + 1
-            if not use_tqdm:
+            if not use_tqdm and not quiet:
                 msg = f"  Adding batch {batch_num}/{total_batches} ({len(batch)} chunks)..."
                 print(dim(no_color, msg))
                 if log_line:
@@ -1342,8 +1728,12 @@ def _batch_add(
                 ids_b = [ids_b[i] for i in dedup]
                 docs_b = [docs_b[i] for i in dedup]
                 metas_b = [metas_b[i] for i in dedup]
-            collection.add(ids=ids_b, documents=docs_b, metadatas=metas_b)
+            if embed is not embedding_fn:
+                collection.add(ids=ids_b, documents=docs_b, metadatas=metas_b, embeddings=embed(docs_b))
+            else:
+                collection.add(ids=ids_b, documents=docs_b, metadatas=metas_b)
             _verify_batch_write(collection, ids_b)
+            _record_written_batch(lexical_index, chunk_counts, ids_b, docs_b, metas_b)
         return
 
     # Experimental: parallelize embedding computation, then add in main thread.
@@ -1351,7 +1741,7 @@ def _batch_add(
         ids_b = [c[0] for c in batch]
         docs_b = [c[1] for c in batch]
         metas_b = [c[2] for c in batch]
-        embeddings = embedding_fn(docs_b)
+        embeddings = embed(docs_b)
         return (ids_b, docs_b, metas_b, embeddings)
 
     with ThreadPoolExecutor(max_workers=embedding_workers, thread_name_prefix="llmli-embed") as executor:
@@ -1363,7 +1753,7 @@ def _batch_add(
         for future in as_completed(futures):
             i = futures[future]
             batch_num = i // batch_size + 1
-            if not use_tqdm:
+            if not use_tqdm and not quiet:
                 msg = f"  Adding batch {batch_num}/{total_batches} ({min(batch_size, len(chunks) - i)} chunks)..."
                 print(dim(no_color, msg))
                 if log_line:
@@ -1383,6 +1773,7 @@ def _batch_add(
                 embeddings = [embeddings[i] for i in dedup]
             collection.add(ids=ids_b, documents=docs_b, metadatas=metas_b, embeddings=embeddings)
             _verify_batch_write(collection, ids_b)
+            _record_written_batch(lexical_index, chunk_counts, ids_b, docs_b, metas_b)
             completed += 1
             if pbar is not None:
                 pbar.update(1)
@@ -1392,6 +1783,37 @@ def _batch_add(
 
 
 
+def _pdf_mmap_enabled() -> bool:
+    """LLMLIBRARIAN_PDF_MMAP (default on): parse PDFs from a mapping instead of a heap copy."""
+    return os.environ.get("LLMLIBRARIAN_PDF_MMAP", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+@contextmanager
+def _mapped_file(path: Path) -> Iterator[bytes | memoryview]:
+    """The file's contents as a read-only memoryview over an mmap (page cache, not heap).
+
+    If another program truncates the file while it is mapped, touching the lost pages
+    raises SIGBUS and kills the process, where read_bytes() would only see a short read.
+    Long-lived processes (MCP server, watcher updates) therefore read instead."""
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file: nothing to map
+            mapped = None
+    if mapped is None:
+        yield b""
+        return
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        try:
+            view.release()
+            mapped.close()
+        except BufferError:
+            pass  # a parser still holds the buffer; the mapping closes when it is collected
+
+
 def process_one_file(
     path: Path,
     kind: str,
@@ -1400,10 +1822,14 @@ def process_one_file(
     path_resolved: Path | None = None,
     db_path: str | Path | None = None,
     image_vision_enabled: bool = True,
+    defer_image_summary: bool = False,
+    map_pdf: bool | None = None,
 ) -> list[ChunkTuple]:
     """
     Read file and return list of (id, doc, meta). Runs in worker thread.
     Uses processor registry from processors.py. Falls back to TextProcessor for code/text.
+    defer_image_summary leaves eager image summaries to the caller's ImageSummaryQueue.
+    map_pdf maps PDFs instead of reading them (None: LLMLIBRARIAN_PDF_MMAP; see _mapped_file).
     """
     if path.is_symlink() and not follow_symlinks:
         return []
@@ -1416,27 +1842,34 @@ def process_one_file(
     except OSError:
         return []
     file_id = path_resolved.name
-    try:
-        data = path_resolved.read_bytes()
-    except OSError:
-        return []
     suffix = path_resolved.suffix.lower()
     processor = PROCESSORS.get(suffix, DEFAULT_PROCESSOR)
-    try:
-        if isinstance(processor, ImageProcessor):
-            result = processor.extract(data, path_str, enable_multimodal=image_vision_enabled)
-        else:
-            result = processor.extract(data, path_str)
-    except DocumentExtractionError as e:
-        _log_event(
-            "ERROR",
-            "Extraction failed",
-            path=path_str,
-            kind=kind,
-            error=str(e),
-            extractor=getattr(processor, "format_label", "unknown"),
-        )
-        return []
+    with ExitStack() as stack:
+        try:
+            if isinstance(processor, PDFProcessor) and (_pdf_mmap_enabled() if map_pdf is None else map_pdf):
+                # Parsed in place from a mapping instead of a heap copy of the file.
+                data = stack.enter_context(_mapped_file(path_resolved))
+            else:
+                data = path_resolved.read_bytes()
+        except OSError:
+            return []
+        try:
+            if isinstance(processor, ImageProcessor):
+                result = processor.extract(
+                    data, path_str, enable_multimodal=image_vision_enabled, defer_summary=defer_image_summary
+                )
+            else:
+                result = processor.extract(data, path_str)
+        except DocumentExtractionError as e:
+            _log_event(
+                "ERROR",
+                "Extraction failed",
+                path=path_str,
+                kind=kind,
+                error=str(e),
+                extractor=getattr(processor, "format_label", "unknown"),
+            )
+            return []
     return _chunks_from_processor_result(
         file_id,
         result,
@@ -1449,6 +1882,101 @@ def process_one_file(
     )
 
 
+EXTRACT_EXECUTORS = ("thread", "process")
+DEFAULT_EXTRACT_RECYCLE_AFTER = 64
+
+
+def _resolve_extract_executor(value: str | None) -> str:
+    """'thread' (default) or 'process', from the argument or LLMLIBRARIAN_EXTRACT_EXECUTOR."""
+    raw = value if value is not None else os.environ.get("LLMLIBRARIAN_EXTRACT_EXECUTOR")
+    kind = (raw or "thread").strip().lower()
+    if kind not in EXTRACT_EXECUTORS:
+        raise ValueError(f"Unknown extract executor {raw!r} (expected one of: {', '.join(EXTRACT_EXECUTORS)})")
+    return kind
+
+
+def _extract_recycle_after() -> int:
+    try:
+        n = int(os.environ.get("LLMLIBRARIAN_EXTRACT_RECYCLE_AFTER", DEFAULT_EXTRACT_RECYCLE_AFTER))
+    except (TypeError, ValueError):
+        n = DEFAULT_EXTRACT_RECYCLE_AFTER
+    return max(1, n)
+
+
+def _extract_worker_init(processes: int = 1) -> None:
+    from proctitle import set_process_title
+
+    set_process_title("extract")
+    # Each worker has its own OCR pool; split the default among the workers.
+    set_ocr_process_share(processes)
+
+
+def _make_extract_executor(kind: str, workers: int) -> Executor:
+    """File-extraction pool for run_add / run_index.
+
+    'process' sidesteps the GIL for the pure-Python parts of PDF/DOCX/XLSX/PPTX
+    extraction and chunking. Workers are spawned (never forked: the parent may
+    already hold torch/Chroma threads) and, on Python 3.11+, replaced after
+    LLMLIBRARIAN_EXTRACT_RECYCLE_AFTER files so allocator fragmentation from
+    large documents does not accumulate in long runs.
+    """
+    if kind == "process":
+        import multiprocessing
+
+        kwargs: dict[str, Any] = {
+            "max_workers": workers,
+            "mp_context": multiprocessing.get_context("spawn"),
+            "initializer": _extract_worker_init,
+            "initargs": (workers,),
+        }
+        if sys.version_info >= (3, 11):
+            kwargs["max_tasks_per_child"] = _extract_recycle_after()
+        return ProcessPoolExecutor(**kwargs)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llmli-file")
+
+
+_COMPACT_MISSING = object()
+
+
+def _compact_chunks(chunks: list[ChunkTuple]) -> tuple[dict[str, Any], list[ChunkTuple]]:
+    """Hoist metadata shared by every chunk of a file so process workers pickle it once."""
+    if not chunks:
+        return ({}, [])
+    shared = dict(chunks[0][2] or {})
+    for _cid, _doc, meta in chunks[1:]:
+        meta = meta or {}
+        for key in list(shared):
+            if meta.get(key, _COMPACT_MISSING) != shared[key]:
+                del shared[key]
+    rows = [
+        (cid, doc, {k: v for k, v in (meta or {}).items() if k not in shared})
+        for cid, doc, meta in chunks
+    ]
+    return (shared, rows)
+
+
+def _expand_chunks(shared: dict[str, Any], rows: list[ChunkTuple]) -> list[ChunkTuple]:
+    return [(cid, doc, {**shared, **meta}) for cid, doc, meta in rows]
+
+
+def _process_one_file_compact(
+    path: Path,
+    kind: str,
+    file_hash: str | None = None,
+    follow_symlinks: bool = False,
+    path_resolved: Path | None = None,
+    db_path: str | Path | None = None,
+    image_vision_enabled: bool = True,
+    defer_image_summary: bool = False,
+) -> tuple[dict[str, Any], list[ChunkTuple]]:
+    """process_one_file for process workers; returns _compact_chunks output."""
+    return _compact_chunks(
+        process_one_file(
+            path, kind, file_hash, follow_symlinks, path_resolved, db_path, image_vision_enabled, defer_image_summary
+        )
+    )
+
+
 def collect_files(
     root: Path,
     include: list[str],
@@ -1759,9 +2287,13 @@ def _delete_source_from_collections(
     image_collection: Any | None,
     silo_slug: str,
     source_path: str,
+    lexical_index: Any | None = None,
+    chunk_counts: Any | None = None,
 ) -> None:
     try:
         collection.delete(where={"$and": [{"silo": silo_slug}, {"source": source_path}]})
+        _sidecar_write(lexical_index, [silo_slug], lambda ix: ix.delete_source(silo_slug, source_path))
+        _sidecar_write(chunk_counts, [silo_slug], lambda counts: counts.forget_source(silo_slug, source_path))
     except Exception as e:
         _log_event("WARN", "Failed to delete updated file chunks", path=source_path, error=str(e))
     try:
@@ -1776,6 +2308,80 @@ def _delete_source_from_collections(
         _log_event("WARN", "Failed to delete image vector rows", path=source_path, error=str(e))
 
 
+def _diff_source_chunks(
+    collection: Any,
+    silo_slug: str,
+    source_path: str,
+    chunks: list[ChunkTuple],
+    lexical_index: Any | None = None,
+    chunk_counts: Any | None = None,
+) -> set[str] | None:
+    """Delete this source's stored chunks whose id is not in `chunks`; return the ids kept.
+
+    None means the stored ids could not be read and the caller should fall back to
+    deleting the whole source.
+    """
+    try:
+        got = collection.get(where={"$and": [{"silo": silo_slug}, {"source": source_path}]}, include=[])
+        existing = {str(cid) for cid in _flatten_get_values((got or {}).get("ids"))}
+    except Exception as e:
+        _log_event("WARN", "Failed to read stored chunk ids; replacing all", path=source_path, error=str(e))
+        return None
+    new_ids = {c[0] for c in chunks}
+    stale = sorted(existing - new_ids)
+    if stale:
+        try:
+            collection.delete(ids=stale)
+        except Exception as e:
+            _log_event("WARN", "Failed to delete stale chunks; replacing all", path=source_path, error=str(e))
+            return None
+        _sidecar_write(lexical_index, [silo_slug], lambda ix: ix.delete_ids(stale))
+        _sidecar_write(chunk_counts, [silo_slug], lambda counts: counts.subtract(silo_slug, source_path, len(stale)))
+    return existing & new_ids
+
+
+def _refresh_chunk_metadata(
+    collection: Any,
+    chunks: list[ChunkTuple],
+    *,
+    batch_size: int,
+    chunk_counts: Any | None = None,
+) -> list[ChunkTuple]:
+    """Metadata-only update (mtime, line_start, indexed_at, ...) for chunks whose text is
+    already stored under the same id; nothing is re-embedded. Chroma merges metadata on
+    update, so keys the stored chunk has and the new metadata lacks are sent as None to
+    clear them. Chunks whose update failed are deleted and returned so the caller adds them again."""
+    retry: list[ChunkTuple] = []
+    for i in range(0, len(chunks), batch_size):
+        batch = chunks[i : i + batch_size]
+        ids_b = [c[0] for c in batch]
+        try:
+            stored = collection.get(ids=ids_b, include=["metadatas"])
+            stored_by_id = dict(zip(stored.get("ids") or [], stored.get("metadatas") or []))
+            metas_b: list[dict[str, Any]] = []
+            for cid, _doc, meta in batch:
+                full = dict(meta)
+                for key in stored_by_id.get(cid) or {}:
+                    full.setdefault(key, None)
+                metas_b.append(full)
+            collection.update(ids=ids_b, metadatas=metas_b)
+            _sidecar_write(
+                chunk_counts,
+                {str((c[2] or {}).get("silo") or "") for c in batch},
+                lambda counts: counts.refresh_sources([c[2] for c in batch]),
+            )
+        except Exception as e:
+            _log_event("WARN", "Chunk metadata refresh failed; re-adding", chunks=len(batch), error=str(e))
+            try:
+                collection.delete(ids=ids_b)
+                silos = {str((c[2] or {}).get("silo") or "") for c in batch}
+                _sidecar_write(chunk_counts, silos, lambda counts: counts.subtract_metas([c[2] for c in batch]))
+            except Exception:
+                pass
+            retry.extend(batch)
+    return retry
+
+
 def _batch_add_image_vectors(
     collection: Any,
     rows: list[ImageVectorTuple],
@@ -1803,6 +2409,291 @@ def _batch_add_image_vectors(
         collection.add(ids=ids_b, documents=docs_b, metadatas=metas_b, embeddings=embeddings)
 
 
+def _ingest_streaming_enabled(requested: bool | None) -> bool:
+    if requested is not None:
+        return bool(requested)
+    return (os.environ.get("LLMLIBRARIAN_INGEST_STREAM") or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _ingest_max_inflight_bytes() -> int:
+    """In-flight ceiling for streaming add (LLMLIBRARIAN_INGEST_MAX_INFLIGHT_MB, default INGEST_MAX_INFLIGHT_MB)."""
+    mb = INGEST_MAX_INFLIGHT_MB
+    try:
+        mb = int(os.environ.get("LLMLIBRARIAN_INGEST_MAX_INFLIGHT_MB", mb))
+    except (TypeError, ValueError):
+        pass
+    return max(1, mb) * 1024 * 1024
+
+
+def _iter_bounded_completions(
+    executor: Executor,
+    fn: Callable[..., Any],
+    items: list[Any],
+    args_for: Callable[[Any], tuple[Any, ...]],
+    max_in_flight: int,
+) -> Any:
+    """Yield (item, future) as futures finish, never holding more than max_in_flight submitted.
+
+    The caller consumes results on its own thread, so anything it does between
+    yields (e.g. a batch write) stalls new submissions: that is the backpressure.
+    """
+    pending: dict[Any, Any] = {}
+    queue = iter(items)
+    exhausted = False
+    while True:
+        while not exhausted and len(pending) < max_in_flight:
+            try:
+                item = next(queue)
+            except StopIteration:
+                exhausted = True
+                break
+            pending[executor.submit(fn, *args_for(item))] = item
+        if not pending:
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future
+
+
+class _ChunkWriter:
+    """Collects run_add output and writes it through _batch_add.
+
+    Buffered (default): everything is held until finish(), so the write phase is
+    one short window after extraction. Streaming: a batch is written as soon as it
+    fills or the buffered text passes max_inflight_bytes, so peak memory tracks the
+    batch size instead of the silo. The caller must open the write phase (journal
+    marker, rebuild delete) before the first add() when streaming.
+
+    With a summary_queue, an image whose chunks carry a vision_summary_key is written
+    with its OCR-only placeholder unless the summary is already in; once the rows are
+    written and the summary lands, apply_image_summaries() updates them in place
+    (collection.update plus the lexical index, chunk counts and image artifact).
+    """
+
+    def __init__(
+        self,
+        collection: Any,
+        image_collection: Any,
+        *,
+        streaming: bool,
+        batch_size: int,
+        max_inflight_bytes: int,
+        embedding_fn: Any | None,
+        embedding_workers: int,
+        image_embed_ok: bool,
+        no_color: bool = False,
+        quiet: bool = False,
+        embedding_cache: Any | None = None,
+        lexical_index: Any | None = None,
+        chunk_counts: Any | None = None,
+        summary_queue: ImageSummaryQueue | None = None,
+        db_path: str | Path | None = None,
+    ) -> None:
+        self.collection = collection
+        self.image_collection = image_collection
+        self.streaming = streaming
+        self.batch_size = batch_size
+        self.max_inflight_bytes = max_inflight_bytes
+        self.embedding_fn = embedding_fn
+        self.embedding_workers = embedding_workers
+        self.embedding_cache = embedding_cache
+        self.lexical_index = lexical_index
+        self.chunk_counts = chunk_counts
+        self.image_embed_ok = image_embed_ok
+        self.no_color = no_color
+        self.quiet = quiet
+        self._chunks: list[ChunkTuple] = []
+        self._chunk_bytes = 0
+        self._image_vectors: list[ImageVectorTuple] = []
+        self.chunks_seen = 0
+        self.chunks_written = 0
+        self.image_vectors_written = 0
+        self.code_sources_by_ext: dict[str, set[str]] = {}
+        self.summary_queue = summary_queue
+        self.db_path = db_path
+        self.summaries_backfilled = 0
+        self._summary_jobs: dict[str, tuple[Any, str]] = {}
+        self._summary_results: dict[str, tuple[str, str] | None] = {}
+        # Placeholder rows already written (or buffered: _unflushed_*), awaiting their summary.
+        self._placeholder_chunks: dict[str, list[ChunkTuple]] = {}
+        self._placeholder_vectors: dict[str, list[ImageVectorTuple]] = {}
+        self._unflushed_chunk_keys: set[str] = set()
+        self._unflushed_vector_keys: set[str] = set()
+
+    def add(self, chunks: list[ChunkTuple]) -> None:
+        for chunk in chunks:
+            src = (chunk[2] or {}).get("source") or ""
+            ext = Path(src).suffix.lower() if src else ""
+            if ext in ADD_CODE_EXTENSIONS:
+                self.code_sources_by_ext.setdefault(ext, set()).add(src)
+        self.chunks_seen += len(chunks)
+        if self.summary_queue is not None:
+            chunks = self._route_queued_images(chunks)
+        self._buffer_chunks(chunks)
+        if self.summary_queue is not None and self.streaming:
+            self.apply_image_summaries(wait=False)
+
+    def _buffer_chunks(self, chunks: list[ChunkTuple]) -> None:
+        self._chunks.extend(chunks)
+        self._chunk_bytes += sum(len(chunk[1] or "") for chunk in chunks)
+        if self.streaming and (
+            len(self._chunks) >= self.batch_size or self._chunk_bytes >= self.max_inflight_bytes
+        ):
+            self._write_chunks()
+
+    def add_image_vector(self, row: ImageVectorTuple) -> None:
+        key = str((row[3] or {}).get("vision_summary_key") or "")
+        if key:
+            job = self._summary_jobs.get(key)
+            if job is not None and not job[0].done():
+                row = _strip_summary_key_vectors([row])[0]
+                self._placeholder_vectors.setdefault(key, []).append(row)
+                self._unflushed_vector_keys.add(key)
+            else:
+                row = self._finish_image(key, [], [row])[1][0]
+        self._image_vectors.append(row)
+        if self.streaming and len(self._image_vectors) >= max(1, min(64, ADD_BATCH_SIZE)):
+            self._write_image_vectors()
+
+    def _route_queued_images(self, chunks: list[ChunkTuple]) -> list[ChunkTuple]:
+        """Submit summaries for queued images; finish rows whose summary is in, keep placeholders for the rest."""
+        out: list[ChunkTuple] = []
+        for chunk in chunks:
+            meta = chunk[2] or {}
+            key = str(meta.get("vision_summary_key") or "")
+            if not key:
+                out.append(chunk)
+                continue
+            if key not in self._summary_jobs:
+                artifact = _read_image_artifact(self.db_path, meta.get("image_artifact_relpath")) or {}
+                visible_text = str(artifact.get("visible_text") or "")
+                source_path = str(meta.get("source") or "")
+                self._summary_jobs[key] = (self.summary_queue.submit(key, source_path, visible_text), visible_text)
+            if self._summary_jobs[key][0].done():
+                out.extend(self._finish_image(key, [chunk], [])[0])
+            else:
+                placeholder = _strip_summary_key_chunks([chunk])[0]
+                self._placeholder_chunks.setdefault(key, []).append(placeholder)
+                self._unflushed_chunk_keys.add(key)
+                out.append(placeholder)
+        return out
+
+    def _summary_result(self, key: str) -> tuple[str, str] | None:
+        if key not in self._summary_results:
+            future, _visible_text = self._summary_jobs[key]
+            try:
+                self._summary_results[key] = future.result()
+            except Exception as e:
+                self._summary_results[key] = None
+                _log_event("WARN", "Queued image summary failed; left deferred", key=key, error=str(e))
+        return self._summary_results[key]
+
+    def _finish_image(
+        self, key: str, chunks: list[ChunkTuple], vectors: list[ImageVectorTuple]
+    ) -> tuple[list[ChunkTuple], list[ImageVectorTuple]]:
+        result = self._summary_result(key)
+        summary, vision_model = result if result else (None, None)
+        if summary and chunks:
+            self.summaries_backfilled += 1
+        return _backfill_image_summary(
+            chunks,
+            vectors,
+            summary=summary,
+            vision_model=vision_model,
+            visible_text=self._summary_jobs[key][1],
+            db_path=self.db_path,
+        )
+
+    def pending_image_summaries(self) -> list[Any]:
+        """Futures of summaries whose placeholder rows still wait for them."""
+        keys = set(self._placeholder_chunks) | set(self._placeholder_vectors)
+        return [self._summary_jobs[key][0] for key in keys]
+
+    def apply_image_summaries(
+        self, *, wait: bool, collection: Any | None = None, image_collection: Any | None = None
+    ) -> int:
+        """Update written placeholder rows whose summary has landed (all of them with wait=True); returns how many images."""
+        applied = 0
+        for key in sorted(set(self._placeholder_chunks) | set(self._placeholder_vectors)):
+            if key in self._unflushed_chunk_keys or key in self._unflushed_vector_keys:
+                continue
+            future = self._summary_jobs[key][0]
+            if not wait and not future.done():
+                continue
+            chunks = self._placeholder_chunks.pop(key, [])
+            vectors = self._placeholder_vectors.pop(key, [])
+            result = self._summary_result(key)
+            if not result or not result[0]:
+                continue  # the written placeholder already is the deferred state
+            chunks, vectors = self._finish_image(key, chunks, vectors)
+            _update_image_summary_rows(
+                collection if collection is not None else self.collection,
+                image_collection if image_collection is not None else self.image_collection,
+                chunks,
+                vectors if self.image_embed_ok else [],
+                embedding_fn=self.embedding_fn,
+                embedding_cache=self.embedding_cache,
+                lexical_index=self.lexical_index,
+                chunk_counts=self.chunk_counts,
+            )
+            applied += 1
+        return applied
+
+    def _write_chunks(self) -> None:
+        if not self._chunks:
+            return
+        batch, self._chunks, self._chunk_bytes = self._chunks, [], 0
+        if self.streaming and not self.quiet and not _should_use_tqdm():
+            print(dim(self.no_color, f"  Streaming {len(batch)} chunks ({self.chunks_written + len(batch)} written)..."))
+        _batch_add(
+            self.collection,
+            batch,
+            batch_size=self.batch_size,
+            no_color=self.no_color,
+            embedding_fn=self.embedding_fn,
+            embedding_workers=self.embedding_workers,
+            quiet=self.streaming,
+            embedding_cache=self.embedding_cache,
+            lexical_index=self.lexical_index,
+            chunk_counts=self.chunk_counts,
+        )
+        self.chunks_written += len(batch)
+        self._unflushed_chunk_keys.clear()
+
+    def _write_image_vectors(self) -> None:
+        if not self._image_vectors:
+            return
+        rows, self._image_vectors = self._image_vectors, []
+        self._unflushed_vector_keys.clear()
+        if not self.image_embed_ok:
+            return
+        _batch_add_image_vectors(
+            self.image_collection,
+            rows,
+            batch_size=max(1, min(64, ADD_BATCH_SIZE)),
+            no_color=self.no_color,
+        )
+        self.image_vectors_written += len(rows)
+
+    def finish(self) -> None:
+        """Write whatever is still buffered (all of it, in buffered mode)."""
+        if self._chunks and not self.streaming and not _should_use_tqdm():
+            total_batches = (len(self._chunks) + self.batch_size - 1) // self.batch_size
+            print(dim(self.no_color, f"  Adding {len(self._chunks)} chunks in {total_batches} batches (batch_size={self.batch_size})..."))
+        self._write_chunks()
+        self._write_image_vectors()
+        if self.summary_queue is not None:
+            self.apply_image_summaries(wait=False)
+
+    def language_stats(self) -> dict[str, Any] | None:
+        if not self.code_sources_by_ext:
+            return None
+        return {
+            "by_ext": {ext: len(paths) for ext, paths in self.code_sources_by_ext.items()},
+            "sample_paths": {ext: list(paths)[:3] for ext, paths in self.code_sources_by_ext.items()},
+        }
+
+
 def _clone_chunks_from_existing_silo(
     *,
     collection: Any,
@@ -1878,7 +2769,9 @@ def run_index(
     log_path: str | Path | None = None,
     mode: str = "normal",
     follow_symlinks: bool = False,
+    extract_executor: str | None = None,
 ) -> None:
+    extract_executor = _resolve_extract_executor(extract_executor)
     try:
         from floor import print_resources
         print_resources(DB_PATH, mode=mode, reranker_loaded=False, no_color=no_color)
@@ -1969,19 +2862,21 @@ def run_index(
         files_indexed = 0
     
         # 3. Process regular files in parallel
-        log("Processing files (parallel)...")
-        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llmli-file") as executor:
+        log(f"Processing files (parallel, {extract_executor} pool)...")
+        use_processes = extract_executor == "process"
+        extract_fn = _process_one_file_compact if use_processes else process_one_file
+        with _make_extract_executor(extract_executor, workers) as executor:
             future_to_item = {}
             for path, kind in regular:
                 try:
                     p_res = path.resolve()
                 except OSError:
                     p_res = None
-                future_to_item[executor.submit(process_one_file, path, kind, None, follow_symlinks, p_res)] = (path, kind)
+                future_to_item[executor.submit(extract_fn, path, kind, None, follow_symlinks, p_res)] = (path, kind)
             for future in as_completed(future_to_item):
                 path, kind = future_to_item[future]
                 try:
-                    chunks = future.result()
+                    chunks = _expand_chunks(*future.result()) if use_processes else future.result()
                 except Exception as e:
                     _log_event(
                         "ERROR",
@@ -2082,6 +2977,7 @@ def run_index(
                 log_line=log_line,
                 embedding_fn=ef,
                 embedding_workers=embedding_workers,
+                embedding_cache=open_embedding_cache(DB_PATH, ef),
             )
         if all_image_vectors and _image_embed_ok:
             _batch_add_image_vectors(
@@ -2166,11 +3062,20 @@ def _delete_silo_rows_for_rebuild(
 
     Called immediately before the replacement batch is written, not at the top of
     ``run_add``: the delete is what makes the silo queryable-but-empty, so the
-    window between it and the re-add should be as short as possible.
+    window between it and the re-add should be as short as possible. Once the
+    chunk delete succeeded the silo's lexical index and chunk counts are emptied
+    and marked exact: the rebuild's adds fill them from scratch.
     """
     for label, coll in (("chunks", collection), ("images", image_collection)):
         try:
             coll.delete(where={"silo": silo_slug})
+            if label == "chunks":
+                _sidecar_write(
+                    open_lexical_index(db_path), [silo_slug], lambda ix: ix.reset_silo(silo_slug)
+                )
+                _sidecar_write(
+                    open_chunk_counts(db_path), [silo_slug], lambda counts: counts.reset_silo(silo_slug)
+                )
         except Exception as e:
             try:
                 from state import record_index_error
@@ -2198,12 +3103,28 @@ def run_add(
     embedding_workers: int | None = None,
     get_chroma_client: Callable[[str], Any] | None = None,
     _pre_write_hook: Callable[[], None] | None = None,
+    stream: bool | None = None,
+    extract_executor: str | None = None,
+    fingerprint: str | None = None,
+    on_sources_changed: Callable[[set[str] | None], None] | None = None,
 ) -> tuple[int, int]:
     """
     Index a folder or a single file into the unified collection (llmli). Silo name = basename(path) unless forced.
     Returns (files_indexed, failed_count). Failures saved for llmli log --last.
     Refuses cloud-sync roots (OneDrive, iCloud, Dropbox, etc.) unless allow_cloud=True.
 
+    stream=True (or LLMLIBRARIAN_INGEST_STREAM=1) writes chunks as batches fill instead of
+    holding the whole silo in memory; the write phase (journal marker, pre-write hook, and
+    on --full the rebuild delete) then opens before extraction rather than after it.
+
+    extract_executor='process' (or LLMLIBRARIAN_EXTRACT_EXECUTOR=process) runs file
+    extraction in a spawned process pool instead of the llmli-file thread pool.
+
+    Change detection stats files on a thread pool (LLMLIBRARIAN_SCAN_WORKERS) and only
+    fingerprints files whose (mtime_ns, size, inode, ctime_ns) differ from the manifest.
+    fingerprint='full' (or LLMLIBRARIAN_FINGERPRINT=full) hashes whole files instead of
+    the first 8 KB.
+
     When path is a single file (e.g. places.sqlite), include/exclude filters are bypassed — the file
     is indexed directly. Use this to add explicitly-chosen files that are excluded by default (SQLite DBs, etc.).
 
@@ -2214,6 +3135,9 @@ def run_add(
 
     run_started_at = time.perf_counter()
     db_path = db_path or DB_PATH
+    extract_executor = _resolve_extract_executor(extract_executor)
+    if fingerprint is not None:
+        fingerprint = _resolve_fingerprint_mode(fingerprint)
     path = Path(path)
     if path.is_symlink() and not follow_symlinks:
         raise ValueError(f"Refusing to follow symlinked path: {path}. Use --follow-symlinks to allow.")
@@ -2310,6 +3234,13 @@ def run_add(
         "LLMLIBRARIAN_EMBEDDING_WORKERS",
         8,
     )
+    # Change detection is stat/open latency bound, not CPU bound; oversubscribe.
+    scan_workers = _resolve_worker_override(
+        None,
+        "LLMLIBRARIAN_SCAN_WORKERS",
+        min(32, (os.cpu_count() or 4) * 4),
+        cap=64,
+    )
     # MPS (Apple Silicon) is not thread-safe for concurrent inference; cap to 1
     # when embeddings run on MPS. Large multi-file ingests force CPU instead so
     # parallel embedding workers stay enabled (see ingest_parallel_embedding_device).
@@ -2324,9 +3255,14 @@ def run_add(
     if _effective_embed_device == "mps":
         embedding_workers = 1
 
+    streaming = _ingest_streaming_enabled(stream)
     if not quiet:
         print(dim(no_color, _format_preflight_summary(file_list, collect_stats)))
         print(dim(no_color, f"  Workers: file={workers}, embedding={embedding_workers}"))
+        if extract_executor != "thread":
+            print(dim(no_color, f"  Extract executor: {extract_executor} (recycle after {_extract_recycle_after()} files)"))
+        if streaming:
+            print(dim(no_color, f"  Streaming: in-flight ceiling {_ingest_max_inflight_bytes() // (1024 * 1024)} MB"))
 
     def _run_add_chroma_phase(client) -> tuple[int, int]:
         nonlocal incremental
@@ -2339,6 +3275,8 @@ def run_add(
             ef = client.get_effective_ef(LLMLI_COLLECTION) or ef
         validate_embedding_dimension(collection, ef)
         image_collection = _get_image_collection(client)
+        lexical_index = open_lexical_index(db_path)
+        chunk_counts = open_chunk_counts(db_path)
 
         # Cheap consistency check: if manifest says files are indexed but ChromaDB has 0
         # chunks for this silo, the previous ingest was incomplete — force a full re-index.
@@ -2349,7 +3287,7 @@ def run_add(
                     silo_result = collection.get(where={"silo": silo_slug}, limit=1)
                     silo_ids = silo_result.get("ids") or []
                     if not silo_ids:
-                        prior_manifest = _read_file_manifest(db_path)
+                        prior_manifest = _read_file_manifest(db_path, silos=[silo_slug])
                         prior_silo = (prior_manifest.get("silos") or {}).get(silo_slug, {})
                         prior_files = (prior_silo.get("files") or {}) if isinstance(prior_silo, dict) else {}
                         if prior_files:
@@ -2366,10 +3304,11 @@ def run_add(
 
         # Pre-pass: resolve paths, hash, skip duplicates (same file already indexed in any silo)
         regular_with_hash: list[tuple[Path, str, str, Path | None]] = []
-        manifest = _read_file_manifest(db_path) if incremental else {"silos": {}}
+        manifest = _read_file_manifest(db_path, silos=[silo_slug]) if incremental else {"silos": {}}
         silo_manifest = (manifest.get("silos") or {}).get(silo_slug, {})
         manifest_files = (silo_manifest.get("files") or {}) if isinstance(silo_manifest, dict) else {}
         ledger_sources_to_replace: set[str] = set()
+        changed_sources: set[str] = set()
         current_paths: set[str] = set()
         if incremental:
             for zp in zips:
@@ -2378,78 +3317,76 @@ def run_add(
                 except OSError:
                     current_paths.add(str(zp))
         skipped = 0
+        stat_by_path: dict[str, os.stat_result] = {}
+        refreshed_entries: dict[str, dict[str, Any]] = {}
         precloned_by_path: dict[str, tuple[str, list[ChunkTuple]]] = {}
         precloned_image_vectors_by_path: dict[str, list[ImageVectorTuple]] = {}
-        for p, k in regular:
-            try:
-                p_res = p.resolve()
-                if not p_res.is_file():
-                    continue
-                current_paths.add(str(p_res))
-                stat = p_res.stat()
-                mtime = stat.st_mtime
-                size = stat.st_size
-                h = get_file_hash(p_res)
-                if incremental:
-                    prev = manifest_files.get(str(p_res)) if isinstance(manifest_files, dict) else None
-                    if prev and prev.get("mtime") == mtime and prev.get("size") == size:
-                        # Unchanged stat, but still confirm the content hash: an edit
-                        # that preserves both mtime and size would otherwise be skipped.
-                        # The manifest entry is the hash record, so this is a local
-                        # compare rather than a lookup through the derived index.
-                        if not h or prev.get("hash") == h:
-                            continue
-                if h:
-                    existing_entries = _file_registry_get(db_path, h)
-                    if not incremental:
-                        existing_entries = [
-                            e for e in existing_entries
-                            if str(e.get("silo") or "") != silo_slug
-                        ]
-                    # Warn when identical content is already indexed in this silo under a different path.
-                    same_silo_dupes = [
-                        str(e.get("path") or "")
-                        for e in existing_entries
-                        if str(e.get("silo") or "") == silo_slug and str(e.get("path") or "") != str(p_res)
+        probes = _probe_files(
+            regular,
+            manifest_files if isinstance(manifest_files, dict) else {},
+            incremental=incremental,
+            workers=scan_workers,
+            fingerprint=fingerprint,
+        )
+        for p, k, p_res, st, h, unchanged in probes:
+            if p_res is None or st is None:
+                regular_with_hash.append((p, k, "", None))
+                continue
+            current_paths.add(str(p_res))
+            stat_by_path[str(p_res)] = st
+            if unchanged:
+                prev = manifest_files.get(str(p_res)) if isinstance(manifest_files, dict) else None
+                if isinstance(prev, dict) and not _stat_signature_matches(prev, st):
+                    # Confirmed by fingerprint: record the full signature so the next
+                    # pull can skip this file on stat alone.
+                    refreshed_entries[str(p_res)] = {**prev, **_manifest_stat_fields(st)}
+                continue
+            if h:
+                existing_entries = _file_registry_get(db_path, h)
+                if not incremental:
+                    existing_entries = [
+                        e for e in existing_entries
+                        if str(e.get("silo") or "") != silo_slug
                     ]
-                    if same_silo_dupes:
-                        print(
-                            f"[llmli][WARN] Duplicate content: {p_res} matches already-indexed"
-                            f" {same_silo_dupes[0]} — consider consolidating your folder structure.",
-                            file=sys.stderr,
-                        )
-                    clone_from = next(
-                        (str(e.get("silo") or "") for e in existing_entries if str(e.get("silo") or "") != silo_slug),
-                        "",
+                # Warn when identical content is already indexed in this silo under a different path.
+                same_silo_dupes = [
+                    str(e.get("path") or "")
+                    for e in existing_entries
+                    if str(e.get("silo") or "") == silo_slug and str(e.get("path") or "") != str(p_res)
+                ]
+                if same_silo_dupes:
+                    print(
+                        f"[llmli][WARN] Duplicate content: {p_res} matches already-indexed"
+                        f" {same_silo_dupes[0]} — consider consolidating your folder structure.",
+                        file=sys.stderr,
+                    )
+                clone_from = next(
+                    (str(e.get("silo") or "") for e in existing_entries if str(e.get("silo") or "") != silo_slug),
+                    "",
+                )
+                can_clone = bool(clone_from)
+                if can_clone and k == "image":
+                    source_mode = get_silo_image_vision_enabled(db_path, clone_from) if clone_from else None
+                    target_mode = effective_image_vision_enabled
+                    can_clone = source_mode is not None and target_mode is not None and source_mode == target_mode
+                if can_clone and clone_from:
+                    cloned = _clone_chunks_from_existing_silo(
+                        collection=collection,
+                        from_silo=clone_from,
+                        source_path=str(p_res),
+                        target_silo=silo_slug,
                     )
-                    can_clone = bool(clone_from)
-                    if can_clone and k == "image":
-                        source_mode = get_silo_image_vision_enabled(db_path, clone_from) if clone_from else None
-                        target_mode = effective_image_vision_enabled
-                        can_clone = source_mode is not None and target_mode is not None and source_mode == target_mode
-                    if can_clone and clone_from:
-                        cloned = _clone_chunks_from_existing_silo(
-                            collection=collection,
+                    if cloned:
+                        precloned_by_path[str(p_res)] = (h, cloned)
+                        precloned_image_vectors_by_path[str(p_res)] = _clone_image_vectors_from_existing_silo(
+                            collection=image_collection,
                             from_silo=clone_from,
                             source_path=str(p_res),
                             target_silo=silo_slug,
                         )
-                        if cloned:
-                            precloned_by_path[str(p_res)] = (h, cloned)
-                            precloned_image_vectors_by_path[str(p_res)] = _clone_image_vectors_from_existing_silo(
-                                collection=image_collection,
-                                from_silo=clone_from,
-                                source_path=str(p_res),
-                                target_silo=silo_slug,
-                            )
-                            continue
-                if not h:
-                    regular_with_hash.append((p, k, "", p_res))
-                    continue
-                regular_with_hash.append((p, k, h, p_res))
-            except OSError:
-                regular_with_hash.append((p, k, "", None))
-    
+                        continue
+            regular_with_hash.append((p, k, h, p_res))
+
         if incremental and isinstance(manifest_files, dict):
             cleanup_targets: list[Path] = [p_res for _p, _k, _h, p_res in regular_with_hash if p_res is not None]
             for p_res in cleanup_targets:
@@ -2463,10 +3400,33 @@ def run_add(
                         image_collection=image_collection,
                         silo_slug=silo_slug,
                         source_path=path_str,
+                        lexical_index=lexical_index,
+                        chunk_counts=chunk_counts,
                     )
     
-        all_chunks = []
-        all_image_vectors: list[ImageVectorTuple] = []
+        batch_size = ADD_BATCH_SIZE
+        try:
+            batch_size = int(os.environ.get("LLMLIBRARIAN_ADD_BATCH_SIZE", batch_size))
+        except (TypeError, ValueError):
+            pass
+        batch_size = max(1, min(batch_size, 2000))
+        writer = _ChunkWriter(
+            collection,
+            image_collection,
+            streaming=streaming,
+            batch_size=batch_size,
+            max_inflight_bytes=_ingest_max_inflight_bytes(),
+            embedding_fn=ef,
+            embedding_workers=embedding_workers,
+            image_embed_ok=_image_embed_ok,
+            no_color=no_color,
+            quiet=quiet,
+            embedding_cache=open_embedding_cache(db_path, ef),
+            lexical_index=lexical_index,
+            chunk_counts=chunk_counts,
+            summary_queue=summary_queue,
+            db_path=db_path,
+        )
         tax_rows: list[dict[str, Any]] = []
         files_indexed = 0
         failures = []
@@ -2474,7 +3434,6 @@ def run_add(
         image_done = 0
         eager_summaries = 0
         deferred_summaries = 0
-        image_embeddings_complete = 0
         extraction_started_at = time.perf_counter()
         last_image_progress_at = extraction_started_at
     
@@ -2482,13 +3441,51 @@ def run_add(
             removed = [path_str for path_str in manifest_files.keys() if path_str not in current_paths]
             for path_str in removed:
                 ledger_sources_to_replace.add(path_str)
+                changed_sources.add(path_str)
                 _delete_source_from_collections(
                     collection=collection,
                     image_collection=image_collection,
                     silo_slug=silo_slug,
                     source_path=path_str,
+                    lexical_index=lexical_index,
+                    chunk_counts=chunk_counts,
                 )
     
+        from ingest_journal import write_pending, clear_pending
+
+        write_phase_open = False
+
+        def _open_write_phase() -> None:
+            nonlocal write_phase_open
+            if write_phase_open:
+                return
+            write_phase_open = True
+            # Acquire any external lock before Chroma writes begin (e.g. MCP in-process lock).
+            # File crawl / chunking is lock-free; only the write phase needs serialization.
+            if _pre_write_hook is not None:
+                _pre_write_hook()
+            # Write-ahead marker: if we crash between here and clear_pending, the next
+            # run will detect this silo as interrupted and force a full non-incremental
+            # re-index. It also makes the write visible to concurrent readers while it
+            # runs — see ingest_journal.write_in_progress.
+            write_pending(str(db_path), silo_slug, kind="incremental" if incremental else "full")
+            # Deferred rebuild delete: in buffered mode the replacements are embedded and
+            # in hand by now, so the empty window is the batch write rather than the whole
+            # extract phase. Streaming writes during extraction, so it opens this first.
+            if not incremental:
+                _delete_silo_rows_for_rebuild(
+                    db_path, silo_slug, collection, image_collection, no_color=no_color
+                )
+            else:
+                # First incremental write since the lexical index existed: backfill
+                # this silo from Chroma so its BM25 stats cover the whole silo.
+                _sidecar_write(
+                    lexical_index, [silo_slug], lambda ix: ix.ensure_silo(collection, silo_slug)
+                )
+
+        if streaming:
+            _open_write_phase()
+
         if precloned_by_path:
             for path_str, (fhash, cloned_chunks) in precloned_by_path.items():
                 _now_iso = datetime.now(timezone.utc).isoformat()
@@ -2502,10 +3499,10 @@ def run_add(
                 ]
                 if not cloned_norm:
                     continue
-                all_chunks.extend(cloned_norm)
-                cloned_vectors = precloned_image_vectors_by_path.get(path_str) or []
-                if cloned_vectors:
-                    all_image_vectors.extend(cloned_vectors)
+                writer.add(cloned_norm)
+                changed_sources.add(path_str)
+                for cloned_vector in precloned_image_vectors_by_path.get(path_str) or []:
+                    writer.add_image_vector(cloned_vector)
                 summary_status, has_image = _image_progress_snapshot(cloned_norm)
                 if has_image:
                     image_done += 1
@@ -2517,24 +3514,23 @@ def run_add(
                 files_indexed += 1
     
         total_to_process = len(regular_with_hash) + len(zips)
-        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llmli-file") as executor:
-            future_to_item = {
-                executor.submit(
-                    process_one_file,
-                    p,
-                    k,
-                    h,
-                    follow_symlinks,
-                    p_res,
-                    db_path,
-                    effective_image_vision_enabled,
-                ): (p, k, h)
-                for p, k, h, p_res in regular_with_hash
-            }
-            for future in as_completed(future_to_item):
-                p, kind, fhash = future_to_item[future]
+        # Streaming keeps only a couple of files per worker in flight so extraction
+        # cannot run ahead of the writer; buffered mode queues everything up front.
+        max_in_flight = workers * 2 if streaming else max(1, len(regular_with_hash))
+        use_processes = extract_executor == "process"
+        with _make_extract_executor(extract_executor, workers) as executor:
+            for (p, kind, fhash, _p_res), future in _iter_bounded_completions(
+                executor,
+                _process_one_file_compact if use_processes else process_one_file,
+                regular_with_hash,
+                lambda item: (
+                    item[0], item[1], item[2], follow_symlinks, item[3], db_path,
+                    effective_image_vision_enabled, summary_queue is not None,
+                ),
+                max_in_flight,
+            ):
                 try:
-                    chunks = future.result()
+                    chunks = _expand_chunks(*future.result()) if use_processes else future.result()
                 except Exception as e:
                     _log_event(
                         "ERROR",
@@ -2553,14 +3549,14 @@ def run_add(
                         (hashlib.sha256(f"{silo_slug}|{cid}".encode()).hexdigest()[:20], doc, {**meta, "silo": silo_slug, "indexed_at": _now_iso})
                         for cid, doc, meta in chunks
                     ]
-                    all_chunks.extend(chunks)
+                    writer.add(chunks)
                     summary_status, has_image = _image_progress_snapshot(chunks)
                     if has_image:
                         source_path = str((chunks[0][2] or {}).get("source") or p)
                         vector_row = _image_vector_from_chunks(source_path=source_path, chunks=chunks)
                         if vector_row is not None:
                             vid, vpath, vdoc, vmeta = vector_row
-                            all_image_vectors.append((vid, vpath, vdoc, {**vmeta, "silo": silo_slug}))
+                            writer.add_image_vector((vid, vpath, vdoc, {**vmeta, "silo": silo_slug}))
                         image_done += 1
                         if summary_status == "eager":
                             eager_summaries += 1
@@ -2574,7 +3570,7 @@ def run_add(
                                     image_total=image_total,
                                     eager_count=eager_summaries,
                                     deferred_count=deferred_summaries,
-                                    embeddings_complete=image_embeddings_complete,
+                                    embeddings_complete=writer.image_vectors_written,
                                     started_at=extraction_started_at,
                                     no_color=no_color,
                                 )
@@ -2608,10 +3604,17 @@ def run_add(
                         continue
                     try:
                         collection.delete(where={"$and": [{"silo": silo_slug}, {"zip_path": str(zip_path)}]})
+                        _sidecar_write(
+                            lexical_index, [silo_slug], lambda ix: ix.delete_source(silo_slug, str(zip_path))
+                        )
+                        _sidecar_write(
+                            chunk_counts, [silo_slug], lambda counts: counts.forget_source(silo_slug, str(zip_path))
+                        )
                     except Exception as e:
                         _log_event("WARN", "Failed to delete ZIP chunks", path=str(zip_path), error=str(e))
                 except OSError:
                     pass
+            changed_sources.add(str(zip_path))
             try:
                 chunks = process_zip_to_chunks(
                     zip_path,
@@ -2637,7 +3640,7 @@ def run_add(
                     (hashlib.sha256(f"{silo_slug}|{cid}".encode()).hexdigest()[:20], doc, {**meta, "silo": silo_slug, "indexed_at": _now_iso})
                     for cid, doc, meta in chunks
                 ]
-                all_chunks.extend(chunks)
+                writer.add(chunks)
                 tax_rows.extend(extract_tax_rows_from_chunks(chunks))
                 files_indexed += 1
     
@@ -2645,6 +3648,7 @@ def run_add(
             for _p, _k, _h, p_res in regular_with_hash:
                 if p_res is not None:
                     ledger_sources_to_replace.add(str(p_res))
+                    changed_sources.add(str(p_res))
     
         if incremental:
             def _update_manifest(manifest_data: dict) -> None:
@@ -2658,82 +3662,48 @@ def run_add(
                 for path_str in list(files_map.keys()):
                     if path_str not in current_paths and path_str not in [str(z) for z in zips]:
                         del files_map[path_str]
+                for path_str, entry in refreshed_entries.items():
+                    if path_str in files_map:
+                        files_map[path_str] = entry
                 # Update regular files
                 for p, _k, h, p_res in regular_with_hash:
                     if p_res is None:
                         continue
                     try:
-                        st = p_res.stat()
-                        files_map[str(p_res)] = {"mtime": st.st_mtime, "size": st.st_size, "hash": h}
+                        st = stat_by_path.get(str(p_res)) or p_res.stat()
+                        files_map[str(p_res)] = {**_manifest_stat_fields(st), "hash": h}
                     except OSError:
                         continue
                 # Update zips
                 for zp in zips:
                     try:
                         st = zp.stat()
-                        files_map[str(zp)] = {"mtime": st.st_mtime, "size": st.st_size, "hash": ""}
+                        files_map[str(zp)] = {**_manifest_stat_fields(st), "hash": ""}
                     except OSError:
                         continue
     
-        # Acquire any external lock before Chroma writes begin (e.g. MCP in-process lock).
-        # File crawl / chunking above is lock-free; only the write phase needs serialization.
-        if _pre_write_hook is not None:
-            _pre_write_hook()
-
-        # Write-ahead marker: if we crash between here and clear_pending, the next
-        # run will detect this silo as interrupted and force a full non-incremental
-        # re-index. It also makes the write visible to concurrent readers while it
-        # runs — see ingest_journal.write_in_progress.
-        from ingest_journal import write_pending, clear_pending
-        write_pending(str(db_path), silo_slug, kind="incremental" if incremental else "full")
-
-        # Deferred rebuild delete: replacements are embedded and in hand, so the
-        # empty window is now the batch write rather than the whole extract phase.
-        if not incremental:
-            _delete_silo_rows_for_rebuild(
-                db_path, silo_slug, collection, image_collection, no_color=no_color
-            )
-    
-        if all_chunks:
-            batch_size = ADD_BATCH_SIZE
-            try:
-                batch_size = int(os.environ.get("LLMLIBRARIAN_ADD_BATCH_SIZE", batch_size))
-            except (TypeError, ValueError):
-                pass
-            batch_size = max(1, min(batch_size, 2000))
-            total_batches = (len(all_chunks) + batch_size - 1) // batch_size
-            if not _should_use_tqdm():
-                print(dim(no_color, f"  Adding {len(all_chunks)} chunks in {total_batches} batches (batch_size={batch_size})..."))
-            _batch_add(
-                collection,
-                all_chunks,
-                batch_size=batch_size,
-                no_color=no_color,
-                embedding_fn=ef,
-                embedding_workers=embedding_workers,
-            )
-        if all_image_vectors and _image_embed_ok:
-            _batch_add_image_vectors(
-                image_collection,
-                all_image_vectors,
-                batch_size=max(1, min(64, ADD_BATCH_SIZE)),
+        _open_write_phase()
+        writer.finish()
+        # Images still waiting on the vision queue are written with their OCR placeholder;
+        # a background thread applies each summary as it lands, after run_add returns.
+        eager_summaries += writer.summaries_backfilled
+        deferred_summaries -= writer.summaries_backfilled
+        if summary_queue is not None:
+            late_writer.append(writer)
+        if writer.image_vectors_written and not quiet and image_total:
+            _print_image_progress(
+                image_done=image_done,
+                image_total=image_total,
+                eager_count=eager_summaries,
+                deferred_count=deferred_summaries,
+                embeddings_complete=writer.image_vectors_written,
+                started_at=extraction_started_at,
                 no_color=no_color,
             )
-            image_embeddings_complete = len(all_image_vectors)
-            if not quiet and image_total:
-                _print_image_progress(
-                    image_done=image_done,
-                    image_total=image_total,
-                    eager_count=eager_summaries,
-                    deferred_count=deferred_summaries,
-                    embeddings_complete=image_embeddings_complete,
-                    started_at=extraction_started_at,
-                    no_color=no_color,
-                )
     
         # State writes — all happen after ChromaDB batch_add succeeds.
         if incremental:
-            _update_file_manifest(db_path, _update_manifest)
+            _update_file_manifest(db_path, _update_manifest, silos=[silo_slug])
         else:
             def _overwrite_manifest(manifest_data: dict) -> None:
                 silos = manifest_data.setdefault("silos", {})
@@ -2742,18 +3712,18 @@ def run_add(
                     if p_res is None:
                         continue
                     try:
-                        st = p_res.stat()
-                        files_map[str(p_res)] = {"mtime": st.st_mtime, "size": st.st_size, "hash": h}
+                        st = stat_by_path.get(str(p_res)) or p_res.stat()
+                        files_map[str(p_res)] = {**_manifest_stat_fields(st), "hash": h}
                     except OSError:
                         continue
                 for zp in zips:
                     try:
                         st = zp.stat()
-                        files_map[str(zp)] = {"mtime": st.st_mtime, "size": st.st_size, "hash": ""}
+                        files_map[str(zp)] = {**_manifest_stat_fields(st), "hash": ""}
                     except OSError:
                         continue
                 silos[silo_slug] = {"path": str(path), "files": files_map}
-            _update_file_manifest(db_path, _overwrite_manifest)
+            _update_file_manifest(db_path, _overwrite_manifest, silos=[silo_slug])
     
         if (not incremental) or ledger_sources_to_replace or tax_rows:
             replace_tax_rows_for_sources(
@@ -2765,32 +3735,18 @@ def run_add(
             )
     
         now_iso = datetime.now(timezone.utc).isoformat()
-        language_stats = None
-        if all_chunks:
-            unique_by_ext: dict[str, set[str]] = {}
-            for _id, _doc, meta in all_chunks:
-                src = (meta or {}).get("source") or ""
-                if not src:
-                    continue
-                ext = Path(src).suffix.lower()
-                if ext not in ADD_CODE_EXTENSIONS:
-                    continue
-                unique_by_ext.setdefault(ext, set()).add(src)
-            if unique_by_ext:
-                language_stats = {
-                    "by_ext": {ext: len(paths) for ext, paths in unique_by_ext.items()},
-                    "sample_paths": {ext: list(paths)[:3] for ext, paths in unique_by_ext.items()},
-                }
-        chunks_count = len(all_chunks)
+        language_stats = writer.language_stats()
+        chunks_count = writer.chunks_seen
         total_files = files_indexed
         if incremental:
             try:
-                result = collection.get(where={"silo": silo_slug}, include=["metadatas"])
-                chunks_count = len(result.get("metadatas") or [])
+                chunks_count = chunk_counts.chunk_total(silo_slug) if chunk_counts is not None else None
             except Exception:
-                pass
+                chunks_count = None
+            if chunks_count is None:
+                chunks_count = _recount_silo_chunks(chunk_counts, collection, silo_slug)
             try:
-                manifest = _read_file_manifest(db_path)
+                manifest = _read_file_manifest(db_path, silos=[silo_slug])
                 silo_manifest = (manifest.get("silos") or {}).get(silo_slug, {})
                 manifest_files = (silo_manifest.get("files") or {}) if isinstance(silo_manifest, dict) else {}
                 if isinstance(manifest_files, dict):
@@ -2815,9 +3771,11 @@ def run_add(
         # landing in that gap raise "Error finding id" and fall back to a global
         # scan — which can yield zero chunks for a silo that is in fact complete.
         # Clearing the marker on write-completion alone left that window unflagged.
-        if all_chunks:
+        if writer.chunks_seen:
             _wait_until_queryable(collection, silo_slug)
         clear_pending(str(db_path), silo_slug)
+        if on_sources_changed is not None:
+            on_sources_changed(changed_sources if incremental else None)
         elapsed_seconds = time.perf_counter() - run_started_at
         elapsed_label = f"{elapsed_seconds:.1f}s"
     
@@ -2852,14 +3810,98 @@ def run_add(
                 pass
         return (files_indexed, len(failures))
 
-    if get_chroma_client is not None:
-        # Test/operator override: use the provided client factory directly (no flock).
+    @contextmanager
+    def _chroma_session() -> Iterator[Any]:
+        if get_chroma_client is not None:
+            # Test/operator override: use the provided client factory directly (no flock).
+            try:
+                yield get_chroma_client(str(db_path))
+            finally:
+                release_chroma_client()
+            return
+        with writer_client(str(Path(db_path).resolve())) as client:
+            yield client
+
+    # Eager image summaries run on the DB's vision queue while extraction continues.
+    summary_queue = open_image_summary_queue(db_path) if effective_image_vision_enabled else None
+    late_writer: list[_ChunkWriter] = []
+    try:
+        with manifest_session(db_path), _chroma_session() as client:
+            result = _run_add_chroma_phase(client)
+        if late_writer and late_writer[0].pending_image_summaries():
+            _start_late_image_summaries(late_writer[0], _chroma_session, summary_queue, quiet=quiet, no_color=no_color)
+            summary_queue = None  # the backfill thread holds the reference now
+        return result
+    finally:
+        if summary_queue is not None:
+            summary_queue.close()
+
+
+_late_summary_threads: list[threading.Thread] = []
+_late_summary_threads_lock = threading.Lock()
+
+
+def _start_late_image_summaries(
+    writer: _ChunkWriter,
+    chroma_session: Callable[[], Any],
+    summary_queue: ImageSummaryQueue | None,
+    *,
+    quiet: bool = False,
+    no_color: bool = False,
+) -> threading.Thread:
+    """
+    Apply the summaries still pending after run_add's write phase on a background thread,
+    so run_add returns (and its caller drops pal's write gate or MCP's Chroma lock) at
+    OCR speed. The thread is not a daemon: a CLI run finishes its summaries before the
+    interpreter exits, and interrupting it leaves the jobs queued for the next run.
+    It closes summary_queue when done.
+    """
+    if not quiet and not _should_use_tqdm():
+        count = len(writer.pending_image_summaries())
+        print(dim(no_color, f"  Searchable now; applying {count} image summaries in the background..."))
+
+    def _run() -> None:
         try:
-            return _run_add_chroma_phase(get_chroma_client(str(db_path)))
+            _apply_late_image_summaries(writer, chroma_session)
+        except Exception as e:
+            _log_event("WARN", "Late image summaries stopped; remaining jobs stay queued", error=str(e))
         finally:
-            release_chroma_client()
-    with writer_client(str(Path(db_path).resolve())) as client:
-        return _run_add_chroma_phase(client)
+            if summary_queue is not None:
+                summary_queue.close()
+            with _late_summary_threads_lock:
+                _late_summary_threads.remove(thread)
+
+    thread = threading.Thread(target=_run, name="llmli-summary-backfill")
+    with _late_summary_threads_lock:
+        _late_summary_threads.append(thread)
+    thread.start()
+    return thread
+
+
+def wait_for_image_summaries(timeout: float | None = None) -> bool:
+    """Wait for background summary backfills started by run_add; True when none are left running."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with _late_summary_threads_lock:
+        threads = list(_late_summary_threads)
+    for thread in threads:
+        thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+    return not any(thread.is_alive() for thread in threads)
+
+
+def _apply_late_image_summaries(writer: _ChunkWriter, chroma_session: Callable[[], Any]) -> None:
+    """Apply summaries as they land, each batch in its own short writer session, so the
+    images are searchable (OCR text) meanwhile and other writers are not blocked at
+    vision speed."""
+    pending = writer.pending_image_summaries()
+    while pending:
+        wait(pending, return_when=FIRST_COMPLETED)
+        with chroma_session() as client:
+            writer.apply_image_summaries(
+                wait=False,
+                collection=client.get_or_create_collection(name=LLMLI_COLLECTION, embedding_function=writer.embedding_fn),
+                image_collection=_get_image_collection(client),
+            )
+        pending = writer.pending_image_summaries()
 
 
 def _load_limits_config() -> tuple[int, int, int, int, int]:
@@ -2878,12 +3920,33 @@ def _load_limits_config() -> tuple[int, int, int, int, int]:
     return max_file_bytes, max_depth, max_archive_bytes, max_files_per_zip, max_extracted_per_zip
 
 
+def _recount_silo_chunks(chunk_counts: Any | None, collection: Any, silo_slug: str) -> int:
+    """Chunk total for a silo whose counters are not ready: recount it from Chroma
+    (which seeds the counters), else count its ids. 0 when both fail."""
+    try:
+        if chunk_counts is not None:
+            chunk_counts.recount_silo(collection, silo_slug)
+            total = chunk_counts.chunk_total(silo_slug)
+            if total is not None:
+                return total
+    except Exception:
+        pass
+    try:
+        result = collection.get(where={"silo": silo_slug}, include=[])
+        ids = result.get("ids") if isinstance(result, dict) else None
+        if isinstance(ids, list):
+            return len(ids)
+    except Exception:
+        pass
+    return 0
+
+
 def update_silo_counts(db_path: str | Path, silo_slug: str, display_name: str | None = None) -> None:
     """Recompute silo file/chunk counts and update llmli registry."""
     from state import update_silo, list_silos
 
     db_path = db_path or DB_PATH
-    manifest = _read_file_manifest(db_path)
+    manifest = _read_file_manifest(db_path, silos=[silo_slug])
     silo_manifest = (manifest.get("silos") or {}).get(silo_slug, {})
     manifest_files = (silo_manifest.get("files") or {}) if isinstance(silo_manifest, dict) else {}
     total_files = len(manifest_files) if isinstance(manifest_files, dict) else 0
@@ -2899,23 +3962,26 @@ def update_silo_counts(db_path: str | Path, silo_slug: str, display_name: str |
                 break
     name = display_name or existing_display or silo_slug
 
-    from chroma_lock import chroma_shared_lock
-
+    # Maintained by the chunk writes; only a silo that has never been counted (or whose
+    # counters went stale) pays for a Chroma metadata scan, which then seeds them.
+    chunk_counts = open_chunk_counts(db_path)
+    chunks_count: int | None = None
     try:
-        with chroma_shared_lock(str(Path(db_path).resolve())):
-            ef = get_embedding_function(batch_size=1)
-            client = get_client(str(db_path))
-            collection = client.get_or_create_collection(name=LLMLI_COLLECTION, embedding_function=ef)
-            chunks_count = 0
-            try:
-                result = collection.get(where={"silo": silo_slug})
-                ids = result.get("ids") if isinstance(result, dict) else None
-                if isinstance(ids, list):
-                    chunks_count = len(ids)
-            except Exception:
-                pass
-    finally:
-        release_chroma_client()
+        chunks_count = chunk_counts.chunk_total(silo_slug) if chunk_counts is not None else None
+    except Exception:
+        chunks_count = None
+
+    if chunks_count is None:
+        from chroma_lock import chroma_shared_lock
+
+        try:
+            with chroma_shared_lock(str(Path(db_path).resolve())):
+                ef = get_embedding_function(batch_size=1)
+                client = get_client(str(db_path))
+                collection = client.get_or_create_collection(name=LLMLI_COLLECTION, embedding_function=ef)
+                chunks_count = _recount_silo_chunks(chunk_counts, collection, silo_slug)
+        finally:
+            release_chroma_client()
 
     now_iso = datetime.now(timezone.utc).isoformat()
     update_silo(db_path, silo_slug, silo_path, total_files, chunks_count, now_iso, display_name=name)
@@ -2953,10 +4019,7 @@ def remove_single_file(
     p = Path(path).resolve()
     path_str = str(p)
 
-    manifest = _read_file_manifest(db_path)
-    silo_manifest = (manifest.get("silos") or {}).get(silo_slug, {})
-    manifest_files = (silo_manifest.get("files") or {}) if isinstance(silo_manifest, dict) else {}
-    prev = manifest_files.get(path_str) if isinstance(manifest_files, dict) else None
+    prev = _get_manifest_file(db_path, silo_slug, path_str)
 
     with writer_client(str(Path(db_path).resolve())) as client:
         ef = get_embedding_function(batch_size=1)
@@ -2967,18 +4030,11 @@ def remove_single_file(
             image_collection=image_collection,
             silo_slug=silo_slug,
             source_path=path_str,
+            lexical_index=open_lexical_index(db_path),
+            chunk_counts=open_chunk_counts(db_path),
         )
 
-        def _update_manifest(manifest_data: dict) -> None:
-            silos = manifest_data.setdefault("silos", {})
-            silo_entry = silos.setdefault(silo_slug, {"path": "", "files": {}})
-            if not silo_entry.get("path"):
-                silo_entry["path"] = str(p.parent)
-            files_map = silo_entry.setdefault("files", {})
-            if isinstance(files_map, dict) and path_str in files_map:
-                del files_map[path_str]
-
-        _update_file_manifest(db_path, _update_manifest)
+        _delete_manifest_files(db_path, silo_slug, [path_str], silo_path=str(p.parent))
         replace_tax_rows_for_sources(
             db_path,
             silo=silo_slug,
@@ -3001,94 +4057,194 @@ def _fail_single_file(db_path: str | Path, path_str: str, error: str) -> tuple[s
     return ("error", path_str)
 
 
-def update_single_file(
-    path: str | Path,
-    db_path: str | Path | None = None,
-    silo_slug: str = "__self__",
-    allow_cloud: bool = False,
-    follow_symlinks: bool = False,
-    no_color: bool = False,
-    update_counts: bool = True,
-    image_vision_enabled: bool | None = None,
-    embedding_workers: int | None = None,
-    exclude_patterns: list[str] | None = None,
-) -> tuple[str, str]:
+class _PendingFileUpdate:
+    """A file that passed the single-file checks and needs (re-)indexing.
+
+    chunks is filled by extraction before the writer session; files with a
+    cross-silo clone candidate are resolved inside it (cloning reads the collection).
     """
-    Index or update a single file within a silo. Returns (status, path).
-    status: updated|unchanged|removed|skipped|duplicate|error
+
+    __slots__ = ("p", "path_str", "kind", "stat", "file_hash", "clone_from", "chunks")
+
+    def __init__(self, p: Path, kind: str, stat: os.stat_result, file_hash: str, clone_from: str) -> None:
+        self.p = p
+        self.path_str = str(p)
+        self.kind = kind
+        self.stat = stat
+        self.file_hash = file_hash
+        self.clone_from = clone_from
+        self.chunks: list[ChunkTuple] | None = None
+
+
+class _FileUpdateContext:
+    """Per-call settings shared by every file of an update_single_file / update_files call."""
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        silo_slug: str,
+        allow_cloud: bool,
+        follow_symlinks: bool,
+        image_vision_enabled: bool | None,
+        exclude_patterns: list[str] | None,
+    ) -> None:
+        self.db_path = db_path
+        self.silo_slug = silo_slug
+        self.allow_cloud = allow_cloud
+        self.follow_symlinks = follow_symlinks
+        self.image_vision_enabled = _resolve_image_vision_enabled(
+            db_path=db_path,
+            silo_slug=silo_slug,
+            requested=image_vision_enabled,
+        )
+        self.excludes = _effective_add_excludes(db_path, silo_slug, exclude_patterns)
+        self.limits = _load_limits_config()
+        self._image_ready: bool | None = None
+        self._image_lock = threading.Lock()
+
+    def image_models_ready(self) -> bool:
+        with self._image_lock:
+            if self._image_ready is None:
+                try:
+                    if self.image_vision_enabled:
+                        ensure_vision_model_ready()
+                    ensure_image_embedding_adapter_ready()
+                    self._image_ready = True
+                except Exception:
+                    self._image_ready = False
+            return self._image_ready
+
+
+def _plan_file_update(
+    path: str | Path,
+    ctx: _FileUpdateContext,
+    prev_lookup: Callable[[str], dict[str, Any] | None],
+) -> tuple[str, str] | _PendingFileUpdate:
+    """Checks shared by update_single_file and update_files, before any write.
+
+    Returns a final (status, path), ("remove", path) when the file should leave the
+    index (gone, excluded, over limits), or a _PendingFileUpdate. Error statuses
+    carry the failure reason in place of the path; callers record it.
     """
-    db_path = db_path or DB_PATH
-    try:
-        Path(db_path).mkdir(parents=True, exist_ok=True)
-    except Exception:
-        pass
     p = Path(path)
-    if p.is_symlink() and not follow_symlinks:
+    if p.is_symlink() and not ctx.follow_symlinks:
         return ("skipped", str(p))
     try:
         p = p.resolve()
     except Exception:
-        return _fail_single_file(db_path, str(p), "path resolution failed")
+        return ("error", "path resolution failed")
     path_str = str(p)
     if not p.exists() or not p.is_file():
-        return remove_single_file(p, db_path=db_path, silo_slug=silo_slug, update_counts=update_counts)
-    if not allow_cloud:
-        cloud_kind = is_cloud_sync_path(p)
-        if cloud_kind:
-            return ("skipped", path_str)
-    effective_image_vision_enabled = _resolve_image_vision_enabled(
-        db_path=db_path,
-        silo_slug=silo_slug,
-        requested=image_vision_enabled,
-    )
-    effective_excludes = _effective_add_excludes(db_path, silo_slug, exclude_patterns)
-    if not should_index(path_str, ADD_DEFAULT_INCLUDE, effective_excludes):
-        return remove_single_file(p, db_path=db_path, silo_slug=silo_slug, update_counts=update_counts)
-    if p.suffix.lower() in {".png", ".jpg", ".jpeg", ".heic", ".heif", ".tif", ".tiff"}:
-        try:
-            if effective_image_vision_enabled:
-                ensure_vision_model_ready()
-            ensure_image_embedding_adapter_ready()
-        except Exception:
-            return _fail_single_file(db_path, path_str, "image model not ready")
-
-    max_file_bytes, _max_depth, max_archive_bytes, max_files_per_zip, max_extracted_per_zip = _load_limits_config()
+        return ("remove", path_str)
+    if not ctx.allow_cloud and is_cloud_sync_path(p):
+        return ("skipped", path_str)
+    if not should_index(path_str, ADD_DEFAULT_INCLUDE, ctx.excludes):
+        return ("remove", path_str)
+    if p.suffix.lower() in IMAGE_EXTENSIONS and not ctx.image_models_ready():
+        return ("error", "image model not ready")
+
+    max_file_bytes, _max_depth, max_archive_bytes, _max_files_per_zip, _max_extracted_per_zip = ctx.limits
     try:
         stat = p.stat()
-        mtime = stat.st_mtime
-        size = stat.st_size
     except OSError:
-        return _fail_single_file(db_path, path_str, "stat failed")
+        return ("error", "stat failed")
+    mtime = stat.st_mtime
+    size = stat.st_size
 
     kind = _detect_kind(p)
     if kind != "zip" and size > max_file_bytes:
-        return remove_single_file(p, db_path=db_path, silo_slug=silo_slug, update_counts=update_counts)
+        return ("remove", path_str)
     if kind == "zip" and size > max_archive_bytes:
-        return remove_single_file(p, db_path=db_path, silo_slug=silo_slug, update_counts=update_counts)
+        return ("remove", path_str)
 
-    manifest = _read_file_manifest(db_path)
-    silo_manifest = (manifest.get("silos") or {}).get(silo_slug, {})
-    manifest_files = (silo_manifest.get("files") or {}) if isinstance(silo_manifest, dict) else {}
-    prev = manifest_files.get(path_str) if isinstance(manifest_files, dict) else None
+    prev = prev_lookup(path_str)
 
     file_hash = ""
-    existing: list[dict[str, Any]] = []
+    clone_from = ""
     if kind != "zip":
-        file_hash = get_file_hash(p)
+        if prev and _stat_signature_matches(prev, stat):
+            return ("unchanged", path_str)
+        file_hash = get_file_fingerprint(p, _resolve_fingerprint_mode(None, str((prev or {}).get("hash") or "")))
         if prev and prev.get("mtime") == mtime and prev.get("size") == size:
             if not file_hash:
                 return ("unchanged", path_str)
             # The manifest entry IS this path's hash record, so comparing it is
-            # the whole check — the derived index would only report back what
+            # the whole check — the hash index would only report back what
             # prev already says.
             if prev.get("hash") == file_hash:
                 return ("unchanged", path_str)
         if file_hash:
-            existing = _file_registry_get(db_path, file_hash)
+            existing = _file_registry_get(ctx.db_path, file_hash)
+            clone_from = next(
+                (str(e.get("silo") or "") for e in existing if str(e.get("silo") or "") != ctx.silo_slug),
+                "",
+            )
+            if clone_from and kind == "image":
+                from state import get_silo_image_vision_enabled
+
+                if get_silo_image_vision_enabled(ctx.db_path, clone_from) != ctx.image_vision_enabled:
+                    clone_from = ""
     else:
         if prev and prev.get("mtime") == mtime and prev.get("size") == size:
             return ("unchanged", path_str)
+    return _PendingFileUpdate(p, kind, stat, file_hash, clone_from)
+
+
+def _extract_pending_file(pending: _PendingFileUpdate, ctx: _FileUpdateContext) -> str | None:
+    """Fill pending.chunks; returns an error reason on failure."""
+    max_file_bytes, _max_depth, max_archive_bytes, max_files_per_zip, max_extracted_per_zip = ctx.limits
+    if pending.kind == "zip":
+        try:
+            pending.chunks = process_zip_to_chunks(
+                pending.p,
+                ADD_DEFAULT_INCLUDE,
+                ctx.excludes,
+                max_archive_bytes,
+                max_file_bytes,
+                max_files_per_zip,
+                max_extracted_per_zip,
+                db_path=ctx.db_path,
+            )
+        except Exception:
+            return "zip processing failed"
+        return None
+    try:
+        pending.chunks = process_one_file(
+            pending.p,
+            pending.kind,
+            pending.file_hash or None,
+            ctx.follow_symlinks,
+            pending.p,
+            db_path=ctx.db_path,
+            image_vision_enabled=ctx.image_vision_enabled,
+            # Single-file updates run in the MCP server and watcher, often right after a write.
+            map_pdf=False,
+        )
+    except Exception:
+        return "file processing failed"
+    return None
+
 
+def _commit_file_updates(
+    ctx: _FileUpdateContext,
+    pending: list[_PendingFileUpdate],
+    removals: list[str],
+    *,
+    no_color: bool,
+    embedding_workers: int | None,
+    removal_silo_path: str | None = None,
+) -> dict[str, str]:
+    """One writer session for every pending update and removal of a silo.
+
+    Text files are diffed per chunk (only removed chunk ids are deleted, unchanged
+    ones get a metadata refresh); zips, images, and files whose stored ids cannot be
+    read are replaced per source. All new chunks go through one batched embed/add,
+    and the manifest, tax ledger, and (in the caller) silo counts are updated once.
+    Returns {path: error reason} for files that failed in here.
+    """
+    db_path = ctx.db_path
+    silo_slug = ctx.silo_slug
+    failed: dict[str, str] = {}
     with writer_client(str(Path(db_path).resolve())) as client:
         ef = get_embedding_function(batch_size=1)
         collection = client.get_or_create_collection(name=LLMLI_COLLECTION, embedding_function=ef)
@@ -3096,124 +4252,303 @@ def update_single_file(
             ef = client.get_effective_ef(LLMLI_COLLECTION) or ef
         validate_embedding_dimension(collection, ef)
         image_collection = _get_image_collection(client)
+        lexical_index = open_lexical_index(db_path)
+        _sidecar_write(lexical_index, [silo_slug], lambda ix: ix.ensure_silo(collection, silo_slug))
+        chunk_counts = open_chunk_counts(db_path)
 
-        chunks: list[ChunkTuple] = []
-        image_vectors: list[ImageVectorTuple] = []
-        if kind == "zip":
-            try:
-                chunks = process_zip_to_chunks(
-                    p,
-                    ADD_DEFAULT_INCLUDE,
-                    effective_excludes,
-                    max_archive_bytes,
-                    max_file_bytes,
-                    max_files_per_zip,
-                    max_extracted_per_zip,
-                    db_path=db_path,
-                )
-            except Exception:
-                return _fail_single_file(db_path, path_str, "zip processing failed")
-        else:
-            clone_from = next(
-                (str(e.get("silo") or "") for e in existing if str(e.get("silo") or "") != silo_slug),
-                "",
-            )
-            can_clone = bool(clone_from and file_hash)
-            if can_clone and kind == "image":
-                from state import get_silo_image_vision_enabled
-
-                source_mode = get_silo_image_vision_enabled(db_path, clone_from) if clone_from else None
-                can_clone = source_mode is not None and source_mode == effective_image_vision_enabled
-            if can_clone and clone_from and file_hash:
-                chunks = _clone_chunks_from_existing_silo(
+        image_vectors_by_path: dict[str, list[ImageVectorTuple]] = {}
+        for item in pending:
+            if item.chunks is not None:
+                continue
+            if item.clone_from:
+                item.chunks = _clone_chunks_from_existing_silo(
                     collection=collection,
-                    from_silo=clone_from,
-                    source_path=path_str,
+                    from_silo=item.clone_from,
+                    source_path=item.path_str,
                     target_silo=silo_slug,
                 )
-                image_vectors = _clone_image_vectors_from_existing_silo(
+                image_vectors_by_path[item.path_str] = _clone_image_vectors_from_existing_silo(
                     collection=image_collection,
-                    from_silo=clone_from,
-                    source_path=path_str,
+                    from_silo=item.clone_from,
+                    source_path=item.path_str,
                     target_silo=silo_slug,
                 )
-            if not chunks:
-                try:
-                    chunks = process_one_file(
-                        p,
-                        kind,
-                        file_hash or None,
-                        follow_symlinks,
-                        p,
-                        db_path=db_path,
-                        image_vision_enabled=effective_image_vision_enabled,
-                    )
-                except Exception:
-                    return _fail_single_file(db_path, path_str, "file processing failed")
-
-        _delete_source_from_collections(
-            collection=collection,
-            image_collection=image_collection,
-            silo_slug=silo_slug,
-            source_path=path_str,
-        )
-
-        if chunks:
-            _now_iso = datetime.now(timezone.utc).isoformat()
-            chunks = [
+            if not item.chunks:
+                error = _extract_pending_file(item, ctx)
+                if error:
+                    failed[item.path_str] = error
+        ready = [item for item in pending if item.path_str not in failed]
+
+        _now_iso = datetime.now(timezone.utc).isoformat()
+        scoped: dict[str, list[ChunkTuple]] = {
+            item.path_str: [
                 (hashlib.sha256(f"{silo_slug}|{cid}".encode()).hexdigest()[:20], doc, {**meta, "silo": silo_slug, "indexed_at": _now_iso})
-                for cid, doc, meta in chunks
+                for cid, doc, meta in item.chunks
             ]
-            batch_size = ADD_BATCH_SIZE
-            try:
-                batch_size = int(os.environ.get("LLMLIBRARIAN_ADD_BATCH_SIZE", batch_size))
-            except (TypeError, ValueError):
-                pass
-            batch_size = max(1, min(batch_size, 2000))
-            embedding_workers = _resolve_worker_override(
-                embedding_workers,
-                "LLMLIBRARIAN_EMBEDDING_WORKERS",
-                1,
+            for item in ready
+            if item.chunks
+        }
+
+        # Text files get a per-chunk diff: content-addressed ids mean an edit only
+        # deletes the chunks it changed and only the new ones are embedded.
+        kept_ids: dict[str, set[str]] = {}
+        for item in ready:
+            chunks = scoped.get(item.path_str)
+            if chunks and item.kind not in ("zip", "image"):
+                kept = _diff_source_chunks(
+                    collection,
+                    silo_slug,
+                    item.path_str,
+                    chunks,
+                    lexical_index=lexical_index,
+                    chunk_counts=chunk_counts,
+                )
+                if kept is not None:
+                    kept_ids[item.path_str] = kept
+                    continue
+            _delete_source_from_collections(
+                collection=collection,
+                image_collection=image_collection,
+                silo_slug=silo_slug,
+                source_path=item.path_str,
+                lexical_index=lexical_index,
+                chunk_counts=chunk_counts,
             )
+        for source_path in removals:
+            _delete_source_from_collections(
+                collection=collection,
+                image_collection=image_collection,
+                silo_slug=silo_slug,
+                source_path=source_path,
+                lexical_index=lexical_index,
+                chunk_counts=chunk_counts,
+            )
+
+        all_chunks: list[ChunkTuple] = []
+        unchanged_chunks: list[ChunkTuple] = []
+        image_vectors: list[ImageVectorTuple] = []
+        tax_rows: list[dict[str, Any]] = []
+        for item in ready:
+            chunks = scoped.get(item.path_str)
+            if not chunks:
+                continue
+            kept = kept_ids.get(item.path_str) or set()
+            for chunk in chunks:
+                (unchanged_chunks if chunk[0] in kept else all_chunks).append(chunk)
+            item_vectors = image_vectors_by_path.get(item.path_str) or []
+            if not item_vectors:
+                vector_row = _image_vector_from_chunks(source_path=item.path_str, chunks=chunks)
+                if vector_row is not None:
+                    vid, vpath, vdoc, vmeta = vector_row
+                    item_vectors = [(vid, vpath, vdoc, {**vmeta, "silo": silo_slug})]
+            image_vectors.extend(item_vectors)
+            tax_rows.extend(extract_tax_rows_from_chunks(chunks))
+
+        batch_size = ADD_BATCH_SIZE
+        try:
+            batch_size = int(os.environ.get("LLMLIBRARIAN_ADD_BATCH_SIZE", batch_size))
+        except (TypeError, ValueError):
+            pass
+        batch_size = max(1, min(batch_size, 2000))
+        if unchanged_chunks:
+            all_chunks.extend(
+                _refresh_chunk_metadata(
+                    collection, unchanged_chunks, batch_size=batch_size, chunk_counts=chunk_counts
+                )
+            )
+        if all_chunks:
             _batch_add(
                 collection,
-                chunks,
+                all_chunks,
                 batch_size=batch_size,
                 no_color=no_color,
                 embedding_fn=ef,
-                embedding_workers=embedding_workers,
+                embedding_workers=_resolve_worker_override(
+                    embedding_workers,
+                    "LLMLIBRARIAN_EMBEDDING_WORKERS",
+                    1,
+                ),
+                embedding_cache=open_embedding_cache(db_path, ef),
+                lexical_index=lexical_index,
+                chunk_counts=chunk_counts,
             )
-            if not image_vectors:
-                vector_row = _image_vector_from_chunks(source_path=path_str, chunks=chunks)
-                if vector_row is not None:
-                    vid, vpath, vdoc, vmeta = vector_row
-                    image_vectors = [(vid, vpath, vdoc, {**vmeta, "silo": silo_slug})]
-            if image_vectors:
-                _batch_add_image_vectors(
-                    image_collection,
-                    image_vectors,
-                    batch_size=1,
-                    no_color=no_color,
-                )
-        tax_rows = extract_tax_rows_from_chunks(chunks) if chunks else []
-
-        def _update_manifest(manifest_data: dict) -> None:
-            silos = manifest_data.setdefault("silos", {})
-            silo_entry = silos.setdefault(silo_slug, {"path": "", "files": {}})
-            files_map = silo_entry.setdefault("files", {})
-            if not isinstance(files_map, dict):
-                files_map = {}
-                silo_entry["files"] = files_map
-            files_map[path_str] = {"mtime": mtime, "size": size, "hash": file_hash if kind != "zip" else ""}
-
-        _update_file_manifest(db_path, _update_manifest)
+        if image_vectors:
+            _batch_add_image_vectors(
+                image_collection,
+                image_vectors,
+                batch_size=max(1, min(len(image_vectors), ADD_BATCH_SIZE)),
+                no_color=no_color,
+            )
+
+        _apply_manifest_file_changes(
+            db_path,
+            silo_slug,
+            upserts={
+                item.path_str: {**_manifest_stat_fields(item.stat), "hash": item.file_hash if item.kind != "zip" else ""}
+                for item in ready
+            },
+            deletes=removals,
+            silo_path=removal_silo_path,
+        )
         replace_tax_rows_for_sources(
             db_path,
             silo=silo_slug,
-            sources={path_str},
+            sources={item.path_str for item in ready} | set(removals),
             new_rows=tax_rows,
         )
+    return failed
 
-    if update_counts:
-        update_silo_counts(db_path, silo_slug)
-    return ("updated", path_str)
+
+def update_single_file(
+    path: str | Path,
+    db_path: str | Path | None = None,
+    silo_slug: str = "__self__",
+    allow_cloud: bool = False,
+    follow_symlinks: bool = False,
+    no_color: bool = False,
+    update_counts: bool = True,
+    image_vision_enabled: bool | None = None,
+    embedding_workers: int | None = None,
+    exclude_patterns: list[str] | None = None,
+) -> tuple[str, str]:
+    """
+    Index or update a single file within a silo. Returns (status, path).
+    status: updated|unchanged|removed|skipped|duplicate|error
+    """
+    db_path = db_path or DB_PATH
+    try:
+        Path(db_path).mkdir(parents=True, exist_ok=True)
+    except Exception:
+        pass
+    ctx = _FileUpdateContext(db_path, silo_slug, allow_cloud, follow_symlinks, image_vision_enabled, exclude_patterns)
+    with manifest_session(db_path):
+        plan = _plan_file_update(path, ctx, lambda path_str: _get_manifest_file(db_path, silo_slug, path_str))
+        if isinstance(plan, tuple):
+            status, detail = plan
+            if status == "remove":
+                return remove_single_file(detail, db_path=db_path, silo_slug=silo_slug, update_counts=update_counts)
+            if status == "error":
+                return _fail_single_file(db_path, _plan_error_path(path), detail)
+            return plan
+        if not plan.clone_from:
+            error = _extract_pending_file(plan, ctx)
+            if error:
+                return _fail_single_file(db_path, plan.path_str, error)
+        failed = _commit_file_updates(ctx, [plan], [], no_color=no_color, embedding_workers=embedding_workers)
+        if failed:
+            return _fail_single_file(db_path, plan.path_str, failed[plan.path_str])
+        if update_counts:
+            update_silo_counts(db_path, silo_slug)
+        return ("updated", plan.path_str)
+
+
+def _plan_error_path(path: str | Path) -> str:
+    try:
+        return str(Path(path).resolve())
+    except Exception:
+        return str(path)
+
+
+def update_files(
+    paths: list[str | Path],
+    db_path: str | Path | None = None,
+    silo_slug: str = "__self__",
+    allow_cloud: bool = False,
+    follow_symlinks: bool = False,
+    no_color: bool = False,
+    update_counts: bool = True,
+    image_vision_enabled: bool | None = None,
+    embedding_workers: int | None = None,
+    exclude_patterns: list[str] | None = None,
+    removals: list[str | Path] | None = None,
+    workers: int | None = None,
+) -> list[tuple[str, str]]:
+    """
+    Batch form of update_single_file / remove_single_file for one silo.
+
+    Files are checked, hashed, and extracted on a thread pool (workers /
+    LLMLIBRARIAN_MAX_WORKERS), then every delete, the chunk add, and the
+    manifest/ledger/count updates happen in one writer session instead of one
+    per file. Paths that are gone, excluded, or over limits are removed, as
+    update_single_file would. Returns (status, path) per input, paths first
+    then removals, in input order.
+    """
+    db_path = db_path or DB_PATH
+    try:
+        Path(db_path).mkdir(parents=True, exist_ok=True)
+    except Exception:
+        pass
+    ctx = _FileUpdateContext(db_path, silo_slug, allow_cloud, follow_symlinks, image_vision_enabled, exclude_patterns)
+    removal_paths: list[str] = []
+    for r in removals or []:
+        try:
+            removal_paths.append(str(Path(r).resolve()))
+        except Exception:
+            removal_paths.append(str(r))
+    candidate_paths: list[str] = []
+    for raw in paths:
+        try:
+            candidate_paths.append(str(Path(raw).resolve()))
+        except Exception:
+            continue
+    prev_entries = _get_manifest_files(db_path, silo_slug, candidate_paths + removal_paths)
+
+    def _plan_and_extract(raw: str | Path) -> tuple[str, str] | _PendingFileUpdate:
+        plan = _plan_file_update(raw, ctx, prev_entries.get)
+        if isinstance(plan, _PendingFileUpdate) and not plan.clone_from:
+            error = _extract_pending_file(plan, ctx)
+            if error:
+                return ("error", error)
+        return plan
+
+    workers = _resolve_worker_override(
+        workers,
+        "LLMLIBRARIAN_MAX_WORKERS",
+        max(1, min(MAX_WORKERS, (os.cpu_count() or 8))),
+    )
+    plans: list[tuple[str, str] | _PendingFileUpdate] = []
+    if paths:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(paths))), thread_name_prefix="llmli-file") as executor:
+            plans = list(executor.map(_plan_and_extract, paths))
+
+    results: list[tuple[str, str]] = []
+    failures: list[dict[str, str]] = []
+    pending: list[_PendingFileUpdate] = []
+    for raw, plan in zip(paths, plans):
+        if isinstance(plan, _PendingFileUpdate):
+            pending.append(plan)
+            results.append(("updated", plan.path_str))
+            continue
+        status, detail = plan
+        if status == "remove":
+            removal_paths.append(detail)
+            results.append(("removed" if detail in prev_entries else "skipped", detail))
+        elif status == "error":
+            err_path = _plan_error_path(raw)
+            failures.append({"path": err_path, "error": detail})
+            results.append(("error", err_path))
+        else:
+            results.append(plan)
+    for r in removals or []:
+        r_str = _plan_error_path(r)
+        results.append(("removed" if r_str in prev_entries else "skipped", r_str))
+
+    if pending or removal_paths:
+        failed = _commit_file_updates(
+            ctx,
+            pending,
+            list(dict.fromkeys(removal_paths)),
+            no_color=no_color,
+            embedding_workers=embedding_workers,
+            removal_silo_path=str(Path(removal_paths[0]).parent) if removal_paths else None,
+        )
+        if failed:
+            failures.extend({"path": p, "error": e} for p, e in failed.items())
+            results = [("error", path_str) if path_str in failed else (status, path_str) for status, path_str in results]
+        if update_counts:
+            update_silo_counts(db_path, silo_slug)
+    if failures:
+        from state import append_last_failures
+
+        append_last_failures(db_path, failures)
+    return results
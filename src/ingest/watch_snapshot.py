@@ -0,0 +1,170 @@
+"""
+Persisted per-directory snapshot for watcher reconciliation.
+
+A full reconcile walks the tree, stats every file and compares against the
+file manifest. The snapshot records, for each directory the walk descends into,
+its mtime and the indexable files (name -> [mtime, size]) and subdirectories it
+held. Creating, deleting or renaming an entry bumps the parent directory's
+mtime, so an incremental pass stats directories only: a directory whose mtime
+is unchanged keeps its recorded files without listing or stat'ing them, and
+only changed directories are re-listed and diffed.
+
+In-place content edits do not touch the directory mtime; those are the
+filesystem observer's job, and a periodic full pass catches anything it missed.
+Directory mtimes newer than the scan start minus _RACY_WINDOW_S are recorded as
+0 (untrusted) so an entry created in the same mtime tick is not skipped.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from ingest.watch_scan import should_descend_into_dir, should_index
+
+SNAPSHOT_VERSION = 1
+_RACY_WINDOW_S = 2.0
+
+FileStat = tuple[float, int]
+
+
+def snapshot_path(state_dir: Path, slug: str) -> Path:
+    safe = "".join(ch if ch.isalnum() or ch in ("-", "_") else "-" for ch in str(slug)).strip("-_") or "default"
+    return state_dir / f"{safe}.json"
+
+
+def scan_params_key(include: list[str], exclude: list[str], max_depth: int, max_file_bytes: int) -> str:
+    """Digest of the scan rules; a snapshot taken under other rules is discarded."""
+    raw = json.dumps([sorted(include), sorted(exclude), int(max_depth), int(max_file_bytes)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def load_snapshot(path: Path, root: Path, params_key: str) -> dict[str, Any] | None:
+    """The persisted snapshot for root under params_key, or None if absent or stale."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != SNAPSHOT_VERSION
+        or data.get("root") != str(root)
+        or data.get("params") != params_key
+        or not isinstance(data.get("dirs"), dict)
+    ):
+        return None
+    return data
+
+
+def save_snapshot(path: Path, snapshot: dict[str, Any]) -> None:
+    """Atomically write the snapshot (compact JSON; it can hold every file of the tree)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(snapshot, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        try:
+            tmp.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def snapshot_files(dirs: dict[str, dict[str, Any]]) -> dict[str, FileStat]:
+    """Every recorded file as path -> (mtime, size)."""
+    out: dict[str, FileStat] = {}
+    for dir_path, entry in dirs.items():
+        for name, (mtime, size) in (entry.get("files") or {}).items():
+            out[os.path.join(dir_path, name)] = (mtime, size)
+    return out
+
+
+def _subtree_files(dirs: dict[str, dict[str, Any]], top: str) -> list[str]:
+    prefix = top.rstrip(os.sep) + os.sep
+    out: list[str] = []
+    for dir_path, entry in dirs.items():
+        if dir_path == top or dir_path.startswith(prefix):
+            out.extend(os.path.join(dir_path, name) for name in entry.get("files") or {})
+    return out
+
+
+def scan_tree(
+    root: Path,
+    include: list[str],
+    exclude: list[str],
+    max_depth: int,
+    max_file_bytes: int,
+    previous: dict[str, dict[str, Any]] | None = None,
+    *,
+    full: bool = True,
+) -> tuple[dict[str, dict[str, Any]], list[str], list[str]]:
+    """
+    Walk root with collect_files' rules (hidden entries and symlinks skipped).
+
+    Returns (dirs, changed, removed): the new per-directory snapshot, files that are
+    new or whose (mtime, size) differ from previous, and files previous held that
+    are gone. With full=False, directories whose mtime matches previous are not
+    listed and their files are not stat'ed.
+    """
+    prev_dirs = previous or {}
+    trust_before_ns = time.time_ns() - int(_RACY_WINDOW_S * 1e9)
+    dirs: dict[str, dict[str, Any]] = {}
+    changed: list[str] = []
+    removed: list[str] = []
+
+    def _walk(dir_path: str, depth: int) -> None:
+        if depth > max_depth:
+            return
+        try:
+            mtime_ns = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            return
+        prev = prev_dirs.get(dir_path)
+        recorded_ns = mtime_ns if mtime_ns < trust_before_ns else 0
+        if not full and prev and prev.get("mtime_ns") and prev.get("mtime_ns") == mtime_ns:
+            dirs[dir_path] = prev
+            for name in prev.get("dirs") or []:
+                _walk(os.path.join(dir_path, name), depth + 1)
+            return
+        files: dict[str, list] = {}
+        subdirs: list[str] = []
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            entries = []
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            try:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    if should_descend_into_dir(entry.path, exclude):
+                        subdirs.append(entry.name)
+                    continue
+                if not should_index(entry.path, include, exclude):
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            if st.st_size > max_file_bytes:
+                continue
+            files[entry.name] = [st.st_mtime, st.st_size]
+        dirs[dir_path] = {"mtime_ns": recorded_ns, "files": files, "dirs": subdirs}
+        prev_files = (prev or {}).get("files") or {}
+        for name, stat in files.items():
+            if prev_files.get(name) != stat:
+                changed.append(os.path.join(dir_path, name))
+        removed.extend(os.path.join(dir_path, name) for name in prev_files if name not in files)
+        for name in (prev or {}).get("dirs") or []:
+            if name not in subdirs:
+                removed.extend(_subtree_files(prev_dirs, os.path.join(dir_path, name)))
+        for name in subdirs:
+            _walk(os.path.join(dir_path, name), depth + 1)
+
+    _walk(str(root), 0)
+    return dirs, changed, removed
@@ -20,6 +20,9 @@ SERVICE_PREFIX_SYSTEMD = "llmlibrarian-watch-"
 # racing it; if the unit is absent under this name, systemd simply ignores it.
 SERVICE_MCP_SYSTEMD = "llmlibrarian-mcp.service"
 LOG_DIRNAME = "logs"
+# Slug of the single service that hosts every silo watcher (`pal pull --watch`
+# without PATH) when the daemon runs multiplexed.
+WATCH_HUB_SLUG = "all-silos"
 # Activating N watch daemons back-to-back means N processes all connect to
 # Chroma within the same instant. Reproduced empirically: loading 8 daemons
 # simultaneously against a freshly-started Chroma server reliably crashed it
@@ -190,6 +193,14 @@ def _env_for_service(env: dict[str, str] | None = None) -> dict[str, str]:
     return out
 
 
+def _watch_program_args(job: JobSpec) -> list[str]:
+    """`pal` arguments for a job; the hub job omits PATH so one process watches every silo."""
+    args = ["pull"]
+    if job.kind != "watch_hub":
+        args.append(job.source_path)
+    return args + ["--watch", "--interval", str(int(job.interval)), "--debounce", str(int(job.debounce))]
+
+
 def render_launchd_plist(
     job: JobSpec,
     *,
@@ -201,17 +212,7 @@ def render_launchd_plist(
 ) -> str:
     payload = {
         "Label": job.service_name,
-        "ProgramArguments": [
-            python_executable,
-            pal_path,
-            "pull",
-            job.source_path,
-            "--watch",
-            "--interval",
-            str(int(job.interval)),
-            "--debounce",
-            str(int(job.debounce)),
-        ],
+        "ProgramArguments": [python_executable, pal_path, *_watch_program_args(job)],
         "RunAtLoad": True,
         "KeepAlive": True,
         "WorkingDirectory": workdir,
@@ -241,26 +242,15 @@ def render_systemd_unit(
     stderr_path: str | None = None,
     restart_sec: int = SERVICE_RESTART_DELAY_DEFAULT,
 ) -> str:
-    exec_start = shlex.join(
-        [
-            python_executable,
-            pal_path,
-            "pull",
-            job.source_path,
-            "--watch",
-            "--interval",
-            str(int(job.interval)),
-            "--debounce",
-            str(int(job.debounce)),
-        ]
-    )
+    exec_start = shlex.join([python_executable, pal_path, *_watch_program_args(job)])
+    target = "all silos" if job.kind == "watch_hub" else f"silo {job.slug}"
     env_lines = [
         f'Environment="{key}={_escape_systemd_env_value(value)}"'
         for key, value in sorted(_env_for_service(env).items())
     ]
     lines = [
         "[Unit]",
-        f"Description=llmLibrarian watch silo {job.slug}",
+        f"Description=llmLibrarian watch {target}",
         f"After=default.target {SERVICE_MCP_SYSTEMD}",
         f"Wants={SERVICE_MCP_SYSTEMD}",
         "StartLimitIntervalSec=300",
@@ -444,6 +434,24 @@ def derive_watch_jobs(
     return jobs, warnings
 
 
+def watch_hub_job(jobs: list[JobSpec], *, pal_home: Path, manager: str) -> JobSpec | None:
+    """The single service that hosts every job's watcher in one process, or None with no jobs."""
+    enabled = [job for job in jobs if job.enabled]
+    if not enabled:
+        return None
+    return JobSpec(
+        id="watch_hub",
+        kind="watch_hub",
+        slug=WATCH_HUB_SLUG,
+        source_path="",
+        service_name=desired_service_name(manager, WATCH_HUB_SLUG),
+        log_path=str(watch_log_path(pal_home, WATCH_HUB_SLUG)),
+        interval=min(job.interval for job in enabled),
+        debounce=min(job.debounce for job in enabled),
+        enabled=True,
+    )
+
+
 def _run_command(cmd: list[str]) -> tuple[int, str]:
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, check=False)
@@ -556,7 +564,7 @@ class PlatformManager:
         for job in jobs:
             if not job.enabled:
                 continue
-            path = str(Path(job.source_path).resolve())
+            path = str(Path(job.source_path).resolve()) if job.source_path else job.id
             existing = path_to_job.get(path)
             if existing and len(job.slug) > len(existing.slug):
                 path_to_job[path] = job
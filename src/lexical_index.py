@@ -0,0 +1,363 @@
+"""
+Persisted BM25 inverted index for the lexical leg of hybrid retrieval.
+
+``run_hybrid_retrieve`` used to get lexical candidates with a Chroma
+``where_document`` ``$contains`` scan: case-sensitive, unranked, and cut at
+MAX_LEXICAL_FOR_RRF in storage order, so RRF saw arbitrary lexical ranks. This
+index is written next to Chroma at ingest time and answers the same question
+with case-folded BM25 scores from a few indexed SQLite lookups.
+
+Layout: ``<db>/llmli_lexical_index/index.sqlite3`` (WAL), partitioned by silo:
+  - ``postings(silo, term, id, tf)`` and ``terms(silo, term, df)``
+  - ``docs(id, silo, source, zip_path, length)`` for deletes and length norms
+  - ``silos(silo, ready, n_docs, total_len)``
+
+A silo is only searched once it is ``ready``: rebuilt from empty (``add
+--full``, repair) or backfilled from Chroma by ``ensure_silo`` on its first
+incremental write. Until then callers fall back to the ``$contains`` scan.
+LLMLIBRARIAN_LEXICAL_INDEX=0 disables the index.
+"""
+import heapq
+import math
+import os
+import re
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Any, ContextManager, Iterable, Iterator
+
+from sqlite_store import connect_store, write_txn
+
+INDEX_DIRNAME = "llmli_lexical_index"
+BM25_K1 = 1.2
+BM25_B = 0.75
+_SQL_IN_CHUNK = 500
+_BACKFILL_PAGE = 1000
+# Postings scored per term, highest tf first: a term in most of a large silo
+# would otherwise pull every one of its postings through Python on each query.
+MAX_POSTINGS_PER_TERM = 5000
+_MAX_TOKEN_LEN = 64
+# Words plus dotted/colon numbers ("12.5", "10:30") and inner apostrophes.
+_TOKEN_RE = re.compile(r"[^\W_]+(?:[.:'][^\W_]+)*")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS silos (
+    silo TEXT PRIMARY KEY,
+    ready INTEGER NOT NULL DEFAULT 0,
+    n_docs INTEGER NOT NULL DEFAULT 0,
+    total_len INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS docs (
+    id TEXT PRIMARY KEY,
+    silo TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT '',
+    zip_path TEXT NOT NULL DEFAULT '',
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_docs_source ON docs(silo, source);
+CREATE INDEX IF NOT EXISTS idx_docs_zip ON docs(silo, zip_path);
+CREATE TABLE IF NOT EXISTS postings (
+    silo TEXT NOT NULL,
+    term TEXT NOT NULL,
+    id TEXT NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (silo, term, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_id ON postings(id);
+CREATE TABLE IF NOT EXISTS terms (
+    silo TEXT NOT NULL,
+    term TEXT NOT NULL,
+    df INTEGER NOT NULL,
+    PRIMARY KEY (silo, term)
+) WITHOUT ROWID;
+"""
+
+
+def lexical_index_enabled() -> bool:
+    raw = os.environ.get("LLMLIBRARIAN_LEXICAL_INDEX", "1").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def tokenize(text: str) -> list[str]:
+    """Case-folded terms. Single characters are dropped unless they are digits."""
+    out: list[str] = []
+    for tok in _TOKEN_RE.findall((text or "").casefold()):
+        if len(tok) > _MAX_TOKEN_LEN or (len(tok) < 2 and not tok.isdigit()):
+            continue
+        out.append(tok)
+    return out
+
+
+def _index_dir(db_path: str | Path) -> Path:
+    p = Path(db_path).resolve()
+    if p.is_dir():
+        return p / INDEX_DIRNAME
+    return p.parent / INDEX_DIRNAME
+
+
+def _index_conn(path: Path, *, create: bool = True) -> ContextManager[sqlite3.Connection | None]:
+    return connect_store(path, _SCHEMA, create=create)
+
+
+def _write_txn(path: Path) -> ContextManager[sqlite3.Connection]:
+    return write_txn(path, _SCHEMA)
+
+
+def _chunked(items: list[Any]) -> Iterator[list[Any]]:
+    for i in range(0, len(items), _SQL_IN_CHUNK):
+        yield items[i : i + _SQL_IN_CHUNK]
+
+
+def _delete_ids(conn: sqlite3.Connection, ids: list[str]) -> int:
+    removed = 0
+    for part in _chunked(list(dict.fromkeys(ids))):
+        marks = ",".join("?" * len(part))
+        per_silo = conn.execute(
+            f"SELECT silo, COUNT(*), COALESCE(SUM(length), 0) FROM docs WHERE id IN ({marks}) GROUP BY silo",
+            part,
+        ).fetchall()
+        if not per_silo:
+            continue
+        term_counts = conn.execute(
+            f"SELECT silo, term, COUNT(*) FROM postings WHERE id IN ({marks}) GROUP BY silo, term",
+            part,
+        ).fetchall()
+        conn.executemany(
+            "UPDATE terms SET df = df - ? WHERE silo = ? AND term = ?",
+            [(count, silo, term) for silo, term, count in term_counts],
+        )
+        conn.executemany(
+            "DELETE FROM terms WHERE silo = ? AND term = ? AND df <= 0",
+            [(silo, term) for silo, term, _count in term_counts],
+        )
+        conn.execute(f"DELETE FROM postings WHERE id IN ({marks})", part)
+        conn.execute(f"DELETE FROM docs WHERE id IN ({marks})", part)
+        conn.executemany(
+            "UPDATE silos SET n_docs = MAX(0, n_docs - ?), total_len = MAX(0, total_len - ?) WHERE silo = ?",
+            [(count, length, silo) for silo, count, length in per_silo],
+        )
+        removed += sum(row[1] for row in per_silo)
+    return removed
+
+
+def _clear_silo(conn: sqlite3.Connection, silo: str) -> None:
+    conn.execute("DELETE FROM postings WHERE silo = ?", (silo,))
+    conn.execute("DELETE FROM terms WHERE silo = ?", (silo,))
+    conn.execute("DELETE FROM docs WHERE silo = ?", (silo,))
+
+
+class LexicalIndex:
+    """BM25 index for every silo in one DB. Each call opens its own connection,
+    so one instance can be shared across threads."""
+
+    def __init__(self, path: Path, db_path: str | Path | None = None) -> None:
+        self.path = Path(path)
+        self.db_path = db_path
+
+    def add(self, chunks: Iterable[tuple[str, str, dict[str, Any] | None]]) -> int:
+        """Index (id, document, metadata) rows; ids already present are replaced.
+        Rows without a ``silo`` in their metadata are skipped."""
+        rows: list[tuple[str, str, str, str, Counter[str]]] = []
+        seen: set[str] = set()
+        for cid, doc, meta in chunks:
+            m = meta or {}
+            silo = str(m.get("silo") or "")
+            if not cid or not silo or cid in seen:
+                continue
+            seen.add(cid)
+            rows.append((cid, silo, str(m.get("source") or ""), str(m.get("zip_path") or ""), Counter(tokenize(doc))))
+        if not rows:
+            return 0
+        with _write_txn(self.path) as conn:
+            _delete_ids(conn, [r[0] for r in rows])
+            conn.executemany(
+                "INSERT INTO docs(id, silo, source, zip_path, length) VALUES (?, ?, ?, ?, ?)",
+                [(cid, silo, source, zip_path, sum(tf.values())) for cid, silo, source, zip_path, tf in rows],
+            )
+            conn.executemany(
+                "INSERT INTO postings(silo, term, id, tf) VALUES (?, ?, ?, ?)",
+                [(silo, term, cid, n) for cid, silo, _s, _z, tf in rows for term, n in tf.items()],
+            )
+            df: Counter[tuple[str, str]] = Counter((silo, term) for _c, silo, _s, _z, tf in rows for term in tf)
+            conn.executemany(
+                "INSERT INTO terms(silo, term, df) VALUES (?, ?, ?) "
+                "ON CONFLICT(silo, term) DO UPDATE SET df = df + excluded.df",
+                [(silo, term, n) for (silo, term), n in df.items()],
+            )
+            per_silo: dict[str, list[int]] = {}
+            for _c, silo, _s, _z, tf in rows:
+                acc = per_silo.setdefault(silo, [0, 0])
+                acc[0] += 1
+                acc[1] += sum(tf.values())
+            conn.executemany(
+                "INSERT INTO silos(silo, ready, n_docs, total_len) VALUES (?, 0, ?, ?) "
+                "ON CONFLICT(silo) DO UPDATE SET n_docs = n_docs + excluded.n_docs, "
+                "total_len = total_len + excluded.total_len",
+                [(silo, n, length) for silo, (n, length) in per_silo.items()],
+            )
+        return len(rows)
+
+    def delete_ids(self, ids: Iterable[str]) -> int:
+        wanted = [i for i in ids if i]
+        if not wanted or not self.path.exists():
+            return 0
+        with _write_txn(self.path) as conn:
+            return _delete_ids(conn, wanted)
+
+    def delete_source(self, silo: str, source: str) -> int:
+        """Drop a file's rows, including chunks of archive members recorded under ``zip_path``."""
+        if not self.path.exists():
+            return 0
+        with _write_txn(self.path) as conn:
+            ids = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT id FROM docs WHERE silo = ? AND source = ? "
+                    "UNION SELECT id FROM docs WHERE silo = ? AND zip_path = ?",
+                    (silo, source, silo, source),
+                )
+            ]
+            return _delete_ids(conn, ids)
+
+    def reset_silo(self, silo: str, *, ready: bool = True) -> None:
+        """Empty a silo. ``ready`` marks it searchable, i.e. Chroma's rows were wiped too."""
+        with _write_txn(self.path) as conn:
+            _clear_silo(conn, silo)
+            conn.execute(
+                "INSERT INTO silos(silo, ready, n_docs, total_len) VALUES (?, ?, 0, 0) "
+                "ON CONFLICT(silo) DO UPDATE SET ready = excluded.ready, n_docs = 0, total_len = 0",
+                (silo, 1 if ready else 0),
+            )
+
+    def drop_silo(self, silo: str) -> None:
+        if not self.path.exists():
+            return
+        with _write_txn(self.path) as conn:
+            _clear_silo(conn, silo)
+            conn.execute("DELETE FROM silos WHERE silo = ?", (silo,))
+
+    def clear(self) -> None:
+        if not self.path.exists():
+            return
+        with _write_txn(self.path) as conn:
+            for table in ("postings", "terms", "docs", "silos"):
+                conn.execute(f"DELETE FROM {table}")
+
+    def mark_stale(self, silos: Iterable[str] | None = None) -> None:
+        """Stop searching these silos (all when None) until they are rebuilt or backfilled."""
+        if not self.path.exists():
+            return
+        with _write_txn(self.path) as conn:
+            if silos is None:
+                conn.execute("UPDATE silos SET ready = 0")
+            else:
+                conn.executemany("UPDATE silos SET ready = 0 WHERE silo = ?", [(s,) for s in silos])
+
+    def is_ready(self, silo: str) -> bool:
+        with _index_conn(self.path, create=False) as conn:
+            if conn is None:
+                return False
+            row = conn.execute("SELECT ready FROM silos WHERE silo = ?", (silo,)).fetchone()
+        return bool(row and row[0])
+
+    def ensure_silo(self, collection: Any, silo: str) -> bool:
+        """Backfill a silo from Chroma the first time it is written incrementally.
+        Call with the write lock held. Returns whether the silo is now searchable."""
+        try:
+            if self.is_ready(silo):
+                return True
+            self.reset_silo(silo, ready=False)
+            offset = 0
+            while True:
+                page = collection.get(
+                    where={"silo": silo},
+                    include=["documents", "metadatas"],
+                    limit=_BACKFILL_PAGE,
+                    offset=offset,
+                )
+                ids = list(page.get("ids") or [])
+                docs = list(page.get("documents") or [])
+                metas = list(page.get("metadatas") or [])
+                self.add(
+                    (cid, docs[i] if i < len(docs) else "", metas[i] if i < len(metas) else None)
+                    for i, cid in enumerate(ids)
+                )
+                if len(ids) < _BACKFILL_PAGE:
+                    break
+                offset += len(ids)
+            with _write_txn(self.path) as conn:
+                conn.execute(
+                    "INSERT INTO silos(silo, ready) VALUES (?, 1) ON CONFLICT(silo) DO UPDATE SET ready = 1",
+                    (silo,),
+                )
+            return True
+        except Exception:
+            return False
+
+    def search(self, terms: Iterable[str], silos: list[str], limit: int) -> list[tuple[str, float]] | None:
+        """Top ``limit`` (id, BM25 score) over ``silos``, best first.
+
+        Phrases are scored by their terms; the caller checks the phrase itself on
+        the returned docs. Each term scores only its MAX_POSTINGS_PER_TERM highest-tf
+        postings. Statistics (N, avgdl, df) are pooled across the requested silos.
+        Returns None when any silo is not ready, so the caller can fall back to a scan.
+        """
+        tokens = list(dict.fromkeys(tok for term in terms for tok in tokenize(term)))
+        wanted = sorted(set(s for s in silos if s))
+        if not wanted:
+            return None
+        with _index_conn(self.path, create=False) as conn:
+            if conn is None:
+                return None
+            conn.execute("BEGIN")
+            try:
+                marks = ",".join("?" * len(wanted))
+                stats = conn.execute(
+                    f"SELECT silo, ready, n_docs, total_len FROM silos WHERE silo IN ({marks})",
+                    wanted,
+                ).fetchall()
+                if len(stats) < len(wanted) or not all(row[1] for row in stats):
+                    return None
+                n_docs = sum(row[2] for row in stats)
+                if not tokens or n_docs <= 0:
+                    return []
+                avgdl = max(1.0, sum(row[3] for row in stats) / n_docs)
+                scores: dict[str, float] = {}
+                for tok in tokens:
+                    df = conn.execute(
+                        f"SELECT COALESCE(SUM(df), 0) FROM terms WHERE term = ? AND silo IN ({marks})",
+                        [tok, *wanted],
+                    ).fetchone()[0]
+                    if not df:
+                        continue
+                    idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                    for cid, tf, length in conn.execute(
+                        "SELECT p.id, p.tf, d.length FROM ("
+                        f" SELECT id, tf FROM postings WHERE term = ? AND silo IN ({marks})"
+                        " ORDER BY tf DESC LIMIT ?"
+                        ") p JOIN docs d ON d.id = p.id",
+                        [tok, *wanted, MAX_POSTINGS_PER_TERM],
+                    ):
+                        norm = tf + BM25_K1 * (1.0 - BM25_B + BM25_B * length / avgdl)
+                        scores[cid] = scores.get(cid, 0.0) + idf * tf * (BM25_K1 + 1.0) / norm
+            finally:
+                conn.rollback()
+        return heapq.nlargest(max(0, int(limit)), scores.items(), key=lambda kv: (kv[1], kv[0]))
+
+    def stats(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"path": str(self.path), "enabled": lexical_index_enabled(), "silos": []}
+        with _index_conn(self.path, create=False) as conn:
+            if conn is None:
+                return out
+            for silo, ready, n_docs, total_len in conn.execute(
+                "SELECT silo, ready, n_docs, total_len FROM silos ORDER BY silo"
+            ):
+                out["silos"].append({"silo": silo, "ready": bool(ready), "docs": n_docs, "tokens": total_len})
+        return out
+
+
+def open_lexical_index(db_path: str | Path | None) -> LexicalIndex | None:
+    """Index for the DB at ``db_path``, or None when disabled or there is no path."""
+    if db_path is None or not lexical_index_enabled():
+        return None
+    return LexicalIndex(_index_dir(db_path) / "index.sqlite3", db_path=db_path)
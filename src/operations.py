@@ -131,12 +131,13 @@ def op_chroma_diagnostics(db_path: str) -> dict[str, Any]:
     hnsw_global_queued: int | None = None
     if sqlite_exists:
         try:
-            from silo_audit import _hnsw_id_set, _embeddings_queue_id_set
+            from silo_audit import hnsw_consistency_snapshot
             with sqlite3.connect(str(sqlite_path)) as conn:
                 rows = conn.execute("SELECT DISTINCT embedding_id FROM embeddings").fetchall()
             sqlite_emb_ids = {r[0] for r in rows if r and r[0]}
-            hnsw_ids = _hnsw_id_set(db_root)
-            queued = _embeddings_queue_id_set(db_root)
+            snapshot = hnsw_consistency_snapshot(db_root)
+            hnsw_ids = snapshot["hnsw_ids"]
+            queued = snapshot["queued_ids"]
             missing = sqlite_emb_ids - hnsw_ids
             hnsw_global_truly_missing = len(missing - queued)
             hnsw_global_queued = len(missing & queued)
@@ -168,25 +169,27 @@ def op_chroma_diagnostics(db_path: str) -> dict[str, Any]:
 
 def op_silo_hnsw_consistency(db_path: str) -> dict[str, Any]:
     """
-    Per-silo SQLite ↔ HNSW consistency report. Opens a Chroma client.
+    Per-silo SQLite ↔ HNSW consistency report.
     Returns {"status": "ok", "silos": [verify_silo_hnsw_consistency(...) per silo]}.
+
+    Served from the cached silo_audit snapshot (one grouped SQLite read for all
+    silos); opens a Chroma client only when Chroma's tables cannot be read directly.
     """
     from chroma_client import get_client, release as _release
     from constants import LLMLI_COLLECTION
     from state import list_silos
-    from silo_audit import verify_silo_hnsw_consistency
+    from silo_audit import silo_consistency_reports, verify_silo_hnsw_consistency
 
     db_root = Path(db_path).expanduser().resolve()
+    opened = False
     try:
-        silos = list_silos(str(db_root))
-        client = get_client(str(db_root))
-        coll = client.get_or_create_collection(name=LLMLI_COLLECTION)
-        reports = []
-        for s in silos:
-            slug = s.get("slug")
-            if not slug:
-                continue
-            reports.append(verify_silo_hnsw_consistency(coll, slug, db_root))
+        slugs = [str(s.get("slug")) for s in list_silos(str(db_root)) if s.get("slug")]
+        reports = silo_consistency_reports(db_root, slugs)
+        if reports is None:
+            opened = True
+            client = get_client(str(db_root))
+            coll = client.get_or_create_collection(name=LLMLI_COLLECTION)
+            reports = [verify_silo_hnsw_consistency(coll, slug, db_root) for slug in slugs]
         bad = [r for r in reports if not r.get("consistent")]
         return {
             "status": "ok",
@@ -198,8 +201,27 @@ def op_silo_hnsw_consistency(db_path: str) -> dict[str, Any]:
     except Exception as e:
         return {"status": "error", "error": f"{type(e).__name__}: {e}"}
     finally:
+        if opened:
+            try:
+                _release()
+            except Exception:
+                pass
+
+
+def _drop_silo_sidecars(db_path: str, slug: str, *, rebuilding: bool = False) -> None:
+    """Forget a silo in the lexical index and chunk counts after its Chroma rows were
+    wiped. A repair re-adds from empty, so the silo is kept and marked exact."""
+    from chunk_counts import open_chunk_counts
+    from lexical_index import open_lexical_index
+
+    for sidecar in (open_lexical_index(db_path), open_chunk_counts(db_path)):
+        if sidecar is None:
+            continue
         try:
-            _release()
+            if rebuilding:
+                sidecar.reset_silo(slug)
+            else:
+                sidecar.drop_silo(slug)
         except Exception:
             pass
 
@@ -232,6 +254,7 @@ def op_remove_silo(db_path: str, slug_or_name: str) -> dict:
         with chroma_exclusive_lock(db_path):
             coll = get_client(db_path).get_or_create_collection(name=LLMLI_COLLECTION)
             coll.delete(where={"silo": slug_to_clean})
+            _drop_silo_sidecars(db_path, slug_to_clean)
         from chroma_client import bump_generation
         bump_generation(db_path)
     except Exception as e:
@@ -293,6 +316,7 @@ def op_repair_silo(db_path: str, slug_or_name: str, verbose: bool = True) -> dic
             try:
                 coll = get_client(db_path).get_or_create_collection(name=LLMLI_COLLECTION)
                 coll.delete(where={"silo": slug})
+                _drop_silo_sidecars(db_path, slug, rebuilding=True)
                 from chroma_client import bump_generation
                 bump_generation(db_path)
             except Exception as e:
@@ -431,12 +455,16 @@ def op_inspect_silo(db_path: str, slug_or_name: str, top: int = 50) -> dict:
     Return per-file chunk counts for a silo.
 
     Returns a dict with slug, display_name, path, total_chunks_registry,
-    total_chunks_chroma, registry_match, total_files, files_shown, and files list.
+    total_chunks_chroma, registry_match, total_files, files_shown, files list,
+    chunks_by_doc_type and chunks_by_extension. Counts come from the chunk counters
+    (counts_source="counters"); a silo without them is scanned once from ChromaDB
+    (counts_source="chroma"), which also seeds them.
     Returns {"error": str} on failure.
     """
     from state import list_silos, resolve_silo_to_slug
     from constants import LLMLI_COLLECTION
     from chroma_client import get_client, release
+    from chunk_counts import open_chunk_counts
 
     slug = resolve_silo_to_slug(db_path, slug_or_name)
     if slug is None:
@@ -448,41 +476,71 @@ def op_inspect_silo(db_path: str, slug_or_name: str, top: int = 50) -> dict:
     path = (info or {}).get("path", "")
     total_registry = (info or {}).get("chunks_count", 0)
 
-    from chroma_lock import chroma_shared_lock
-
-    _PAGE_SIZE = 200
+    chunk_counts = open_chunk_counts(db_path)
+    breakdown = None
     try:
-        with chroma_shared_lock(db_path):
-            coll = get_client(db_path).get_or_create_collection(name=LLMLI_COLLECTION)
-            metas: list = []
-            offset = 0
-            while True:
-                result = coll.get(
-                    where={"silo": slug},
-                    include=["metadatas"],
-                    limit=_PAGE_SIZE,
-                    offset=offset,
-                )
-                page = result.get("metadatas") or []
-                metas.extend(page)
-                if len(page) < _PAGE_SIZE:
-                    break
-                offset += _PAGE_SIZE
-    except Exception as e:
-        return {"error": f"ChromaDB error: {e}"}
-    finally:
-        release()
+        breakdown = chunk_counts.silo_breakdown(slug) if chunk_counts is not None else None
+    except Exception:
+        breakdown = None
 
-    total_chroma = len(metas)
+    if breakdown is None:
+        from chroma_lock import chroma_shared_lock
+
+        _PAGE_SIZE = 200
+        try:
+            with chroma_shared_lock(db_path):
+                coll = get_client(db_path).get_or_create_collection(name=LLMLI_COLLECTION)
+                metas: list = []
+                offset = 0
+                while True:
+                    result = coll.get(
+                        where={"silo": slug},
+                        include=["metadatas"],
+                        limit=_PAGE_SIZE,
+                        offset=offset,
+                    )
+                    page = result.get("metadatas") or []
+                    metas.extend(page)
+                    if len(page) < _PAGE_SIZE:
+                        break
+                    offset += _PAGE_SIZE
+                if chunk_counts is not None:
+                    try:
+                        chunk_counts.rebuild_silo(slug, [{**(m or {}), "silo": slug} for m in metas])
+                        breakdown = chunk_counts.silo_breakdown(slug)
+                    except Exception:
+                        breakdown = None
+        except Exception as e:
+            return {"error": f"ChromaDB error: {e}"}
+        finally:
+            release()
+        counts_source = "chroma"
+    else:
+        metas = []
+        counts_source = "counters"
 
     by_source: dict[str, int] = {}
     source_to_hash: dict[str, str] = {}
-    for m in metas:
-        meta = m or {}
-        src = meta.get("source") or "?"
-        by_source[src] = by_source.get(src, 0) + 1
-        if src not in source_to_hash and meta.get("file_hash"):
-            source_to_hash[src] = meta["file_hash"]
+    by_doc_type: dict[str, int] = {}
+    by_extension: dict[str, int] = {}
+    if breakdown is not None:
+        for row in breakdown["sources"]:
+            src = row["source"] or "?"
+            by_source[src] = by_source.get(src, 0) + int(row["chunks"])
+            if src not in source_to_hash and row.get("file_hash"):
+                source_to_hash[src] = row["file_hash"]
+        by_doc_type = dict(breakdown["by_doc_type"])
+        by_extension = dict(breakdown["by_extension"])
+    else:
+        for m in metas:
+            meta = m or {}
+            src = meta.get("source") or "?"
+            by_source[src] = by_source.get(src, 0) + 1
+            if src not in source_to_hash and meta.get("file_hash"):
+                source_to_hash[src] = meta["file_hash"]
+            doc_type = str(meta.get("doc_type") or "other")
+            by_doc_type[doc_type] = by_doc_type.get(doc_type, 0) + 1
+    total_chroma = sum(by_source.values())
 
     hash_to_sources: dict[str, list[str]] = {}
     for src, h in source_to_hash.items():
@@ -512,6 +570,9 @@ def op_inspect_silo(db_path: str, slug_or_name: str, top: int = 50) -> dict:
         "total_files": len(by_source),
         "files_shown": len(files),
         "files": files,
+        "chunks_by_doc_type": by_doc_type,
+        "chunks_by_extension": by_extension,
+        "counts_source": counts_source,
     }
 
 
@@ -579,11 +640,20 @@ def op_list_silos(db_path: str, check_staleness: bool = False) -> dict:
     List all indexed silos with metadata.
 
     check_staleness=True walks source directories to detect changed files.
+    chunks_count is the live value from the chunk counters when the silo has them
+    (the registry copy is only refreshed after ingest), with chunks_by_doc_type beside it.
     Returns {"db_path": str, "db_exists": bool, "silo_count": int, "silos": list}
     """
     from state import list_silos as _list_silos, get_last_failures, get_query_health
+    from chunk_counts import open_chunk_counts
 
     silos = _list_silos(db_path)
+    live_counts: dict[str, dict[str, Any]] = {}
+    try:
+        chunk_counts = open_chunk_counts(db_path)
+        live_counts = chunk_counts.silo_totals() if chunk_counts is not None else {}
+    except Exception:
+        live_counts = {}
 
     health_entries = get_query_health(db_path)
     silo_errors: dict[str, str] = {}
@@ -611,6 +681,10 @@ def op_list_silos(db_path: str, check_staleness: bool = False) -> dict:
         s["doc_type_breakdown"] = _doc_type_breakdown(by_ext)
 
         slug = s.get("slug") or ""
+        live = live_counts.get(slug)
+        if live is not None:
+            s["chunks_count"] = live["chunks"]
+            s["chunks_by_doc_type"] = live["by_doc_type"]
         # An error recorded before the silo's most recent successful update
         # (e.g. a full repair_silo/llmli repair rebuild) has been superseded —
         # without this check, one historical error flags a silo as broken
@@ -2,7 +2,7 @@
 Filename / date file lookup against the manifest.
 
 ``op_find_files`` is the metadata-only counterpart to vector retrieval: it
-filters ``llmli_file_manifest.json`` by name glob and date range and returns a
+filters the file manifest by name glob and date range and returns a
 structured list of file hits. No ChromaDB access unless the caller asks for
 chunk counts.
 
@@ -78,7 +78,7 @@ def op_find_files(
     if date_start is not None and date_end is not None and date_start > date_end:
         return FindResult(warnings=[f"empty range: {date_start} > {date_end}"]).as_dict()
 
-    manifest = _read_file_manifest(db_path)
+    manifest = _read_file_manifest(db_path, silos=silos or None)
     silo_map = manifest.get("silos") or {}
     if not isinstance(silo_map, dict):
         return FindResult(warnings=["manifest is malformed"]).as_dict()
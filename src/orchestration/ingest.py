@@ -29,6 +29,12 @@ class IngestRequest:
     image_vision_enabled: bool | None = None
     workers: int | None = None
     embedding_workers: int | None = None
+    stream: bool | None = None
+    """Streaming write mode for run_add (None: LLMLIBRARIAN_INGEST_STREAM decides)."""
+    extract_executor: str | None = None
+    """'thread' or 'process' extraction pool (None: LLMLIBRARIAN_EXTRACT_EXECUTOR decides)."""
+    fingerprint: str | None = None
+    """'prefix' or 'full' change-detection hash (None: LLMLIBRARIAN_FINGERPRINT or the manifest decides)."""
     get_chroma_client: Callable[[str], Any] | None = None
     pre_write_hook: Callable[[], None] | None = None
     quiet: bool = False
@@ -37,6 +43,8 @@ class IngestRequest:
     """If set, LLMLIBRARIAN_STATUS_FILE for run_add completion JSON."""
     extra_env: dict[str, str] | None = None
     """Merged into os.environ for the duration of run_add (e.g. pal log levels)."""
+    compile_artifacts: bool = True
+    """If False, run_ingest skips artifact compilation; the caller runs compile_ingest_artifacts later."""
 
 
 @dataclass
@@ -45,6 +53,8 @@ class IngestResult:
     failures: int
     silo_slug: str | None
     artifact_result: dict[str, Any] | None = None
+    changed_sources: set[str] | None = None
+    """Sources run_add rewrote (None: the whole silo, e.g. a full rebuild)."""
 
 
 @contextmanager
@@ -87,6 +97,11 @@ def run_ingest(request: IngestRequest) -> IngestResult:
         for k, v in request.extra_env.items():
             overlay[k] = v
 
+    changed_sources: list[set[str] | None] = [None]
+
+    def _record_changed_sources(sources: set[str] | None) -> None:
+        changed_sources[0] = sources
+
     with _env_overlay(overlay):
         files_ok, n_failures = run_add(
             path,
@@ -103,6 +118,10 @@ def run_ingest(request: IngestRequest) -> IngestResult:
             embedding_workers=request.embedding_workers,
             get_chroma_client=request.get_chroma_client,
             _pre_write_hook=request.pre_write_hook,
+            stream=request.stream,
+            extract_executor=request.extract_executor,
+            fingerprint=request.fingerprint,
+            on_sources_changed=_record_changed_sources,
         )
 
     slug: str | None = None
@@ -113,29 +132,43 @@ def run_ingest(request: IngestRequest) -> IngestResult:
     except Exception:
         slug = None
 
-    artifact_result: dict[str, Any] | None = None
-    if slug:
-        try:
-            from artifacts import compile_artifacts_for_silo
-
-            artifact_result = compile_artifacts_for_silo(
-                db_path=db,
-                parent_slug=slug,
-                source_path=path,
-                display_name=request.display_name or path.name,
-            )
-        except Exception as exc:
-            artifact_result = {
-                "status": "error",
-                "parent_silo": slug,
-                "error": f"{type(exc).__name__}: {exc}",
-            }
-    return IngestResult(
+    result = IngestResult(
         files_indexed=files_ok,
         failures=n_failures,
         silo_slug=slug,
-        artifact_result=artifact_result,
+        changed_sources=changed_sources[0],
     )
+    if request.compile_artifacts:
+        result.artifact_result = compile_ingest_artifacts(request, result)
+    return result
+
+
+def compile_ingest_artifacts(request: IngestRequest, result: IngestResult) -> dict[str, Any] | None:
+    """Compile derived artifacts for the silo run_ingest just indexed (None when it has no slug)."""
+    if not result.silo_slug:
+        return None
+    path = Path(request.path).resolve()
+    db = request.db_path
+    if db is None:
+        from constants import DB_PATH
+
+        db = DB_PATH
+    try:
+        from artifacts import compile_artifacts_for_silo
+
+        return compile_artifacts_for_silo(
+            db_path=db,
+            parent_slug=result.silo_slug,
+            source_path=path,
+            display_name=request.display_name or path.name,
+            changed_sources=result.changed_sources,
+        )
+    except Exception as exc:
+        return {
+            "status": "error",
+            "parent_silo": result.silo_slug,
+            "error": f"{type(exc).__name__}: {exc}",
+        }
 
 
 def llmli_add_argv(request: IngestRequest) -> list[str]:
@@ -155,6 +188,12 @@ def llmli_add_argv(request: IngestRequest) -> list[str]:
         out.extend(["--workers", str(request.workers)])
     if request.embedding_workers is not None:
         out.extend(["--embedding-workers", str(request.embedding_workers)])
+    if request.stream:
+        out.append("--stream")
+    if request.extract_executor:
+        out.extend(["--extract-executor", request.extract_executor])
+    if request.fingerprint:
+        out.extend(["--fingerprint", request.fingerprint])
     if request.forced_silo_slug:
         out.extend(["--silo", request.forced_silo_slug])
     if request.display_name:
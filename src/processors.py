@@ -6,13 +6,15 @@ import hashlib
 import io
 import importlib.util
 import json
-import logging
 import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -116,6 +118,19 @@ _OCR_LABEL = "OCR text (scan fallback):"
 _PADDLE_OCR_ENGINE: Any | None = None
 _PADDLE_OCR_INIT_ATTEMPTED = False
 _PADDLE_OCR_USE_ANGLE: bool | None = None
+# PaddleOCR inference is not thread-safe; OCR pool threads share the one engine under this lock.
+_PADDLE_OCR_LOCK = threading.Lock()
+# One warm tesserocr API per OCR thread (see _tesserocr_api).
+_TESSEROCR_LOCAL = threading.local()
+_OCR_POOL: ThreadPoolExecutor | None = None
+_OCR_POOL_WORKERS = 0
+_OCR_POOL_LOCK = threading.Lock()
+# Extraction processes sharing this machine's OCR threads (set in process workers).
+_OCR_PROCESS_SHARE = 1
+_DEFAULT_OCR_CACHE_SIZE = 1024
+# (image sha256, backend chain, preprocess) -> result; None records "no usable text".
+_OCR_CACHE: "OrderedDict[tuple[str, tuple[str, ...], bool], _OCRResult | None]" = OrderedDict()
+_OCR_CACHE_LOCK = threading.Lock()
 _OCR_PREPROCESS_WARNED: set[str] = set()
 _PROCESSOR_LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
 _VALID_OCR_BACKENDS = frozenset({"auto", "none", "vision", "paddleocr", "tesseract"})
@@ -165,7 +180,7 @@ def _log_warn_once(key: str, message: str, **fields: Any) -> None:
 
 
 def _pdf_tables_enabled() -> bool:
-    # Default ON: pdfplumber table extraction improves structured PDF data (e.g. tax forms).
+    # Default ON: PDF table extraction improves structured PDF data (e.g. tax forms).
     # Disable with LLMLIBRARIAN_PDF_TABLES=0 for noisy/scanned PDFs.
     val = os.environ.get("LLMLIBRARIAN_PDF_TABLES", "1").strip().lower()
     return val not in ("0", "false", "no")
@@ -228,9 +243,17 @@ def _paddleocr_available() -> bool:
         return False
 
 
+def _tesserocr_available() -> bool:
+    """True when tesserocr (in-process libtesseract bindings) is importable."""
+    try:
+        return importlib.util.find_spec("tesserocr") is not None
+    except Exception:
+        return False
+
+
 def _tesseract_available() -> bool:
-    """True when the tesseract binary is available on PATH."""
-    return bool(shutil.which("tesseract"))
+    """True when tesseract is usable: the binary on PATH or the tesserocr bindings."""
+    return bool(shutil.which("tesseract")) or _tesserocr_available()
 
 
 def _ocr_backend_available(name: str) -> bool:
@@ -700,8 +723,14 @@ def _ocr_with_vision_path(image_path: str) -> str | None:
     return text or None
 
 
-def _summarize_image_with_vision_model(image_bytes: bytes, source_path: str, visible_text: str) -> tuple[str, str]:
-    """Generate a compact ingest-time summary for image retrieval."""
+def _summarize_image_with_vision_model(
+    image_bytes: bytes,
+    source_path: str,
+    visible_text: str,
+    *,
+    keep_alive: str | int = 0,
+) -> tuple[str, str]:
+    """Generate a compact ingest-time summary for image retrieval (keep_alive=0 unloads the model after the call)."""
     model = ensure_vision_model_ready()
     try:
         import ollama
@@ -726,7 +755,7 @@ def _summarize_image_with_vision_model(image_bytes: bytes, source_path: str, vis
                     "images": [image_bytes],
                 }
             ],
-            keep_alive=0,
+            keep_alive=keep_alive,
             options={"temperature": 0, "seed": 42},
         )
         text = ((resp.get("message") or {}).get("content") or "").strip()
@@ -828,7 +857,8 @@ def _ocr_with_paddle_path(image_path: str) -> str | None:
         return None
     try:
         use_angle = _ocr_preprocess_enabled()
-        result = engine.ocr(str(image_path), cls=use_angle)
+        with _PADDLE_OCR_LOCK:
+            result = engine.ocr(str(image_path), cls=use_angle)
         text = _extract_paddleocr_text(result)
         return text or None
     except Exception as e:
@@ -865,17 +895,48 @@ def _ocr_with_paddle(image_png: bytes) -> str | None:
         return None
 
 
+def _tesserocr_api() -> Any:
+    """This thread's tesserocr API, created once and kept warm (language data stays loaded)."""
+    api = getattr(_TESSEROCR_LOCAL, "api", None)
+    if api is None:
+        import tesserocr
+
+        api = _TESSEROCR_LOCAL.api = tesserocr.PyTessBaseAPI(lang="eng")
+    return api
+
+
 def _ocr_with_tesseract_path(image_path: str) -> str | None:
-    """Run OCR with tesseract CLI when available. Returns extracted text or None."""
+    """Run OCR with tesseract when available (tesserocr in-process, else the CLI). Returns extracted text or None."""
+    return _ocr_with_tesseract_image(image_path)
+
+
+def _ocr_with_tesseract_image(image: str | bytes) -> str | None:
+    """_ocr_with_tesseract_path for a path or encoded image bytes; bytes need tesserocr,
+    which is handed the decoded image so it never touches disk."""
     if not _tesseract_available():
         return None
     try:
+        pil_image = None
+        if isinstance(image, bytes):
+            from PIL import Image
+
+            pil_image = Image.open(io.BytesIO(image))
+            pil_image.load()
+
         def _run_tesseract(psm: str) -> str | None:
+            if _tesserocr_available():
+                api = _tesserocr_api()
+                api.SetPageSegMode(int(psm))
+                if pil_image is not None:
+                    api.SetImage(pil_image)
+                else:
+                    api.SetImageFile(str(image))
+                return (api.GetUTF8Text() or "").strip() or None
             with tempfile.TemporaryDirectory() as td:
                 output_base = Path(td) / f"ocr_out_psm{psm}"
                 cmd = [
                     "tesseract",
-                    str(image_path),
+                    str(image),
                     str(output_base),
                     "-l",
                     "eng",
@@ -930,8 +991,8 @@ def _ocr_with_tesseract_path(image_path: str) -> str | None:
         return None
 
 
-def _ocr_with_tesseract_detail_path(image_path: str) -> _OCRResult | None:
-    text = _ocr_with_tesseract_path(image_path)
+def _ocr_with_tesseract_detail_path(image: str | bytes) -> _OCRResult | None:
+    text = _ocr_with_tesseract_image(image) if isinstance(image, bytes) else _ocr_with_tesseract_path(image)
     if not text:
         return None
     return _OCRResult(text=text, backend="tesseract")
@@ -970,7 +1031,40 @@ def _ocr_with_vision_detail_path(image_path: str) -> _OCRResult | None:
     )
 
 
+class _OCRInput:
+    """Image to OCR: a file on disk, or bytes written to a temp file only when a
+    backend needs a path (tesserocr is handed the bytes in memory)."""
+
+    def __init__(self, path: str | None = None, data: bytes | None = None, suffix: str = ".png") -> None:
+        self._path = path
+        self.data = data
+        self._suffix = suffix
+        self._tmp: tempfile.TemporaryDirectory | None = None
+
+    def path(self) -> str:
+        if self._path is None:
+            self._tmp = tempfile.TemporaryDirectory()
+            staged = Path(self._tmp.name) / f"ocr-input{self._suffix}"
+            staged.write_bytes(self.data or b"")
+            self._path = str(staged)
+        return self._path
+
+    def tesseract_input(self) -> str | bytes:
+        if self._path is None and self.data is not None and _tesserocr_available():
+            return self.data
+        return self.path()
+
+    def close(self) -> None:
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+
+
 def _ocr_image_path_detailed(image_path: str, source_path: str, ocr_mode: str) -> _OCRResult | None:
+    return _ocr_image_detailed(_OCRInput(path=image_path), source_path, ocr_mode)
+
+
+def _ocr_image_detailed(image: _OCRInput, source_path: str, ocr_mode: str) -> _OCRResult | None:
     configured = _configured_ocr_backend()
     preferred = _preferred_ocr_backends()
     for idx, backend in enumerate(preferred):
@@ -989,11 +1083,11 @@ def _ocr_image_path_detailed(image_path: str, source_path: str, ocr_mode: str) -
 
         candidate: _OCRResult | None = None
         if backend == "vision":
-            candidate = _ocr_with_vision_detail_path(image_path)
+            candidate = _ocr_with_vision_detail_path(image.path())
         elif backend == "paddleocr":
-            candidate = _ocr_with_paddle_detail_path(image_path)
+            candidate = _ocr_with_paddle_detail_path(image.path())
         elif backend == "tesseract":
-            candidate = _ocr_with_tesseract_detail_path(image_path)
+            candidate = _ocr_with_tesseract_detail_path(image.tesseract_input())
 
         if candidate and candidate.text:
             quality_ok, reasons, quality_stats = _ocr_quality_assessment(candidate.text)
@@ -1075,19 +1169,96 @@ def _ocr_image_bytes(
     return result.text, result.backend
 
 
+def _ocr_cache_size() -> int:
+    try:
+        return max(0, int(os.environ.get("LLMLIBRARIAN_OCR_CACHE_SIZE", _DEFAULT_OCR_CACHE_SIZE)))
+    except (TypeError, ValueError):
+        return _DEFAULT_OCR_CACHE_SIZE
+
+
+def _cached_ocr(image_bytes: bytes, compute: Any) -> _OCRResult | None:
+    """
+    compute() memoized on the image's sha256, the usable backend chain and the
+    preprocess flag. Repeated page images (blank or cover pages, a PDF present in
+    two silos, a re-extracted archive) are recognized once per process.
+    """
+    size = _ocr_cache_size()
+    if not size:
+        return compute()
+    key = (hashlib.sha256(image_bytes).hexdigest(), tuple(_available_ocr_backends()), _ocr_preprocess_enabled())
+    with _OCR_CACHE_LOCK:
+        if key in _OCR_CACHE:
+            _OCR_CACHE.move_to_end(key)
+            return _OCR_CACHE[key]
+    result = compute()
+    with _OCR_CACHE_LOCK:
+        _OCR_CACHE[key] = result
+        _OCR_CACHE.move_to_end(key)
+        while len(_OCR_CACHE) > size:
+            _OCR_CACHE.popitem(last=False)
+    return result
+
+
+def _reset_ocr_cache_for_tests() -> None:
+    """Drop cached OCR results. Test-only helper."""
+    with _OCR_CACHE_LOCK:
+        _OCR_CACHE.clear()
+
+
+def set_ocr_process_share(processes: int) -> None:
+    """Called in each of `processes` extraction worker processes: the default OCR
+    pool is split between them instead of every process starting a full one."""
+    global _OCR_PROCESS_SHARE
+    _OCR_PROCESS_SHARE = max(1, int(processes))
+
+
+def _ocr_workers() -> int:
+    """Scanned pages OCR'd at once per process (LLMLIBRARIAN_OCR_WORKERS; default: CPU count,
+    at most 8, divided among extraction worker processes)."""
+    default = max(1, min(8, os.cpu_count() or 4) // _OCR_PROCESS_SHARE)
+    try:
+        return max(1, int(os.environ.get("LLMLIBRARIAN_OCR_WORKERS", default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _ocr_pool(workers: int) -> ThreadPoolExecutor | None:
+    """Process-wide OCR thread pool of `workers` threads shared by every PDF being extracted; None with one worker."""
+    global _OCR_POOL, _OCR_POOL_WORKERS
+    if workers <= 1:
+        return None
+    with _OCR_POOL_LOCK:
+        if _OCR_POOL is None or _OCR_POOL_WORKERS != workers:
+            if _OCR_POOL is not None:
+                _OCR_POOL.shutdown(wait=False)
+            _OCR_POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llmli-ocr")
+            _OCR_POOL_WORKERS = workers
+        return _OCR_POOL
+
+
 def _ocr_image_bytes_detailed(
     image_bytes: bytes,
     source_path: str,
     ocr_mode: str,
     preferred_suffix: str = ".png",
+) -> _OCRResult | None:
+    return _cached_ocr(
+        image_bytes,
+        lambda: _ocr_image_bytes_uncached(image_bytes, source_path, ocr_mode, preferred_suffix),
+    )
+
+
+def _ocr_image_bytes_uncached(
+    image_bytes: bytes,
+    source_path: str,
+    ocr_mode: str,
+    preferred_suffix: str,
 ) -> _OCRResult | None:
     payload = _preprocess_image_for_ocr(image_bytes) if _ocr_preprocess_enabled() else image_bytes
     suffix = preferred_suffix if preferred_suffix.startswith(".") else f".{preferred_suffix}"
+    image = _OCRInput(data=payload, suffix=suffix)
     try:
-        with tempfile.TemporaryDirectory() as td:
-            image_path = Path(td) / f"ocr-input{suffix}"
-            image_path.write_bytes(payload)
-            return _ocr_image_path_detailed(str(image_path), source_path, ocr_mode)
+        return _ocr_image_detailed(image, source_path, ocr_mode)
     except Exception as e:
         _log_processor_event(
             "WARN",
@@ -1097,6 +1268,8 @@ def _ocr_image_bytes_detailed(
             ocr_mode=ocr_mode,
         )
         return None
+    finally:
+        image.close()
 
 
 def _ocr_image_file(data: bytes, source_path: str, ocr_mode: str = "image_file") -> tuple[str | None, str | None]:
@@ -1111,26 +1284,15 @@ def _ocr_image_file_detailed(data: bytes, source_path: str, ocr_mode: str = "ima
     if _ocr_preprocess_enabled():
         return _ocr_image_bytes_detailed(data, source_path, ocr_mode=ocr_mode, preferred_suffix=".png")
     if Path(source_path).exists():
-        return _ocr_image_path_detailed(source_path, source_path, ocr_mode)
+        return _cached_ocr(data, lambda: _ocr_image_path_detailed(source_path, source_path, ocr_mode))
     return _ocr_image_bytes_detailed(data, source_path, ocr_mode=ocr_mode, preferred_suffix=suffix)
 
 
-def _ocr_pdf_page_text(page: Any, source_path: str) -> tuple[str | None, str | None]:
-    """OCR fallback for image-only PDF pages. Returns (text, backend) or (None, None)."""
-    result = _ocr_pdf_page_result(page, source_path)
-    if result is None:
-        return None, None
-    return result.text, result.backend
-
-
-def _ocr_pdf_page_result(page: Any, source_path: str) -> _OCRResult | None:
-    """OCR fallback for image-only PDF pages with quality gate metadata."""
-    if not _available_ocr_backends():
-        return None
-    use_preprocess = _ocr_preprocess_enabled()
+def _render_pdf_page_for_ocr(page: Any, source_path: str) -> bytes | None:
+    """PNG of a PDF page at OCR resolution (300 DPI, 400 with preprocessing), or None if rendering fails."""
     try:
-        dpi = 400 if use_preprocess else 300
-        image_png = page.get_pixmap(dpi=dpi, alpha=False).tobytes("png")
+        dpi = 400 if _ocr_preprocess_enabled() else 300
+        return page.get_pixmap(dpi=dpi, alpha=False).tobytes("png")
     except Exception as e:
         _log_processor_event(
             "WARN",
@@ -1141,7 +1303,40 @@ def _ocr_pdf_page_result(page: Any, source_path: str) -> _OCRResult | None:
         )
         return None
 
-    return _ocr_image_bytes_detailed(image_png, source_path, ocr_mode="pdf_scan_fallback", preferred_suffix=".png")
+
+def _ocr_pdf_pages(
+    doc: Any, page_numbers: list[int], source_path: str, workers: int
+) -> dict[int, _OCRResult | None]:
+    """
+    OCR the given pages of an open PDF. Pages are rendered here, one at a time (a
+    fitz document is not thread-safe), and recognized on the shared OCR pool, so
+    the pages of one scan, and of every scan extracted at once, run in parallel.
+    At most two renders per worker are in flight, which bounds memory on large scans.
+    """
+    pool = _ocr_pool(workers)
+    results: dict[int, _OCRResult | None] = {}
+    pending: dict[int, Future] = {}
+    window: deque[Future] = deque()
+    for number in page_numbers:
+        image_png = _render_pdf_page_for_ocr(doc[number], source_path)
+        if image_png is None:
+            results[number] = None
+            continue
+        if pool is None:
+            results[number] = _ocr_image_bytes_detailed(
+                image_png, source_path, ocr_mode="pdf_scan_fallback", preferred_suffix=".png"
+            )
+            continue
+        future = pool.submit(
+            _ocr_image_bytes_detailed, image_png, source_path, ocr_mode="pdf_scan_fallback", preferred_suffix=".png"
+        )
+        pending[number] = future
+        window.append(future)
+        if len(window) >= 2 * workers:
+            window.popleft().result()
+    for number, future in pending.items():
+        results[number] = future.result()
+    return results
 
 
 def _normalize_table_rows(rows: list[list[str | None]]) -> list[list[str]]:
@@ -1247,49 +1442,92 @@ def _merge_pdf_page_content(
     return structured or raw
 
 
-def _extract_pdf_tables_by_page(data: bytes) -> list[list[list[str | None]]]:
-    """Return page-indexed tables from pdfplumber. Empty list means unavailable/no tables."""
-    try:
-        import pdfplumber
-    except ImportError:
-        return []
-    # pdfplumber/pdfminer can emit high-volume parser warnings on broken PDFs; keep stderr usable.
-    logging.getLogger("pdfminer").setLevel(logging.ERROR)
+# The table finder's default "lines" strategy drops edges shorter than this.
+_PDF_RULE_MIN_LENGTH = 3.0
+# Clip padding around the ruling lines: the finder's snap/join tolerances are 3pt.
+_PDF_RULE_CLIP_PAD = 6.0
 
-    tables_by_page: list[list[list[str | None]]] = []
-    with pdfplumber.open(io.BytesIO(data)) as pdf:
-        for page in pdf.pages:
-            page_tables = page.extract_tables() or []
-            tables_by_page.append(page_tables)
-    return tables_by_page
+
+def _pdf_page_ruling_area(page: Any) -> Any | None:
+    """
+    Bounding box of a page's axis-aligned ruling lines, or None when there are too
+    few to form a cell (two horizontal and two vertical). The default table finder
+    only builds cells from such edges, so other pages cannot hold a table and skip it.
+    """
+    import fitz
+
+    draw = getattr(page, "get_cdrawings", None) or page.get_drawings
+    horizontal = vertical = 0
+    xs: list[float] = []
+    ys: list[float] = []
+    for path in draw() or []:
+        for item in path.get("items") or ():
+            kind = item[0]
+            if kind == "l":
+                (ax, ay), (bx, by) = item[1], item[2]
+                if abs(ay - by) <= 1.0 and abs(ax - bx) >= _PDF_RULE_MIN_LENGTH:
+                    horizontal += 1
+                elif abs(ax - bx) <= 1.0 and abs(ay - by) >= _PDF_RULE_MIN_LENGTH:
+                    vertical += 1
+                else:
+                    continue
+                points = [(ax, ay), (bx, by)]
+            elif kind == "re":
+                rx0, ry0, rx1, ry1 = item[1]
+                if abs(rx1 - rx0) >= _PDF_RULE_MIN_LENGTH:
+                    horizontal += 2
+                if abs(ry1 - ry0) >= _PDF_RULE_MIN_LENGTH:
+                    vertical += 2
+                points = [(rx0, ry0), (rx1, ry1)]
+            elif kind == "qu":
+                points = [tuple(point) for point in item[1]]
+                horizontal += 2
+                vertical += 2
+            else:
+                continue
+            xs.extend(x for x, _y in points)
+            ys.extend(y for _x, y in points)
+    if horizontal < 2 or vertical < 2:
+        return None
+    pad = _PDF_RULE_CLIP_PAD
+    return fitz.Rect(min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad)
+
+
+def _extract_pdf_page_tables(page: Any) -> list[list[list[str | None]]]:
+    """
+    Tables on one page of an open PyMuPDF document, via its table finder (a port of
+    pdfplumber's, same defaults and cell text). Pages without ruling lines are
+    skipped, and the finder only reads characters inside the ruled area.
+    """
+    area = _pdf_page_ruling_area(page)
+    if area is None:
+        return []
+    clip = area if not page.rotation else None
+    return [table.extract() for table in page.find_tables(clip=clip).tables]
 
 
 class PDFProcessor:
     format_label = "PDF"
     install_hint = "pymupdf"
 
-    def extract(self, data: bytes, source_path: str) -> list[ExtractedPage]:
+    def extract(self, data: bytes | memoryview, source_path: str) -> list[ExtractedPage]:
+        """
+        One PyMuPDF parse serves page text, form widgets, tables and OCR. data may be a
+        memoryview over a mapped file; MuPDF reads it in place.
+        """
         try:
             import fitz
-            tables_by_page: list[list[list[str | None]]] = []
-            if _pdf_tables_enabled():
-                try:
-                    tables_by_page = _extract_pdf_tables_by_page(data)
-                except Exception as e:
-                    _log_processor_event(
-                        "WARN",
-                        "PDF table extraction failed",
-                        path=source_path,
-                        error=str(e),
-                        extractor="pdfplumber",
-                    )
+
+            if hasattr(fitz, "no_recommend_layout"):
+                fitz.no_recommend_layout()
             with fitz.open(stream=data, filetype="pdf") as doc:
                 out: list[ExtractedPage] = []
                 pages_without_text_or_ocr: list[int] = []
+                raw_texts: list[str] = []
+                tables_by_page: list[list[list[list[str | None]]]] = []
+                tables_ok = _pdf_tables_enabled()
                 for page in doc:
                     raw_text = page.get_text()
-                    ocr_text: str | None = None
-                    page_meta: dict[str, Any] = {}
                     try:
                         for w in page.widgets():
                             name = getattr(w, "field_name", None) or ""
@@ -1298,8 +1536,35 @@ class PDFProcessor:
                                 raw_text += f"\n{name}: {val}"
                     except Exception:
                         pass
+                    raw_texts.append(raw_text)
+                    page_tables: list[list[list[str | None]]] = []
+                    if tables_ok:
+                        try:
+                            page_tables = _extract_pdf_page_tables(page)
+                        except Exception as e:
+                            tables_ok = False
+                            _log_processor_event(
+                                "WARN",
+                                "PDF table extraction failed",
+                                path=source_path,
+                                page=page.number + 1,
+                                error=str(e),
+                                extractor="pymupdf",
+                            )
+                    tables_by_page.append(page_tables)
+                scanned = [number for number, raw_text in enumerate(raw_texts) if not raw_text.strip()]
+                ocr_results = (
+                    _ocr_pdf_pages(doc, scanned, source_path, _ocr_workers())
+                    if scanned and _available_ocr_backends()
+                    else {}
+                )
+                for number, raw_text in enumerate(raw_texts):
+                    ocr_text: str | None = None
+                    page_meta: dict[str, Any] = {}
                     if not raw_text.strip():
-                        ocr_text, backend = _ocr_pdf_page_text(page, source_path)
+                        ocr_result = ocr_results.get(number)
+                        ocr_text = ocr_result.text if ocr_result else None
+                        backend = ocr_result.backend if ocr_result else None
                         if ocr_text:
                             if backend:
                                 page_meta = {"ocr_backend": backend, "ocr_mode": "pdf_scan_fallback"}
@@ -1307,12 +1572,12 @@ class PDFProcessor:
                                 "INFO",
                                 "PDF OCR fallback applied",
                                 path=source_path,
-                                page=page.number + 1,
+                                page=number + 1,
                                 backend=backend,
                             )
                         else:
-                            pages_without_text_or_ocr.append(page.number + 1)
-                    page_tables = tables_by_page[page.number] if page.number < len(tables_by_page) else []
+                            pages_without_text_or_ocr.append(number + 1)
+                    page_tables = tables_by_page[number]
                     hints: list[str] = []
                     md_tables: list[str] = []
                     for table in page_tables:
@@ -1324,7 +1589,7 @@ class PDFProcessor:
                         if md:
                             md_tables.append(md)
                     text = _merge_pdf_page_content(raw_text, "\n\n".join(md_tables), hints, ocr_text=ocr_text)
-                    out.append(ExtractedPage(text=text, page_num=page.number + 1, meta=page_meta or None))
+                    out.append(ExtractedPage(text=text, page_num=number + 1, meta=page_meta or None))
                 if pages_without_text_or_ocr:
                     _log_processor_event(
                         "WARN",
@@ -1422,7 +1687,13 @@ class ImageProcessor:
         source_path: str,
         *,
         enable_multimodal: bool = True,
+        defer_summary: bool = False,
     ) -> ExtractedImage | None:
+        """
+        OCR regions plus a summary chunk. With defer_summary, an image that would get an
+        eager vision summary gets the deferred placeholder and a vision_summary_key
+        (sha256 of data) in its meta instead, for image_summary_queue to fill in.
+        """
         try:
             ocr_result = _ocr_image_file_detailed(data, source_path, ocr_mode="image_file")
             signal = _image_ocr_signal_assessment(ocr_result)
@@ -1451,8 +1722,13 @@ class ImageProcessor:
             summary_text = ""
             vision_model = ""
             summary_status = "deferred"
+            content_key = hashlib.sha256(data).hexdigest()
+            queued = False
             if enable_multimodal:
-                if signal["eager_summary"]:
+                if signal["eager_summary"] and defer_summary:
+                    summary_text = _image_summary_placeholder(visible_text)
+                    queued = True
+                elif signal["eager_summary"]:
                     summary_text, vision_model = _summarize_image_with_vision_model(data, source_path, visible_text)
                     summary_status = "eager"
                 else:
@@ -1485,6 +1761,7 @@ class ImageProcessor:
                 "raw_visible_text": raw_visible_text,
                 "summary": summary_text,
                 "summary_status": summary_status,
+                "content_sha256": content_key,
                 "ocr_signal_score": signal["ocr_signal_score"],
                 "query_time_summary_cached_at": None,
                 "ocr_signal": {
@@ -1519,6 +1796,8 @@ class ImageProcessor:
             }
             if vision_model:
                 meta["vision_model"] = vision_model
+            if queued:
+                meta["vision_summary_key"] = content_key
             return ExtractedImage(
                 summary=_build_image_summary_text(summary_text, visible_text),
                 visible_text=visible_text,
@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import query.core as qc
+from lexical_index import open_lexical_index
 
 # Local bindings for defaults and constants (tests patch qc.*; defaults mirror qc at import time)
 for _sym in (
@@ -98,8 +99,14 @@ def execute_run_ask(
     force: bool = False,
     explicit_unified: bool = False,
     get_chroma_client: Any = None,
+    answer_stream: Any = None,
 ) -> str:
-    """Query archetype's collection, or unified llmli collection if archetype_id is None (optional silo filter)."""
+    """
+    Query archetype's collection, or unified llmli collection if archetype_id is None (optional silo filter).
+
+    answer_stream: optional object with write(text) and close(); when the answer comes from
+    the LLM, raw tokens are written to it as they stream and it is closed before post-processing.
+    """
     if use_reranker is None:
         use_reranker = qc.is_reranker_enabled()
 
@@ -1201,6 +1208,8 @@ def execute_run_ask(
         # Temporal decomposition path skips hybrid (ids_v is empty in that case).
         _hybrid_where = query_kw.get("where") if isinstance(query_kw.get("where"), dict) else None
         _lexical_phrases = PROFILE_LEXICAL_PHRASES if intent == INTENT_EVIDENCE_PROFILE else None
+        # The lexical index covers the unified llmli collection only (silo-scoped chunks).
+        _lexical_index = open_lexical_index(db) if use_unified else None
         docs, metas, dists, hybrid_method = qc.run_hybrid_retrieve(
             ids_v=ids_v,
             docs_v=docs,
@@ -1211,6 +1220,7 @@ def execute_run_ask(
             where_filter=_hybrid_where,
             top_k=n_stage1,
             lexical_phrases=_lexical_phrases,
+            lexical_index=_lexical_index,
         )
         hybrid_used = (hybrid_method == "hybrid")
 
@@ -1270,6 +1280,7 @@ def execute_run_ask(
                     where_filter=artifact_hybrid_where,
                     top_k=n_stage1,
                     lexical_phrases=_lexical_phrases,
+                    lexical_index=_lexical_index,
                 )
                 per_intent_cap_dual = qc.max_chunks_for_intent(intent, MAX_CHUNKS_PER_FILE)
                 raw_docs_stream, raw_metas_stream, raw_dists_stream = qc.diversify_by_source(
@@ -1905,8 +1916,7 @@ def execute_run_ask(
         roster_block = ""
         if silo:
             from query.context import build_file_roster
-            manifest_path = Path(db) / "llmli_file_manifest.json"
-            roster_block = build_file_roster(silo, manifest_path)
+            roster_block = build_file_roster(silo, db)
         
         # --- Deterministic form-count: bypass LLM for "how many [form_type]" queries ---
         import re as _re
@@ -1919,8 +1929,7 @@ def execute_run_ask(
             from query.context import count_forms_from_manifest, format_form_count_answer
             _year_m = _re.search(r"\b(20\d{2})\b", query)
             _year = _year_m.group(1) if _year_m else None
-            _manifest_path = Path(db) / "llmli_file_manifest.json"
-            _form_result = count_forms_from_manifest(silo, _manifest_path, year=_year)
+            _form_result = count_forms_from_manifest(silo, db, year=_year)
             if _form_result:
                 _answer = format_form_count_answer(_form_result, query, source_label)
                 lines = [_answer, "", qc.dim(no_color, "---"), qc.label_style(no_color, f"Answered by: {source_label} (file roster)")]
@@ -1934,7 +1943,6 @@ def execute_run_ask(
             "[END CONTEXT]"
         )
         
-        import ollama
         import time as _time
         try:
             import psutil as _psutil
@@ -1945,20 +1953,28 @@ def execute_run_ask(
             _proc = None
             _mem_before_gb = _sys_avail_before_gb = None
         _t0 = _time.perf_counter()
-        response = ollama.chat(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            keep_alive=0,
-            options={"temperature": 0, "seed": 42},
-        )
+        try:
+            raw_answer, _first_token_ms = qc._chat_answer(
+                model,
+                [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                answer_stream=answer_stream,
+            )
+        finally:
+            # The live preview is replaced by the post-processed answer.
+            if answer_stream is not None:
+                answer_stream.close()
         _elapsed = _time.perf_counter() - _t0
         stage_timings_ms["llm_call"] = round(_elapsed * 1000, 2)
+        if _first_token_ms is not None:
+            stage_timings_ms["llm_first_token"] = _first_token_ms
         _stage_started = _time.perf_counter()
         try:
             _parts = [f"[llm {model}] {_elapsed:.1f}s"]
+            if _first_token_ms is not None:
+                _parts.append(f"first token {_first_token_ms / 1000:.2f}s")
             if _proc is not None:
                 _mem_after_gb = _proc.memory_info().rss / 1e9
                 _sys_avail_after_gb = _psutil.virtual_memory().available / 1e9
@@ -1967,7 +1983,6 @@ def execute_run_ask(
             print(" | ".join(_parts), file=__import__("sys").stderr)
         except Exception:
             pass
-        raw_answer = (response.get("message") or {}).get("content") or ""
         raw_answer = qc.sanitize_answer_metadata_artifacts(raw_answer.strip())
         raw_answer = qc.normalize_answer_direct_address(raw_answer)
         direct_address_violations = qc.find_direct_address_contract_violations(raw_answer)
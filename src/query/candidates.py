@@ -0,0 +1,175 @@
+"""
+Array-backed candidate sets for the post-retrieval stages.
+
+Retrieval hands docs/metas/dists through a chain of stages (diversity caps,
+chunk-hash dedup, source-priority ordering, silo coverage). Done on three
+parallel lists, every stage re-reads metadata fields and rebuilds the lists.
+A CandidateSet reads each key it needs (source, silo, chunk_hash) once, interns
+it to an integer array, keeps distances as a float array, and implements the
+stages as NumPy selections over those arrays, so a chain of stages costs one
+metadata pass plus a few array operations regardless of stage-1 depth.
+
+The list functions in query.retrieval are thin adapters over these methods.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import numpy as np
+
+_MISSING_DIST = 999.0
+
+# How each key is read from a chunk's metadata (falsy values are "unknown").
+_KEY_READERS: dict[str, Callable[[dict], Any]] = {
+    "source": lambda m: m.get("source") or "",
+    "silo": lambda m: str(m.get("silo") or ""),
+    "chunk_hash": lambda m: m.get("chunk_hash") or "",
+}
+
+
+def _intern(values: list[Any]) -> tuple[np.ndarray, list[Any]]:
+    """(ids, labels): equal values share an id; every unknown (falsy) value gets its own."""
+    table: dict[Any, int] = {}
+    labels: list[Any] = []
+    ids: list[int] = []
+    for value in values:
+        if not value:
+            ids.append(len(labels))
+            labels.append("")
+            continue
+        j = table.get(value)
+        if j is None:
+            j = table[value] = len(labels)
+            labels.append(value)
+        ids.append(j)
+    return np.fromiter(ids, dtype=np.int64, count=len(ids)), labels
+
+
+def _occurrence_rank(ids: np.ndarray) -> np.ndarray:
+    """For each row, how many earlier rows share its id (0 for the first occurrence)."""
+    n = ids.size
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    order = np.argsort(ids, kind="stable")
+    sorted_ids = ids[order]
+    positions = np.arange(n)
+    starts = np.empty(n, dtype=bool)
+    starts[0] = True
+    np.not_equal(sorted_ids[1:], sorted_ids[:-1], out=starts[1:])
+    group_start = np.maximum.accumulate(np.where(starts, positions, 0))
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = positions - group_start
+    return rank
+
+
+class CandidateSet:
+    """
+    Ranked candidates (docs, metas, dists) with lazily interned key arrays.
+
+    Stages return a new CandidateSet over the selected rows; docs and metas are
+    shared, not copied, and interned keys are sliced rather than re-read.
+    """
+
+    __slots__ = ("docs", "metas", "dists", "_dist", "_keys")
+
+    def __init__(
+        self,
+        docs: list[str],
+        metas: list[dict | None],
+        dists: list[float | None],
+        *,
+        keys: dict[str, list[Any]] | None = None,
+    ) -> None:
+        n = len(docs)
+        self.docs = list(docs)
+        self.metas = [metas[i] if i < len(metas) else None for i in range(n)] if len(metas) != n else list(metas)
+        self.dists = [dists[i] if i < len(dists) else None for i in range(n)] if len(dists) != n else list(dists)
+        self._dist: np.ndarray | None = None
+        self._keys: dict[str, tuple[np.ndarray, list[Any]]] = {}
+        for name, values in (keys or {}).items():
+            reader = _KEY_READERS[name]
+            self._keys[name] = _intern(
+                [values[i] if i < len(values) else reader(self.metas[i] or {}) for i in range(n)]
+            )
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def to_lists(self) -> tuple[list[str], list[dict | None], list[float | None]]:
+        return self.docs, self.metas, self.dists
+
+    def key_ids(self, name: str) -> np.ndarray:
+        """Interned ids of one metadata key (source, silo or chunk_hash), read on first use."""
+        entry = self._keys.get(name)
+        if entry is None:
+            reader = _KEY_READERS[name]
+            entry = self._keys[name] = _intern([reader(m or {}) for m in self.metas])
+        return entry[0]
+
+    def key_labels(self, name: str) -> list[Any]:
+        self.key_ids(name)
+        return self._keys[name][1]
+
+    def dist_array(self) -> np.ndarray:
+        """Distances as float64, missing ones as 999.0 (worst)."""
+        if self._dist is None:
+            self._dist = np.fromiter(
+                (float(d) if d is not None else _MISSING_DIST for d in self.dists),
+                dtype=np.float64,
+                count=len(self.dists),
+            )
+        return self._dist
+
+    def take(self, rows: np.ndarray | list[int]) -> "CandidateSet":
+        """The candidates at rows, in that order."""
+        idx = np.asarray(rows, dtype=np.int64)
+        picked = idx.tolist()
+        out = CandidateSet.__new__(CandidateSet)
+        out.docs = [self.docs[i] for i in picked]
+        out.metas = [self.metas[i] for i in picked]
+        out.dists = [self.dists[i] for i in picked]
+        out._dist = self._dist[idx] if self._dist is not None else None
+        out._keys = {name: (ids[idx], labels) for name, (ids, labels) in self._keys.items()}
+        return out
+
+    def head(self, top_k: int) -> "CandidateSet":
+        return self if len(self) <= top_k else self.take(np.arange(max(0, top_k)))
+
+    def cap_per_key(self, name: str, top_k: int, cap: int) -> "CandidateSet":
+        """First top_k rows, in order, keeping at most cap rows per key value."""
+        rank = _occurrence_rank(self.key_ids(name))
+        return self.take(np.flatnonzero(rank < cap)[: max(0, top_k)])
+
+    def dedup(self, name: str = "chunk_hash") -> "CandidateSet":
+        """Keep the first row of each key value (rows with no value are all kept)."""
+        rank = _occurrence_rank(self.key_ids(name))
+        if not rank.any():
+            return self
+        return self.take(np.flatnonzero(rank == 0))
+
+    def order_by(self, priority: np.ndarray) -> "CandidateSet":
+        """Stable sort: higher priority first, then smaller distance."""
+        return self.take(np.lexsort((self.dist_array(), -priority)))
+
+    def label_scores(self, name: str, score: Callable[[Any], float]) -> np.ndarray:
+        """score(label) per row, evaluated once per distinct key value."""
+        labels = self.key_labels(name)
+        table = np.fromiter((score(label) for label in labels), dtype=np.float64, count=len(labels))
+        return table[self.key_ids(name)]
+
+    def ensure_key_coverage(self, name: str, top_k: int, min_keys: int) -> "CandidateSet":
+        """
+        Up to top_k rows (in original order) that include the first row of each of the
+        min_keys best key values, ranked by best distance then first appearance.
+        """
+        ids = self.key_ids(name)
+        first_rows = np.flatnonzero(_occurrence_rank(ids) == 0)
+        best = np.full(len(self.key_labels(name)), np.inf)
+        np.minimum.at(best, ids, self.dist_array())
+        # first_rows is already in first-appearance order, so a stable sort on best distance ranks ties by it.
+        ranked = first_rows[np.argsort(best[ids[first_rows]], kind="stable")]
+        covered = np.sort(ranked[: max(0, min_keys)])[: max(0, top_k)]
+        mask = np.zeros(len(self), dtype=bool)
+        mask[covered] = True
+        fill = np.flatnonzero(~mask)[: max(0, top_k - covered.size)]
+        return self.take(np.sort(np.concatenate((covered, fill))))
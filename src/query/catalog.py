@@ -130,7 +130,7 @@ def _path_has_year_token(path_str: str, year: int) -> bool:
 
 
 def _iter_manifest_paths_for_silo(db_path: str, silo_slug: str) -> tuple[dict[str, dict], str | None]:
-    manifest = _read_file_manifest(db_path)
+    manifest = _read_file_manifest(db_path, silos=[silo_slug])
     silos = manifest.get("silos") or {}
     silo_entry = silos.get(silo_slug) if isinstance(silos, dict) else None
     if not isinstance(silo_entry, dict):
@@ -93,7 +93,7 @@ def get_code_language_stats_from_manifest_year(
     - Uses mtime year only.
     - silo=None aggregates across all silos.
     """
-    manifest = _read_file_manifest(db_path)
+    manifest = _read_file_manifest(db_path, silos=[silo] if silo else None)
     manifest_silos = (manifest.get("silos") or {}) if isinstance(manifest, dict) else {}
     if not isinstance(manifest_silos, dict):
         return ({}, {})
@@ -147,7 +147,7 @@ def get_code_sources_from_manifest_year(
     - Uses mtime year only.
     - silo=None aggregates across all silos.
     """
-    manifest = _read_file_manifest(db_path)
+    manifest = _read_file_manifest(db_path, silos=[silo] if silo else None)
     manifest_silos = (manifest.get("silos") or {}) if isinstance(manifest, dict) else {}
     if not isinstance(manifest_silos, dict):
         return []
@@ -101,14 +101,11 @@ def recency_score(mtime: float, half_life_days: float = 365.0) -> float:
         return 0.0
 
 
-def build_file_roster(silo_slug: str, manifest_path) -> str:
+def build_file_roster(silo_slug: str, db_path) -> str:
     """Build a compact file inventory for a silo from the manifest."""
-    import json
-    try:
-        with open(manifest_path) as f:
-            manifest = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
-        return ""
+    from file_registry import _read_file_manifest
+
+    manifest = _read_file_manifest(db_path, silos=[silo_slug])
 
     silo_data = manifest.get("silos", {}).get(silo_slug, {})
     files = silo_data.get("files", {})
@@ -128,13 +125,13 @@ def build_file_roster(silo_slug: str, manifest_path) -> str:
 
 
 def count_forms_from_manifest(
-    silo_slug: str, manifest_path, year: str | None = None
+    silo_slug: str, db_path, year: str | None = None
 ) -> dict:
     """
     Count files by tax form type from the manifest using filename patterns.
     Returns {"counts": {"1099": [...], ...}, "total_matched": N, "total_files": N, "year": year}.
     """
-    import json
+    from file_registry import _read_file_manifest
 
     FORM_PATTERNS = [
         ("W-2",      re.compile(r"\bw.?2\b", re.IGNORECASE)),
@@ -149,12 +146,7 @@ def count_forms_from_manifest(
         ("1040",     re.compile(r"1040",        re.IGNORECASE)),
     ]
 
-    try:
-        with open(manifest_path) as f:
-            manifest = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
-        return {}
-
+    manifest = _read_file_manifest(db_path, silos=[silo_slug])
     silo_data = manifest.get("silos", {}).get(silo_slug, {})
     files = silo_data.get("files", {})
     if not files:
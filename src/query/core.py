@@ -23,6 +23,7 @@ except ImportError:
     get_silo_image_vision_enabled = None  # type: ignore[misc, assignment]
 
 from query.core_reexports import *  # noqa: F403
+from query.result_cache import get_cached_retrieve, put_cached_retrieve, retrieve_cache_key
 
 _DETERMINISTIC_INTENTS = frozenset({
     INTENT_CAPABILITIES,
@@ -50,6 +51,7 @@ def run_ask(
     force: bool = False,
     explicit_unified: bool = False,
     get_chroma_client: Any | None = None,
+    answer_stream: Any = None,
 ) -> str:
     """Query archetype's collection, or unified llmli collection if archetype_id is None (optional silo filter)."""
     from query.ask.orchestrator import execute_run_ask
@@ -70,6 +72,7 @@ def run_ask(
         force=force,
         explicit_unified=explicit_unified,
         get_chroma_client=get_chroma_client or get_client,
+        answer_stream=answer_stream,
     )
 
 
@@ -109,22 +112,22 @@ def run_retrieve(
             "chunks": [],
         }
 
+    # An injected client is the caller's own read path; only the default one is cached.
+    cache_key = None
+    if get_chroma_client is None:
+        cache_key = retrieve_cache_key(db, query, silo, n_results, section, doc_type)
+        cached = get_cached_retrieve(cache_key)
+        if cached is not None:
+            return cached
+
     silo_slug: str | None = None
     if silo:
         silo_slug = resolve_silo_to_slug(db, silo) or silo
 
     use_reranker = is_reranker_enabled()
-    n_effective = effective_k(intent, n_results)
-    if intent in (INTENT_EVIDENCE_PROFILE, INTENT_AGGREGATE, INTENT_ACADEMIC_HISTORY):
-        n_stage1 = max(n_effective, RERANK_STAGE1_N if use_reranker else 60)
-    elif intent == INTENT_REFLECT:
-        n_stage1 = n_effective
-    else:
-        n_stage1 = RERANK_STAGE1_N if use_reranker else min(100, max(n_results * 5, 60))
-
-    query_for_retrieval = query.strip()
-    if intent not in (INTENT_FIELD_LOOKUP, INTENT_CAPABILITIES, INTENT_CODE_LANGUAGE):
-        query_for_retrieval = expand_query(query_for_retrieval)
+    plan = _retrieval_plan(query, intent, n_results, use_reranker)
+    n_stage1 = plan["n_stage1"]
+    query_for_retrieval = plan["query_for_retrieval"]
 
     from chroma_lock import chroma_shared_lock
     from query.retrieve_locked import execute_retrieve_chroma_phase
@@ -144,8 +147,113 @@ def run_retrieve(
             doc_type=doc_type,
             db_path=str(db_path) if db_path is not None else None,
             get_chroma_client=_gc,
+            use_reranker=use_reranker,
         )
-    return annotate_write_state(result, before, _sample_write_state(db, silo_slug))
+    result = annotate_write_state(result, before, _sample_write_state(db, silo_slug))
+    put_cached_retrieve(cache_key, result)
+    return result
+
+
+def _retrieval_plan(query: str, intent: str, n_results: int, use_reranker: bool) -> dict:
+    """Expanded retrieval text and stage-1 depth for one routed query."""
+    n_effective = effective_k(intent, n_results)
+    if intent in (INTENT_EVIDENCE_PROFILE, INTENT_AGGREGATE, INTENT_ACADEMIC_HISTORY):
+        n_stage1 = max(n_effective, RERANK_STAGE1_N if use_reranker else 60)
+    elif intent == INTENT_REFLECT:
+        n_stage1 = n_effective
+    else:
+        n_stage1 = RERANK_STAGE1_N if use_reranker else min(100, max(n_results * 5, 60))
+    query_for_retrieval = query.strip()
+    if intent not in (INTENT_FIELD_LOOKUP, INTENT_CAPABILITIES, INTENT_CODE_LANGUAGE):
+        query_for_retrieval = expand_query(query_for_retrieval)
+    return {"intent": intent, "query": query, "query_for_retrieval": query_for_retrieval, "n_stage1": n_stage1}
+
+
+def run_retrieve_many(
+    queries: list[str],
+    silo: str | None = None,
+    n_results: int = DEFAULT_N_RESULTS,
+    section: str | None = None,
+    doc_type: str | None = None,
+    db_path: str | Path | None = None,
+    config_path: str | Path | None = None,
+    get_chroma_client: Any | None = None,
+) -> list[dict | BaseException]:
+    """
+    run_retrieve for several queries over the same scope in one pass.
+
+    The silo is resolved, the shared lock taken, and write state sampled once;
+    all queries are embedded in one model call and sent as one multi-row Chroma
+    query, then lexical legs run concurrently and (when the reranker is on) all
+    candidates are cross-encoder scored in one batch. Returns one entry per query, in
+    order: the same dict run_retrieve would return, or the exception that query
+    raised (a failure of the shared vector query is raised for all of them).
+    Queries already in the result cache are answered from it and skip the batch.
+    """
+    db = str(db_path or DB_PATH)
+    silo_slug: str | None = None
+    if silo:
+        silo_slug = resolve_silo_to_slug(db, silo) or silo
+    use_reranker = is_reranker_enabled()
+
+    results: list[dict | BaseException | None] = [None] * len(queries)
+    plans: list[dict] = []
+    plan_slots: list[int] = []
+    plan_keys: list[tuple | None] = []
+    for i, q in enumerate(queries):
+        try:
+            intent = route_intent(q)
+            if intent in _DETERMINISTIC_INTENTS:
+                results[i] = {
+                    "query": q,
+                    "intent": intent,
+                    "silo_filter": silo,
+                    "note": (
+                        f"Intent '{intent}' is deterministic and does not use vector retrieval. "
+                        "Try rephrasing as a descriptive question for semantic retrieval."
+                    ),
+                    "chunks": [],
+                }
+                continue
+            key = retrieve_cache_key(db, q, silo, n_results, section, doc_type) if get_chroma_client is None else None
+            cached = get_cached_retrieve(key)
+            if cached is not None:
+                results[i] = cached
+                continue
+            plan = _retrieval_plan(q, intent, n_results, use_reranker)
+        except Exception as e:
+            results[i] = e
+            continue
+        plans.append(plan)
+        plan_slots.append(i)
+        plan_keys.append(key)
+
+    if plans:
+        from chroma_lock import chroma_shared_lock
+        from query.retrieve_locked import execute_retrieve_chroma_phase_many
+
+        _gc = get_chroma_client or get_client
+        before = _sample_write_state(db, silo_slug)
+        with chroma_shared_lock(str(db)):
+            batch = execute_retrieve_chroma_phase_many(
+                db=db,
+                plans=plans,
+                silo_slug=silo_slug,
+                n_results=n_results,
+                section=section,
+                doc_type=doc_type,
+                db_path=str(db_path) if db_path is not None else None,
+                get_chroma_client=_gc,
+                use_reranker=use_reranker,
+            )
+        after = _sample_write_state(db, silo_slug)
+        for slot, key, res in zip(plan_slots, plan_keys, batch):
+            if isinstance(res, BaseException):
+                results[slot] = res
+                continue
+            results[slot] = annotate_write_state(res, before, after)
+            put_cached_retrieve(key, results[slot])
+    return [r if r is not None else RuntimeError("no result") for r in results]
 
 
 def _sample_write_state(db: str, silo_slug: str | None) -> dict | None:
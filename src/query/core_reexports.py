@@ -150,6 +150,8 @@ from query.core_support import (
     _strip_hash_suffix,
     _top_distance,
     _build_recency_hints,
+    _chat_answer,
+    _ollama_keep_alive,
     _query_requests_ownership_framing,
     _query_requests_recency_hints,
 )
@@ -208,6 +210,8 @@ __all__ = [
     "_strip_hash_suffix",
     "_top_distance",
     "_build_recency_hints",
+    "_chat_answer",
+    "_ollama_keep_alive",
     "_query_requests_ownership_framing",
     "_query_requests_recency_hints",
     "aggregate_metadata",
@@ -4,12 +4,16 @@ and prompt utilities. Extracted from core.py for maintainability.
 """
 from __future__ import annotations
 
+import os
 import re
 import sys
+import time
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from image_summary_queue import image_content_key, read_cached_summary, write_cached_summary
 from processors import _build_image_summary_text
 
 from query.context import query_mentioned_years, context_block
@@ -194,28 +198,38 @@ def _is_chroma_index_error(exc: Exception) -> bool:
     return "finding id" in msg or "internalerror" in type(exc).__name__.lower()
 
 
-def _safe_query(
+def _query_rows(results: dict[str, Any]) -> list[tuple[list[str], list[dict | None], list[float | None], list[str]]]:
+    """Split a Chroma query() response into one (docs, metas, dists, ids) tuple per query row."""
+    docs_rows = results.get("documents") or [[]]
+    metas_rows = results.get("metadatas") or []
+    dists_rows = results.get("distances") or []
+    ids_rows = results.get("ids") or []
+    rows = []
+    for i in range(max(1, len(docs_rows))):
+        rows.append((
+            (docs_rows[i] if i < len(docs_rows) else None) or [],
+            (metas_rows[i] if i < len(metas_rows) else None) or [],
+            (dists_rows[i] if i < len(dists_rows) else None) or [],
+            (ids_rows[i] if i < len(ids_rows) else None) or [],
+        ))
+    return rows
+
+
+def _safe_query_rows(
     collection: Any,
     query_kw: dict[str, Any],
     silo_slug: str | None = None,
     db_path: str | None = None,
-) -> tuple[list[str], list[dict | None], list[float | None], list[str], str | None]:
+    scope_silos: list[str] | None = None,
+) -> tuple[list[tuple[list[str], list[dict | None], list[float | None], list[str]]], str | None]:
     """
-    Run collection.query(**query_kw) with a graceful fallback when ChromaDB throws an
-    index-consistency error (e.g. 'InternalError: Error finding id').
-
-    When the scoped query fails and a silo_slug is set, retries without the where filter
-    and post-filters results to the target silo in Python.  Returns (docs, metas, dists,
-    ids, warning) where warning is None on success or a human-readable string on fallback.
-    ChromaDB always returns ids from .query() regardless of the include list.
+    Multi-row form of _safe_query: one collection.query() for every query text/embedding
+    in query_kw, returning ([(docs, metas, dists, ids) per row], warning). Same index-error
+    fallback as _safe_query, applied row by row; scope_silos widens the post-filter to
+    every silo the where filter spanned (default: silo_slug only).
     """
     try:
-        results = collection.query(**query_kw)
-        docs = (results.get("documents") or [[]])[0] or []
-        metas = (results.get("metadatas") or [[]])[0] or []
-        dists = (results.get("distances") or [[]])[0] or []
-        ids = (results.get("ids") or [[]])[0] or []
-        return docs, metas, dists, ids, None
+        return _query_rows(collection.query(**query_kw)), None
     except Exception as exc:
         if not _is_chroma_index_error(exc):
             raise
@@ -234,23 +248,44 @@ def _safe_query(
             except Exception:
                 pass
         fallback_kw = {k: v for k, v in query_kw.items() if k != "where"}
-        results = collection.query(**fallback_kw)
-        docs = (results.get("documents") or [[]])[0] or []
-        metas = (results.get("metadatas") or [[]])[0] or []
-        dists = (results.get("distances") or [[]])[0] or []
-        ids = (results.get("ids") or [[]])[0] or []
-        if silo_slug:
+        rows = _query_rows(collection.query(**fallback_kw))
+        if not silo_slug:
+            return rows, warning
+        keep = set(scope_silos or [silo_slug])
+        filtered_rows = []
+        for docs, metas, dists, ids in rows:
             filtered = [
                 (d, m, dist, cid)
                 for d, m, dist, cid in zip(docs, metas, dists, ids or [""] * len(docs))
-                if str((m or {}).get("silo") or "") == silo_slug
+                if str((m or {}).get("silo") or "") in keep
             ]
             if filtered:
-                docs, metas, dists, ids = zip(*filtered)  # type: ignore[assignment]
-                docs, metas, dists, ids = list(docs), list(metas), list(dists), list(ids)
+                f_docs, f_metas, f_dists, f_ids = zip(*filtered)
+                filtered_rows.append((list(f_docs), list(f_metas), list(f_dists), list(f_ids)))
             else:
-                docs, metas, dists, ids = [], [], [], []
-        return docs, metas, dists, ids, warning
+                filtered_rows.append(([], [], [], []))
+        return filtered_rows, warning
+
+
+def _safe_query(
+    collection: Any,
+    query_kw: dict[str, Any],
+    silo_slug: str | None = None,
+    db_path: str | None = None,
+    scope_silos: list[str] | None = None,
+) -> tuple[list[str], list[dict | None], list[float | None], list[str], str | None]:
+    """
+    Run collection.query(**query_kw) with a graceful fallback when ChromaDB throws an
+    index-consistency error (e.g. 'InternalError: Error finding id').
+
+    When the scoped query fails and a silo_slug is set, retries without the where filter
+    and post-filters results to the target silo in Python.  Returns (docs, metas, dists,
+    ids, warning) where warning is None on success or a human-readable string on fallback.
+    ChromaDB always returns ids from .query() regardless of the include list.
+    """
+    rows, warning = _safe_query_rows(collection, query_kw, silo_slug, db_path=db_path, scope_silos=scope_silos)
+    docs, metas, dists, ids = rows[0]
+    return docs, metas, dists, ids, warning
 
 
 def _query_is_image_relevant(query: str, docs: list[str], metas: list[dict | None]) -> bool:
@@ -301,17 +336,24 @@ def _hydrate_single_image_summary_doc(
     if summary_status != "deferred" or not allow_lazy:
         return doc, meta
 
-    source_path = str(meta_dict.get("source") or artifact.get("source_path") or "").strip()
-    if not source_path:
-        return doc, meta
-    try:
-        image_bytes = Path(source_path).read_bytes()
-    except OSError:
-        return doc, meta
-    try:
-        summary_text, vision_model = _vision_summarize(image_bytes, source_path, visible_text)
-    except Exception:
-        return doc, meta
+    content_key = str(artifact.get("content_sha256") or "")
+    cached = read_cached_summary(db_path, content_key)
+    if cached is not None:
+        summary_text, vision_model = cached
+    else:
+        source_path = str(meta_dict.get("source") or artifact.get("source_path") or "").strip()
+        if not source_path:
+            return doc, meta
+        try:
+            image_bytes = Path(source_path).read_bytes()
+        except OSError:
+            return doc, meta
+        try:
+            summary_text, vision_model = _vision_summarize(image_bytes, source_path, visible_text)
+        except Exception:
+            return doc, meta
+        if vision_model and content_key == image_content_key(image_bytes):
+            write_cached_summary(db_path, content_key, summary_text, vision_model)
 
     artifact["summary"] = summary_text
     artifact["summary_status"] = "cached_query_time"
@@ -898,7 +940,7 @@ def _llm_summarize_structure(
                     ),
                 },
             ],
-            keep_alive=0,
+            keep_alive=_ollama_keep_alive(),
             options={"temperature": 0, "seed": 42},
         )
         text = ((resp.get("message") or {}).get("content") or "").strip()
@@ -907,6 +949,69 @@ def _llm_summarize_structure(
         return None
 
 
+_DEFAULT_OLLAMA_KEEP_ALIVE = "5m"
+
+
+def _ollama_keep_alive() -> str | int:
+    """
+    keep_alive for answer-time chat calls (LLMLIBRARIAN_OLLAMA_KEEP_ALIVE, default 5m).
+
+    Keeping the model loaded between asks (and between an answer and its repair call)
+    avoids reloading weights on every call. Bare numbers are seconds: 0 unloads the
+    model after each call, -1 keeps it loaded indefinitely.
+    """
+    raw = os.environ.get("LLMLIBRARIAN_OLLAMA_KEEP_ALIVE", "").strip()
+    if not raw:
+        return _DEFAULT_OLLAMA_KEEP_ALIVE
+    try:
+        return int(raw)
+    except ValueError:
+        return raw
+
+
+def _chat_answer(
+    model: str,
+    messages: list[dict[str, str]],
+    answer_stream: Any = None,
+) -> tuple[str, float | None]:
+    """
+    Run the answer chat call; return (raw answer text, time to first token in ms).
+
+    With answer_stream (an object with write(text)), the call streams and each token
+    is written as it arrives; first-token time is None when not streaming.
+    """
+    import ollama
+
+    kwargs: dict[str, Any] = {
+        "model": model,
+        "messages": messages,
+        "keep_alive": _ollama_keep_alive(),
+        "options": {"temperature": 0, "seed": 42},
+    }
+    if answer_stream is None:
+        response = ollama.chat(**kwargs)
+        return (response.get("message") or {}).get("content") or "", None
+    started = time.perf_counter()
+    response = ollama.chat(stream=True, **kwargs)
+    if not isinstance(response, Iterator):
+        # Clients that ignore stream=True hand back the whole response at once.
+        text = (response.get("message") or {}).get("content") or ""
+        if text:
+            answer_stream.write(text)
+        return text, round((time.perf_counter() - started) * 1000, 2)
+    parts: list[str] = []
+    first_token_ms: float | None = None
+    for chunk in response:
+        token = (chunk.get("message") or {}).get("content") or ""
+        if not token:
+            continue
+        if first_token_ms is None:
+            first_token_ms = round((time.perf_counter() - started) * 1000, 2)
+        parts.append(token)
+        answer_stream.write(token)
+    return "".join(parts), first_token_ms
+
+
 def _compose_answer_system_prompt(base_prompt: str, voice_policy: str) -> str:
     parts = [voice_policy.strip()]
     base = (base_prompt or "").strip()
@@ -951,7 +1056,7 @@ def _repair_direct_address_answer(
                 {"role": "system", "content": repair_system_prompt},
                 {"role": "user", "content": repair_user_prompt},
             ],
-            keep_alive=0,
+            keep_alive=_ollama_keep_alive(),
             options={"temperature": 0, "seed": 42},
         )
         repaired = ((response.get("message") or {}).get("content") or "").strip()
@@ -74,7 +74,7 @@ def aggregate_metadata(
     - label: dimension value (e.g., "2024", ".pdf", "Q1-2024")
     - count: number of files
     """
-    manifest = _read_file_manifest(db_path)
+    manifest = _read_file_manifest(db_path, silos=[silo_slug])
     silos = manifest.get("silos") or {}
     silo_entry = silos.get(silo_slug) if isinstance(silos, dict) else None
 
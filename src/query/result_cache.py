@@ -0,0 +1,147 @@
+"""
+In-process cache of run_retrieve results, keyed by index generation.
+
+Agents re-ask the same question within a session, and between writes the answer
+cannot change. Entries are keyed on (normalized query, silo, n_results, section,
+doc_type, embedding model, reranker model) plus an index-generation token, so
+any write makes old entries unreachable and they age out of the LRU.
+
+The token is the stat of the files every index write touches: the Chroma write
+generation (``bump_generation``), the chunk-count and file-manifest stores (and
+their WAL files), and the silo registry. It is a few stat calls, so a hit costs
+microseconds. In-process writers (the MCP file tools) also call
+``invalidate_retrieve_cache`` so a result cached in the same mtime tick as the
+write cannot survive it.
+
+Results taken while a write was in progress are never cached.
+
+Env:
+  - LLMLIBRARIAN_RETRIEVE_CACHE_SIZE -> LRU entries (default: 256; 0 disables)
+"""
+import copy
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+_DEFAULT_CACHE_SIZE = 256
+_GENERATION_FILES = (
+    ".llmli_chroma_generation",
+    "llmli_chunk_counts.sqlite3",
+    "llmli_chunk_counts.sqlite3-wal",
+    "llmli_file_manifest.sqlite3",
+    "llmli_file_manifest.sqlite3-wal",
+    "llmli_registry.json",
+)
+
+_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+# Bumped by invalidate_retrieve_cache; part of every key.
+_local_epoch = 0
+
+
+def _cache_size() -> int:
+    try:
+        return max(0, int(os.environ.get("LLMLIBRARIAN_RETRIEVE_CACHE_SIZE", _DEFAULT_CACHE_SIZE)))
+    except (TypeError, ValueError):
+        return _DEFAULT_CACHE_SIZE
+
+
+def index_generation(db: str) -> tuple[int, ...]:
+    """mtime_ns of every index store file (0 when absent); changes on any write."""
+    root = Path(db).expanduser()
+    out: list[int] = []
+    for name in _GENERATION_FILES:
+        try:
+            out.append((root / name).stat().st_mtime_ns)
+        except OSError:
+            out.append(0)
+    return tuple(out)
+
+
+def _model_key() -> tuple[str, ...]:
+    return (
+        os.environ.get("LLMLIBRARIAN_EMBEDDING", "").lower(),
+        os.environ.get("LLMLIBRARIAN_EMBEDDING_MODEL", "all-mpnet-base-v2"),
+        os.environ.get("LLMLIBRARIAN_RERANK", "").lower(),
+        os.environ.get("LLMLIBRARIAN_RERANK_MODEL", ""),
+    )
+
+
+def retrieve_cache_key(
+    db: str,
+    query: str,
+    silo: str | None,
+    n_results: int,
+    section: str | None,
+    doc_type: str | None,
+) -> tuple | None:
+    """Cache key for one run_retrieve call, or None when the cache is disabled."""
+    if not _cache_size():
+        return None
+    return (
+        str(Path(db).expanduser().resolve()),
+        " ".join((query or "").split()),
+        silo or "",
+        int(n_results),
+        section or "",
+        doc_type or "",
+        _model_key(),
+        index_generation(db),
+        _local_epoch,
+    )
+
+
+def get_cached_retrieve(key: tuple | None) -> dict | None:
+    """A private copy of the cached result for key, or None (counted as a miss)."""
+    if key is None:
+        return None
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is None:
+            _stats["misses"] += 1
+            return None
+        _cache.move_to_end(key)
+        _stats["hits"] += 1
+    return copy.deepcopy(hit)
+
+
+def put_cached_retrieve(key: tuple | None, result: dict) -> None:
+    """Store a copy of result; skipped for results that saw an in-flight write."""
+    if key is None or not isinstance(result, dict) or result.get("write_in_progress"):
+        return
+    entry = copy.deepcopy(result)
+    size = _cache_size()
+    with _cache_lock:
+        _cache[key] = entry
+        _cache.move_to_end(key)
+        while len(_cache) > size:
+            _cache.popitem(last=False)
+
+
+def invalidate_retrieve_cache() -> None:
+    """Drop every cached result (call after an in-process index write)."""
+    global _local_epoch
+    with _cache_lock:
+        _local_epoch += 1
+        _cache.clear()
+        _stats["invalidations"] += 1
+
+
+def retrieve_cache_info() -> dict[str, int]:
+    with _cache_lock:
+        return {
+            "size": len(_cache),
+            "max_size": _cache_size(),
+            "hits": _stats["hits"],
+            "misses": _stats["misses"],
+            "invalidations": _stats["invalidations"],
+        }
+
+
+def _reset_retrieve_cache_for_tests() -> None:
+    """Drop cached results and counters. Test-only helper."""
+    with _cache_lock:
+        _cache.clear()
+        _stats.update({"hits": 0, "misses": 0, "invalidations": 0})
@@ -5,9 +5,11 @@ relevance gating, and catalog sub-scope resolution.
 import os
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from constants import DEFAULT_RELEVANCE_MAX_DISTANCE
+from lexical_index import tokenize
+from query.candidates import CandidateSet
 
 # Lexical triggers for "what do I like / what did I say / do I mention" — prefer chunks containing these.
 PROFILE_TRIGGERS = re.compile(
@@ -128,37 +130,34 @@ def rrf_merge(
     """
     pos_v = {vid: i + 1 for i, vid in enumerate(ids_v)}  # 1-based rank
     pos_l = {lid: i + 1 for i, lid in enumerate(ids_l)}
-    score_v = {vid: 1.0 / (k + pos_v[vid]) for vid in ids_v}
-    score_l = {lid: 1.0 / (k + pos_l[lid]) for lid in ids_l}
-    scores: dict[str, float] = {}
-    for vid in ids_v:
-        scores[vid] = score_v[vid] + score_l.get(vid, 0.0)
-    for lid in ids_l:
-        if lid not in scores:
-            scores[lid] = score_l[lid]
-    id_to_doc = dict(zip(ids_v, docs_v))
-    id_to_meta = dict(zip(ids_v, metas_v))
-    id_to_dist = dict(zip(ids_v, dists_v))
+    # Row of each id in the vector list, else (negated, 1-based) in the lexical list.
+    row = {vid: i for i, vid in enumerate(ids_v)}
     for i, lid in enumerate(ids_l):
-        if lid not in id_to_doc:
-            id_to_doc[lid] = docs_l[i] if i < len(docs_l) else ""
-            id_to_meta[lid] = metas_l[i] if i < len(metas_l) else None
-            id_to_dist[lid] = None
-    sorted_ids = sorted(scores.keys(), key=lambda x: -scores[x])[:top_k]
-    signals = [
-        {
-            "vector_rank": pos_v.get(cid),
-            "lexical_rank": pos_l.get(cid),
-            "rrf_score": round(scores[cid], 6),
-        }
-        for cid in sorted_ids
-    ]
-    return (
-        [id_to_doc[i] for i in sorted_ids],
-        [id_to_meta[i] for i in sorted_ids],
-        [id_to_dist[i] for i in sorted_ids],
-        signals,
-    )
+        if lid not in row:
+            row[lid] = -(i + 1)
+    scores = {cid: 0.0 for cid in row}
+    for cid, pos in pos_v.items():
+        scores[cid] += 1.0 / (k + pos)
+    for cid, pos in pos_l.items():
+        scores[cid] += 1.0 / (k + pos)
+    sorted_ids = sorted(scores, key=scores.__getitem__, reverse=True)[:top_k]
+    out_docs: list[str] = []
+    out_metas: list[dict | None] = []
+    out_dists: list[float | None] = []
+    signals: list[dict] = []
+    for cid in sorted_ids:
+        r = row[cid]
+        if r >= 0:
+            out_docs.append(docs_v[r])
+            out_metas.append(metas_v[r])
+            out_dists.append(dists_v[r])
+        else:
+            j = -r - 1
+            out_docs.append(docs_l[j] if j < len(docs_l) else "")
+            out_metas.append(metas_l[j] if j < len(metas_l) else None)
+            out_dists.append(None)
+        signals.append({"vector_rank": pos_v.get(cid), "lexical_rank": pos_l.get(cid), "rrf_score": round(scores[cid], 6)})
+    return out_docs, out_metas, out_dists, signals
 
 
 def merge_dual_streams_rrf(
@@ -225,6 +224,128 @@ def merge_dual_streams_rrf(
     )
 
 
+def _silos_in_where(where: dict | None) -> list[str] | None:
+    """Silo slugs a Chroma where filter pins the query to, or None when it does not."""
+    if not isinstance(where, dict):
+        return None
+    parts = where.get("$and")
+    if isinstance(parts, list):
+        for part in parts:
+            found = _silos_in_where(part)
+            if found is not None:
+                return found
+        return None
+    value = where.get("silo")
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        if isinstance(value.get("$eq"), str):
+            return [value["$eq"]]
+        if isinstance(value.get("$in"), list):
+            return [str(v) for v in value["$in"]]
+    return None
+
+
+def _phrase_match(terms: list[str]) -> Callable[[str], bool] | None:
+    """Doc test for terms that are phrases ("I like"). The index scores a phrase by its
+    words, so a doc it returns counts for a phrase only when the phrase itself is in the
+    text (case-insensitive, any whitespace); single-word terms count as the index found
+    them. None when no term is a phrase."""
+    phrases = [term.split() for term in terms if len(term.split()) > 1]
+    if not phrases:
+        return None
+    patterns = [
+        re.compile(r"(?<!\w)" + r"\s+".join(re.escape(w) for w in words) + r"(?!\w)", re.IGNORECASE)
+        for words in phrases
+    ]
+    words = {tok for term in terms if len(term.split()) == 1 for tok in tokenize(term)}
+
+    def _match(doc: str) -> bool:
+        if words and not words.isdisjoint(tokenize(doc)):
+            return True
+        return any(p.search(doc) for p in patterns)
+
+    return _match
+
+
+def _indexed_lexical_candidates(
+    lexical_index: Any,
+    terms: list[str],
+    collection: Any,
+    where_filter: dict | None,
+    limit: int = MAX_LEXICAL_FOR_RRF,
+) -> tuple[list[str], list[str], list[dict | None]] | None:
+    """BM25-ranked (ids, docs, metas) from the lexical index, or None when it cannot answer.
+
+    Unscoped queries search every registered silo. Candidates are over-fetched and
+    re-read from the collection with where_filter, which applies the non-silo
+    constraints (doc_type, source, ...) and drops rows Chroma no longer has, and
+    rows that only matched a phrase's words rather than the phrase.
+    """
+    silos = _silos_in_where(where_filter)
+    if silos is None:
+        db_path = getattr(lexical_index, "db_path", None)
+        if db_path is None:
+            return None
+        from state import list_silos
+
+        silos = [str(s.get("slug") or "") for s in list_silos(db_path)]
+    ranked = lexical_index.search(terms, silos, limit=limit * 2)
+    if ranked is None:
+        return None
+    if not ranked:
+        return [], [], []
+    ranked_ids = [cid for cid, _score in ranked]
+    get_kw: dict[str, Any] = {"ids": ranked_ids, "include": ["documents", "metadatas"]}
+    if where_filter:
+        get_kw["where"] = where_filter
+    got = collection.get(**get_kw)
+    got_ids = got.get("ids") or []
+    got_docs = got.get("documents") or []
+    got_metas = got.get("metadatas") or []
+    by_id = {
+        cid: (got_docs[i] if i < len(got_docs) else "", got_metas[i] if i < len(got_metas) else None)
+        for i, cid in enumerate(got_ids)
+    }
+    matches = _phrase_match(terms)
+    ids_l = [cid for cid in ranked_ids if cid in by_id and (matches is None or matches(by_id[cid][0] or ""))][:limit]
+    return ids_l, [by_id[cid][0] for cid in ids_l], [by_id[cid][1] for cid in ids_l]
+
+
+def lexical_candidates(
+    query_text: str,
+    collection: Any,
+    where_filter: dict | None,
+    lexical_phrases: list[str] | None = None,
+    lexical_index: Any | None = None,
+    limit: int = MAX_LEXICAL_FOR_RRF,
+) -> tuple[list[str], list[str], list[dict | None]] | None:
+    """Lexical leg of hybrid retrieval: up to limit (ids, docs, metas), or None when the query has no terms.
+
+    Uses the BM25 index when every silo in scope is indexed, else a $contains scan.
+    """
+    terms = list(lexical_phrases) if lexical_phrases is not None else extract_direct_lexical_terms(query_text)
+    if not terms:
+        return None
+    if lexical_index is not None:
+        try:
+            ranked = _indexed_lexical_candidates(lexical_index, terms, collection, where_filter, limit=limit)
+        except Exception:
+            ranked = None
+        if ranked is not None:
+            return ranked
+    where_doc: dict = {"$or": [{"$contains": t} for t in terms[:MAX_LEXICAL_FOR_RRF]]}
+    get_kw: dict[str, Any] = {"where_document": where_doc, "include": ["documents", "metadatas"]}
+    if where_filter:
+        get_kw["where"] = where_filter
+    lex = collection.get(**get_kw)
+    return (
+        (lex.get("ids") or [])[:limit],
+        (lex.get("documents") or [])[:limit],
+        (lex.get("metadatas") or [])[:limit],
+    )
+
+
 def run_hybrid_retrieve(
     ids_v: list[str],
     docs_v: list[str],
@@ -235,6 +356,8 @@ def run_hybrid_retrieve(
     where_filter: dict | None,
     top_k: int,
     lexical_phrases: list[str] | None = None,
+    lexical_index: Any | None = None,
+    lexical: tuple[list[str], list[str], list[dict | None]] | None = None,
 ) -> tuple[list[str], list[dict | None], list[float | None], str]:
     """Run hybrid retrieval: combine pre-executed vector results with a lexical query and merge via RRF.
 
@@ -243,26 +366,28 @@ def run_hybrid_retrieve(
     lexical_phrases — if provided, use these directly as $contains anchors (e.g. PROFILE_LEXICAL_PHRASES
     for EVIDENCE_PROFILE intent). If None, terms are extracted from query_text automatically.
 
+    lexical_index — a lexical_index.LexicalIndex. When every silo in scope is indexed, lexical
+    candidates come from it in BM25 order; otherwise the $contains scan is used.
+
+    lexical — pre-fetched (ids, docs, metas) from lexical_candidates, e.g. one pass shared by
+    several streams; skips the lexical query (empty lists mean vector-only).
+
     Injects ``_signals`` into each returned meta dict with keys:
         vector_rank, lexical_rank, rrf_score  (all None for vector-only path)
 
     Returns (docs, metas, dists, retrieval_method) where retrieval_method is ``"hybrid"`` or ``"vector_only"``.
     """
-    if lexical_phrases is not None:
-        terms = list(lexical_phrases)
-    else:
-        terms = extract_direct_lexical_terms(query_text)
-
-    if ids_v and terms:
-        where_doc: dict = {"$or": [{"$contains": t} for t in terms[:MAX_LEXICAL_FOR_RRF]]}
-        get_kw: dict[str, Any] = {"where_document": where_doc, "include": ["documents", "metadatas"]}
-        if where_filter:
-            get_kw["where"] = where_filter
+    if ids_v:
         try:
-            lex = collection.get(**get_kw)
-            ids_l: list[str] = (lex.get("ids") or [])[:MAX_LEXICAL_FOR_RRF]
-            docs_l: list[str] = (lex.get("documents") or [])[:MAX_LEXICAL_FOR_RRF]
-            metas_l: list[dict | None] = (lex.get("metadatas") or [])[:MAX_LEXICAL_FOR_RRF]
+            if lexical is None:
+                lexical = lexical_candidates(
+                    query_text,
+                    collection,
+                    where_filter,
+                    lexical_phrases=lexical_phrases,
+                    lexical_index=lexical_index,
+                )
+            ids_l, docs_l, metas_l = lexical or ([], [], [])
             if ids_l:
                 docs, metas, dists, signals = rrf_merge(
                     ids_v, docs_v, metas_v, dists_v,
@@ -313,27 +438,8 @@ def diversify_by_source(
     """Keep best chunks by distance but cap at max_per_source per unique source path so one big file doesn't dominate."""
     if not docs or max_per_source < 1:
         return docs[:top_k], (metas or [])[:top_k], (dists or [])[:top_k]
-    if sources is None:
-        sources = [((m or {}).get("source") or "") for m in metas]
-    out_docs: list[str] = []
-    out_metas: list[dict | None] = []
-    out_dists: list[float | None] = []
-    count_per_source: dict[str, int] = {}
-    for i, doc in enumerate(docs):
-        if len(out_docs) >= top_k:
-            break
-        meta = metas[i] if i < len(metas) else None
-        source = sources[i] if i < len(sources) else ((meta or {}).get("source") or "")
-        if not source:
-            source = f"__unknown_{i}"
-        n = count_per_source.get(source, 0)
-        if n >= max_per_source:
-            continue
-        count_per_source[source] = n + 1
-        out_docs.append(doc)
-        out_metas.append(meta)
-        out_dists.append(dists[i] if i < len(dists) else None)
-    return out_docs, out_metas, out_dists
+    keys = {"source": sources} if sources is not None else None
+    return CandidateSet(docs, metas, dists, keys=keys).cap_per_key("source", top_k, max_per_source).to_lists()
 
 
 def diversify_by_silo(
@@ -347,27 +453,8 @@ def diversify_by_silo(
     """Cap chunks per silo to avoid large silos dominating unified answers."""
     if not docs or max_per_silo < 1:
         return docs[:top_k], (metas or [])[:top_k], (dists or [])[:top_k]
-    if silos is None:
-        silos = [str(((m or {}).get("silo") or "")) for m in metas]
-    out_docs: list[str] = []
-    out_metas: list[dict | None] = []
-    out_dists: list[float | None] = []
-    count_per_silo: dict[str, int] = {}
-    for i, doc in enumerate(docs):
-        if len(out_docs) >= top_k:
-            break
-        meta = metas[i] if i < len(metas) else None
-        silo = silos[i] if i < len(silos) else str(((meta or {}).get("silo") or ""))
-        if not silo:
-            silo = f"__unknown_silo_{i}"
-        n = count_per_silo.get(silo, 0)
-        if n >= max_per_silo:
-            continue
-        count_per_silo[silo] = n + 1
-        out_docs.append(doc)
-        out_metas.append(meta)
-        out_dists.append(dists[i] if i < len(dists) else None)
-    return out_docs, out_metas, out_dists
+    keys = {"silo": silos} if silos is not None else None
+    return CandidateSet(docs, metas, dists, keys=keys).cap_per_key("silo", top_k, max_per_silo).to_lists()
 
 
 def ensure_min_silo_coverage(
@@ -382,7 +469,7 @@ def ensure_min_silo_coverage(
     Ensure at least one chunk from up to `min_silos` distinct silos when available.
 
     Deterministic behavior:
-    - Candidate silos are ranked by best distance, then first-seen index, then silo id.
+    - Candidate silos are ranked by best distance, then first-seen index.
     - Within a silo, first-seen chunk is used for coverage pass.
     - Remaining slots are filled in original order.
     """
@@ -390,63 +477,8 @@ def ensure_min_silo_coverage(
         return docs[:top_k], (metas or [])[:top_k], (dists or [])[:top_k]
     if min_silos <= 1:
         return docs[:top_k], (metas or [])[:top_k], (dists or [])[:top_k]
-    if silos is None:
-        silos = [str(((m or {}).get("silo") or "")) for m in metas]
-
-    silo_rows: dict[str, dict[str, Any]] = {}
-    ordered_rows: list[tuple[int, str, str, dict | None, float | None]] = []
-    for i, doc in enumerate(docs):
-        meta = metas[i] if i < len(metas) else None
-        dist = dists[i] if i < len(dists) else None
-        silo = silos[i] if i < len(silos) else str(((meta or {}).get("silo") or ""))
-        if not silo:
-            silo = f"__unknown_silo_{i}"
-        ordered_rows.append((i, silo, doc, meta, dist))
-        best_dist = float(dist) if dist is not None else 999.0
-        slot = silo_rows.get(silo)
-        if slot is None:
-            silo_rows[silo] = {
-                "first_idx": i,
-                "best_dist": best_dist,
-            }
-            continue
-        if best_dist < slot["best_dist"]:
-            slot["best_dist"] = best_dist
-
-    if not silo_rows:
-        return docs[:top_k], (metas or [])[:top_k], (dists or [])[:top_k]
-
-    ranked_silos = sorted(
-        silo_rows.items(),
-        key=lambda kv: (kv[1]["best_dist"], kv[1]["first_idx"], kv[0]),
-    )
-    target_silos = {s for s, _row in ranked_silos[: min(min_silos, len(ranked_silos))]}
-
-    selected_idx: list[int] = []
-    picked_silos: set[str] = set()
-    for i, silo, _doc, _meta, _dist in ordered_rows:
-        if len(selected_idx) >= top_k:
-            break
-        if silo in target_silos and silo not in picked_silos:
-            selected_idx.append(i)
-            picked_silos.add(silo)
-
-    if len(selected_idx) < top_k:
-        selected_set = set(selected_idx)
-        for i, _silo, _doc, _meta, _dist in ordered_rows:
-            if len(selected_idx) >= top_k:
-                break
-            if i in selected_set:
-                continue
-            selected_idx.append(i)
-            selected_set.add(i)
-
-    selected_idx.sort()
-    return (
-        [docs[i] for i in selected_idx if i < len(docs)],
-        [metas[i] if i < len(metas) else None for i in selected_idx],
-        [dists[i] if i < len(dists) else None for i in selected_idx],
-    )
+    keys = {"silo": silos} if silos is not None else None
+    return CandidateSet(docs, metas, dists, keys=keys).ensure_key_coverage("silo", top_k, min_silos).to_lists()
 
 
 def soft_promote_silo_diversity(
@@ -553,23 +585,13 @@ def dedup_by_chunk_hash(
     dists: list[float | None],
 ) -> tuple[list[str], list[dict | None], list[float | None]]:
     """Keep first occurrence of each chunk_hash; drop later duplicates. On by default; disable with LLMLIBRARIAN_DEDUP_CHUNK_HASH=0."""
-    if os.environ.get("LLMLIBRARIAN_DEDUP_CHUNK_HASH", "1").strip().lower() in ("0", "false", "no"):
+    if not chunk_hash_dedup_enabled():
         return docs, metas, dists
-    seen: set[str] = set()
-    out_docs: list[str] = []
-    out_metas: list[dict | None] = []
-    out_dists: list[float | None] = []
-    for i, doc in enumerate(docs):
-        meta = metas[i] if i < len(metas) else None
-        ch = (meta or {}).get("chunk_hash") or ""
-        if ch and ch in seen:
-            continue
-        if ch:
-            seen.add(ch)
-        out_docs.append(doc)
-        out_metas.append(meta)
-        out_dists.append(dists[i] if i < len(dists) else None)
-    return out_docs, out_metas, out_dists
+    return CandidateSet(docs, metas, dists).dedup("chunk_hash").to_lists()
+
+
+def chunk_hash_dedup_enabled() -> bool:
+    return os.environ.get("LLMLIBRARIAN_DEDUP_CHUNK_HASH", "1").strip().lower() not in ("0", "false", "no")
 
 
 def extract_scope_tokens(query: str) -> list[str]:
@@ -678,21 +700,12 @@ def sort_by_source_priority(
     deprioritized_tokens: list[str],
 ) -> tuple[list[str], list[dict | None], list[float | None]]:
     """Stable rerank with source-priority first, distance as tie-breaker."""
-    combined = list(zip(docs, metas, dists))
-
-    def _k(item: tuple[str, dict | None, float | None]) -> tuple[int, float]:
-        _doc, meta, dist = item
-        return (
-            -source_priority_score(meta, canonical_tokens, deprioritized_tokens),
-            float(dist) if dist is not None else 999.0,
-        )
-
-    combined.sort(key=_k)
-    return (
-        [x[0] for x in combined],
-        [x[1] for x in combined],
-        [x[2] for x in combined],
+    cands = CandidateSet(docs, metas, dists)
+    priority = cands.label_scores(
+        "source",
+        lambda source: source_priority_score({"source": source}, canonical_tokens, deprioritized_tokens),
     )
+    return cands.order_by(priority).to_lists()
 
 
 def sort_by_image_chunk_priority(
@@ -1,20 +1,28 @@
-"""Shared Chroma retrieval path for MCP-style chunk lists (used by run_retrieve)."""
+"""Shared Chroma retrieval path for MCP-style chunk lists (used by run_retrieve / run_retrieve_many)."""
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Callable
 
 from chroma_client import get_client
 from constants import LLMLI_COLLECTION, MAX_CHUNKS_PER_FILE
-from embeddings import get_embedding_function
+from embeddings import embed_queries, embed_query, get_embedding_function
+from lexical_index import open_lexical_index
+from reranker import order_by_scores, rerank_budget_ms, score_candidates
 
-from query.core_support import _safe_query
+from query.candidates import CandidateSet
+from query.core_support import _safe_query, _safe_query_rows
 from query.intent import INTENT_EVIDENCE_PROFILE, INTENT_TAX_QUERY
 from query.retrieval import (
+    MAX_LEXICAL_FOR_RRF,
     PROFILE_LEXICAL_PHRASES,
+    chunk_hash_dedup_enabled,
     dedup_by_chunk_hash,
     diversify_by_silo,
     diversify_by_source,
+    lexical_candidates,
     merge_dual_streams_rrf,
     max_chunks_for_intent,
     max_silo_chunks_for_intent,
@@ -33,82 +41,201 @@ def _artifact_stream_enabled(db: str, silo_slug: str) -> bool:
         return False
 
 
-def execute_retrieve_chroma_phase(
+def _artifact_silo_for(db: str, silo_slug: str | None, doc_type: str | None) -> str | None:
+    """The silo's artifact stream, when a scoped query should also search it."""
+    if silo_slug and (doc_type is None or doc_type == "artifact") and _artifact_stream_enabled(db, silo_slug):
+        return f"{silo_slug}-artifacts"
+    return None
+
+
+def _where_for(target_silo: str | list[str] | None, doc_type: str | None) -> dict | None:
+    parts: list[dict[str, Any]] = []
+    if isinstance(target_silo, list):
+        parts.append({"silo": {"$in": target_silo}})
+    elif target_silo:
+        parts.append({"silo": target_silo})
+    if doc_type:
+        parts.append({"doc_type": doc_type})
+    if len(parts) == 1:
+        return parts[0]
+    if len(parts) > 1:
+        return {"$and": parts}
+    return None
+
+
+def _open_collection(db: str, get_chroma_client: Callable[[str], Any] | None, batch_size: int) -> tuple[Any, Any]:
+    _gc = get_chroma_client or get_client
+    ef = get_embedding_function(batch_size=batch_size)
+    client = _gc(str(db))
+    collection = client.get_or_create_collection(name=LLMLI_COLLECTION, embedding_function=ef)
+    if hasattr(client, "get_effective_ef"):
+        ef = client.get_effective_ef(LLMLI_COLLECTION) or ef
+    return collection, ef
+
+
+_Stream = tuple[list[str], list[dict | None], list[float | None]]
+
+
+def _hybrid_candidates(
+    collection: Any,
     *,
-    db: str,
     intent: str,
-    query: str,
     query_for_retrieval: str,
-    silo_slug: str | None,
     n_stage1: int,
-    n_results: int,
-    section: str | None,
+    where: dict | None,
+    docs_v: list[str],
+    metas_v: list[dict | None],
+    dists_v: list[float | None],
+    ids_v: list[str],
+    lexical_index: Any | None = None,
+) -> _Stream:
+    """Lexical leg + fusion for one vector result, still at stage-1 depth."""
+    _lexical_phrases = PROFILE_LEXICAL_PHRASES if intent == INTENT_EVIDENCE_PROFILE else None
+    docs_h, metas_h, dists_h, _method = run_hybrid_retrieve(
+        ids_v=ids_v,
+        docs_v=docs_v,
+        metas_v=metas_v,
+        dists_v=dists_v,
+        query_text=query_for_retrieval,
+        collection=collection,
+        where_filter=where,
+        top_k=n_stage1,
+        lexical_phrases=_lexical_phrases,
+        lexical_index=lexical_index,
+    )
+    return docs_h, metas_h, dists_h
+
+
+def _silo_positions(metas: list[dict | None], silos: list[str], limit: int) -> list[list[int]]:
+    """Row positions per silo (in order, at most limit each) for results spanning several silos."""
+    slot = {silo: i for i, silo in enumerate(silos)}
+    out: list[list[int]] = [[] for _ in silos]
+    for pos, meta in enumerate(metas):
+        i = slot.get(str((meta or {}).get("silo") or ""))
+        if i is not None and len(out[i]) < limit:
+            out[i].append(pos)
+    return out
+
+
+def _take(values: list, positions: list[int]) -> list:
+    return [values[p] for p in positions if p < len(values)]
+
+
+def _split_stream_candidates(
+    collection: Any,
+    *,
+    intent: str,
+    query_for_retrieval: str,
+    n_stage1: int,
+    silos: list[str],
     doc_type: str | None,
-    db_path: str | None,
-    get_chroma_client: Callable[[str], Any] | None = None,
-) -> dict:
-    _gc = get_chroma_client or get_client
-    ef = get_embedding_function(batch_size=1)
-    client = _gc(str(db))
-    collection = client.get_or_create_collection(name=LLMLI_COLLECTION, embedding_function=ef)
+    row: tuple[list[str], list[dict | None], list[float | None], list[str]],
+    lexical_index: Any | None = None,
+) -> list[_Stream]:
+    """
+    Hybrid candidates per silo from one vector row spanning all of them.
 
-    def _where_for_silo(target_silo: str | None) -> dict | None:
-        parts: list[dict[str, Any]] = []
-        if target_silo:
-            parts.append({"silo": target_silo})
-        if doc_type:
-            parts.append({"doc_type": doc_type})
-        if len(parts) == 1:
-            return parts[0]
-        if len(parts) > 1:
-            return {"$and": parts}
-        return None
-
-    def _query_stream(target_silo: str | None) -> tuple[list[str], list[dict | None], list[float | None], str | None]:
-        query_kw: dict[str, Any] = {
-            "query_texts": [query_for_retrieval],
-            "n_results": n_stage1,
-            "include": ["documents", "metadatas", "distances"],
-        }
-        where = _where_for_silo(target_silo)
-        if where:
-            query_kw["where"] = where
-        docs_v, metas_v, dists_v, ids_v, _warn = _safe_query(collection, query_kw, target_silo, db_path=db_path)
-        _hybrid_where = query_kw.get("where") if isinstance(query_kw.get("where"), dict) else None
-        _lexical_phrases = PROFILE_LEXICAL_PHRASES if intent == INTENT_EVIDENCE_PROFILE else None
+    row comes from a single $in-scoped query at len(silos) * n_stage1. It is split by
+    each chunk's silo (order kept, n_stage1 per silo); the lexical leg runs once over
+    all silos and is split the same way, then each silo is fused on its own.
+    """
+    docs_v, metas_v, dists_v, ids_v = row
+    phrases = PROFILE_LEXICAL_PHRASES if intent == INTENT_EVIDENCE_PROFILE else None
+    lexical: tuple[list[str], list[str], list[dict | None]] = ([], [], [])
+    if ids_v:
+        try:
+            found = lexical_candidates(
+                query_for_retrieval,
+                collection,
+                _where_for(silos, doc_type),
+                lexical_phrases=phrases,
+                lexical_index=lexical_index,
+                limit=MAX_LEXICAL_FOR_RRF * len(silos),
+            )
+            lexical = found or lexical
+        except Exception:
+            pass
+    ids_l, docs_l, metas_l = lexical
+    streams: list[_Stream] = []
+    for silo, vec, lex in zip(
+        silos,
+        _silo_positions(list(metas_v), silos, n_stage1),
+        _silo_positions(list(metas_l), silos, MAX_LEXICAL_FOR_RRF),
+    ):
         docs_h, metas_h, dists_h, _method = run_hybrid_retrieve(
-            ids_v=ids_v,
-            docs_v=docs_v,
-            metas_v=metas_v,
-            dists_v=dists_v,
+            ids_v=_take(ids_v, vec),
+            docs_v=_take(docs_v, vec),
+            metas_v=_take(metas_v, vec),
+            dists_v=_take(dists_v, vec),
             query_text=query_for_retrieval,
             collection=collection,
-            where_filter=_hybrid_where,
+            where_filter=_where_for(silo, doc_type),
             top_k=n_stage1,
-            lexical_phrases=_lexical_phrases,
+            lexical_phrases=phrases,
+            lexical_index=lexical_index,
+            lexical=(_take(ids_l, lex), _take(docs_l, lex), _take(metas_l, lex)),
         )
-        per_cap = max_chunks_for_intent(intent, MAX_CHUNKS_PER_FILE)
-        docs_h, metas_h, dists_h = diversify_by_source(docs_h, metas_h, dists_h, n_results, max_per_source=per_cap)
-        docs_h, metas_h, dists_h = dedup_by_chunk_hash(docs_h, metas_h, dists_h)
-        return docs_h, metas_h, dists_h, _warn
+        streams.append((docs_h, metas_h, dists_h))
+    return streams
+
+
+def _cut_stream(intent: str, n_results: int, stream: _Stream) -> _Stream:
+    """Per-source diversity down to n_results, then chunk-hash dedup."""
+    docs_h, metas_h, dists_h = stream
+    per_cap = max_chunks_for_intent(intent, MAX_CHUNKS_PER_FILE)
+    if not docs_h or per_cap < 1:
+        return dedup_by_chunk_hash(*diversify_by_source(docs_h, metas_h, dists_h, n_results, max_per_source=per_cap))
+    candidates = CandidateSet(docs_h, metas_h, dists_h).cap_per_key("source", n_results, per_cap)
+    if chunk_hash_dedup_enabled():
+        candidates = candidates.dedup("chunk_hash")
+    return candidates.to_lists()
+
 
-    docs, metas, dists, _silo_warning = _query_stream(silo_slug)
+def _rerank_streams(queries: list[str], streams: list[_Stream]) -> tuple[list[_Stream], str]:
+    """
+    Cross-encoder order for every (query, candidates) stream, scored in one batch.
+
+    Returns the reordered streams and "applied", or the input streams and
+    "budget_skipped" / "failed" when scoring was skipped or raised.
+    """
+    groups = [(q, list(stream[0]), list(stream[1])) for q, stream in zip(queries, streams)]
+    try:
+        scored = score_candidates(groups, budget_ms=rerank_budget_ms())
+    except Exception:
+        return streams, "failed"
+    if scored is None:
+        return streams, "budget_skipped"
+    return [order_by_scores(list(s[0]), list(s[1]), list(s[2]), sc) for s, sc in zip(streams, scored)], "applied"
+
+
+def _assemble_result(
+    *,
+    db: str,
+    intent: str,
+    query: str,
+    silo_slug: str | None,
+    n_results: int,
+    section: str | None,
+    stream: tuple[list[str], list[dict | None], list[float | None]],
+    artifact_stream: tuple[list[str], list[dict | None], list[float | None]] | None,
+    silo_warning: str | None,
+    rerank_status: str | None = None,
+) -> dict:
+    docs, metas, dists = stream
     retrieval_method = "hybrid_or_vector"
-    if silo_slug and (doc_type is None or doc_type == "artifact") and _artifact_stream_enabled(db, silo_slug):
-        artifact_slug = f"{silo_slug}-artifacts"
-        artifact_docs, artifact_metas, artifact_dists, _artifact_warning = _query_stream(artifact_slug)
-        if artifact_docs:
-            docs, metas, dists = merge_dual_streams_rrf(
-                docs,
-                metas,
-                dists,
-                artifact_docs,
-                artifact_metas,
-                artifact_dists,
-                top_k=n_results,
-            )
-            docs, metas, dists = dedup_by_chunk_hash(docs, metas, dists)
-            retrieval_method = "dual_stream_rrf"
+    if artifact_stream is not None and artifact_stream[0]:
+        artifact_docs, artifact_metas, artifact_dists = artifact_stream
+        docs, metas, dists = merge_dual_streams_rrf(
+            docs,
+            metas,
+            dists,
+            artifact_docs,
+            artifact_metas,
+            artifact_dists,
+            top_k=n_results,
+        )
+        docs, metas, dists = dedup_by_chunk_hash(docs, metas, dists)
+        retrieval_method = "dual_stream_rrf"
 
     if silo_slug is None:
         per_silo_cap = max_silo_chunks_for_intent(intent, 3)
@@ -116,7 +243,6 @@ def execute_retrieve_chroma_phase(
         docs, metas, dists = diversify_by_silo(
             docs, metas, dists, n_results, max_per_silo=per_silo_cap, silos=silo_cache
         )
-
     if section:
         section_lower = section.lower()
         filtered = [
@@ -170,8 +296,10 @@ def execute_retrieve_chroma_phase(
         "retrieval_method": retrieval_method,
         "chunks": chunks,
     }
-    if _silo_warning:
-        result["silo_warning"] = _silo_warning
+    if silo_warning:
+        result["silo_warning"] = silo_warning
+    if rerank_status is not None:
+        result["rerank"] = rerank_status
 
     if intent == INTENT_TAX_QUERY:
         try:
@@ -205,3 +333,243 @@ def execute_retrieve_chroma_phase(
             pass
 
     return result
+
+
+def execute_retrieve_chroma_phase(
+    *,
+    db: str,
+    intent: str,
+    query: str,
+    query_for_retrieval: str,
+    silo_slug: str | None,
+    n_stage1: int,
+    n_results: int,
+    section: str | None,
+    doc_type: str | None,
+    db_path: str | None,
+    get_chroma_client: Callable[[str], Any] | None = None,
+    use_reranker: bool = False,
+) -> dict:
+    collection, ef = _open_collection(db, get_chroma_client, batch_size=1)
+    lexical_index = open_lexical_index(db)
+
+    # Embed once (LRU-cached across calls) and hand Chroma the vector. Falls back
+    # to query_texts if the ef cannot be called here.
+    query_embedding: list[float] | None = None
+    if ef is not None:
+        try:
+            query_embedding = embed_query(query_for_retrieval, ef)
+        except Exception:
+            query_embedding = None
+
+    # With an artifact stream, one $in-scoped query covers the silo and its
+    # artifacts; the rows are split by silo before per-stream fusion.
+    artifact_silo = _artifact_silo_for(db, silo_slug, doc_type)
+    scope: str | list[str] | None = [silo_slug, artifact_silo] if silo_slug and artifact_silo else silo_slug
+    query_kw: dict[str, Any] = {
+        "n_results": n_stage1 * (len(scope) if isinstance(scope, list) else 1),
+        "include": ["documents", "metadatas", "distances"],
+    }
+    if query_embedding is not None:
+        query_kw["query_embeddings"] = [query_embedding]
+    else:
+        query_kw["query_texts"] = [query_for_retrieval]
+    where = _where_for(scope, doc_type)
+    if where:
+        query_kw["where"] = where
+    artifact_stream = None
+    if isinstance(scope, list):
+        docs_v, metas_v, dists_v, ids_v, silo_warning = _safe_query(
+            collection, query_kw, silo_slug, db_path=db_path, scope_silos=scope
+        )
+        stream, artifact_stream = _split_stream_candidates(
+            collection,
+            intent=intent,
+            query_for_retrieval=query_for_retrieval,
+            n_stage1=n_stage1,
+            silos=scope,
+            doc_type=doc_type,
+            row=(docs_v, metas_v, dists_v, ids_v),
+            lexical_index=lexical_index,
+        )
+    else:
+        docs_v, metas_v, dists_v, ids_v, silo_warning = _safe_query(collection, query_kw, silo_slug, db_path=db_path)
+        stream = _hybrid_candidates(
+            collection,
+            intent=intent,
+            query_for_retrieval=query_for_retrieval,
+            n_stage1=n_stage1,
+            where=where,
+            docs_v=docs_v,
+            metas_v=metas_v,
+            dists_v=dists_v,
+            ids_v=ids_v,
+            lexical_index=lexical_index,
+        )
+    rerank_status = None
+    if use_reranker:
+        streams = [stream] if artifact_stream is None else [stream, artifact_stream]
+        streams, rerank_status = _rerank_streams([query] * len(streams), streams)
+        stream = streams[0]
+        artifact_stream = streams[1] if artifact_stream is not None else None
+    stream = _cut_stream(intent, n_results, stream)
+    if artifact_stream is not None:
+        artifact_stream = _cut_stream(intent, n_results, artifact_stream)
+    return _assemble_result(
+        db=db,
+        intent=intent,
+        query=query,
+        silo_slug=silo_slug,
+        n_results=n_results,
+        section=section,
+        stream=stream,
+        artifact_stream=artifact_stream,
+        silo_warning=silo_warning,
+        rerank_status=rerank_status,
+    )
+
+
+def _multi_query_workers(count: int) -> int:
+    try:
+        workers = int(os.environ.get("LLMLIBRARIAN_MULTI_QUERY_WORKERS", "4"))
+    except (TypeError, ValueError):
+        workers = 4
+    return max(1, min(workers, count, 16))
+
+
+def execute_retrieve_chroma_phase_many(
+    *,
+    db: str,
+    plans: list[dict[str, Any]],
+    silo_slug: str | None,
+    n_results: int,
+    section: str | None,
+    doc_type: str | None,
+    db_path: str | None,
+    get_chroma_client: Callable[[str], Any] | None = None,
+    use_reranker: bool = False,
+) -> list[dict | BaseException]:
+    """execute_retrieve_chroma_phase for several queries sharing one scope.
+
+    plans: [{"intent", "query", "query_for_retrieval", "n_stage1"}, ...]. All queries
+    are embedded in one model call and sent as one multi-row collection.query (at the
+    largest n_stage1; each row is cut back to its own), $in-scoped over the silo and
+    its artifact stream when it has one. The lexical legs then run concurrently, and with use_reranker every query's candidates are
+    cross-encoder scored in one batch. Returns one entry per plan: its result dict,
+    or the exception that query raised.
+    """
+    if not plans:
+        return []
+    collection, ef = _open_collection(db, get_chroma_client, batch_size=len(plans))
+    lexical_index = open_lexical_index(db)
+    texts = [p["query_for_retrieval"] for p in plans]
+    embeddings: list[list[float]] | None = None
+    if ef is not None:
+        try:
+            embeddings = embed_queries(texts, ef)
+        except Exception:
+            embeddings = None
+    max_stage1 = max(int(p["n_stage1"]) for p in plans)
+
+    artifact_silo = _artifact_silo_for(db, silo_slug, doc_type)
+    scope: str | list[str] | None = [silo_slug, artifact_silo] if silo_slug and artifact_silo else silo_slug
+    width = len(scope) if isinstance(scope, list) else 1
+    query_kw: dict[str, Any] = {
+        "n_results": max_stage1 * width,
+        "include": ["documents", "metadatas", "distances"],
+    }
+    if embeddings is not None:
+        query_kw["query_embeddings"] = embeddings
+    else:
+        query_kw["query_texts"] = texts
+    where = _where_for(scope, doc_type)
+    if where:
+        query_kw["where"] = where
+    if isinstance(scope, list):
+        rows, silo_warning = _safe_query_rows(collection, query_kw, silo_slug, db_path=db_path, scope_silos=scope)
+    else:
+        rows, silo_warning = _safe_query_rows(collection, query_kw, silo_slug, db_path=db_path)
+
+    def _candidates(index: int) -> list[_Stream | None]:
+        plan = plans[index]
+        n_stage1 = int(plan["n_stage1"])
+        depth = n_stage1 * width
+        docs_v, metas_v, dists_v, ids_v = rows[index] if index < len(rows) else ([], [], [], [])
+        row = (list(docs_v)[:depth], list(metas_v)[:depth], list(dists_v)[:depth], list(ids_v)[:depth])
+        if isinstance(scope, list):
+            main, artifacts = _split_stream_candidates(
+                collection,
+                intent=plan["intent"],
+                query_for_retrieval=plan["query_for_retrieval"],
+                n_stage1=n_stage1,
+                silos=scope,
+                doc_type=doc_type,
+                row=row,
+                lexical_index=lexical_index,
+            )
+            return [main, artifacts]
+        stream = _hybrid_candidates(
+            collection,
+            intent=plan["intent"],
+            query_for_retrieval=plan["query_for_retrieval"],
+            n_stage1=n_stage1,
+            where=where,
+            docs_v=row[0],
+            metas_v=row[1],
+            dists_v=row[2],
+            ids_v=row[3],
+            lexical_index=lexical_index,
+        )
+        return [stream, None]
+
+    candidates: list[list[_Stream | None] | BaseException] = []
+    with ThreadPoolExecutor(max_workers=_multi_query_workers(len(plans)), thread_name_prefix="llmli-retrieve") as pool:
+        futures = [pool.submit(_candidates, i) for i in range(len(plans))]
+        for future in futures:
+            try:
+                candidates.append(future.result())
+            except Exception as e:
+                candidates.append(e)
+
+    rerank_status = None
+    if use_reranker:
+        # One cross-encoder batch for every sub-query's streams.
+        slots: list[tuple[int, int]] = []
+        queries: list[str] = []
+        streams: list[_Stream] = []
+        for i, entry in enumerate(candidates):
+            if isinstance(entry, BaseException):
+                continue
+            for j, stream in enumerate(entry):
+                if stream is not None:
+                    slots.append((i, j))
+                    queries.append(plans[i]["query"])
+                    streams.append(stream)
+        reordered, rerank_status = _rerank_streams(queries, streams)
+        for (i, j), stream in zip(slots, reordered):
+            candidates[i][j] = stream  # type: ignore[index]
+
+    results: list[dict | BaseException] = []
+    for plan, entry in zip(plans, candidates):
+        if isinstance(entry, BaseException):
+            results.append(entry)
+            continue
+        try:
+            main_stream, art_stream = entry
+            results.append(
+                _assemble_result(
+                    db=db,
+                    intent=plan["intent"],
+                    query=plan["query"],
+                    silo_slug=silo_slug,
+                    n_results=n_results,
+                    section=section,
+                    stream=_cut_stream(plan["intent"], n_results, main_stream),
+                    artifact_stream=_cut_stream(plan["intent"], n_results, art_stream) if art_stream is not None else None,
+                    silo_warning=silo_warning,
+                    rerank_status=rerank_status,
+                )
+            )
+        except Exception as e:
+            results.append(e)
+    return results
@@ -7,7 +7,7 @@ import re
 from pathlib import Path
 from typing import TypedDict
 
-from file_registry import _read_file_manifest
+from file_registry import sample_paths_by_silo
 from state import list_silos
 
 
@@ -238,8 +238,7 @@ def rank_silos_by_catalog_tokens(query: str, db_path: str, filetype_hints: Filet
     if not q_tokens:
         return []
     silos = list_silos(db_path)
-    manifest = _read_file_manifest(db_path)
-    manifest_silos = (manifest.get("silos") or {}) if isinstance(manifest, dict) else {}
+    sampled_by_silo = sample_paths_by_silo(db_path, 120)
     candidates: list[SiloCandidate] = []
     for s in silos:
         slug = str((s or {}).get("slug") or "")
@@ -247,13 +246,8 @@ def rank_silos_by_catalog_tokens(query: str, db_path: str, filetype_hints: Filet
             continue
         display = str((s or {}).get("display_name") or "")
         name_tokens = set(_tokenize_query(f"{display} {slug} {_strip_hash_suffix(slug)}"))
-        silo_entry = manifest_silos.get(slug) if isinstance(manifest_silos, dict) else None
-        files_map = (silo_entry or {}).get("files") if isinstance(silo_entry, dict) else {}
-        if not isinstance(files_map, dict):
-            files_map = {}
-
         # sample top filenames (stable by path, bounded for cost)
-        sample_paths = sorted(files_map.keys())[:120]
+        sample_paths = sampled_by_silo.get(slug, [])
         file_tokens: set[str] = set()
         sample_exts: set[str] = set()
         for p in sample_paths:
@@ -9,7 +9,7 @@ from typing import Any
 from style import dim, label_style
 from query.formatting import render_sources_footer
 
-from tax.ledger import load_tax_ledger_rows
+from tax.ledger import has_tax_ledger_rows, load_tax_ledger_rows
 from tax.normalize import format_money_decimal, parse_decimal, source_tokens
 from tax.query_contract import (
     METRIC_AGI,
@@ -31,6 +31,35 @@ from tax.schema import W2_BOX_FIELD_CODES
 
 _MIN_CONFIDENCE = 0.55
 
+# Ledger field codes each metric reads. Box 2 candidates are checked against the same
+# page's Box 1 wages, so withholding metrics pull Box 1 rows too.
+_METRIC_FIELD_CODES: dict[str, tuple[str, ...]] = {
+    METRIC_TOTAL_INCOME: ("f1040_line_9_total_income", "w2_box_1_wages"),
+    METRIC_AGI: ("f1040_line_11_agi",),
+    METRIC_TOTAL_TAX_LIABILITY: ("f1040_line_24_total_tax",),
+    METRIC_FEDERAL_WITHHELD: ("w2_box_2_federal_income_tax_withheld", "w2_box_1_wages"),
+    METRIC_STATE_TAX: ("w2_box_17_state_income_tax",),
+    METRIC_PAYROLL_TAXES: ("w2_box_4_social_security_tax_withheld", "w2_box_6_medicare_tax_withheld"),
+    METRIC_WAGES: ("w2_box_1_wages",),
+    METRIC_INTEREST_INCOME: ("f1099_int_box_1_interest_income",),
+    METRIC_STOCK_PROCEEDS: ("f1099_b_totals",),
+    METRIC_DIVIDENDS: ("f1099_div_box_1a_total_ordinary_dividends",),
+}
+
+
+def _ledger_field_codes(request: TaxQuery) -> list[str] | None:
+    """Field codes to fetch for this request, or None when the metric needs no field filter."""
+    if request.metric == METRIC_W2_BOX:
+        box_meta = W2_BOX_FIELD_CODES.get(request.box_number) if request.box_number is not None else None
+        if box_meta is None:
+            return None
+        codes = [box_meta[0]]
+        if box_meta[0] == "w2_box_2_federal_income_tax_withheld":
+            codes.append("w2_box_1_wages")
+        return codes
+    codes = _METRIC_FIELD_CODES.get(str(request.metric or ""))
+    return list(codes) if codes else None
+
 
 def run_tax_resolver(
     *,
@@ -64,12 +93,19 @@ def run_tax_resolver(
             explain=explain,
         )
 
+    ledger_silo = silo if (use_unified and silo) else None
+    field_codes = _ledger_field_codes(request)
     rows = load_tax_ledger_rows(
         db_path,
-        silo=(silo if (use_unified and silo) else None),
+        silo=ledger_silo,
         tax_year=request.tax_year,
+        field_codes=field_codes,
+    )
+    # A year with ledger rows but none for this field falls through to the metric's own no_match.
+    year_indexed = bool(rows) or (
+        field_codes is not None and has_tax_ledger_rows(db_path, silo=ledger_silo, tax_year=request.tax_year)
     )
-    if not rows:
+    if not year_indexed:
         if intent != "TAX_QUERY":
             # Compatibility fallback for older indexes/unit tests that do not have ledger rows yet.
             return None
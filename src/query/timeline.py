@@ -91,7 +91,7 @@ def build_timeline_from_manifest(
     - path: file path (relative display)
     - silo: silo slug
     """
-    manifest = _read_file_manifest(db_path)
+    manifest = _read_file_manifest(db_path, silos=[silo_slug])
     silos = manifest.get("silos") or {}
     silo_entry = silos.get(silo_slug) if isinstance(silos, dict) else None
 
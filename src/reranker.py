@@ -2,18 +2,46 @@
 Optional reranker for retrieval: stage-1 wide net, then rerank to top_k.
 Disabled if cross-encoder not available; then use_reranker is False.
 
-The CrossEncoder model is cached per (model_name, device) to avoid loading
-it on every query call.
+The CrossEncoder model is cached per (model_name, device, backend) to avoid loading
+it on every query call. Scores are cached per (model, query, chunk_hash), so a
+repeated or overlapping query only scores chunks it has not seen, and every
+uncached pair of a call goes through one batched predict.
+
+Env:
+  - LLMLIBRARIAN_RERANK_MODEL      -> CrossEncoder model (default: cross-encoder/ms-marco-MiniLM-L-6-v2)
+  - LLMLIBRARIAN_RERANK_DEVICE     -> force a device (default: mps, then cuda, then cpu)
+  - LLMLIBRARIAN_RERANK_BACKEND    -> "torch" (default) or "onnx" for ONNX Runtime CPU inference
+  - LLMLIBRARIAN_RERANK_ONNX_FILE  -> ONNX file in the model repo, e.g. a quantized
+                                      onnx/model_qint8_avx2.onnx (default: the backend's own)
+  - LLMLIBRARIAN_RERANK_BATCH_SIZE -> pairs per predict batch (default: 64 on cuda/mps, 16 on cpu)
+  - LLMLIBRARIAN_RERANK_CACHE_SIZE -> score LRU entries (default: 20000; 0 disables)
+  - LLMLIBRARIAN_RERANK_BUDGET_MS  -> budgeted callers (MCP retrieval) skip reranking when the
+                                      uncached pairs are expected to take longer (default: 1500; 0: no budget)
 """
+import hashlib
 import os
 import threading
+import time
+from collections import OrderedDict
 from typing import Any
 
 RERANK_STAGE1_N = 40  # fetch more when reranker is on, then cut to n_results
 
-_model_cache: dict[tuple[str, str], Any] = {}
+_DEFAULT_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+_DEFAULT_CACHE_SIZE = 20000
+_DEFAULT_BUDGET_MS = 1500.0
+# Each budget skip shrinks the estimate, so one slow measurement cannot disable reranking for good:
+# after a few skips a call runs again and re-measures.
+_SKIP_DECAY = 0.7
+
+_model_cache: dict[tuple[str, str, str], Any] = {}
 _cache_lock = threading.Lock()
 
+_score_cache: "OrderedDict[tuple[str, str, str], float]" = OrderedDict()
+_score_cache_lock = threading.Lock()
+# ms_per_pair: moving average of observed predict cost, used to enforce the latency budget.
+_score_stats: dict[str, float] = {"hits": 0, "misses": 0, "budget_skips": 0, "ms_per_pair": 0.0}
+
 
 def _get_reranker_device() -> str:
     override = os.environ.get("LLMLIBRARIAN_RERANK_DEVICE", "").strip()
@@ -30,13 +58,47 @@ def _get_reranker_device() -> str:
     return "cpu"
 
 
-def _get_model(model_name: str, device: str) -> Any:
+def _model_name() -> str:
+    return os.environ.get("LLMLIBRARIAN_RERANK_MODEL", _DEFAULT_MODEL)
+
+
+def _backend() -> str:
+    backend = os.environ.get("LLMLIBRARIAN_RERANK_BACKEND", "").strip().lower()
+    return backend if backend in ("torch", "onnx") else "torch"
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.environ.get(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _batch_size(device: str) -> int:
+    default = 16 if device == "cpu" else 64
+    return max(1, int(_env_number("LLMLIBRARIAN_RERANK_BATCH_SIZE", default)))
+
+
+def _score_cache_size() -> int:
+    return int(_env_number("LLMLIBRARIAN_RERANK_CACHE_SIZE", _DEFAULT_CACHE_SIZE))
+
+
+def rerank_budget_ms() -> float:
+    return _env_number("LLMLIBRARIAN_RERANK_BUDGET_MS", _DEFAULT_BUDGET_MS)
+
+
+def _get_model(model_name: str, device: str, backend: str = "torch") -> Any:
     """Return a cached CrossEncoder; load on first use."""
-    key = (model_name, device)
+    key = (model_name, device, backend)
     with _cache_lock:
         if key not in _model_cache:
             from sentence_transformers import CrossEncoder
-            _model_cache[key] = CrossEncoder(model_name, device=device)
+            if backend == "onnx":
+                onnx_file = os.environ.get("LLMLIBRARIAN_RERANK_ONNX_FILE", "").strip()
+                model_kwargs = {"file_name": onnx_file} if onnx_file else None
+                _model_cache[key] = CrossEncoder(model_name, device=device, backend="onnx", model_kwargs=model_kwargs)
+            else:
+                _model_cache[key] = CrossEncoder(model_name, device=device)
         return _model_cache[key]
 
 
@@ -50,6 +112,113 @@ def is_reranker_enabled() -> bool:
         return False
 
 
+def _record_predict_cost(elapsed_ms: float, pairs: int) -> None:
+    """Fold one predict's cost into the ms_per_pair moving average. Caller holds _score_cache_lock."""
+    observed = elapsed_ms / max(1, pairs)
+    prev = _score_stats["ms_per_pair"]
+    _score_stats["ms_per_pair"] = observed if not prev else 0.7 * prev + 0.3 * observed
+
+
+def warm_reranker() -> None:
+    """Load the CrossEncoder and score one pair so the first rerank is not a cold start, then
+    time one warm batch to seed the budget estimate (the cold call is left out of it)."""
+    device = _get_reranker_device()
+    model = _get_model(_model_name(), device, _backend())
+    model.predict([["warmup", "warmup"]])
+    batch = [["warmup query", "warmup passage"]] * _batch_size(device)
+    started = time.perf_counter()
+    model.predict(batch, batch_size=len(batch))
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    with _score_cache_lock:
+        _record_predict_cost(elapsed_ms, len(batch))
+
+
+def _chunk_key(doc: str, meta: dict | None) -> str:
+    chunk_hash = str((meta or {}).get("chunk_hash") or "")
+    return chunk_hash or hashlib.sha256(doc.encode("utf-8")).hexdigest()[:16]
+
+
+def score_candidates(
+    groups: list[tuple[str, list[str], list[dict | None]]],
+    *,
+    budget_ms: float | None = None,
+) -> list[list[float]] | None:
+    """
+    Cross-encoder scores for several (query, docs, metas) candidate lists.
+
+    Cached pairs are served from the LRU; every other pair, across all groups, goes
+    through one predict call batched for the device. With budget_ms, returns None
+    (and scores nothing) when the uncached pairs are expected to exceed it.
+    """
+    model_name = _model_name()
+    device = _get_reranker_device()
+    backend = _backend()
+    model_id = f"{model_name}|{backend}"
+    size = _score_cache_size()
+    keys: list[list[tuple[str, str, str]]] = []
+    for query, docs, metas in groups:
+        q = hashlib.sha256(query.encode("utf-8")).hexdigest()[:16]
+        metas_list = list(metas or [None] * len(docs))
+        keys.append([(model_id, q, _chunk_key(d or "", m)) for d, m in zip(docs, metas_list)])
+
+    scores: dict[tuple[str, str, str], float] = {}
+    if size:
+        with _score_cache_lock:
+            for group_keys in keys:
+                for key in group_keys:
+                    cached = _score_cache.get(key)
+                    if cached is not None:
+                        _score_cache.move_to_end(key)
+                        scores[key] = cached
+    pending: dict[tuple[str, str, str], tuple[str, str]] = {}
+    for (query, docs, _metas), group_keys in zip(groups, keys):
+        for doc, key in zip(docs, group_keys):
+            if key not in scores and key not in pending:
+                pending[key] = (query, doc or "")
+
+    with _score_cache_lock:
+        ms_per_pair = _score_stats["ms_per_pair"]
+        if pending and budget_ms and ms_per_pair and ms_per_pair * len(pending) > budget_ms:
+            _score_stats["budget_skips"] += 1
+            _score_stats["ms_per_pair"] = ms_per_pair * _SKIP_DECAY
+            return None
+        _score_stats["hits"] += sum(len(k) for k in keys) - len(pending)
+
+    if pending:
+        model = _get_model(model_name, device, backend)
+        started = time.perf_counter()
+        predicted = model.predict([list(pair) for pair in pending.values()], batch_size=_batch_size(device))
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        fresh = {key: float(score) for key, score in zip(pending, predicted)}
+        scores.update(fresh)
+        with _score_cache_lock:
+            _score_stats["misses"] += len(fresh)
+            _record_predict_cost(elapsed_ms, len(fresh))
+            if size:
+                _score_cache.update(fresh)
+                while len(_score_cache) > size:
+                    _score_cache.popitem(last=False)
+    return [[scores[key] for key in group_keys] for group_keys in keys]
+
+
+def order_by_scores(
+    docs: list[str],
+    metas: list[dict | None],
+    dists: list[float | None],
+    scores: list[float],
+    top_k: int | None = None,
+) -> tuple[list[str], list[dict | None], list[float | None]]:
+    """Sort candidates by descending score (stable); record the score in each meta's _signals."""
+    metas = list(metas or [None] * len(docs))
+    dists = list(dists or [0.0] * len(docs))
+    order = sorted(range(len(docs)), key=lambda i: scores[i], reverse=True)[: top_k if top_k is not None else None]
+    for i in order:
+        signals = (metas[i] or {}).get("_signals")
+        if isinstance(signals, dict):
+            signals["rerank_score"] = round(float(scores[i]), 4)
+    return [docs[i] for i in order], [metas[i] for i in order], [dists[i] for i in order]
+
+
 def rerank(
     query: str,
     docs: list[str],
@@ -62,14 +231,30 @@ def rerank(
     if not docs:
         return docs, metas, dists
     try:
-        model_name = os.environ.get("LLMLIBRARIAN_RERANK_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
-        device = _get_reranker_device()
-        model = _get_model(model_name, device)
-        pairs = [[query, d or ""] for d in docs]
-        scores = model.predict(pairs)
-        combined = list(zip(scores, docs, metas or [None] * len(docs), dists or [0.0] * len(docs)))
-        combined.sort(key=lambda x: x[0], reverse=True)
-        top = combined[:top_k]
-        return [t[1] for t in top], [t[2] for t in top], [t[3] for t in top]
+        scored = score_candidates([(query, docs, metas)])
+        if scored is not None:
+            return order_by_scores(docs, metas, dists, scored[0], top_k=top_k)
     except Exception:
-        return docs[:top_k], (metas or [None] * len(docs))[:top_k], (dists or [0.0] * len(docs))[:top_k]
+        pass
+    return docs[:top_k], (metas or [None] * len(docs))[:top_k], (dists or [0.0] * len(docs))[:top_k]
+
+
+def rerank_cache_info() -> dict[str, Any]:
+    """Score-cache and budget counters for health output."""
+    with _score_cache_lock:
+        return {
+            "size": len(_score_cache),
+            "max_size": _score_cache_size(),
+            "hits": int(_score_stats["hits"]),
+            "misses": int(_score_stats["misses"]),
+            "budget_skips": int(_score_stats["budget_skips"]),
+            "ms_per_pair": round(float(_score_stats["ms_per_pair"]), 3),
+            "budget_ms": rerank_budget_ms(),
+        }
+
+
+def _reset_rerank_cache_for_tests() -> None:
+    """Drop cached scores and counters. Test-only helper."""
+    with _score_cache_lock:
+        _score_cache.clear()
+        _score_stats.update({"hits": 0, "misses": 0, "budget_skips": 0, "ms_per_pair": 0.0})
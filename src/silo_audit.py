@@ -7,6 +7,8 @@ manifest — this module must not re-read state from a second file.
 """
 import json
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -18,13 +20,6 @@ def _registry_path(db_path: str | Path) -> Path:
     return p.parent / "llmli_registry.json"
 
 
-def _file_manifest_path(db_path: str | Path) -> Path:
-    p = Path(db_path).resolve()
-    if p.is_dir():
-        return p / "llmli_file_manifest.json"
-    return p.parent / "llmli_file_manifest.json"
-
-
 def _read_json(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
@@ -53,7 +48,9 @@ def load_file_registry(db_path: str | Path) -> dict[str, Any]:
 
 
 def load_manifest(db_path: str | Path) -> dict[str, Any]:
-    return _read_json(_file_manifest_path(db_path))
+    from file_registry import _read_file_manifest
+
+    return _read_file_manifest(db_path)
 
 
 def find_duplicate_hashes(file_registry: dict[str, Any]) -> list[dict[str, Any]]:
@@ -185,11 +182,29 @@ def format_report(
 #
 # Reads `index_metadata.pickle` from every HNSW segment dir under the persist
 # root and `embeddings_queue` from chroma.sqlite3, then compares against the
-# canonical "this silo owns these IDs" view (collection.get(where={silo})).
-# A truly missing ID is one in SQLite but neither in HNSW's id_to_label nor
-# pending in the compaction queue.
+# canonical "this silo owns these IDs" view. A truly missing ID is one in
+# SQLite but neither in HNSW's id_to_label nor pending in the compaction queue.
+#
+# hnsw_consistency_snapshot() loads the label set and the queue once, reads
+# every silo's owned IDs with one grouped query over Chroma's SQLite tables,
+# and caches the result keyed on the mtimes of chroma.sqlite3 (and its WAL),
+# the write generation file and every segment's index_metadata.pickle, so
+# repeated health() / session_context() calls between writes cost a few stats.
 # ---------------------------------------------------------------------------
 
+_SNAPSHOT_CACHE_SIZE = 4
+_snapshot_cache: "OrderedDict[str, tuple[tuple, dict[str, Any]]]" = OrderedDict()
+_snapshot_lock = threading.Lock()
+
+_OWNED_IDS_SQL = """
+SELECT m.string_value, e.embedding_id
+FROM embeddings e
+JOIN segments s ON s.id = e.segment_id
+JOIN collections c ON c.id = s.collection
+JOIN embedding_metadata m ON m.id = e.id AND m.key = 'silo'
+WHERE c.name = ?
+"""
+
 
 def _hnsw_id_set(db_root: Path) -> set[str]:
     import pickle
@@ -227,6 +242,120 @@ def _embeddings_queue_id_set(db_root: Path) -> set[str]:
     return {r[0] for r in rows if r and r[0]}
 
 
+def _silo_owned_id_sets(db_root: Path, collection_name: str) -> dict[str, set[str]] | None:
+    """Every silo's chunk IDs in one grouped query; None if the schema cannot be read."""
+    import sqlite3
+    sqlite_path = db_root / "chroma.sqlite3"
+    if not sqlite_path.exists():
+        return {}
+    out: dict[str, set[str]] = {}
+    try:
+        con = sqlite3.connect(f"file:{sqlite_path}?mode=ro", uri=True)
+        try:
+            for silo, embedding_id in con.execute(_OWNED_IDS_SQL, (collection_name,)):
+                if silo and embedding_id:
+                    out.setdefault(str(silo), set()).add(str(embedding_id))
+        finally:
+            con.close()
+    except Exception:
+        return None
+    return out
+
+
+def _snapshot_stamp(db_root: Path) -> tuple:
+    stamp: list[tuple[str, int]] = []
+    for name in ("chroma.sqlite3", "chroma.sqlite3-wal", ".llmli_chroma_generation"):
+        try:
+            stamp.append((name, (db_root / name).stat().st_mtime_ns))
+        except OSError:
+            stamp.append((name, 0))
+    try:
+        children = sorted(db_root.iterdir())
+    except OSError:
+        children = []
+    for child in children:
+        try:
+            stamp.append((child.name, (child / "index_metadata.pickle").stat().st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(stamp)
+
+
+def hnsw_consistency_snapshot(db_path: str | Path, collection_name: str | None = None) -> dict[str, Any]:
+    """
+    HNSW label set, queued IDs and per-silo owned IDs for a persist root, cached
+    until a segment, the SQLite file or the write generation changes.
+
+    Returns {"hnsw_ids", "queued_ids", "owned"}; "owned" maps silo -> ID set, or is
+    None when Chroma's tables could not be read (callers fall back to collection.get).
+    """
+    if collection_name is None:
+        from constants import LLMLI_COLLECTION
+
+        collection_name = LLMLI_COLLECTION
+    db_root = Path(db_path).resolve()
+    key = f"{db_root}::{collection_name}"
+    stamp = _snapshot_stamp(db_root)
+    with _snapshot_lock:
+        hit = _snapshot_cache.get(key)
+        if hit is not None and hit[0] == stamp:
+            _snapshot_cache.move_to_end(key)
+            return hit[1]
+    snapshot = {
+        "hnsw_ids": frozenset(_hnsw_id_set(db_root)),
+        "queued_ids": frozenset(_embeddings_queue_id_set(db_root)),
+        "owned": _silo_owned_id_sets(db_root, collection_name),
+        "reports": {},
+    }
+    with _snapshot_lock:
+        _snapshot_cache[key] = (stamp, snapshot)
+        _snapshot_cache.move_to_end(key)
+        while len(_snapshot_cache) > _SNAPSHOT_CACHE_SIZE:
+            _snapshot_cache.popitem(last=False)
+    return snapshot
+
+
+def _reset_hnsw_snapshot_cache_for_tests() -> None:
+    """Drop cached consistency snapshots. Test-only helper."""
+    with _snapshot_lock:
+        _snapshot_cache.clear()
+
+
+def _consistency_report(silo_slug: str, owned: set[str] | frozenset[str], snapshot: dict[str, Any]) -> dict[str, Any]:
+    hnsw_ids = snapshot["hnsw_ids"]
+    queued_ids = snapshot["queued_ids"]
+    missing = owned - hnsw_ids
+    truly = missing - queued_ids
+    return {
+        "slug": silo_slug,
+        "sqlite_ids": len(owned),
+        "hnsw_reachable": len(owned) - len(missing),
+        "queued": len(missing) - len(truly),
+        "missing_ids": sorted(truly)[:50],
+        "missing_count": len(truly),
+        "consistent": not truly,
+    }
+
+
+def silo_consistency_reports(db_path: str | Path, silo_slugs: list[str]) -> list[dict[str, Any]] | None:
+    """
+    verify_silo_hnsw_consistency() for every slug from one cached snapshot, without
+    a Chroma client. None when the snapshot has no per-silo view (unreadable schema).
+    """
+    snapshot = hnsw_consistency_snapshot(db_path)
+    owned = snapshot["owned"]
+    if owned is None:
+        return None
+    reports = snapshot["reports"]
+    out: list[dict[str, Any]] = []
+    for slug in silo_slugs:
+        report = reports.get(slug)
+        if report is None:
+            report = reports[slug] = _consistency_report(slug, owned.get(slug) or frozenset(), snapshot)
+        out.append(report)
+    return out
+
+
 def verify_silo_hnsw_consistency(collection: Any, silo_slug: str, db_path: str | Path) -> dict[str, Any]:
     """
     Compare a silo's SQLite-owned chunk IDs against the HNSW id_to_label set,
@@ -242,7 +371,6 @@ def verify_silo_hnsw_consistency(collection: Any, silo_slug: str, db_path: str |
         "consistent": bool,
     }
     """
-    db_root = Path(db_path).resolve()
     try:
         res = collection.get(where={"silo": silo_slug}, include=["metadatas"])
         owned = set(res.get("ids") or [])
@@ -257,17 +385,4 @@ def verify_silo_hnsw_consistency(collection: Any, silo_slug: str, db_path: str |
             "consistent": False,
             "error": f"{type(e).__name__}: {e}",
         }
-    hnsw_ids = _hnsw_id_set(db_root)
-    queued_ids = _embeddings_queue_id_set(db_root)
-    missing = owned - hnsw_ids
-    truly = missing - queued_ids
-    sample = sorted(truly)[:50]
-    return {
-        "slug": silo_slug,
-        "sqlite_ids": len(owned),
-        "hnsw_reachable": len(owned & hnsw_ids),
-        "queued": len(missing & queued_ids),
-        "missing_ids": sample,
-        "missing_count": len(truly),
-        "consistent": not truly,
-    }
+    return _consistency_report(silo_slug, owned, hnsw_consistency_snapshot(db_path))
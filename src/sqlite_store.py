@@ -0,0 +1,68 @@
+"""
+Connections for the SQLite stores kept beside the Chroma DB.
+
+The file manifest, chunk counts, embedding cache, lexical index and tax ledger
+are each one WAL database opened per operation, read and written by CLI, pal,
+MCP and daemon processes at once. This module is the one place that opens them
+(WAL, ``synchronous=NORMAL``, schema once per path, 30 s busy timeout) and runs
+a write under ``BEGIN IMMEDIATE``, so the write lock is taken up front rather
+than upgraded mid-transaction where a concurrent writer would fail it with
+SQLITE_BUSY.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Iterator
+
+BUSY_TIMEOUT_S = 30.0
+
+# Store paths whose schema already ran in this process.
+_initialized: set[str] = set()
+_initialized_lock = threading.Lock()
+
+
+@contextmanager
+def connect_store(path: Path, schema: str, *, create: bool = True) -> Iterator[sqlite3.Connection | None]:
+    """Open the store at path; yields None when the file does not exist and
+    ``create`` is False. The schema runs on the first open of a path in this
+    process, or when the file is new; later opens skip it."""
+    existed = path.exists()
+    if not existed and not create:
+        yield None
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    key = str(path)
+    with closing(sqlite3.connect(key, timeout=BUSY_TIMEOUT_S)) as conn:
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with _initialized_lock:
+            fresh = not existed or key not in _initialized
+        if fresh:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(schema)
+            with _initialized_lock:
+                _initialized.add(key)
+        yield conn
+
+
+@contextmanager
+def immediate_txn(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """BEGIN IMMEDIATE on conn; commit on success, roll back on any exception."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+@contextmanager
+def write_txn(path: Path, schema: str) -> Iterator[sqlite3.Connection]:
+    """Open (creating if needed) the store at path and run one IMMEDIATE transaction."""
+    with connect_store(path, schema) as conn:
+        assert conn is not None
+        with immediate_txn(conn):
+            yield conn
@@ -254,19 +254,9 @@ def remove_silo(db_path: str | Path, name_or_slug: str) -> str | None:
 
 def remove_manifest_silo(db_path: str | Path, slug: str) -> None:
     """Remove silo from file manifest (if present)."""
-    from ingest import _file_manifest_path  # lazy to avoid import cycle
-    path = _file_manifest_path(db_path)
-    if not path.exists():
-        return
+    from file_registry import _remove_manifest_silo  # lazy to avoid import cycle
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f) or {}
-        silos = data.get("silos") or {}
-        if slug in silos:
-            del silos[slug]
-            data["silos"] = silos
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+        _remove_manifest_silo(db_path, slug)
     except Exception:
         return
 
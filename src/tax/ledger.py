@@ -1,14 +1,22 @@
 """Tax ledger extraction + persistence.
 
 The ledger is an ingest-time normalized row store used by deterministic tax QA.
+
+Rows live in ``tax_ledger.sqlite3`` (WAL) next to the Chroma DB, indexed by
+(silo, tax_year, form_type, field_code) and by source, so resolver lookups read
+only the matching rows and a single-file update deletes and inserts only that
+file's rows. A ``tax_ledger.json`` from older versions is imported on first use.
 """
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import datetime, timezone
 import json
 from pathlib import Path
-from typing import Any
+import sqlite3
+from typing import Any, Iterable, Iterator
 
+from sqlite_store import connect_store, immediate_txn
 from tax.extractors.form_fields import extract_form_fields
 from tax.extractors.layout import extract_layout_fields
 from tax.extractors.ocr_layout import extract_ocr_layout_fields
@@ -25,25 +33,143 @@ from tax.normalize import (
 )
 from tax.schema import TaxLedgerRow
 
-_LEDGER_FILENAME = "tax_ledger.json"
+_LEDGER_FILENAME = "tax_ledger.sqlite3"
+_LEGACY_LEDGER_FILENAME = "tax_ledger.json"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tax_rows (
+    silo TEXT NOT NULL,
+    source TEXT NOT NULL,
+    zip_path TEXT NOT NULL DEFAULT '',
+    tax_year INTEGER NOT NULL,
+    form_type TEXT NOT NULL DEFAULT '',
+    field_code TEXT NOT NULL DEFAULT '',
+    row_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tax_rows_lookup ON tax_rows(silo, tax_year, form_type, field_code);
+CREATE INDEX IF NOT EXISTS idx_tax_rows_year ON tax_rows(tax_year, field_code);
+CREATE INDEX IF NOT EXISTS idx_tax_rows_source ON tax_rows(silo, source);
+CREATE INDEX IF NOT EXISTS idx_tax_rows_zip ON tax_rows(silo, zip_path);
+"""
 
 
 def ledger_path(db_path: str | Path) -> Path:
     return Path(db_path) / _LEDGER_FILENAME
 
 
+def _zip_base(source: str) -> str:
+    # ZIP source labels are normalized as "<zip path> > <inner path>".
+    return source.split(" > ", 1)[0] if " > " in source else ""
+
+
+def _insert_rows(conn: sqlite3.Connection, rows: Iterable[dict[str, Any]]) -> None:
+    conn.executemany(
+        "INSERT INTO tax_rows(silo, source, zip_path, tax_year, form_type, field_code, row_json) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                str(row.get("silo") or ""),
+                str(row.get("source") or ""),
+                _zip_base(str(row.get("source") or "")),
+                int(row.get("tax_year") or 0),
+                str(row.get("form_type") or ""),
+                str(row.get("field_code") or ""),
+                json.dumps(row, ensure_ascii=False),
+            )
+            for row in rows
+        ],
+    )
+
+
+def _import_legacy_json(conn: sqlite3.Connection, db_path: str | Path) -> None:
+    legacy = Path(db_path) / _LEGACY_LEDGER_FILENAME
+    if not legacy.exists():
+        return
+    try:
+        payload = json.loads(legacy.read_text(encoding="utf-8"))
+    except Exception:
+        payload = {}
+    rows = payload.get("rows") if isinstance(payload, dict) else None
+    with immediate_txn(conn):
+        if not conn.execute("SELECT 1 FROM tax_rows LIMIT 1").fetchone():
+            _insert_rows(conn, [r for r in rows or [] if isinstance(r, dict)])
+    legacy.unlink(missing_ok=True)
+
+
+@contextmanager
+def _ledger_conn(db_path: str | Path, *, create: bool = True) -> Iterator[sqlite3.Connection | None]:
+    path = ledger_path(db_path)
+    if not create and not path.exists() and not (Path(db_path) / _LEGACY_LEDGER_FILENAME).exists():
+        yield None
+        return
+    with connect_store(path, _SCHEMA) as conn:
+        assert conn is not None
+        _import_legacy_json(conn, db_path)
+        yield conn
+
+
+@contextmanager
+def _write_txn(db_path: str | Path) -> Iterator[sqlite3.Connection]:
+    with _ledger_conn(db_path) as conn:
+        assert conn is not None
+        with immediate_txn(conn):
+            yield conn
+
+
+def _lookup_where(
+    *,
+    silo: str | None,
+    tax_year: int | None,
+    form_types: Iterable[str] | None,
+    field_codes: Iterable[str] | None,
+) -> tuple[str, list[Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    if silo is not None:
+        clauses.append("silo = ?")
+        params.append(silo)
+    if tax_year is not None:
+        clauses.append("tax_year = ?")
+        params.append(int(tax_year))
+    for column, values in (("form_type", form_types), ("field_code", field_codes)):
+        if values is None:
+            continue
+        wanted = sorted({str(v) for v in values})
+        clauses.append(f"{column} IN ({', '.join('?' * len(wanted))})" if wanted else "0")
+        params.extend(wanted)
+    return (f" WHERE {' AND '.join(clauses)}" if clauses else "", params)
+
+
 def load_tax_ledger_rows(
     db_path: str | Path,
     *,
     silo: str | None = None,
     tax_year: int | None = None,
+    form_types: Iterable[str] | None = None,
+    field_codes: Iterable[str] | None = None,
 ) -> list[TaxLedgerRow]:
-    rows = _read_all_rows(db_path)
-    if silo is not None:
-        rows = [r for r in rows if str(r.get("silo") or "") == silo]
-    if tax_year is not None:
-        rows = [r for r in rows if int(r.get("tax_year") or 0) == tax_year]
-    return rows
+    """Rows matching every given filter, in insertion order. None means "any"."""
+    where, params = _lookup_where(silo=silo, tax_year=tax_year, form_types=form_types, field_codes=field_codes)
+    with _ledger_conn(db_path, create=False) as conn:
+        if conn is None:
+            return []
+        found = conn.execute(f"SELECT row_json FROM tax_rows{where} ORDER BY rowid", params).fetchall()
+    out: list[TaxLedgerRow] = []
+    for (raw,) in found:
+        try:
+            row = json.loads(raw)
+        except Exception:
+            continue
+        if isinstance(row, dict):
+            out.append(row)  # type: ignore[arg-type]
+    return out
+
+
+def has_tax_ledger_rows(db_path: str | Path, *, silo: str | None = None, tax_year: int | None = None) -> bool:
+    where, params = _lookup_where(silo=silo, tax_year=tax_year, form_types=None, field_codes=None)
+    with _ledger_conn(db_path, create=False) as conn:
+        if conn is None:
+            return False
+        return conn.execute(f"SELECT 1 FROM tax_rows{where} LIMIT 1", params).fetchone() is not None
 
 
 def replace_tax_rows_for_sources(
@@ -55,17 +181,17 @@ def replace_tax_rows_for_sources(
     replace_all_in_silo: bool = False,
 ) -> None:
     """Replace all rows for the provided source paths in a silo, then append new rows."""
-    existing = _read_all_rows(db_path)
-    if replace_all_in_silo:
-        existing = [row for row in existing if str(row.get("silo") or "") != silo]
-    elif sources:
-        existing = [
-            row
-            for row in existing
-            if not _row_matches_source(row, silo=silo, sources=sources)
-        ]
-    merged = [*existing, *new_rows]
-    _write_all_rows(db_path, merged)
+    if not replace_all_in_silo and not sources and not new_rows:
+        return
+    with _write_txn(db_path) as conn:
+        if replace_all_in_silo:
+            conn.execute("DELETE FROM tax_rows WHERE silo = ?", (silo,))
+        elif sources:
+            conn.executemany(
+                "DELETE FROM tax_rows WHERE silo = ? AND (source = ? OR zip_path = ?)",
+                [(silo, src, src) for src in sorted(sources)],
+            )
+        _insert_rows(conn, new_rows)  # type: ignore[arg-type]
 
 
 def extract_tax_rows_from_chunks(
@@ -142,41 +268,3 @@ def extract_tax_rows_from_chunks(
             )
 
     return out
-
-
-def _row_matches_source(row: dict[str, Any], *, silo: str, sources: set[str]) -> bool:
-    if str(row.get("silo") or "") != silo:
-        return False
-    src = str(row.get("source") or "")
-    if src in sources:
-        return True
-    # ZIP source labels are normalized as "<zip path> > <inner path>".
-    for base in sources:
-        if src.startswith(f"{base} > "):
-            return True
-    return False
-
-
-def _read_all_rows(db_path: str | Path) -> list[TaxLedgerRow]:
-    path = ledger_path(db_path)
-    if not path.exists():
-        return []
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return []
-    rows = payload.get("rows") if isinstance(payload, dict) else None
-    if not isinstance(rows, list):
-        return []
-    out: list[TaxLedgerRow] = []
-    for row in rows:
-        if isinstance(row, dict):
-            out.append(row)  # type: ignore[arg-type]
-    return out
-
-
-def _write_all_rows(db_path: str | Path, rows: list[TaxLedgerRow]) -> None:
-    path = ledger_path(db_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {"rows": rows}
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -102,6 +102,47 @@ def _reset_embedding_function_cache() -> Any:
     _reset_ef_cache_for_tests()
 
 
+@pytest.fixture(autouse=True)
+def _reset_retrieve_result_cache() -> Any:
+    """Clear cached run_retrieve results so tests that swap Chroma fakes never see another case's chunks."""
+    from query.result_cache import _reset_retrieve_cache_for_tests
+
+    _reset_retrieve_cache_for_tests()
+    yield
+    _reset_retrieve_cache_for_tests()
+
+
+@pytest.fixture(autouse=True)
+def _reset_hnsw_snapshot_cache() -> Any:
+    """Clear cached HNSW consistency snapshots; tmp DB paths can be reused across cases."""
+    from silo_audit import _reset_hnsw_snapshot_cache_for_tests
+
+    _reset_hnsw_snapshot_cache_for_tests()
+    yield
+    _reset_hnsw_snapshot_cache_for_tests()
+
+
+@pytest.fixture(autouse=True)
+def _reset_ocr_cache() -> Any:
+    """Clear cached OCR results; blank test pages render to identical images."""
+    from processors import _reset_ocr_cache_for_tests
+
+    _reset_ocr_cache_for_tests()
+    yield
+    _reset_ocr_cache_for_tests()
+
+
+@pytest.fixture(autouse=True)
+def _reset_image_summary_queues() -> Any:
+    """Shut down vision summary queues (and the backfills waiting on them) a test left open."""
+    from image_summary_queue import _reset_image_summary_queues_for_tests
+    from ingest import wait_for_image_summaries
+
+    yield
+    _reset_image_summary_queues_for_tests()
+    wait_for_image_summaries(timeout=5)
+
+
 @pytest.fixture
 def db_path(tmp_path: Path) -> Path:
     """Consistent temp DB path fixture for tests that need a Chroma path."""
@@ -76,6 +76,7 @@ def test_pull_all_subprocess_does_not_capture_output(monkeypatch):
         return SimpleNamespace(returncode=0)
 
     monkeypatch.setattr("pal.subprocess.run", fake_run)
+    monkeypatch.setenv("LLMLIBRARIAN_PULL_ISOLATE", "1")
     pal.pull_all_sources()
     assert not seen["kwargs"].get("capture_output")
     assert seen["cmd"][1].endswith("cli.py") or "cli" in seen["cmd"][1]
@@ -24,8 +24,8 @@ def test_pdf_table_enrichment_persists_line_value_hints(tmp_path, monkeypatch):
     monkeypatch.setenv("LLMLIBRARIAN_PDF_TABLES", "1")
     monkeypatch.setattr(
         processors,
-        "_extract_pdf_tables_by_page",
-        lambda _data: [[[["", "9", "7,522."], ["", "11", "7,522."]]]],
+        "_extract_pdf_page_tables",
+        lambda _page: [[["", "9", "7,522."], ["", "11", "7,522."]]],
     )
 
     db_path = tmp_path / "db"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
 
 import artifacts
@@ -99,13 +100,14 @@ def test_run_ingest_calls_artifact_compile_hook(tmp_path, monkeypatch):
     monkeypatch.setenv("LLMLIBRARIAN_ARTIFACT_SILOS", "*")
     called = {}
 
-    def _fake_compile(*, db_path, parent_slug, source_path, display_name=None):
+    def _fake_compile(*, db_path, parent_slug, source_path, display_name=None, changed_sources=None):
         called.update(
             {
                 "db_path": db_path,
                 "parent_slug": parent_slug,
                 "source_path": source_path,
                 "display_name": display_name,
+                "changed_sources": changed_sources,
             }
         )
         return {"status": "completed"}
@@ -117,3 +119,177 @@ def test_run_ingest_calls_artifact_compile_hook(tmp_path, monkeypatch):
     assert result.silo_slug == "docs-aaaa1111"
     assert result.artifact_result == {"status": "completed"}
     assert called["parent_slug"] == "docs-aaaa1111"
+    assert called["changed_sources"] is None
+
+
+def _row(row_id, doc, source, **meta):
+    return {"id": row_id, "doc": doc, "meta": {"source": str(source), **meta}}
+
+
+def test_compile_artifacts_refreshes_only_changed_sources(tmp_path, monkeypatch):
+    db = tmp_path / "db"
+    source = tmp_path / "docs"
+    source.mkdir(parents=True)
+    slug = "docs-aaaa1111"
+    a, b = str(source / "a.html"), str(source / "b.html")
+    update_silo(db, slug, str(source), 2, 2, "2026-05-07T00:00:00+00:00", display_name="Docs")
+    monkeypatch.setenv("LLMLIBRARIAN_ARTIFACT_SILOS", slug)
+    parent = {
+        a: [_row("a1", "Revenue grew to $4 billion.", a)],
+        b: [_row("b1", "Risk factors include supply shocks.", b)],
+    }
+    loads = []
+
+    def _fake_load(_db, _slug, sources=None):
+        loads.append(sources)
+        keys = sorted(parent) if sources is None else [s for s in sources if s in parent]
+        return [row for key in keys for row in parent[key]]
+
+    monkeypatch.setattr(artifacts, "_load_parent_rows", _fake_load)
+    monkeypatch.setattr(artifacts, "_write_artifact_rows", lambda _db, _slug, rows: len(rows))
+    replaced = []
+
+    def _fake_replace(_db, _slug, rows_by_source):
+        replaced.append(rows_by_source)
+        return sum(len(rows) for rows in rows_by_source.values())
+
+    monkeypatch.setattr(artifacts, "_replace_artifact_sources", _fake_replace)
+    first = artifacts.compile_artifacts_for_silo(db_path=db, parent_slug=slug, source_path=source)
+    assert first["status"] == "completed" and first["sources_refreshed"] == 2
+    b_fingerprint = get_silo_artifact_compile(db, slug)["sources"][b]["fingerprint"]
+
+    parent[a] = [_row("a1", "Operating margin expanded to 31%.", a)]
+    second = artifacts.compile_artifacts_for_silo(db_path=db, parent_slug=slug, source_path=source, changed_sources={a})
+    assert loads[-1] == [a]
+    assert second["status"] == "completed" and second["sources_refreshed"] == 1
+    assert list(replaced[-1]) == [a]
+    assert replaced[-1][a][0][1].startswith("METRIC: Operating margin")
+    state = get_silo_artifact_compile(db, slug)["sources"]
+    assert state[b]["fingerprint"] == b_fingerprint
+
+    del parent[b]
+    third = artifacts.compile_artifacts_for_silo(db_path=db, parent_slug=slug, source_path=source, changed_sources=[b])
+    assert third["status"] == "completed"
+    assert replaced[-1] == {b: []}
+    assert set(get_silo_artifact_compile(db, slug)["sources"]) == {a}
+    assert third["kind_counts"] == {"metric": 1}
+
+    unchanged = artifacts.compile_artifacts_for_silo(db_path=db, parent_slug=slug, source_path=source, changed_sources=[a])
+    assert unchanged["status"] == "unchanged"
+
+
+
+def test_compile_artifacts_caps_facts_across_the_silo(tmp_path, monkeypatch):
+    db = tmp_path / "db"
+    source = tmp_path / "docs"
+    source.mkdir(parents=True)
+    slug = "docs-aaaa1111"
+    a, b, c = (str(source / f"{name}.html") for name in "abc")
+    update_silo(db, slug, str(source), 3, 3, "2026-05-07T00:00:00+00:00", display_name="Docs")
+    monkeypatch.setenv("LLMLIBRARIAN_ARTIFACT_SILOS", slug)
+    monkeypatch.setenv("LLMLIBRARIAN_ARTIFACT_MAX_FACTS", "2")
+    parent = {path: [_row(f"{path}-1", "Revenue grew to $4 billion.", path)] for path in (a, b, c)}
+
+    def _fake_load(_db, _slug, sources=None):
+        keys = sorted(parent) if sources is None else [s for s in sources if s in parent]
+        return [row for key in keys for row in parent[key]]
+
+    replaced = []
+
+    def _fake_replace(_db, _slug, rows_by_source):
+        replaced.append(rows_by_source)
+        return sum(len(rows) for rows in rows_by_source.values())
+
+    monkeypatch.setattr(artifacts, "_load_parent_rows", _fake_load)
+    monkeypatch.setattr(artifacts, "_write_artifact_rows", lambda _db, _slug, rows: len(rows))
+    monkeypatch.setattr(artifacts, "_replace_artifact_sources", _fake_replace)
+
+    first = artifacts.compile_artifacts_for_silo(db_path=db, parent_slug=slug, source_path=source)
+    assert first["chunks_written"] == 2 and first["truncated"] is True
+    state = get_silo_artifact_compile(db, slug)["sources"]
+    assert [state[p]["artifacts"] for p in (a, b, c)] == [1, 1, 0]
+
+    # An edit inside the budget does not let the changed source grow past it.
+    parent[a] = [_row("a-1", "Revenue grew.", a), _row("a-2", "Operating income rose.", a)]
+    artifacts.compile_artifacts_for_silo(db_path=db, parent_slug=slug, source_path=source, changed_sources=[a])
+    assert len(replaced[-1][a]) == 1
+
+    # Removing a source frees its share; the next full pass hands it to the source cut short.
+    del parent[a]
+    artifacts.compile_artifacts_for_silo(db_path=db, parent_slug=slug, source_path=source)
+    assert set(replaced[-1]) == {a, c} and len(replaced[-1][c]) == 1
+    assert sum(e["artifacts"] for e in get_silo_artifact_compile(db, slug)["sources"].values()) == 2
+
+
+def test_replace_artifact_sources_diffs_by_artifact_id(tmp_path, monkeypatch):
+    class _Collection:
+        def __init__(self):
+            self.deleted = []
+            self.added = []
+            self.where = None
+
+        def get(self, where=None, include=None):
+            self.where = where
+            return {"ids": ["keep", "stale"]}
+
+        def delete(self, ids):
+            self.deleted.extend(ids)
+
+        def add(self, ids, documents, metadatas):
+            self.added.extend(ids)
+
+    coll = _Collection()
+
+    class _Client:
+        def get_or_create_collection(self, name):
+            return coll
+
+    @contextmanager
+    def _fake_writer(_db):
+        yield _Client()
+
+    monkeypatch.setattr(artifacts, "writer_client", _fake_writer)
+    meta = {"silo": "docs-artifacts", "source": "/d/a.html", "doc_type": "artifact"}
+    written = artifacts._replace_artifact_sources(
+        str(tmp_path),
+        "docs-artifacts",
+        {"/d/a.html": [("keep", "METRIC: x", meta), ("new", "RISK: y", meta)]},
+    )
+    assert written == 1
+    assert coll.deleted == ["stale"] and coll.added == ["new"]
+    assert coll.where["$and"][0] == {"silo": "docs-artifacts"}
+
+
+def test_write_artifact_rows_logs_and_marks_stale_when_a_sidecar_fails(tmp_path, monkeypatch, capsys):
+    class _Collection:
+        def delete(self, where):
+            pass
+
+        def add(self, ids, documents, metadatas):
+            pass
+
+    class _Client:
+        def get_or_create_collection(self, name):
+            return _Collection()
+
+    @contextmanager
+    def _fake_writer(_db):
+        yield _Client()
+
+    class _BrokenIndex:
+        stale: list[str] = []
+
+        def reset_silo(self, slug):
+            raise OSError("disk I/O error")
+
+        def mark_stale(self, silos):
+            self.stale.extend(silos)
+
+    monkeypatch.setattr(artifacts, "writer_client", _fake_writer)
+    monkeypatch.setattr(artifacts, "open_lexical_index", lambda _db: _BrokenIndex())
+    monkeypatch.setattr(artifacts, "open_chunk_counts", lambda _db: None)
+    rows = [("a", "METRIC: x", {"silo": "docs-artifacts", "source": "/d/a.html"})]
+
+    assert artifacts._write_artifact_rows(str(tmp_path), "docs-artifacts", rows) == 1
+    assert _BrokenIndex.stale == ["docs-artifacts"]
+    assert "Sidecar index update failed" in capsys.readouterr().err
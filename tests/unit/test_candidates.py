@@ -0,0 +1,74 @@
+import random
+
+import numpy as np
+
+from query.candidates import CandidateSet
+
+
+def _rows(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    docs = [f"d{i}" for i in range(n)]
+    metas = [
+        {
+            "source": rng.choice(["/a.pdf", "/b.md", "/c.txt", ""]),
+            "silo": rng.choice(["s1", "s2", "s3", None]),
+            "chunk_hash": rng.choice(["h1", "h2", "h3", "h4", ""]),
+        }
+        for _ in range(n)
+    ]
+    dists = [rng.choice([None, round(rng.random(), 2)]) for _ in range(n)]
+    return docs, metas, dists
+
+
+def _reference_cap(metas, key, top_k, cap):
+    counts: dict[str, int] = {}
+    out = []
+    for i, m in enumerate(metas):
+        value = (m or {}).get(key) or ""
+        if value:
+            if counts.get(value, 0) >= cap:
+                continue
+            counts[value] = counts.get(value, 0) + 1
+        out.append(i)
+        if len(out) >= top_k:
+            break
+    return out
+
+
+def test_cap_per_key_matches_sequential_cap_and_keeps_unknown_keys():
+    docs, metas, dists = _rows(60)
+    for top_k, cap in ((5, 1), (12, 2), (60, 3)):
+        got = CandidateSet(docs, metas, dists).cap_per_key("source", top_k, cap)
+        assert got.docs == [docs[i] for i in _reference_cap(metas, "source", top_k, cap)]
+
+
+def test_dedup_keeps_first_hash_and_rows_without_hash():
+    docs, metas, dists = _rows(40, seed=3)
+    got = CandidateSet(docs, metas, dists).dedup("chunk_hash")
+    seen: set[str] = set()
+    expected = []
+    for d, m in zip(docs, metas):
+        h = m["chunk_hash"]
+        if h and h in seen:
+            continue
+        seen.add(h)
+        expected.append(d)
+    assert got.docs == expected
+
+
+def test_order_by_is_stable_on_priority_then_distance():
+    docs = ["a", "b", "c", "d"]
+    metas = [{"source": "x"}, {"source": "y"}, {"source": "x"}, {"source": "z"}]
+    cs = CandidateSet(docs, metas, [0.5, None, 0.1, 0.5])
+    priority = cs.label_scores("source", lambda s: 1.0 if s == "x" else 0.0)
+    assert cs.order_by(priority).docs == ["c", "a", "d", "b"]
+
+
+def test_take_carries_interned_keys_and_distances():
+    docs, metas, dists = _rows(20, seed=11)
+    cs = CandidateSet(docs, metas, dists)
+    cs.key_ids("silo")
+    sub = cs.take([4, 2, 9])
+    assert sub.metas == [metas[4], metas[2], metas[9]]
+    assert np.array_equal(sub.key_ids("silo"), cs.key_ids("silo")[[4, 2, 9]])
+    assert sub.dist_array().tolist() == [d if d is not None else 999.0 for d in (dists[4], dists[2], dists[9])]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import ingest
+from chunk_counts import open_chunk_counts
+
+
+def _meta(source: str, doc_type: str = "other", **extra: Any) -> dict[str, Any]:
+    return {"silo": "notes", "source": source, "doc_type": doc_type, **extra}
+
+
+class _NoScanCollection:
+    """Collection stub that fails any full-silo read."""
+
+    def __init__(self) -> None:
+        self.deleted: list[dict[str, Any]] = []
+
+    def add(self, **_kwargs: Any) -> None:
+        return None
+
+    def get(self, ids: list[str] | None = None, **kwargs: Any) -> dict[str, Any]:
+        if ids is None:
+            raise AssertionError(f"unexpected scan: {kwargs}")
+        return {"ids": list(ids)}
+
+    def delete(self, **kwargs: Any) -> None:
+        self.deleted.append(kwargs)
+
+
+def test_counts_follow_adds_deletes_and_diffs(tmp_path: Path) -> None:
+    counts = open_chunk_counts(tmp_path)
+    assert counts is not None
+    counts.reset_silo("notes")
+    chunks = [
+        ("a1", "x", _meta("/n/a.md", "note")),
+        ("a2", "y", _meta("/n/a.md", "note")),
+        ("b1", "z", _meta("/n/b.pdf", "reference", file_hash="h1")),
+        ("z1", "w", _meta("/n/pack.zip > inner.txt", zip_path="/n/pack.zip")),
+    ]
+    ingest._batch_add(_NoScanCollection(), chunks, batch_size=2, quiet=True, chunk_counts=counts)
+    assert counts.chunk_total("notes") == 4
+
+    breakdown = counts.silo_breakdown("notes")
+    assert breakdown is not None
+    assert breakdown["by_doc_type"] == {"note": 2, "reference": 1, "other": 1}
+    assert breakdown["by_extension"] == {".md": 2, ".pdf": 1, ".txt": 1}
+    assert breakdown["sources"][0] == {"source": "/n/a.md", "doc_type": "note", "file_hash": "", "chunks": 2}
+
+    ingest._delete_source_from_collections(
+        collection=_NoScanCollection(),
+        image_collection=None,
+        silo_slug="notes",
+        source_path="/n/pack.zip",
+        chunk_counts=counts,
+    )
+    counts.subtract("notes", "/n/a.md", 1)
+    assert counts.chunk_total("notes") == 2
+    assert counts.silo_totals() == {"notes": {"chunks": 2, "files": 2, "by_doc_type": {"note": 1, "reference": 1}}}
+
+
+def test_unready_silo_reports_none_until_rebuilt(tmp_path: Path) -> None:
+    counts = open_chunk_counts(tmp_path)
+    assert counts is not None
+    counts.add([_meta("/n/a.md")])
+    assert counts.chunk_total("notes") is None
+    assert counts.silo_totals() == {}
+    counts.rebuild_silo("notes", [_meta("/n/a.md"), _meta("/n/b.md")])
+    assert counts.chunk_total("notes") == 2
+    counts.mark_stale(["notes"])
+    assert counts.silo_breakdown("notes") is None
+
+
+def test_update_silo_counts_reads_counters_without_scanning(monkeypatch: Any, tmp_path: Path) -> None:
+    counts = open_chunk_counts(tmp_path)
+    assert counts is not None
+    counts.rebuild_silo("notes", [_meta("/n/a.md"), _meta("/n/a.md"), _meta("/n/b.md")])
+
+    def _no_client(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("Chroma should not be opened")
+
+    recorded: list[tuple] = []
+    monkeypatch.setattr(ingest, "get_client", _no_client)
+    monkeypatch.setattr("state.update_silo", lambda *args, **kwargs: recorded.append(args))
+    ingest.update_silo_counts(str(tmp_path), "notes", display_name="Notes")
+    assert recorded and recorded[0][4] == 3
+
+
+def test_op_inspect_silo_uses_counters(monkeypatch: Any, tmp_path: Path) -> None:
+    import operations
+
+    counts = open_chunk_counts(tmp_path)
+    assert counts is not None
+    counts.rebuild_silo(
+        "notes",
+        [_meta("/n/a.md", file_hash="same"), _meta("/n/a.md", file_hash="same"), _meta("/n/copy.md", file_hash="same")],
+    )
+    monkeypatch.setattr("state.list_silos", lambda _db: [{"slug": "notes", "display_name": "Notes", "chunks_count": 3}])
+    monkeypatch.setattr("state.resolve_silo_to_slug", lambda _db, name: "notes")
+
+    def _no_client(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("Chroma should not be opened")
+
+    monkeypatch.setattr("chroma_client.get_client", _no_client)
+    result = operations.op_inspect_silo(str(tmp_path), "notes")
+    assert result["counts_source"] == "counters"
+    assert result["total_chunks_chroma"] == 3 and result["registry_match"] is True
+    assert [f["source"] for f in result["files"]] == ["/n/a.md", "/n/copy.md"]
+    assert all(f["has_duplicate_content"] for f in result["files"])
+    assert result["chunks_by_extension"] == {".md": 3}
@@ -47,3 +47,50 @@ def test_chunk_text_sec_like_prefix_then_megabyte_line():
     assert all("B" in piece and "<" not in piece for piece in by_line[mega_body_line])
     assert len(chunks[0][0]) < 200
     assert chunks[0][1] == 1
+
+
+def _journal(entries: int) -> str:
+    return "\n\n".join(
+        f"## Day {i}\n" + "\n".join(f"entry {i} note {j} about the garden and the weather" for j in range(6))
+        for i in range(entries)
+    )
+
+
+def test_chunk_text_anchored_mode_realigns_after_insert():
+    text = _journal(30)
+    edited = text.replace("## Day 1\n", "## Day 1\nan extra line inserted near the top\n", 1)
+
+    before = {c for c, _ls in chunk_text(text, size=400, overlap=0, mode="anchored")}
+    after = {c for c, _ls in chunk_text(edited, size=400, overlap=0, mode="anchored")}
+    assert len(after - before) <= 2
+    assert len(before & after) >= len(before) - 2
+
+    # Greedy packing shifts every boundary after the insert.
+    greedy_before = {c for c, _ls in chunk_text(text, size=400, overlap=0, mode="lines")}
+    greedy_after = {c for c, _ls in chunk_text(edited, size=400, overlap=0, mode="lines")}
+    assert len(greedy_before & greedy_after) < len(before & after)
+
+
+def test_chunk_text_anchored_mode_respects_size_cap():
+    text = "\n".join(f"line {i} " + "x" * 40 for i in range(200))
+    chunks = chunk_text(text, size=300, overlap=0, mode="anchored")
+    assert all(len(c) <= 300 + 60 for c, _ls in chunks)
+    covered = {line for c, _ls in chunks for line in c.split("\n")}
+    assert covered == set(text.split("\n"))
+
+
+def test_chunk_text_mode_from_env(monkeypatch):
+    text = _journal(10)
+    monkeypatch.setenv("LLMLIBRARIAN_CHUNKING", "anchored")
+    assert chunk_text(text, size=400, overlap=0) == chunk_text(text, size=400, overlap=0, mode="anchored")
+    monkeypatch.setenv("LLMLIBRARIAN_CHUNKING", "bogus")
+    assert chunk_text(text, size=400, overlap=0) == chunk_text(text, size=400, overlap=0, mode="lines")
+
+
+def test_chunk_text_anchored_mode_never_repeats_a_paragraph():
+    paragraphs = [f"paragraph {i} " + "y" * 590 for i in range(6)]
+    text = "\n\n".join(paragraphs)
+    chunks = chunk_text(text, size=1000, overlap=150, mode="anchored")
+    for paragraph in paragraphs:
+        assert sum(paragraph in c for c, _ls in chunks) == 1
+    assert len(chunks) == len(chunk_text(text, size=1000, overlap=150, mode="lines"))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from query.retrieval import merge_dual_streams_rrf
-from query.retrieve_locked import execute_retrieve_chroma_phase
+from query.retrieve_locked import execute_retrieve_chroma_phase, execute_retrieve_chroma_phase_many
 
 
 def test_merge_dual_streams_rrf_combines_both_streams():
@@ -20,70 +20,232 @@ def test_merge_dual_streams_rrf_combines_both_streams():
     assert "artifact1" in sources
 
 
-def test_execute_retrieve_chroma_phase_uses_dual_stream_for_scoped_silo(monkeypatch):
+def test_execute_retrieve_chroma_phase_uses_dual_stream_for_scoped_silo(monkeypatch, tmp_path):
+    queries: list[dict] = []
+    gets: list[dict] = []
+
     class _FakeCollection:
         def query(self, **kwargs):
-            where = kwargs.get("where") or {}
-            where_text = str(where)
-            if "docs-artifacts" in where_text:
-                return {
-                    "documents": [["artifact chunk"]],
-                    "metadatas": [[{"source": "artifact.txt", "silo": "docs-artifacts", "doc_type": "artifact"}]],
-                    "distances": [[0.1]],
-                    "ids": [["aid1"]],
-                }
+            queries.append(kwargs)
             return {
-                "documents": [["raw chunk"]],
-                "metadatas": [[{"source": "raw.txt", "silo": "docs", "doc_type": "other"}]],
-                "distances": [[0.2]],
-                "ids": [["rid1"]],
+                "documents": [["raw chunk", "artifact chunk", "raw revenue chunk"]],
+                "metadatas": [[
+                    {"source": "raw.txt", "silo": "docs", "doc_type": "other"},
+                    {"source": "artifact.txt", "silo": "docs-artifacts", "doc_type": "artifact"},
+                    {"source": "raw2.txt", "silo": "docs", "doc_type": "other"},
+                ]],
+                "distances": [[0.2, 0.1, 0.3]],
+                "ids": [["rid1", "aid1", "rid2"]],
+            }
+
+        def get(self, **kwargs):
+            gets.append(kwargs)
+            return {
+                "ids": ["aid2", "rid2"],
+                "documents": ["artifact revenue fact", "raw revenue chunk"],
+                "metadatas": [
+                    {"source": "artifact2.txt", "silo": "docs-artifacts", "doc_type": "artifact"},
+                    {"source": "raw2.txt", "silo": "docs", "doc_type": "other"},
+                ],
             }
 
     class _FakeClient:
         def get_or_create_collection(self, **_kwargs):
             return _FakeCollection()
 
+    monkeypatch.setattr("query.retrieve_locked._artifact_stream_enabled", lambda _db, _silo: True)
+    monkeypatch.setattr("query.retrieve_locked.get_embedding_function", lambda batch_size=1: None)
+
+    result = execute_retrieve_chroma_phase(
+        db=str(tmp_path),
+        intent="LOOKUP",
+        query="Revenue",
+        query_for_retrieval="Revenue",
+        silo_slug="docs",
+        n_stage1=6,
+        n_results=4,
+        section=None,
+        doc_type=None,
+        db_path=str(tmp_path),
+        get_chroma_client=lambda _db: _FakeClient(),
+    )
+    assert result["retrieval_method"] == "dual_stream_rrf"
+    # One vector query and one lexical pass cover both streams.
+    assert len(queries) == 1 and len(gets) == 1
+    assert queries[0]["where"] == {"silo": {"$in": ["docs", "docs-artifacts"]}}
+    assert queries[0]["n_results"] == 12
+    sources = {chunk["source"]: chunk["silo"] for chunk in result["chunks"]}
+    assert sources["artifact2.txt"] == "docs-artifacts"
+    assert sources["raw.txt"] == "docs"
+    lexical_hit = next(c for c in result["chunks"] if c["source"] == "raw2.txt")
+    assert lexical_hit["_signals"]["lexical_rank"] == 1
+
+
+def test_execute_retrieve_chroma_phase_passes_cached_query_embedding(monkeypatch):
+    seen: list[dict] = []
+
+    class _Ef:
+        model_name = "fake"
+        calls = 0
+
+        def __call__(self, docs):
+            _Ef.calls += 1
+            return [[0.5, 0.25] for _ in docs]
+
+    class _FakeClient:
+        def get_or_create_collection(self, **_kwargs):
+            return object()
+
     def _fake_safe_query(_collection, query_kw, _silo_slug, db_path=None):
-        where = query_kw.get("where") or {}
-        where_text = str(where)
-        if "docs-artifacts" in where_text:
-            return (
-                ["artifact chunk"],
-                [{"source": "artifact.txt", "silo": "docs-artifacts", "doc_type": "artifact"}],
-                [0.1],
-                ["aid1"],
-                None,
-            )
-        return (
-            ["raw chunk"],
-            [{"source": "raw.txt", "silo": "docs", "doc_type": "other"}],
-            [0.2],
-            ["rid1"],
-            None,
-        )
+        seen.append(dict(query_kw))
+        return (["raw chunk"], [{"source": "raw.txt", "silo": "docs"}], [0.2], ["rid1"], None)
 
     monkeypatch.setattr("query.retrieve_locked._safe_query", _fake_safe_query)
-    monkeypatch.setattr("query.retrieve_locked._artifact_stream_enabled", lambda _db, _silo: True)
+    monkeypatch.setattr("query.retrieve_locked._artifact_stream_enabled", lambda _db, _silo: False)
     monkeypatch.setattr(
         "query.retrieve_locked.run_hybrid_retrieve",
         lambda **kwargs: (kwargs["docs_v"], kwargs["metas_v"], kwargs["dists_v"], "vector_only"),
     )
-    monkeypatch.setattr("query.retrieve_locked.get_embedding_function", lambda batch_size=1: object())
+    ef = _Ef()
+    monkeypatch.setattr("query.retrieve_locked.get_embedding_function", lambda batch_size=1: ef)
 
-    result = execute_retrieve_chroma_phase(
+    for _ in range(2):
+        execute_retrieve_chroma_phase(
+            db="/tmp/db",
+            intent="LOOKUP",
+            query="revenue",
+            query_for_retrieval="revenue growth",
+            silo_slug="docs",
+            n_stage1=6,
+            n_results=4,
+            section=None,
+            doc_type=None,
+            db_path="/tmp/db",
+            get_chroma_client=lambda _db: _FakeClient(),
+        )
+    assert _Ef.calls == 1
+    assert all(kw["query_embeddings"] == [[0.5, 0.25]] for kw in seen)
+    assert all("query_texts" not in kw for kw in seen)
+
+
+def test_execute_retrieve_chroma_phase_many_issues_one_query_for_all_plans(monkeypatch):
+    seen: list[dict] = []
+
+    class _Ef:
+        model_name = "fake-many"
+
+        def __init__(self):
+            self.calls: list[list[str]] = []
+
+        def __call__(self, docs):
+            self.calls.append(list(docs))
+            return [[float(len(d)), 0.0] for d in docs]
+
+    class _FakeClient:
+        def get_or_create_collection(self, **_kwargs):
+            return object()
+
+    def _fake_safe_query_rows(_collection, query_kw, _silo_slug, db_path=None):
+        seen.append(dict(query_kw))
+        rows = []
+        for i, _emb in enumerate(query_kw["query_embeddings"]):
+            n = query_kw["n_results"]
+            rows.append((
+                [f"q{i} chunk {j}" for j in range(n)],
+                [{"source": f"q{i}-{j}.txt", "silo": "docs"} for j in range(n)],
+                [0.1 * (j + 1) for j in range(n)],
+                [f"q{i}-{j}" for j in range(n)],
+            ))
+        return rows, None
+
+    monkeypatch.setattr("query.retrieve_locked._safe_query_rows", _fake_safe_query_rows)
+    monkeypatch.setattr("query.retrieve_locked._artifact_stream_enabled", lambda _db, _silo: False)
+    monkeypatch.setattr(
+        "query.retrieve_locked.run_hybrid_retrieve",
+        lambda **kwargs: (kwargs["docs_v"], kwargs["metas_v"], kwargs["dists_v"], "vector_only"),
+    )
+    ef = _Ef()
+    monkeypatch.setattr("query.retrieve_locked.get_embedding_function", lambda batch_size=1: ef)
+
+    plans = [
+        {"intent": "LOOKUP", "query": "a", "query_for_retrieval": "alpha", "n_stage1": 2},
+        {"intent": "LOOKUP", "query": "b", "query_for_retrieval": "beta beta", "n_stage1": 4},
+    ]
+    results = execute_retrieve_chroma_phase_many(
         db="/tmp/db",
-        intent="LOOKUP",
-        query="revenue",
-        query_for_retrieval="revenue",
+        plans=plans,
         silo_slug="docs",
-        n_stage1=6,
         n_results=4,
         section=None,
         doc_type=None,
         db_path="/tmp/db",
         get_chroma_client=lambda _db: _FakeClient(),
     )
-    assert result["retrieval_method"] == "dual_stream_rrf"
-    silos = {chunk["silo"] for chunk in result["chunks"]}
-    assert "docs" in silos
-    assert "docs-artifacts" in silos
+    assert ef.calls == [["alpha", "beta beta"]]
+    assert len(seen) == 1 and seen[0]["n_results"] == 4
+    assert [len(r["chunks"]) for r in results] == [2, 4]
+    assert all(c["text"].startswith("q0") for c in results[0]["chunks"])
+    assert all(c["text"].startswith("q1") for c in results[1]["chunks"])
+
+
+def test_execute_retrieve_chroma_phase_many_reranks_all_queries_in_one_batch(monkeypatch):
+    import reranker
+
+    class _Model:
+        def __init__(self):
+            self.calls: list[list[list[str]]] = []
+
+        def predict(self, pairs, batch_size=32):
+            self.calls.append(pairs)
+            # Later chunks score higher, so reranking reverses the vector order.
+            return [float(doc.rsplit(" ", 1)[-1]) for _q, doc in pairs]
+
+    class _FakeClient:
+        def get_or_create_collection(self, **_kwargs):
+            return object()
+
+    def _fake_safe_query_rows(_collection, query_kw, _silo_slug, db_path=None):
+        n = query_kw["n_results"]
+        rows = [
+            (
+                [f"q{i} chunk {j}" for j in range(n)],
+                [{"source": f"q{i}-{j}.txt", "silo": "docs", "_signals": {}} for j in range(n)],
+                [0.1 * (j + 1) for j in range(n)],
+                [f"q{i}-{j}" for j in range(n)],
+            )
+            for i in range(len(query_kw["query_texts"]))
+        ]
+        return rows, None
+
+    model = _Model()
+    reranker._reset_rerank_cache_for_tests()
+    monkeypatch.setattr("reranker._get_model", lambda *_args: model)
+    monkeypatch.setattr("query.retrieve_locked._safe_query_rows", _fake_safe_query_rows)
+    monkeypatch.setattr("query.retrieve_locked._artifact_stream_enabled", lambda _db, _silo: False)
+    monkeypatch.setattr(
+        "query.retrieve_locked.run_hybrid_retrieve",
+        lambda **kwargs: (kwargs["docs_v"], kwargs["metas_v"], kwargs["dists_v"], "vector_only"),
+    )
+    monkeypatch.setattr("query.retrieve_locked.get_embedding_function", lambda batch_size=1: None)
+
+    plans = [
+        {"intent": "LOOKUP", "query": "a", "query_for_retrieval": "alpha", "n_stage1": 3},
+        {"intent": "LOOKUP", "query": "b", "query_for_retrieval": "beta", "n_stage1": 3},
+    ]
+    results = execute_retrieve_chroma_phase_many(
+        db="/tmp/db",
+        plans=plans,
+        silo_slug="docs",
+        n_results=2,
+        section=None,
+        doc_type=None,
+        db_path="/tmp/db",
+        get_chroma_client=lambda _db: _FakeClient(),
+        use_reranker=True,
+    )
+    assert len(model.calls) == 1 and len(model.calls[0]) == 6
+    assert [c["text"] for c in results[0]["chunks"]] == ["q0 chunk 2", "q0 chunk 1"]
+    assert [c["text"] for c in results[1]["chunks"]] == ["q1 chunk 2", "q1 chunk 1"]
+    assert results[0]["rerank"] == "applied"
+    assert results[0]["chunks"][0]["_signals"]["rerank_score"] == 2.0
+    reranker._reset_rerank_cache_for_tests()
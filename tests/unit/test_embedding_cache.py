@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+import ingest
+from embedding_cache import (
+    EmbeddingCache,
+    embedding_cache_stats,
+    open_embedding_cache,
+    prune_embedding_cache,
+    text_key,
+)
+
+
+class _CountingEf:
+    model_name = "fake-model"
+
+    def __init__(self, dim: int = 4) -> None:
+        self.dim = dim
+        self.calls: list[list[str]] = []
+
+    def __call__(self, docs: list[str]) -> list[np.ndarray]:
+        self.calls.append(list(docs))
+        return [np.full(self.dim, float(len(doc)), dtype=np.float32) for doc in docs]
+
+
+class _FakeCollection:
+    def __init__(self) -> None:
+        self.adds: list[dict[str, Any]] = []
+
+    def add(self, **kwargs: Any) -> None:
+        self.adds.append(kwargs)
+
+    def get(self, ids: list[str], include: list[str] | None = None) -> dict[str, Any]:
+        return {"ids": list(ids)}
+
+
+def test_text_key_matches_ingest_chunk_hash() -> None:
+    assert text_key("alpha beta") == ingest._chunk_hash("alpha beta")
+
+
+def test_embed_reuses_cached_vectors_across_instances(tmp_path: Path) -> None:
+    ef = _CountingEf()
+    cache = open_embedding_cache(tmp_path, ef)
+    assert cache is not None
+    first = cache.embed(["a", "bb", "ccc"], ef)
+    assert ef.calls == [["a", "bb", "ccc"]]
+
+    reopened = open_embedding_cache(tmp_path, ef)
+    assert reopened is not None
+    second = reopened.embed(["bb", "dddd", "a"], ef)
+    assert ef.calls[-1] == ["dddd"]
+    assert np.allclose(second[0], first[1])
+    assert np.allclose(second[2], first[0])
+    assert reopened.hits == 2 and reopened.misses == 1
+
+    stats = embedding_cache_stats(tmp_path)
+    assert stats["entries"] == 4
+    assert stats["hits"] == 2
+    assert stats["models"][0]["dim"] == 4
+
+
+def test_cache_is_keyed_by_model(tmp_path: Path) -> None:
+    ef = _CountingEf()
+    EmbeddingCache(tmp_path / "c", "model-a").embed(["same text"], ef)
+    EmbeddingCache(tmp_path / "c", "model-b").embed(["same text"], ef)
+    assert len(ef.calls) == 2
+
+
+def test_open_embedding_cache_respects_disable_env(monkeypatch: Any, tmp_path: Path) -> None:
+    monkeypatch.setenv("LLMLIBRARIAN_EMBED_CACHE", "0")
+    assert open_embedding_cache(tmp_path, _CountingEf()) is None
+    monkeypatch.delenv("LLMLIBRARIAN_EMBED_CACHE")
+    assert open_embedding_cache(tmp_path, None) is None
+
+
+def test_store_evicts_least_recently_used_past_cap(tmp_path: Path) -> None:
+    ef = _CountingEf(dim=4)
+    row_bytes = 16
+    cache = EmbeddingCache(tmp_path / "c", "m", max_bytes=row_bytes * 3)
+    cache.embed(["a", "b", "c"], ef)
+    cache.lookup([text_key("a")])  # "a" becomes most recently used
+    cache.embed(["d"], ef)
+
+    remaining = cache.lookup([text_key(t) for t in "abcd"])
+    assert text_key("a") in remaining
+    assert text_key("d") in remaining
+    assert text_key("b") not in remaining
+    assert sum(p.stat().st_size for p in (tmp_path / "c").glob("*.f32")) <= row_bytes * 3
+    # Compaction renumbered slots without mixing up vectors.
+    assert np.allclose(remaining[text_key("a")], np.full(4, 1.0))
+
+
+def test_prune_all_and_by_size(tmp_path: Path) -> None:
+    ef = _CountingEf(dim=8)
+    cache = open_embedding_cache(tmp_path, ef)
+    assert cache is not None
+    cache.embed([f"doc {i}" for i in range(10)], ef)
+
+    result = prune_embedding_cache(tmp_path, max_bytes=8 * 4 * 4)
+    assert result["removed"] == 6
+    assert embedding_cache_stats(tmp_path)["entries"] == 4
+    assert result["bytes_after"] == 8 * 4 * 4
+
+    result = prune_embedding_cache(tmp_path, clear=True)
+    assert result["removed"] == 4
+    assert result["bytes_after"] == 0
+    assert embedding_cache_stats(tmp_path)["entries"] == 0
+
+
+def test_batch_add_embeds_only_cache_misses(tmp_path: Path) -> None:
+    ef = _CountingEf()
+    cache = open_embedding_cache(tmp_path, ef)
+    chunks = [
+        ("id1", "one", {"source": "a"}),
+        ("id2", "two two", {"source": "a"}),
+    ]
+    col = _FakeCollection()
+    ingest._batch_add(col, chunks, batch_size=10, quiet=True, embedding_fn=ef, embedding_cache=cache)
+    assert ef.calls == [["one", "two two"]]
+    assert len(col.adds[0]["embeddings"]) == 2
+
+    more = chunks + [("id3", "three", {"source": "b"})]
+    ingest._batch_add(col, more, batch_size=10, quiet=True, embedding_fn=ef, embedding_workers=2, embedding_cache=cache)
+    assert ef.calls[-1] == ["three"]
+    assert [len(v) for v in col.adds[-1]["embeddings"]] == [4, 4, 4]
+
+
+def test_batch_add_without_cache_lets_collection_embed(tmp_path: Path) -> None:
+    ef = _CountingEf()
+    col = _FakeCollection()
+    ingest._batch_add(col, [("id1", "one", {})], batch_size=10, quiet=True, embedding_fn=ef)
+    assert ef.calls == []
+    assert "embeddings" not in col.adds[0]
+
+
+def test_llmli_cache_stats_and_prune_commands(monkeypatch: Any, capsys: Any, tmp_path: Path) -> None:
+    import sys
+
+    import cli
+
+    ef = _CountingEf()
+    cache = open_embedding_cache(tmp_path, ef)
+    assert cache is not None
+    cache.embed(["x", "y"], ef)
+
+    monkeypatch.setattr(sys, "argv", ["llmli", "--db", str(tmp_path), "cache", "stats"])
+    assert cli.main() == 0
+    out = capsys.readouterr().out
+    assert "2 entries" in out
+    assert "fake-model [4d]" in out
+
+    monkeypatch.setattr(sys, "argv", ["llmli", "--db", str(tmp_path), "cache", "prune", "--all"])
+    assert cli.main() == 0
+    assert "Removed 2 entries" in capsys.readouterr().out
@@ -207,3 +207,57 @@ def test_best_device_falls_back_to_cpu_without_torch(monkeypatch: Any) -> None:
 
     assert _best_device(batch_size=100) == "cpu"
 
+
+
+class _CountingQueryEf:
+    def __init__(self, model_name: str = "fake-query-model") -> None:
+        self.model_name = model_name
+        self.calls: list[list[str]] = []
+
+    def __call__(self, docs: list[str]) -> list[list[float]]:
+        self.calls.append(list(docs))
+        return [[float(len(d)), 1.0] for d in docs]
+
+
+def test_embed_query_serves_repeat_queries_from_cache(monkeypatch: Any) -> None:
+    from embeddings import embed_query, query_embedding_cache_info
+
+    monkeypatch.delenv("LLMLIBRARIAN_QUERY_EMBED_CACHE_SIZE", raising=False)
+    ef = _CountingQueryEf()
+    first = embed_query("what  did I plant\nin may", ef)
+    second = embed_query("what did I plant in may ", ef)
+    assert first == second
+    assert ef.calls == [["what did I plant in may"]]
+    info = query_embedding_cache_info()
+    assert info["hits"] == 1 and info["misses"] == 1 and info["size"] == 1
+
+    other_model = _CountingQueryEf(model_name="other-model")
+    embed_query("what did I plant in may", other_model)
+    assert len(other_model.calls) == 1
+
+
+def test_embed_query_cache_is_bounded_and_can_be_disabled(monkeypatch: Any) -> None:
+    from embeddings import embed_query, query_embedding_cache_info
+
+    monkeypatch.setenv("LLMLIBRARIAN_QUERY_EMBED_CACHE_SIZE", "2")
+    ef = _CountingQueryEf()
+    for q in ("a", "b", "c", "a"):
+        embed_query(q, ef)
+    assert query_embedding_cache_info()["size"] == 2
+    assert len(ef.calls) == 4  # "a" was evicted by "c"
+
+    monkeypatch.setenv("LLMLIBRARIAN_QUERY_EMBED_CACHE_SIZE", "0")
+    embed_query("c", ef)
+    embed_query("c", ef)
+    assert len(ef.calls) == 6
+
+
+def test_embed_queries_batches_misses_into_one_call(monkeypatch: Any) -> None:
+    from embeddings import embed_queries
+
+    monkeypatch.delenv("LLMLIBRARIAN_QUERY_EMBED_CACHE_SIZE", raising=False)
+    ef = _CountingQueryEf()
+    embed_queries(["cached"], ef)
+    vectors = embed_queries(["alpha", "cached", "bb", "alpha"], ef)
+    assert ef.calls == [["cached"], ["alpha", "bb"]]
+    assert vectors == [[5.0, 1.0], [6.0, 1.0], [2.0, 1.0], [5.0, 1.0]]
@@ -10,3 +10,29 @@ def test_get_file_hash_changes_with_content(tmp_path):
     assert h1
     assert h2
     assert h1 != h2
+
+
+def test_full_fingerprint_sees_edits_past_prefix(tmp_path):
+    from ingest import get_file_fingerprint
+
+    p = tmp_path / "big.bin"
+    p.write_bytes(b"a" * 20000)
+    prefix_before = get_file_fingerprint(p, "prefix")
+    full_before = get_file_fingerprint(p, "full")
+    p.write_bytes(b"a" * 19999 + b"b")
+    assert get_file_fingerprint(p, "prefix") == prefix_before
+    full_after = get_file_fingerprint(p, "full")
+    assert full_after != full_before
+    assert full_after.split(":", 1)[0] in {"b3", "xxh3", "b2"}
+
+
+def test_fingerprint_mode_follows_manifest_hash_tag(monkeypatch):
+    import pytest
+    from ingest import _resolve_fingerprint_mode
+
+    monkeypatch.delenv("LLMLIBRARIAN_FINGERPRINT", raising=False)
+    assert _resolve_fingerprint_mode(None, "d41d8cd98f00b204e9800998ecf8427e") == "prefix"
+    assert _resolve_fingerprint_mode(None, "b2:abc") == "full"
+    assert _resolve_fingerprint_mode("prefix", "b2:abc") == "prefix"
+    with pytest.raises(ValueError):
+        _resolve_fingerprint_mode("sha1")
@@ -2,23 +2,33 @@
 
 ``llmli_file_registry.json`` used to hold the same facts in an inverted shape,
 written under a separate lock in a separate call. Nothing reconciled the two and
-they drifted. The hash index is now derived from the manifest in memory, so the
-two stores cannot disagree — there is only one store.
+they drifted. The hash index is now an index on the manifest store itself, so
+the two cannot disagree — there is only one store.
 """
 
 from __future__ import annotations
 
 import json
+import sqlite3
 
 import pytest
 
 from file_registry import (
+    _delete_manifest_files,
+    _file_manifest_path,
     _file_registry_get,
+    _get_manifest_file,
     _legacy_registry_path,
+    _read_file_manifest,
     _read_file_registry,
     _registry_from_manifest,
+    _update_file_manifest,
+    _upsert_manifest_file,
     _write_file_manifest,
+    export_file_manifest_json,
     get_paths_by_silo,
+    manifest_session,
+    sample_paths_by_silo,
 )
 from silo_audit import load_file_registry
 
@@ -128,13 +138,8 @@ def test_derived_registry_cache_tracks_manifest_writes(tmp_path):
 
 
 def test_cache_invalidates_on_out_of_band_manifest_change(tmp_path):
-    """Another process writing the manifest must not leave us on a stale index.
-
-    In-process invalidation cannot see that write, so the cache key is
-    (mtime_ns, size) of the manifest file itself.
-    """
-    from file_registry import _file_manifest_path
-
+    """A JSON manifest written by another (older) process must not leave us on a
+    stale index: it is imported into the store on the next access."""
     db = tmp_path / "db"
     _seed_manifest(db, {"docs": {"files": {"/x/a.md": {"hash": "old"}}}})
     assert _file_registry_get(db, "old")
@@ -148,6 +153,108 @@ def test_cache_invalidates_on_out_of_band_manifest_change(tmp_path):
     assert _file_registry_get(db, "external") == [{"silo": "docs", "path": "/x/a.md"}]
 
 
+def test_manifest_session_reuses_one_connection(tmp_path, monkeypatch):
+    db = tmp_path / "db"
+    _seed_manifest(db, {"docs": {"path": "/x", "files": {"/x/a.md": {"hash": "h1"}}}})
+    opened: list[str] = []
+    real_connect = sqlite3.connect
+    monkeypatch.setattr(sqlite3, "connect", lambda path, **kw: opened.append(path) or real_connect(path, **kw))
+
+    with manifest_session(db):
+        assert _get_manifest_file(db, "docs", "/x/a.md")["hash"] == "h1"
+        _upsert_manifest_file(db, "docs", "/x/b.md", {"hash": "h2"})
+        with manifest_session(db):
+            assert set(_read_file_manifest(db)["silos"]["docs"]["files"]) == {"/x/a.md", "/x/b.md"}
+    assert len(opened) == 1
+
+    assert _get_manifest_file(db, "docs", "/x/b.md")["hash"] == "h2"
+    assert len(opened) == 2
+
+
+def test_legacy_json_manifest_is_imported_once_and_retired(tmp_path):
+    db = tmp_path / "db"
+    db.mkdir()
+    legacy = _file_manifest_path(db)
+    legacy.write_text(
+        json.dumps({"silos": {"docs": {"path": "/x", "files": {"/x/a.md": {"mtime": 1.0, "hash": "h1"}}}}}),
+        encoding="utf-8",
+    )
+
+    assert _read_file_manifest(db) == {
+        "silos": {"docs": {"path": "/x", "files": {"/x/a.md": {"mtime": 1.0, "hash": "h1"}}}}
+    }
+    assert not legacy.exists()
+    assert legacy.with_name(legacy.name + ".migrated").exists()
+
+    _upsert_manifest_file(db, "docs", "/x/b.md", {"hash": "h2"})
+    assert set(_read_file_manifest(db)["silos"]["docs"]["files"]) == {"/x/a.md", "/x/b.md"}
+
+
+def test_row_level_upsert_and_delete_leave_other_rows_alone(tmp_path):
+    db = tmp_path / "db"
+    _seed_manifest(
+        db,
+        {
+            "docs": {"path": "/x", "files": {"/x/a.md": {"hash": "h1"}}},
+            "notes": {"path": "/y", "files": {"/y/a.md": {"hash": "h1"}}},
+        },
+    )
+
+    _upsert_manifest_file(db, "docs", "/x/a.md", {"hash": "h9", "name_date": "2024-01-02"})
+    assert _get_manifest_file(db, "docs", "/x/a.md") == {"hash": "h9", "name_date": "2024-01-02"}
+    assert _file_registry_get(db, "h1") == [{"silo": "notes", "path": "/y/a.md"}]
+
+    assert _delete_manifest_files(db, "docs", ["/x/a.md", "/x/missing.md"]) == 1
+    assert _get_manifest_file(db, "docs", "/x/a.md") is None
+    assert _read_file_manifest(db)["silos"]["notes"]["files"] == {"/y/a.md": {"hash": "h1"}}
+
+
+def test_scoped_update_does_not_touch_other_silos(tmp_path):
+    db = tmp_path / "db"
+    _seed_manifest(
+        db,
+        {
+            "docs": {"path": "/x", "files": {"/x/a.md": {"hash": "h1"}}},
+            "notes": {"path": "/y", "files": {"/y/a.md": {"hash": "h2"}}},
+        },
+    )
+    seen: list[str] = []
+
+    def _update(manifest):
+        seen.extend(manifest["silos"].keys())
+        manifest["silos"]["docs"]["files"] = {"/x/b.md": {"hash": "h3"}}
+
+    _update_file_manifest(db, _update, silos=["docs"])
+
+    assert seen == ["docs"]
+    assert get_paths_by_silo(db) == {"docs": {"/x/b.md"}, "notes": {"/y/a.md"}}
+    assert _file_registry_get(db, "h1") == []
+
+
+def test_export_writes_legacy_shape_without_reimport(tmp_path):
+    db = tmp_path / "db"
+    manifest = {"silos": {"docs": {"path": "/x", "files": {"/x/a.md": {"hash": "h1"}}}}}
+    _seed_manifest(db, manifest["silos"])
+
+    out = export_file_manifest_json(db)
+
+    assert out != _file_manifest_path(db)
+    assert json.loads(out.read_text(encoding="utf-8")) == manifest
+    assert _read_file_manifest(db) == manifest
+
+
+def test_sample_paths_by_silo_is_bounded_and_path_ordered(tmp_path):
+    db = tmp_path / "db"
+    _seed_manifest(
+        db,
+        {
+            "docs": {"files": {"/x/c": {"hash": "1"}, "/x/a": {"hash": "2"}, "/x/b": {"hash": "3"}}},
+            "notes": {"files": {"/y/z": {"hash": "4"}}},
+        },
+    )
+    assert sample_paths_by_silo(db, 2) == {"docs": ["/x/a", "/x/b"], "notes": ["/y/z"]}
+
+
 def test_missing_manifest_yields_empty_index(tmp_path):
     db = tmp_path / "db"
     db.mkdir()
@@ -0,0 +1,127 @@
+import hashlib
+import threading
+import time
+
+import processors
+from image_summary_queue import ImageSummaryQueue, open_image_summary_queue, read_cached_summary
+from processors import ImageProcessor
+
+
+def _text_heavy_ocr(monkeypatch):
+    monkeypatch.setattr(
+        processors,
+        "_ocr_image_file_detailed",
+        lambda _data, _source, ocr_mode="image_file": processors._OCRResult(
+            text="They really put me to work.\nMANDALAY BAY CONVENTION CENTER",
+            backend="vision",
+            observations=(
+                {"text": "They really put me to work.", "x": 0.1, "y": 0.8, "w": 0.6, "h": 0.08},
+                {"text": "MANDALAY BAY CONVENTION CENTER", "x": 0.1, "y": 0.68, "w": 0.7, "h": 0.09},
+            ),
+        ),
+    )
+
+
+def test_extract_defers_eager_summary_to_the_queue(monkeypatch):
+    _text_heavy_ocr(monkeypatch)
+
+    def _no_vision(*_args, **_kwargs):
+        raise AssertionError("deferred extraction must not call the vision model")
+
+    monkeypatch.setattr(processors, "_summarize_image_with_vision_model", _no_vision)
+    out = ImageProcessor().extract(b"image-bytes", "badge.png", defer_summary=True)
+
+    key = hashlib.sha256(b"image-bytes").hexdigest()
+    assert out.meta["summary_status"] == "deferred"
+    assert out.meta["vision_summary_key"] == key
+    assert out.artifact["content_sha256"] == key
+    assert "MANDALAY BAY" in out.visible_text
+
+
+def test_queue_keeps_model_warm_until_drained_and_caches_by_content(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLMLIBRARIAN_VISION_MODEL", "llava:test")
+    images = []
+    for name in ("a.png", "b.png"):
+        path = tmp_path / name
+        path.write_bytes(name.encode())
+        images.append((hashlib.sha256(name.encode()).hexdigest(), str(path)))
+    gate = threading.Event()
+    calls: list[tuple[str, object]] = []
+
+    def _summarize(_data, source_path, _visible, *, keep_alive=0):
+        calls.append((source_path, keep_alive))
+        return f"summary of {source_path}", "llava:test"
+
+    monkeypatch.setattr(processors, "_summarize_image_with_vision_model", _summarize)
+    queue = ImageSummaryQueue(tmp_path / "db")
+    queue._executor.submit(gate.wait, 5)  # occupy the single worker until both jobs are queued
+    futures = [queue.submit(key, path) for key, path in images]
+    assert queue.submit(*images[0]) is futures[0]
+    assert len(list((tmp_path / "db" / "image_artifacts" / "summary_queue").glob("*.json"))) == 2
+    gate.set()
+
+    assert [f.result(5)[0] for f in futures] == [f"summary of {path}" for _key, path in images]
+    assert [keep_alive for _src, keep_alive in calls] == ["5m", 0]
+    assert not list((tmp_path / "db" / "image_artifacts" / "summary_queue").glob("*.json"))
+    assert read_cached_summary(tmp_path / "db", images[1][0]) == (f"summary of {images[1][1]}", "llava:test")
+
+    again = queue.submit(*images[1])
+    assert again.done() and len(calls) == 2
+    queue.close()
+
+
+def test_open_resumes_jobs_left_by_an_interrupted_run(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLMLIBRARIAN_VISION_MODEL", "llava:test")
+    image = tmp_path / "left.png"
+    image.write_bytes(b"left")
+    key = hashlib.sha256(b"left").hexdigest()
+    jobs = tmp_path / "db" / "image_artifacts" / "summary_queue"
+    jobs.mkdir(parents=True)
+    (jobs / f"{key}.json").write_text(f'{{"key": "{key}", "source_path": "{image}"}}', encoding="utf-8")
+    monkeypatch.setattr(
+        processors, "_summarize_image_with_vision_model", lambda *_a, **_k: ("resumed summary", "llava:test")
+    )
+
+    queue = open_image_summary_queue(tmp_path / "db")
+    try:
+        assert queue.submit(key, str(image)).result(5) == ("resumed summary", "llava:test")
+    finally:
+        queue.close()
+    assert read_cached_summary(tmp_path / "db", key) == ("resumed summary", "llava:test")
+
+
+
+def test_resumed_jobs_wait_until_submitted_jobs_drain(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLMLIBRARIAN_VISION_MODEL", "llava:test")
+    jobs = tmp_path / "db" / "image_artifacts" / "summary_queue"
+    jobs.mkdir(parents=True)
+    images = {}
+    for name in ("old1", "old2", "new"):
+        path = tmp_path / f"{name}.png"
+        path.write_bytes(name.encode())
+        images[name] = (hashlib.sha256(name.encode()).hexdigest(), str(path))
+    for name in ("old1", "old2"):
+        key, path = images[name]
+        (jobs / f"{key}.json").write_text(f'{{"key": "{key}", "source_path": "{path}"}}', encoding="utf-8")
+    gate = threading.Event()
+    order: list[str] = []
+
+    def _summarize(_data, source_path, _visible, *, keep_alive=0):
+        gate.wait(5)
+        order.append(source_path)
+        return "summary", "llava:test"
+
+    monkeypatch.setattr(processors, "_summarize_image_with_vision_model", _summarize)
+    queue = ImageSummaryQueue(tmp_path / "db")
+    assert queue.resume_pending() == 2
+    current = queue.submit(*images["new"])
+    gate.set()
+
+    assert current.result(5) == ("summary", "llava:test")
+    deadline = time.monotonic() + 5
+    while queue.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # The backlog started one job while the queue sat idle; the rest waited for the run's job.
+    assert order[1] == images["new"][1] and len(order) == 3
+    assert {read_cached_summary(tmp_path / "db", images[name][0]) for name in ("old1", "old2")} == {("summary", "llava:test")}
+    queue.close()
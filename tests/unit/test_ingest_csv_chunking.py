@@ -1,3 +1,4 @@
+import os
 import zipfile
 from pathlib import Path
 import json
@@ -27,6 +28,20 @@ def test_process_one_file_csv_emits_row_chunks(tmp_path: Path):
     assert metas[0]["line_start"] == 2
 
 
+def test_csv_row_ids_survive_an_append(tmp_path: Path):
+    p = tmp_path / "log.csv"
+    p.write_text("when,what\n2024-01-01,boot\n2024-01-02,sync\n", encoding="utf-8")
+    before = [cid for cid, _doc, _meta in process_one_file(p, "code")]
+
+    with p.open("a", encoding="utf-8") as fh:
+        fh.write("2024-01-03,halt\n")
+    os.utime(p, (p.stat().st_atime, p.stat().st_mtime + 60))
+    after = [cid for cid, _doc, _meta in process_one_file(p, "code")]
+
+    assert after[:2] == before
+    assert len(after) == 3
+
+
 def test_process_zip_to_chunks_csv_uses_row_chunking(tmp_path: Path):
     zpath = tmp_path / "bundle.zip"
     with zipfile.ZipFile(zpath, "w") as zf:
@@ -74,6 +89,21 @@ def test_process_one_file_pdf_uses_single_extraction_pass(monkeypatch, tmp_path:
     assert chunks[0][2]["page"] == 1
 
 
+def test_pdf_page_ids_survive_a_resave(monkeypatch, tmp_path: Path):
+    p = tmp_path / "notes.pdf"
+    p.write_bytes(b"fake-pdf")
+    pages = [("Page one text", 1), ("Page two text", 2)]
+    monkeypatch.setattr(ingest.PDFProcessor, "extract", lambda self, data, source_path: list(pages))
+    before = [cid for cid, _doc, _meta in process_one_file(p, "pdf")]
+
+    pages[1] = ("Page two text, edited", 2)
+    os.utime(p, (p.stat().st_atime, p.stat().st_mtime + 60))
+    after = [cid for cid, _doc, _meta in process_one_file(p, "pdf")]
+
+    assert after[0] == before[0]
+    assert after[1] != before[1]
+
+
 def test_process_one_file_transcript_pdf_emits_course_row_chunks(monkeypatch, tmp_path: Path):
     p = tmp_path / "Uccs_Transcript.pdf"
     p.write_bytes(b"fake-transcript")
@@ -178,14 +208,35 @@ def test_process_one_file_non_transcript_pdf_does_not_emit_transcript_rows(monke
     assert chunks[0][2].get("record_type") is None
 
 
+def test_process_one_file_maps_pdfs_instead_of_reading_them(monkeypatch, tmp_path: Path):
+    p = tmp_path / "statement.pdf"
+    p.write_bytes(b"fake-statement")
+
+    seen: list[type] = []
+
+    def _fake_extract(self, data, source_path):
+        seen.append(type(data))
+        assert bytes(data) == b"fake-statement"
+        return [("Monthly statement", 1)]
+
+    monkeypatch.setattr(ingest.PDFProcessor, "extract", _fake_extract)
+    chunks = process_one_file(p, "pdf")
+    assert [doc for _cid, doc, _meta in chunks] == ["Monthly statement"]
+    process_one_file(p, "pdf", map_pdf=False)
+    monkeypatch.setenv("LLMLIBRARIAN_PDF_MMAP", "0")
+    process_one_file(p, "pdf")
+    assert seen == [memoryview, bytes, bytes]
+
+
 def test_process_one_file_image_emits_ocr_metadata(monkeypatch, tmp_path: Path):
     p = tmp_path / "w2.png"
     p.write_bytes(b"fake-image")
 
-    def _fake_extract(self, data, source_path, *, enable_multimodal=True):
+    def _fake_extract(self, data, source_path, *, enable_multimodal=True, defer_summary=False):
         assert data == b"fake-image"
         assert source_path == str(p.resolve())
         assert enable_multimodal is True
+        assert defer_summary is False
         return ExtractedImage(
             summary="Image summary: W-2 wage statement",
             visible_text="Form W-2 Wage and Tax Statement\nEmployer: YMCA\nBox 1 of W-2: 4,626.76",
@@ -222,3 +222,36 @@ def test_render_systemd_unit_contains_restart_and_logs(tmp_path: Path):
     assert "RestartSec=15" in unit
     assert "StandardOutput=append:" in unit
     assert "ExecStart=/tmp/venv/bin/python /tmp/repo/pal.py pull /tmp/docs --watch --interval 60 --debounce 30" in unit
+
+
+def test_watch_hub_job_renders_one_pathless_watch_service(tmp_path: Path):
+    jobs = [
+        jobs_runtime.JobSpec(
+            id=f"watch_silo:{slug}",
+            kind="watch_silo",
+            slug=slug,
+            source_path=f"/tmp/{slug}",
+            service_name=f"llmlibrarian-watch-{slug}.service",
+            log_path=str(tmp_path / f"{slug}.log"),
+            interval=interval,
+            debounce=30,
+        )
+        for slug, interval in (("docs", 3600), ("notes", 600))
+    ]
+    hub = jobs_runtime.watch_hub_job(jobs, pal_home=tmp_path / ".pal", manager="systemd")
+    assert hub is not None
+    assert hub.service_name == "llmlibrarian-watch-all-silos.service"
+    assert hub.interval == 600
+    assert jobs_runtime.watch_hub_job([], pal_home=tmp_path, manager="systemd") is None
+
+    unit = jobs_runtime.render_systemd_unit(
+        hub, python_executable="/tmp/python", pal_path="/tmp/pal.py", workdir="/tmp", env={}
+    )
+    assert "Description=llmLibrarian watch all silos" in unit
+    assert "ExecStart=/tmp/python /tmp/pal.py pull --watch --interval 600 --debounce 30" in unit
+    payload = plistlib.loads(
+        jobs_runtime.render_launchd_plist(
+            hub, python_executable="/tmp/python", pal_path="/tmp/pal.py", workdir="/tmp", env={}
+        ).encode("utf-8")
+    )
+    assert payload["ProgramArguments"][2:] == ["pull", "--watch", "--interval", "600", "--debounce", "30"]
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import ingest
+from lexical_index import LexicalIndex, open_lexical_index, tokenize
+from query.retrieval import run_hybrid_retrieve
+
+
+def _meta(silo: str, source: str, **extra: Any) -> dict[str, Any]:
+    return {"silo": silo, "source": source, **extra}
+
+
+class _GetCollection:
+    """Serves get(ids=...) from a dict and records every get() call."""
+
+    def __init__(self, rows: dict[str, tuple[str, dict[str, Any]]]) -> None:
+        self.rows = rows
+        self.gets: list[dict[str, Any]] = []
+
+    def get(self, **kwargs: Any) -> dict[str, Any]:
+        self.gets.append(kwargs)
+        if "ids" in kwargs:
+            ids = [i for i in kwargs["ids"] if i in self.rows]
+        else:
+            where = kwargs.get("where") or {}
+            ids = [i for i, (_d, m) in self.rows.items() if m.get("silo") == where.get("silo")]
+            offset = int(kwargs.get("offset") or 0)
+            ids = ids[offset : offset + int(kwargs.get("limit") or len(ids))]
+        return {
+            "ids": ids,
+            "documents": [self.rows[i][0] for i in ids],
+            "metadatas": [self.rows[i][1] for i in ids],
+        }
+
+
+def _ready_index(tmp_path: Path, rows: dict[str, tuple[str, dict[str, Any]]]) -> LexicalIndex:
+    index = open_lexical_index(tmp_path)
+    assert index is not None
+    for silo in {m["silo"] for _d, m in rows.values()}:
+        index.reset_silo(silo)
+    index.add((cid, doc, meta) for cid, (doc, meta) in rows.items())
+    return index
+
+
+def test_tokenize_case_folds_and_keeps_numbers() -> None:
+    assert tokenize("Revenue GREW 12.5% in Q3, a 10:30 call") == ["revenue", "grew", "12.5", "in", "q3", "10:30", "call"]
+
+
+def test_search_ranks_by_bm25_and_ignores_case(tmp_path: Path) -> None:
+    index = _ready_index(
+        tmp_path,
+        {
+            "a": ("Tomato seedlings and one more tomato", _meta("garden", "/g/a.md")),
+            "b": ("Notes on basil", _meta("garden", "/g/b.md")),
+            "c": ("A tomato mention among many many other words here", _meta("garden", "/g/c.md")),
+        },
+    )
+    ranked = index.search(["TOMATO"], ["garden"], limit=10)
+    assert ranked is not None
+    assert [cid for cid, _score in ranked] == ["a", "c"]
+
+
+def test_search_returns_none_until_silo_is_ready(tmp_path: Path) -> None:
+    index = open_lexical_index(tmp_path)
+    assert index is not None
+    index.add([("a", "tomato", _meta("garden", "/g/a.md"))])
+    assert index.search(["tomato"], ["garden"], limit=5) is None
+    index.mark_stale()
+    assert index.search(["tomato"], ["garden"], limit=5) is None
+
+
+def test_delete_source_and_replace_keep_stats_consistent(tmp_path: Path) -> None:
+    index = _ready_index(
+        tmp_path,
+        {
+            "a": ("tomato tomato", _meta("garden", "/g/a.md")),
+            "b": ("tomato basil", _meta("garden", "/g/b.md")),
+            "z": ("tomato in archive", _meta("garden", "/g/notes.zip#x.md", zip_path="/g/notes.zip")),
+        },
+    )
+    assert index.delete_source("garden", "/g/notes.zip") == 1
+    assert index.delete_source("garden", "/g/a.md") == 1
+    index.add([("b", "basil only", _meta("garden", "/g/b.md"))])
+    assert index.search(["tomato"], ["garden"], limit=5) == []
+    assert index.stats()["silos"] == [{"silo": "garden", "ready": True, "docs": 1, "tokens": 2}]
+
+
+def test_ensure_silo_backfills_from_collection(tmp_path: Path) -> None:
+    rows = {f"id{i}": (f"chunk {i} tomato", _meta("garden", f"/g/{i}.md")) for i in range(3)}
+    rows["other"] = ("tomato", _meta("kitchen", "/k/x.md"))
+    index = open_lexical_index(tmp_path)
+    assert index is not None
+    assert index.ensure_silo(_GetCollection(rows), "garden") is True
+    ranked = index.search(["tomato"], ["garden"], limit=10)
+    assert ranked is not None and sorted(cid for cid, _s in ranked) == ["id0", "id1", "id2"]
+
+
+def test_run_hybrid_retrieve_uses_index_ranks_for_lexical_leg(tmp_path: Path) -> None:
+    rows = {
+        "weak": ("tomato somewhere in a long long long paragraph of text", _meta("garden", "/g/weak.md")),
+        "strong": ("tomato tomato tomato", _meta("garden", "/g/strong.md")),
+        "vec": ("plants", _meta("garden", "/g/vec.md")),
+    }
+    index = _ready_index(tmp_path, rows)
+    collection = _GetCollection(rows)
+    docs, metas, _dists, method = run_hybrid_retrieve(
+        ids_v=["vec"],
+        docs_v=["plants"],
+        metas_v=[dict(rows["vec"][1])],
+        dists_v=[0.3],
+        query_text="Tomato",
+        collection=collection,
+        where_filter={"silo": "garden"},
+        top_k=3,
+        lexical_index=index,
+    )
+    assert method == "hybrid"
+    assert all("where_document" not in kw for kw in collection.gets)
+    lexical_ranks = {m["source"]: m["_signals"]["lexical_rank"] for m in metas}
+    assert lexical_ranks["/g/strong.md"] == 1
+    assert lexical_ranks["/g/weak.md"] == 2
+
+
+def test_run_hybrid_retrieve_falls_back_to_scan_for_unindexed_silo(tmp_path: Path) -> None:
+    index = open_lexical_index(tmp_path)
+    collection = _GetCollection({})
+    run_hybrid_retrieve(
+        ids_v=["vec"],
+        docs_v=["plants"],
+        metas_v=[{"silo": "garden", "source": "/g/vec.md"}],
+        dists_v=[0.3],
+        query_text="tomato",
+        collection=collection,
+        where_filter={"silo": "garden"},
+        top_k=3,
+        lexical_index=index,
+    )
+    assert "where_document" in collection.gets[-1]
+
+
+def test_batch_add_and_source_delete_update_the_index(tmp_path: Path) -> None:
+    class _Collection:
+        def add(self, **_kwargs: Any) -> None:
+            return None
+
+        def get(self, ids: list[str], include: list[str] | None = None) -> dict[str, Any]:
+            return {"ids": list(ids)}
+
+        def delete(self, **_kwargs: Any) -> None:
+            return None
+
+    index = open_lexical_index(tmp_path)
+    assert index is not None
+    index.reset_silo("garden")
+    chunks = [
+        ("id1", "tomato notes", _meta("garden", "/g/a.md")),
+        ("id2", "basil notes", _meta("garden", "/g/b.md")),
+    ]
+    ingest._batch_add(_Collection(), chunks, batch_size=1, quiet=True, lexical_index=index)
+    assert index.search(["notes"], ["garden"], limit=5) is not None
+    assert len(index.search(["notes"], ["garden"], limit=5) or []) == 2
+
+    ingest._delete_source_from_collections(
+        collection=_Collection(),
+        image_collection=None,
+        silo_slug="garden",
+        source_path="/g/a.md",
+        lexical_index=index,
+    )
+    assert [cid for cid, _s in index.search(["notes"], ["garden"], limit=5) or []] == ["id2"]
+
+
+def test_search_scores_only_the_top_postings_per_term(tmp_path: Path, monkeypatch) -> None:
+    import lexical_index
+
+    rows = {f"d{i}": ("tomato " * (i + 1), _meta("garden", f"/g/{i}.md")) for i in range(6)}
+    index = _ready_index(tmp_path, rows)
+    monkeypatch.setattr(lexical_index, "MAX_POSTINGS_PER_TERM", 2)
+
+    ranked = index.search(["tomato"], ["garden"], limit=10)
+
+    assert ranked is not None
+    assert sorted(cid for cid, _score in ranked) == ["d4", "d5"]
+
+
+def test_indexed_lexical_candidates_keep_only_docs_with_the_phrase(tmp_path: Path) -> None:
+    from query.retrieval import lexical_candidates
+
+    rows = {
+        "phrase": ("Honestly I like   tea more than coffee", _meta("notes", "/n/a.md")),
+        "words": ("I would like to say I prefer nothing", _meta("notes", "/n/b.md")),
+        "single": ("My favorite mug", _meta("notes", "/n/c.md")),
+        "none": ("Unrelated text", _meta("notes", "/n/d.md")),
+    }
+    index = _ready_index(tmp_path, rows)
+
+    ids, _docs, _metas = lexical_candidates(
+        "",
+        _GetCollection(rows),
+        {"silo": "notes"},
+        lexical_phrases=["I like", "favorite"],
+        lexical_index=index,
+    )
+
+    assert sorted(ids) == ["phrase", "single"]
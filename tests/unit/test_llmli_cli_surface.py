@@ -30,6 +30,7 @@ def test_llmli_root_help_lists_all_subcommands(monkeypatch, capsys):
         "rehydrate",
         "capabilities",
         "log",
+        "cache",
         "eval-adversarial",
     ):
         assert cmd in out
@@ -54,3 +54,33 @@ def test_healthz_db_missing(mcp_module, monkeypatch, tmp_path):
         assert body["db_exists"] is False
 
     asyncio.run(_run())
+
+
+def test_model_warmup_loads_embedding_and_reranker(mcp_module, monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(mcp_module, "_warmup_state", {"status": "not_started"})
+    monkeypatch.setattr("embeddings.warm_embedding_function", lambda: calls.append("embedding"))
+    monkeypatch.setattr("reranker.is_reranker_enabled", lambda: True)
+
+    def _broken_reranker():
+        raise RuntimeError("no weights")
+
+    monkeypatch.setattr("reranker.warm_reranker", _broken_reranker)
+    monkeypatch.delenv("LLMLIBRARIAN_MCP_WARMUP", raising=False)
+
+    thread = mcp_module._start_model_warmup()
+    assert thread is not None
+    thread.join(timeout=5)
+
+    state = mcp_module._warmup_state
+    assert calls == ["embedding"]
+    assert state["status"] == "done"
+    assert state["steps"]["embedding"] == "ok"
+    assert state["steps"]["reranker"].startswith("error: RuntimeError")
+
+
+def test_model_warmup_can_be_disabled(mcp_module, monkeypatch):
+    monkeypatch.setattr(mcp_module, "_warmup_state", {"status": "not_started"})
+    monkeypatch.setenv("LLMLIBRARIAN_MCP_WARMUP", "0")
+    assert mcp_module._start_model_warmup() is None
+    assert mcp_module._warmup_state["status"] == "disabled"
@@ -1,6 +1,6 @@
 """Coverage for multi_query_knowledge merge/dedup/truncate/sort/error logic.
 
-The tool fans queries out to `run_retrieve`, then merges chunks by a
+The tool sends all queries through `run_retrieve_many`, then merges chunks by a
 text-prefix dedup key, sorts by score, caps at max_total_chunks, and
 collects per-query errors without aborting. These are the contract
 properties the LLM caller depends on, so we lock them down here.
@@ -26,18 +26,36 @@ def mcp(monkeypatch, tmp_path):
     return mcp_server
 
 
-def _install_run_retrieve(monkeypatch, by_query):
-    """Stub query.core.run_retrieve to return a canned mapping query→result."""
-    def _fake_run_retrieve(*, query, **_kwargs):
-        return by_query[query]
+def _as_many(run_retrieve):
+    """Batched stub built from a per-query stub: one entry per query, exceptions returned in place."""
+    def _fake_run_retrieve_many(*, queries, **kwargs):
+        out = []
+        for q in queries:
+            try:
+                out.append(run_retrieve(query=q, **kwargs))
+            except Exception as e:
+                out.append(e)
+        return out
+
+    return _fake_run_retrieve_many
+
 
+def _install_core(monkeypatch, run_retrieve):
     monkeypatch.setitem(
         sys.modules,
         "query.core",
-        SimpleNamespace(run_retrieve=_fake_run_retrieve),
+        SimpleNamespace(run_retrieve=run_retrieve, run_retrieve_many=_as_many(run_retrieve)),
     )
 
 
+def _install_run_retrieve(monkeypatch, by_query):
+    """Stub query.core.run_retrieve(_many) to return a canned mapping query→result."""
+    def _fake_run_retrieve(*, query, **_kwargs):
+        return by_query[query]
+
+    _install_core(monkeypatch, _fake_run_retrieve)
+
+
 def test_multi_query_db_missing(monkeypatch, tmp_path):
     import mcp_server
     monkeypatch.setattr(mcp_server, "_DB_PATH", str(tmp_path / "missing"))
@@ -121,11 +139,7 @@ def test_multi_query_per_query_errors_are_collected(monkeypatch, mcp):
             raise RuntimeError("mock failure")
         return {"chunks": [{"text": "ok", "score": 0.5}]}
 
-    monkeypatch.setitem(
-        sys.modules,
-        "query.core",
-        SimpleNamespace(run_retrieve=_fake_run_retrieve),
-    )
+    _install_core(monkeypatch, _fake_run_retrieve)
 
     res = mcp.multi_query_knowledge(["good", "boom", "good2"])
 
@@ -160,7 +174,7 @@ def test_multi_query_all_busy_sets_busy_flag(monkeypatch, mcp):
     def _boom(*, query, **_kwargs):
         raise ChromaLockTimeoutError("db busy")
 
-    monkeypatch.setitem(sys.modules, "query.core", SimpleNamespace(run_retrieve=_boom))
+    _install_core(monkeypatch, _boom)
 
     res = mcp.multi_query_knowledge(["a", "b"])
 
@@ -210,3 +224,41 @@ def test_multi_query_dedup_uses_first_200_chars(monkeypatch, mcp):
 
     res = mcp.multi_query_knowledge(["q"])
     assert res["total_chunks"] == 1
+
+
+def test_multi_query_takes_the_lock_once_for_all_queries(monkeypatch, mcp):
+    from contextlib import contextmanager
+
+    lock_calls: list[str] = []
+    batches: list[list[str]] = []
+
+    @contextmanager
+    def _lock(name, **_kw):
+        lock_calls.append(name)
+        yield
+
+    def _many(*, queries, **_kwargs):
+        batches.append(list(queries))
+        return [{"chunks": [{"text": f"hit for {q}", "score": 0.5}]} for q in queries]
+
+    monkeypatch.setattr(mcp, "_mcp_chroma_lock", _lock)
+    monkeypatch.setitem(sys.modules, "query.core", SimpleNamespace(run_retrieve_many=_many))
+
+    res = mcp.multi_query_knowledge(["a", "b", "c"])
+
+    assert lock_calls == ["multi_query_knowledge"]
+    assert batches == [["a", "b", "c"]]
+    assert res["total_chunks"] == 3
+
+
+def test_multi_query_batch_failure_reports_every_query(monkeypatch, mcp):
+    def _many(*, queries, **_kwargs):
+        raise RuntimeError("chroma down")
+
+    monkeypatch.setitem(sys.modules, "query.core", SimpleNamespace(run_retrieve_many=_many))
+
+    res = mcp.multi_query_knowledge(["a", "b"])
+
+    assert res["chunks"] == []
+    assert len(res["errors"]) == 2
+    assert all("chroma down" in e for e in res["errors"])
@@ -38,10 +38,11 @@ def _patch_state(monkeypatch, *, slug, silos):
     monkeypatch.setitem(sys.modules, "state", fake_state)
 
 
-def _patch_ingest(monkeypatch, *, update=None, remove=None):
+def _patch_ingest(monkeypatch, *, update=None, remove=None, batch=None):
     fake = SimpleNamespace(
         update_single_file=update or (lambda *a, **kw: ("updated", str(a[0]))),
         remove_single_file=remove or (lambda *a, **kw: ("removed", str(a[0]))),
+        update_files=batch or (lambda paths, **kw: [("updated", p) for p in paths]),
     )
     monkeypatch.setitem(sys.modules, "ingest", fake)
 
@@ -188,3 +189,48 @@ def test_remove_file_happy_path_calls_remove_single_file(monkeypatch, mcp_module
     assert res["silo"] == "docs-1"
     assert len(calls) == 1
     assert calls[0][2] == "docs-1"
+
+
+# ---------- update_files ----------
+
+
+def test_update_files_requires_confirm(mcp_module):
+    res = mcp_module.update_files("docs", ["/x"], confirm=False)
+    assert res["status"] == "not_started"
+
+
+def test_update_files_runs_one_batch_and_reports_outside_paths(monkeypatch, mcp_module, tmp_path):
+    silo_root = tmp_path / "silo"
+    silo_root.mkdir()
+    a = silo_root / "a.md"
+    b = silo_root / "b.md"
+    a.write_text("a", encoding="utf-8")
+    _patch_state(
+        monkeypatch,
+        slug="docs-1",
+        silos=[{"slug": "docs-1", "path": str(silo_root)}],
+    )
+    calls: list[dict] = []
+
+    def _fake_batch(paths, **kwargs):
+        calls.append({"paths": list(paths), **kwargs})
+        return [("updated", p) for p in paths] + [("removed", p) for p in kwargs["removals"]]
+
+    _patch_ingest(monkeypatch, batch=_fake_batch)
+
+    res = mcp_module.update_files(
+        "docs",
+        paths=[str(a), str(tmp_path / "outside.md")],
+        removed=[str(b)],
+        confirm=True,
+    )
+
+    assert res["status"] == "completed"
+    assert len(calls) == 1
+    assert calls[0]["paths"] == [str(a.resolve())]
+    assert calls[0]["removals"] == [str(b.resolve())]
+    assert calls[0]["silo_slug"] == "docs-1"
+    by_status = {r["path"]: r["status"] for r in res["results"]}
+    assert by_status[str(a.resolve())] == "updated"
+    assert by_status[str(b.resolve())] == "removed"
+    assert by_status[str(tmp_path / "outside.md")] == "error"
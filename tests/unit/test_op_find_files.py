@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from file_registry import _read_file_manifest
 from operations_find import op_find_files
 
 
@@ -118,8 +119,8 @@ def test_name_date_lazy_derive_from_path_no_writeback(tmp_path: Path):
     assert result["files"][0]["name_date"] == "2026-05-06"
     assert result["files"][0]["name_date_precision"] == "day"
 
-    # And the manifest on disk is unchanged.
-    raw = json.loads((tmp_path / "llmli_file_manifest.json").read_text())
+    # And the stored manifest entry is unchanged.
+    raw = _read_file_manifest(tmp_path)
     stored = raw["silos"]["j"]["files"][f"{silo_root}/2026-05-06.md"]
     assert "name_date" not in stored
 
@@ -10,6 +10,7 @@ def _mock_subprocess(monkeypatch, files_indexed_by_path=None, failures_by_path=N
     files_indexed_by_path = files_indexed_by_path or {}
     failures_by_path = failures_by_path or set()
     seen_cmds = seen_cmds if seen_cmds is not None else []
+    monkeypatch.setenv("LLMLIBRARIAN_PULL_ISOLATE", "1")
 
     def _lookup_files_indexed(path_arg: str) -> int:
         if path_arg in files_indexed_by_path:
@@ -112,10 +113,92 @@ def test_pull_all_passes_image_vision_and_worker_flags(monkeypatch):
     assert "4" in cmd
 
 
-def test_pull_command_requires_path_for_watch(capsys):
+def test_pull_all_in_process_opens_a_writer_per_silo_and_serializes_writes(monkeypatch, capsys):
+    import threading
+    import time
+    import orchestration.ingest as orch
+
+    monkeypatch.setattr(
+        "pal._read_registry",
+        lambda: {"bookmarks": [{"name": n, "path": f"/tmp/{n}"} for n in ("small", "new", "big", "stale")]},
+    )
+    monkeypatch.setattr(
+        "pal._read_llmli_registry",
+        lambda _db: {
+            "small": {"path": "/tmp/small", "files_indexed": 3, "updated": "2026-01-02T00:00:00+00:00"},
+            "big": {"path": "/tmp/big", "files_indexed": 900, "updated": "2026-01-02T00:00:00+00:00"},
+            "stale": {"path": "/tmp/stale", "files_indexed": 3, "updated": "2025-06-01T00:00:00+00:00"},
+        },
+    )
+    monkeypatch.setenv("LLMLIBRARIAN_PULL_CONCURRENCY", "3")
+    events: list[str] = []
+    lock = threading.Lock()
+    writing = {"now": 0, "max": 0}
+
+    def fake_run_ingest(request):
+        name = Path(request.path).name
+        assert request.compile_artifacts is False
+        # run_add opens (and closes) its own writer client, so the flock is free between silos.
+        assert request.get_chroma_client is None
+        request.pre_write_hook()
+        with lock:
+            writing["now"] += 1
+            writing["max"] = max(writing["max"], writing["now"])
+            events.append(f"write:{name}")
+        time.sleep(0.01)
+        with lock:
+            writing["now"] -= 1
+        return orch.IngestResult(files_indexed=2 if name == "big" else 0, failures=0, silo_slug=name)
+
+    monkeypatch.setattr(orch, "run_ingest", fake_run_ingest)
+    monkeypatch.setattr(orch, "compile_ingest_artifacts", lambda request, result: events.append(f"artifacts:{result.silo_slug}"))
+
+    rc = pal.pull_all_sources()
+
+    captured = capsys.readouterr()
+    assert rc == 0
+    assert "Updated: big (2 files)" in captured.out
+    assert writing["max"] == 1
+    last_write = max(i for i, e in enumerate(events) if e.startswith("write:"))
+    assert last_write < min(i for i, e in enumerate(events) if e.startswith("artifacts:"))
+    starts = [line.split("] ")[1].rstrip(" =") for line in captured.err.splitlines() if line.startswith("=== ")]
+    assert starts == ["new", "big", "stale", "small"]
+
+
+def test_pull_all_in_process_reports_failed_silo(monkeypatch, capsys):
+    import orchestration.ingest as orch
+
+    monkeypatch.setattr(
+        "pal._read_registry",
+        lambda: {"bookmarks": [{"name": "Stuff", "path": "/tmp/stuff"}, {"name": "Tax", "path": "/tmp/tax"}]},
+    )
+
+    def fake_run_ingest(request):
+        if Path(request.path).name == "tax":
+            raise NotADirectoryError(f"Not a directory or file: {request.path}")
+        return orch.IngestResult(files_indexed=1, failures=0, silo_slug="stuff")
+
+    monkeypatch.setattr(orch, "run_ingest", fake_run_ingest)
+    monkeypatch.setattr(orch, "compile_ingest_artifacts", lambda request, result: None)
+
+    rc = pal.pull_all_sources()
+
+    captured = capsys.readouterr()
+    assert rc == 1
+    assert "Updated: Stuff (1 files)" in captured.out
+    assert "Failed: Tax" in captured.err
+    assert "Tax FAILED (NotADirectoryError" in captured.err
+
+
+def test_pull_command_watch_without_path_runs_the_watch_hub(monkeypatch):
     from typer.testing import CliRunner
     runner = CliRunner()
-    res = runner.invoke(pal.app, ["pull", "--watch"])
+    seen: list[tuple[float, float]] = []
+    monkeypatch.setattr(pal, "_pull_watch_all_mode", lambda interval, debounce: seen.append((interval, debounce)) or 0)
+    res = runner.invoke(pal.app, ["pull", "--watch", "--interval", "60", "--debounce", "5"])
+    assert res.exit_code == 0
+    assert seen == [(60.0, 5.0)]
+    res = runner.invoke(pal.app, ["pull", "--watch", "--full"])
     assert res.exit_code == 2
 
 
@@ -86,6 +86,24 @@ def test_stop_process_same_user_stops_and_removes_lock(monkeypatch, tmp_path: Pa
     assert lock_path.exists() is False
 
 
+def test_stop_process_asks_hub_to_drop_one_silo_without_signaling(monkeypatch, tmp_path: Path):
+    lock_path = tmp_path / "watch_locks" / "demo.pid"
+    _write_lock(lock_path, {"pid": 321, "hub": True})
+    monkeypatch.setattr("pal._pid_is_running", lambda _pid: True)
+    monkeypatch.setattr("pal._current_uid", lambda: 501)
+    monkeypatch.setattr("pal.os.kill", lambda *_a: (_ for _ in ()).throw(AssertionError("hub signaled")))
+
+    def _hub_releases(_seconds):
+        if pal._watch_stop_request_path(lock_path).exists():
+            lock_path.unlink(missing_ok=True)
+
+    monkeypatch.setattr("pal.time.sleep", _hub_releases)
+    record = {"lock_path": str(lock_path), "pid": 321, "uid": 501, "silo": "demo", "hub": True}
+    out = pal._stop_watch_process(record, timeout=1.0)
+    assert out["status"] == "stopped"
+    assert lock_path.exists() is False
+
+
 def test_stop_process_rejects_uid_mismatch(monkeypatch, tmp_path: Path):
     lock_path = tmp_path / "watch_locks" / "demo.pid"
     _write_lock(lock_path, {"pid": 321})
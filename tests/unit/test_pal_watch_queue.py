@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -62,7 +63,7 @@ def test_reconcile_queues_missing_for_removal(monkeypatch, tmp_path: Path):
     watcher = _make_watcher(monkeypatch, root)
 
     watcher._collect_files = lambda *a, **k: []
-    watcher._read_manifest = lambda _db: {"silos": {"__self__": {"files": {str(root / "gone.py"): {"mtime": 1, "size": 1}}}}}
+    watcher._read_manifest = lambda _db, **_kw: {"silos": {"__self__": {"files": {str(root / "gone.py"): {"mtime": 1, "size": 1}}}}}
 
     updated, removed_count, skipped = watcher._reconcile_once()
     assert updated == 0
@@ -97,3 +98,210 @@ def test_watch_retries_error_with_backoff(monkeypatch, tmp_path: Path):
     assert queued["action"] == "update"
     assert int(queued["attempts"]) == 1
     assert any("failed via MCP" in line and "boom" in line for line in logged)
+
+
+def test_watch_drain_batches_due_paths_into_one_update_files_call(monkeypatch, tmp_path: Path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    first = root / "a.py"
+    second = root / "b.py"
+    first.write_text("a", encoding="utf-8")
+    second.write_text("b", encoding="utf-8")
+
+    watcher = _make_watcher(monkeypatch, root)
+    watcher._log = lambda message: None
+    calls: list[tuple] = []
+
+    def _fake_mcp(tool, **kwargs):
+        calls.append((tool, kwargs))
+        results = [{"path": p, "status": "updated"} for p in kwargs["paths"]]
+        results += [{"path": p, "status": "removed"} for p in kwargs["removed"]]
+        return {"status": "completed", "silo": kwargs["silo"], "results": results}
+
+    monkeypatch.setattr(pal, "_mcp_call_sync", _fake_mcp)
+
+    now = pal.time.time()
+    watcher.enqueue_update(str(first))
+    watcher.enqueue_update(str(second))
+    watcher._queue_action(str(root / "gone.py"), "delete")
+    assert watcher._drain_due(now=now + 2.0) == 3
+
+    assert [tool for tool, _kw in calls] == ["update_files"]
+    assert sorted(calls[0][1]["paths"]) == sorted([str(first.resolve()), str(second.resolve())])
+    assert calls[0][1]["removed"] == [str(root / "gone.py")]
+    assert watcher._queue == {}
+
+
+def test_watch_drain_falls_back_to_per_file_calls_when_batch_fails(monkeypatch, tmp_path: Path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    first = root / "a.py"
+    second = root / "b.py"
+    first.write_text("a", encoding="utf-8")
+    second.write_text("b", encoding="utf-8")
+
+    watcher = _make_watcher(monkeypatch, root)
+    watcher._log = lambda message: None
+    tools: list[str] = []
+
+    def _fake_mcp(tool, **kwargs):
+        tools.append(tool)
+        if tool == "update_files":
+            raise RuntimeError("Unknown tool: update_files")
+        return {"status": "updated", "path": kwargs["path"]}
+
+    monkeypatch.setattr(pal, "_mcp_call_sync", _fake_mcp)
+
+    now = pal.time.time()
+    watcher.enqueue_update(str(first))
+    watcher.enqueue_update(str(second))
+    assert watcher._drain_due(now=now + 2.0) == 2
+    assert tools == ["update_files", "update_file", "update_file"]
+
+
+def _age(*paths: Path) -> None:
+    old = 1_700_000_000
+    for p in paths:
+        pal.os.utime(p, (old, old))
+
+
+def test_incremental_reconcile_relists_only_changed_directories(monkeypatch, tmp_path: Path):
+    root = tmp_path / "repo"
+    (root / "docs").mkdir(parents=True)
+    (root / "src").mkdir()
+    (root / "docs" / "a.md").write_text("a", encoding="utf-8")
+    (root / "src" / "b.py").write_text("b", encoding="utf-8")
+    (root / "src" / "gone").mkdir()
+    (root / "src" / "gone" / "c.py").write_text("c", encoding="utf-8")
+    _age(root, root / "docs", root / "src", root / "src" / "gone")
+
+    watcher = _make_watcher(monkeypatch, root)
+    watcher._read_manifest = lambda _db, **_kw: {"silos": {}}
+    assert watcher._reconcile_once() == (3, 0, 0)
+    watcher._queue.clear()
+
+    # Unchanged directories: nothing queued, and an in-place edit is left to the observer.
+    (root / "docs" / "a.md").write_text("edited", encoding="utf-8")
+    _age(root / "docs")
+    watcher._read_manifest = lambda *_a, **_kw: (_ for _ in ()).throw(AssertionError("manifest read"))
+    assert watcher._reconcile_once() == (0, 0, 0)
+
+    (root / "src" / "new.py").write_text("n", encoding="utf-8")
+    (root / "src" / "gone" / "c.py").unlink()
+    (root / "src" / "gone").rmdir()
+    assert watcher._reconcile_once() == (1, 1, 0)
+    assert watcher._queue[str(root / "src" / "new.py")]["action"] == "update"
+    assert watcher._queue[str(root / "src" / "gone" / "c.py")]["action"] == "delete"
+
+
+def test_reconcile_snapshot_persists_across_watchers(monkeypatch, tmp_path: Path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / "a.py").write_text("a", encoding="utf-8")
+    _age(root)
+
+    watcher = _make_watcher(monkeypatch, root)
+    watcher._read_manifest = lambda _db, **_kw: {"silos": {}}
+    assert watcher._reconcile_once() == (1, 0, 0)
+
+    fresh = _make_watcher(monkeypatch, root)
+    fresh._read_manifest = lambda *_a, **_kw: (_ for _ in ()).throw(AssertionError("manifest read"))
+    assert fresh._reconcile_once() == (0, 0, 0)
+
+    monkeypatch.setenv("LLMLIBRARIAN_WATCH_FULL_RESCAN", "0")
+    fresh._read_manifest = lambda _db, **_kw: {"silos": {}}
+    assert fresh._reconcile_once() == (1, 0, 0)
+
+
+def test_watch_max_interval_never_below_base(monkeypatch):
+    monkeypatch.delenv("LLMLIBRARIAN_WATCH_MAX_INTERVAL", raising=False)
+    assert pal._watch_max_interval(10) == 600.0
+    monkeypatch.setenv("LLMLIBRARIAN_WATCH_MAX_INTERVAL", "5")
+    assert pal._watch_max_interval(10) == 10.0
+
+
+class _SharedObserver(_DummyObserver):
+    def __init__(self):
+        self.scheduled: list[str] = []
+
+    def schedule(self, _handler, path, recursive=False):
+        self.scheduled.append(path)
+        return path
+
+    def unschedule(self, watch):
+        self.scheduled.remove(watch)
+
+
+def test_watch_hub_shares_one_observer_and_drains_silos_round_robin(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(pal, "Observer", _DummyObserver)
+    monkeypatch.setattr(pal, "PAL_HOME", tmp_path / ".pal")
+    monkeypatch.setattr(pal, "WATCH_LOCKS_DIR", tmp_path / ".pal" / "watch_locks")
+    monkeypatch.setenv("LLMLIBRARIAN_WATCH_BATCH_MAX", "2")
+    jobs = []
+    for slug in ("alpha", "beta"):
+        (tmp_path / slug).mkdir()
+        jobs.append(SimpleNamespace(slug=slug, source_path=str(tmp_path / slug), enabled=True))
+    observer = _SharedObserver()
+    hub = pal.WatchHub(tmp_path / "db", interval=10, debounce=0, jobs_fn=lambda: list(jobs), observer=observer)
+    hub.sync_watchers()
+    assert hub.watched_slugs() == ["alpha", "beta"]
+    assert observer.scheduled == [str((tmp_path / "alpha").resolve()), str((tmp_path / "beta").resolve())]
+    assert len(list(pal.WATCH_LOCKS_DIR.glob("*.pid"))) == 2
+
+    calls: list[tuple[str, list[str]]] = []
+
+    def _fake_mcp(tool, **kwargs):
+        calls.append((kwargs["silo"], list(kwargs.get("paths") or [])))
+        return {"status": "completed", "results": [{"path": p, "status": "updated"} for p in kwargs.get("paths") or []]}
+
+    monkeypatch.setattr(pal, "_mcp_call_sync", _fake_mcp)
+    for name in ("a1", "a2", "a3", "a4", "a5"):
+        hub._watchers["alpha"]._queue_action(str(tmp_path / "alpha" / name), "update", delay=0.0)
+    hub._watchers["beta"]._queue_action(str(tmp_path / "beta" / "b1"), "update", delay=0.0)
+    hub._watchers["beta"]._queue_action(str(tmp_path / "beta" / "b2"), "update", delay=0.0)
+
+    assert hub.drain_once() == 4
+    assert [(silo, len(paths)) for silo, paths in calls] == [("alpha", 2), ("beta", 2)]
+    assert len(hub._watchers["alpha"]._queue) == 3
+
+    jobs.pop()
+    hub.sync_watchers()
+    assert hub.watched_slugs() == ["alpha"]
+    assert observer.scheduled == [str((tmp_path / "alpha").resolve())]
+    assert len(list(pal.WATCH_LOCKS_DIR.glob("*.pid"))) == 1
+
+
+def test_watch_hub_retries_held_silos_and_honors_per_silo_stop(monkeypatch, tmp_path: Path, capsys):
+    monkeypatch.setattr(pal, "Observer", _DummyObserver)
+    monkeypatch.setattr(pal, "PAL_HOME", tmp_path / ".pal")
+    monkeypatch.setattr(pal, "WATCH_LOCKS_DIR", tmp_path / ".pal" / "watch_locks")
+    jobs = []
+    for slug in ("alpha", "beta"):
+        (tmp_path / slug).mkdir()
+        jobs.append(SimpleNamespace(slug=slug, source_path=str(tmp_path / slug), enabled=True))
+    db = tmp_path / "db"
+    beta_lock = pal._watch_lock_path(db, "beta")
+    beta_lock.parent.mkdir(parents=True)
+    beta_lock.write_text(json.dumps({"pid": 999, "silo": "beta"}), encoding="utf-8")
+    foreground = {"running": True}
+    monkeypatch.setattr(pal, "_pid_is_running", lambda pid: pid != 999 or foreground["running"])
+    hub = pal.WatchHub(db, interval=10, debounce=0, jobs_fn=lambda: list(jobs), observer=_SharedObserver())
+
+    hub.sync_watchers()
+    hub.retry_blocked()
+    assert hub.watched_slugs() == ["alpha"]
+    assert capsys.readouterr().err.count("watcher already running for silo 'beta'") == 1
+
+    foreground["running"] = False  # `pal pull <path> --watch` exited
+    hub.retry_blocked()
+    assert hub.watched_slugs() == ["alpha", "beta"]
+
+    alpha_lock = pal._watch_lock_path(db, "alpha")
+    record = pal._build_watch_status_record(alpha_lock)
+    assert record["hub"] is True
+    pal._watch_stop_request_path(alpha_lock).touch()
+    hub.apply_stop_requests()
+    hub.sync_watchers()
+    assert hub.watched_slugs() == ["beta"]
+    assert not alpha_lock.exists()
+    assert not pal._watch_stop_request_path(alpha_lock).exists()
@@ -1,6 +1,7 @@
 import builtins
 import io
 import sys
+import threading
 import types
 from pathlib import Path
 
@@ -170,8 +171,8 @@ def test_pdf_processor_enriches_with_table_hints(monkeypatch):
     monkeypatch.setenv("LLMLIBRARIAN_PDF_TABLES", "1")
     monkeypatch.setattr(
         processors,
-        "_extract_pdf_tables_by_page",
-        lambda _data: [[[["", "9", "7,522."], ["", "11", "7,522."]]]],
+        "_extract_pdf_page_tables",
+        lambda _page: [[["", "9", "7,522."], ["", "11", "7,522."]]],
     )
 
     proc = PDFProcessor()
@@ -182,6 +183,33 @@ def test_pdf_processor_enriches_with_table_hints(monkeypatch):
     assert "Form 1040 sample" in text
 
 
+def test_pdf_processor_finds_ruled_tables_and_skips_unruled_pages(monkeypatch):
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 60), "Form W-2 summary")
+    for y in (100, 130, 160):
+        page.draw_line((72, y), (372, y))
+    for x in (72, 172, 272, 372):
+        page.draw_line((x, 100), (x, 160))
+    for row, cells in enumerate((("Wages", "1", "4,626.76"), ("Tax", "9", "7,522."))):
+        for col, text in enumerate(cells):
+            page.insert_text((77 + col * 100, 120 + row * 30), text)
+    doc.new_page().insert_text((72, 72), "Notes page without rules")
+    data = doc.tobytes()
+    doc.close()
+
+    monkeypatch.setenv("LLMLIBRARIAN_PDF_TABLES", "1")
+    with fitz.open(stream=data, filetype="pdf") as parsed:
+        assert processors._pdf_page_ruling_area(parsed[0]) is not None
+        assert processors._pdf_page_ruling_area(parsed[1]) is None
+    pages = PDFProcessor().extract(memoryview(data), "w2.pdf")
+
+    assert "line 9: 7,522." in pages[0].text
+    assert "| Tax | 9 | 7,522. |" in pages[0].text
+    assert "Extracted tables:" not in pages[1].text
+
+
 def test_pdf_processor_falls_back_when_table_extraction_raises(monkeypatch):
     fitz = pytest.importorskip("fitz")
     doc = fitz.open()
@@ -192,10 +220,10 @@ def test_pdf_processor_falls_back_when_table_extraction_raises(monkeypatch):
 
     monkeypatch.setenv("LLMLIBRARIAN_PDF_TABLES", "1")
 
-    def _boom(_data):
-        raise RuntimeError("pdfplumber boom")
+    def _boom(_page):
+        raise RuntimeError("table finder boom")
 
-    monkeypatch.setattr(processors, "_extract_pdf_tables_by_page", _boom)
+    monkeypatch.setattr(processors, "_extract_pdf_page_tables", _boom)
     proc = PDFProcessor()
     pages = proc.extract(data, "a.pdf")
     text = pages[0].text
@@ -213,10 +241,10 @@ def test_pdf_processor_skips_table_enrichment_when_disabled(monkeypatch):
 
     monkeypatch.setenv("LLMLIBRARIAN_PDF_TABLES", "0")
 
-    def _boom(_data):
+    def _boom(_page):
         raise AssertionError("table extractor should not be called when disabled")
 
-    monkeypatch.setattr(processors, "_extract_pdf_tables_by_page", _boom)
+    monkeypatch.setattr(processors, "_extract_pdf_page_tables", _boom)
     proc = PDFProcessor()
     pages = proc.extract(data, "a.pdf")
     text = pages[0].text
@@ -314,6 +342,72 @@ def test_pdf_processor_keeps_empty_text_when_no_ocr_backend(monkeypatch):
     assert warning.get("available_ocr_backends") == []
 
 
+def test_pdf_processor_ocrs_scanned_pages_in_parallel_in_page_order(monkeypatch):
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open()
+    for i in range(3):
+        page = doc.new_page()
+        page.draw_rect(fitz.Rect(20, 20 + 40 * i, 120, 50 + 40 * i), color=(0, 0, 0), fill=(0, 0, 0))
+    data = doc.tobytes()
+    doc.close()
+
+    barrier = threading.Barrier(3, timeout=5)
+    threads: set[str] = set()
+
+    def _fake_tesseract(image_path):
+        threads.add(threading.current_thread().name)
+        barrier.wait()
+        return f"Scanned page {Path(image_path).stat().st_size}"
+
+    monkeypatch.setenv("LLMLIBRARIAN_OCR_WORKERS", "3")
+    monkeypatch.setattr(processors, "_vision_ocr_available", lambda: False)
+    monkeypatch.setattr(processors, "_paddleocr_available", lambda: False)
+    monkeypatch.setattr(processors, "_tesseract_available", lambda: True)
+    monkeypatch.setattr(processors, "_ocr_with_tesseract_path", _fake_tesseract)
+
+    pages = PDFProcessor().extract(data, "scan.pdf")
+
+    assert [p.page_num for p in pages] == [1, 2, 3]
+    assert all("Scanned page" in p.text for p in pages)
+    assert len(threads) == 3
+    assert all(name.startswith("llmli-ocr") for name in threads)
+
+
+def test_ocr_workers_default_is_split_among_extraction_processes(monkeypatch):
+    monkeypatch.delenv("LLMLIBRARIAN_OCR_WORKERS", raising=False)
+    monkeypatch.setattr(processors.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(processors, "_OCR_PROCESS_SHARE", 1)
+    assert processors._ocr_workers() == 8
+
+    processors.set_ocr_process_share(4)
+    assert processors._ocr_workers() == 2
+    processors.set_ocr_process_share(16)
+    assert processors._ocr_workers() == 1
+    monkeypatch.setenv("LLMLIBRARIAN_OCR_WORKERS", "3")
+    assert processors._ocr_workers() == 3
+
+
+def test_pdf_processor_ocrs_identical_page_images_once(monkeypatch):
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open()
+    for _ in range(4):
+        doc.new_page()
+    data = doc.tobytes()
+    doc.close()
+
+    calls: list[str] = []
+    monkeypatch.setattr(processors, "_vision_ocr_available", lambda: False)
+    monkeypatch.setattr(processors, "_paddleocr_available", lambda: False)
+    monkeypatch.setattr(processors, "_tesseract_available", lambda: True)
+    monkeypatch.setattr(processors, "_ocr_with_tesseract_path", lambda img: calls.append(img) or "Gross Pay $4,626.76")
+
+    pages = PDFProcessor().extract(data, "scan.pdf")
+    again = PDFProcessor().extract(data, "copy.pdf")
+
+    assert len(calls) == 1
+    assert all(p.meta == {"ocr_backend": "tesseract", "ocr_mode": "pdf_scan_fallback"} for p in pages + again)
+
+
 @pytest.mark.parametrize(
     ("raw", "expected"),
     [
@@ -335,7 +429,7 @@ def test_ocr_preprocess_enabled_flag(monkeypatch, raw, expected):
 
 
 @pytest.mark.parametrize(("env_value", "expected_dpi"), [("0", 300), ("1", 400)])
-def test_ocr_pdf_page_text_uses_expected_dpi(monkeypatch, env_value, expected_dpi):
+def test_render_pdf_page_for_ocr_uses_expected_dpi(monkeypatch, env_value, expected_dpi):
     calls: list[int] = []
 
     class _FakePixmap:
@@ -352,13 +446,8 @@ def test_ocr_pdf_page_text_uses_expected_dpi(monkeypatch, env_value, expected_dp
             return _FakePixmap()
 
     monkeypatch.setenv("LLMLIBRARIAN_OCR_PREPROCESS", env_value)
-    monkeypatch.setattr(processors, "_available_ocr_backends", lambda: ["tesseract"])
-    monkeypatch.setattr(processors, "_paddleocr_available", lambda: False)
-    monkeypatch.setattr(processors, "_tesseract_available", lambda: False)
-    text, backend = processors._ocr_pdf_page_text(_FakePage(), "scan.pdf")
+    assert processors._render_pdf_page_for_ocr(_FakePage(), "scan.pdf") == b"png-bytes"
     assert calls == [expected_dpi]
-    assert text is None
-    assert backend is None
 
 
 def test_get_paddle_ocr_engine_uses_angle_mode_from_env(monkeypatch):
@@ -817,6 +906,40 @@ def test_ocr_image_path_detailed_drops_low_quality_fallback(monkeypatch):
     assert any(e.get("message") == "OCR text dropped by quality gate" for e in events)
 
 
+def test_ocr_image_bytes_hands_tesserocr_the_image_in_memory(monkeypatch):
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.new("L", (40, 20), color=255).save(buf, format="PNG")
+    calls: list[object] = []
+
+    class _FakeApi:
+        def SetPageSegMode(self, psm):
+            pass
+
+        def SetImage(self, image):
+            calls.append(image.size)
+
+        def SetImageFile(self, path):
+            raise AssertionError("in-memory OCR input must not be staged to a file")
+
+        def GetUTF8Text(self):
+            return "Gross Pay $4,626.76 for the period ending March 31"
+
+    monkeypatch.delenv("LLMLIBRARIAN_OCR_PREPROCESS", raising=False)
+    monkeypatch.setattr(processors, "_vision_ocr_available", lambda: False)
+    monkeypatch.setattr(processors, "_paddleocr_available", lambda: False)
+    monkeypatch.setattr(processors, "_tesseract_available", lambda: True)
+    monkeypatch.setattr(processors, "_tesserocr_available", lambda: True)
+    monkeypatch.setattr(processors, "_tesserocr_api", lambda: _FakeApi())
+    monkeypatch.setattr(processors.tempfile, "TemporaryDirectory", None)
+
+    out = processors._ocr_image_bytes_uncached(buf.getvalue(), "scan.png", "image_file", ".png")
+
+    assert out is not None and out.backend == "tesseract" and "Gross Pay" in out.text
+    assert calls == [(40, 20)]
+
+
 def test_merge_observation_rows_groups_adjacent_lines():
     regions = processors._merge_observation_rows(
         [
@@ -185,7 +185,10 @@ def mcp(monkeypatch, tmp_path):
     monkeypatch.setitem(
         sys.modules,
         "query.core",
-        SimpleNamespace(run_retrieve=lambda *, query, **kw: {"chunks": _chunks()}),
+        SimpleNamespace(
+            run_retrieve=lambda *, query, **kw: {"chunks": _chunks()},
+            run_retrieve_many=lambda *, queries, **kw: [{"chunks": _chunks()} for _ in queries],
+        ),
     )
     return mcp_server
 
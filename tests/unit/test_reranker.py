@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+import reranker
+
+
+class _Model:
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[list[str]], int]] = []
+
+    def predict(self, pairs: list[list[str]], batch_size: int = 32) -> list[float]:
+        self.calls.append((pairs, batch_size))
+        return [float(len(doc)) for _q, doc in pairs]
+
+
+@pytest.fixture
+def model(monkeypatch: Any) -> _Model:
+    fake = _Model()
+    reranker._reset_rerank_cache_for_tests()
+    monkeypatch.setattr(reranker, "_get_model", lambda *_args: fake)
+    monkeypatch.setenv("LLMLIBRARIAN_RERANK_DEVICE", "cpu")
+    yield fake
+    reranker._reset_rerank_cache_for_tests()
+
+
+def test_scores_are_cached_per_query_and_chunk_hash(model: _Model) -> None:
+    metas = [{"chunk_hash": "h1"}, {"chunk_hash": "h2"}]
+    first = reranker.score_candidates([("q", ["a", "bbb"], metas)])
+    again = reranker.score_candidates([("q", ["a", "bbb"], metas), ("other", ["cc"], [None])])
+    assert first == [[1.0, 3.0]]
+    assert again == [[1.0, 3.0], [2.0]]
+    assert [len(pairs) for pairs, _bs in model.calls] == [2, 1]
+    assert model.calls[0][1] == 16
+    info = reranker.rerank_cache_info()
+    assert info["hits"] == 2 and info["misses"] == 3
+
+
+def test_budget_skips_scoring_when_uncached_pairs_would_exceed_it(model: _Model) -> None:
+    reranker.score_candidates([("q", ["warm"], [None])])
+    reranker._score_stats["ms_per_pair"] = 50.0
+    assert reranker.score_candidates([("q", ["x"] * 10, [{"chunk_hash": str(i)} for i in range(10)])], budget_ms=100) is None
+    assert reranker.score_candidates([("q", ["warm"], [None])], budget_ms=100) == [[4.0]]
+    assert len(model.calls) == 1
+    assert reranker.rerank_cache_info()["budget_skips"] == 1
+
+
+def test_budget_skips_decay_the_estimate_until_a_call_remeasures(model: _Model) -> None:
+    reranker._score_stats["ms_per_pair"] = 50.0
+    batch = [("q", ["x"] * 10, [{"chunk_hash": str(i)} for i in range(10)])]
+    skips = 0
+    while reranker.score_candidates(batch, budget_ms=100) is None:
+        skips += 1
+        assert skips < 20
+    assert skips >= 1 and len(model.calls) == 1
+    assert reranker.rerank_cache_info()["ms_per_pair"] < 10.0
+
+
+def test_warm_reranker_seeds_the_estimate_from_a_warm_batch(model: _Model) -> None:
+    reranker.warm_reranker()
+    assert [len(pairs) for pairs, _bs in model.calls] == [1, 16]
+    assert reranker._score_stats["ms_per_pair"] > 0.0
+
+
+def test_rerank_orders_by_score_and_cuts_to_top_k(model: _Model) -> None:
+    docs, metas, dists = reranker.rerank("q", ["a", "ccc", "bb"], [None, None, None], [0.1, 0.2, 0.3], top_k=2)
+    assert docs == ["ccc", "bb"] and dists == [0.2, 0.3]
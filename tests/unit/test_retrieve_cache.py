@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import query.retrieve_locked as retrieve_locked
+from chroma_client import bump_generation
+from query.core import run_retrieve, run_retrieve_many
+from query.result_cache import invalidate_retrieve_cache, retrieve_cache_info
+
+
+def _install_fake_phase(monkeypatch: Any) -> list[str]:
+    calls: list[str] = []
+
+    def _phase(**kwargs: Any) -> dict[str, Any]:
+        calls.append(kwargs["query"])
+        return {"query": kwargs["query"], "chunks": [{"text": f"hit {len(calls)}", "source": "/n/a.md"}]}
+
+    def _phase_many(**kwargs: Any) -> list[dict[str, Any]]:
+        return [_phase(query=plan["query"]) for plan in kwargs["plans"]]
+
+    monkeypatch.setattr(retrieve_locked, "execute_retrieve_chroma_phase", _phase)
+    monkeypatch.setattr(retrieve_locked, "execute_retrieve_chroma_phase_many", _phase_many)
+    monkeypatch.setattr("query.core.is_reranker_enabled", lambda: False)
+    return calls
+
+
+def test_repeat_retrieve_is_served_from_cache_until_a_write(monkeypatch: Any, tmp_path: Path) -> None:
+    calls = _install_fake_phase(monkeypatch)
+    query = "what did I write about gardening"
+
+    first = run_retrieve(query, db_path=tmp_path)
+    first["chunks"].append({"text": "caller mutation"})
+    second = run_retrieve(f"  {query} ", db_path=tmp_path)
+    assert calls == [query]
+    assert second["chunks"] == [{"text": "hit 1", "source": "/n/a.md"}]
+
+    run_retrieve(query, db_path=tmp_path, n_results=5)
+    assert len(calls) == 2
+
+    (tmp_path / "llmli_file_manifest.sqlite3-wal").write_bytes(b"x")
+    assert run_retrieve(query, db_path=tmp_path)["chunks"][0]["text"] == "hit 3"
+
+    invalidate_retrieve_cache()
+    run_retrieve(query, db_path=tmp_path)
+    assert len(calls) == 4
+    info = retrieve_cache_info()
+    assert info["hits"] == 1 and info["misses"] == 4 and info["invalidations"] == 1
+
+
+def test_generation_bump_and_write_in_progress_bypass_cache(monkeypatch: Any, tmp_path: Path) -> None:
+    calls = _install_fake_phase(monkeypatch)
+    query = "notes on the kitchen remodel"
+    run_retrieve(query, db_path=tmp_path)
+    bump_generation(str(tmp_path))
+    run_retrieve(query, db_path=tmp_path)
+    assert len(calls) == 2
+
+    monkeypatch.setattr(
+        "query.core._sample_write_state",
+        lambda *_a: {"silos": ["notes"], "rebuilding": [], "results_may_be_incomplete": False, "started_at": None},
+    )
+    monkeypatch.setattr("ingest_journal.merge_write_states", lambda states: states[0])
+    other = "notes on the garden shed"
+    run_retrieve(other, db_path=tmp_path)
+    run_retrieve(other, db_path=tmp_path)
+    assert calls[-2:] == [other, other]
+
+
+def test_retrieve_many_reuses_cached_queries(monkeypatch: Any, tmp_path: Path) -> None:
+    calls = _install_fake_phase(monkeypatch)
+    run_retrieve("resume summary for the design role", db_path=tmp_path)
+    out = run_retrieve_many(
+        ["resume summary for the design role", "cover letter drafts for the design role"],
+        db_path=tmp_path,
+    )
+    assert calls == ["resume summary for the design role", "cover letter drafts for the design role"]
+    assert out[0]["chunks"][0]["text"] == "hit 1"
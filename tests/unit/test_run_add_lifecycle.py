@@ -1,18 +1,29 @@
+import hashlib
+import threading
 import json
 from pathlib import Path
 
 import pytest
 
-from ingest import CloudSyncPathError, _file_manifest_path, run_add
+from ingest import (
+    CloudSyncPathError,
+    _file_manifest_path,
+    _read_file_manifest,
+    _read_image_artifact,
+    _write_image_artifact,
+    run_add,
+    wait_for_image_summaries,
+)
 from processors import ImageExtractionError
 from image_embeddings import ImageEmbeddingError
-from state import get_silo_exclude_patterns, update_silo, resolve_silo_by_path
+from state import get_silo_exclude_patterns, list_silos, update_silo, resolve_silo_by_path
 
 
 class _FakeCollection:
     def __init__(self):
         self.delete_calls = []
         self.add_calls = []
+        self.update_calls = []
         self._metadatas = []
         self._added_ids = set()
 
@@ -25,6 +36,9 @@ class _FakeCollection:
         self._metadatas.extend(kwargs.get("metadatas") or [])
         self._added_ids.update(kwargs.get("ids") or [])
 
+    def update(self, **kwargs):
+        self.update_calls.append(kwargs)
+
     def delete(self, where):
         self.delete_calls.append(where)
 
@@ -32,7 +46,8 @@ class _FakeCollection:
         ids = kwargs.get("ids")
         if ids is not None:
             # Post-add write verification path: acknowledge ids we've seen added.
-            return {"ids": [i for i in ids if i in self._added_ids]}
+            found = [i for i in ids if i in self._added_ids]
+            return {"ids": found, "embeddings": [[0.0] for _i in found]}
         return {"metadatas": list(self._metadatas)}
 
 
@@ -390,6 +405,111 @@ def test_incremental_reindexes_when_content_changes_under_same_mtime_and_size(
     run_add(root, db_path=db_path, allow_cloud=True, incremental=True)
     assert called["process"] == 1, "content change with identical stat was skipped"
 
+
+def test_run_add_reports_changed_and_removed_sources(monkeypatch, tmp_path):
+    root = tmp_path / "docs"
+    root.mkdir()
+    f = root / "a.txt"
+    f.write_text("hello", encoding="utf-8")
+    stat = f.resolve().stat()
+    gone = str((root / "gone.txt").resolve())
+
+    db_path = tmp_path / "db"
+    _seed_silo_manifest(
+        db_path,
+        "silo-fixed",
+        root,
+        {
+            str(f.resolve()): {"mtime": stat.st_mtime, "size": stat.st_size, "hash": "OLD-HASH"},
+            gone: {"mtime": 1.0, "size": 1, "hash": "h-gone"},
+        },
+    )
+
+    coll = _FakeCollection()
+    _patch_runtime(monkeypatch, coll)
+    monkeypatch.setattr("state.resolve_silo_by_path", lambda _db, _path: None)
+    monkeypatch.setattr("state.slugify", lambda _name, _path=None: "silo-fixed")
+    monkeypatch.setattr("ingest.collect_files", lambda *a, **k: [(f, "code")])
+    monkeypatch.setattr("ingest.get_file_hash", lambda _p: "NEW-HASH")
+    monkeypatch.setattr("ingest.process_one_file", lambda *a, **k: [])
+    reported = []
+
+    run_add(root, db_path=db_path, allow_cloud=True, incremental=True, on_sources_changed=reported.append)
+    assert reported == [{str(f.resolve()), gone}]
+
+    run_add(root, db_path=db_path, allow_cloud=True, incremental=False, on_sources_changed=reported.append)
+    assert reported[-1] is None
+
+
+def test_run_add_incremental_skips_hashing_on_full_stat_signature(monkeypatch, tmp_path):
+    """A manifest entry carrying mtime_ns/ctime_ns/inode that all still match is
+    trusted without opening the file."""
+    from ingest import _manifest_stat_fields
+
+    root = tmp_path / "docs"
+    root.mkdir()
+    f = root / "a.txt"
+    f.write_text("hello", encoding="utf-8")
+    stat = f.resolve().stat()
+
+    db_path = tmp_path / "db"
+    _seed_silo_manifest(
+        db_path,
+        "silo-fixed",
+        root,
+        {str(f.resolve()): {**_manifest_stat_fields(stat), "hash": "h1"}},
+    )
+
+    coll = _FakeCollection()
+    _patch_runtime(monkeypatch, coll)
+    monkeypatch.setattr("state.resolve_silo_by_path", lambda _db, _path: None)
+    monkeypatch.setattr("state.slugify", lambda _name, _path=None: "silo-fixed")
+    monkeypatch.setattr("ingest.collect_files", lambda *a, **k: [(f, "code")])
+
+    def _no_hash(_p):
+        raise AssertionError("unchanged file was fingerprinted")
+
+    monkeypatch.setattr("ingest.get_file_hash", _no_hash)
+    monkeypatch.setattr(
+        "ingest.process_one_file",
+        lambda *a, **k: (_ for _ in ()).throw(AssertionError("unchanged file was re-extracted")),
+    )
+
+    run_add(root, db_path=db_path, allow_cloud=True, incremental=True)
+
+
+def test_run_add_incremental_upgrades_legacy_manifest_entry(monkeypatch, tmp_path):
+    """Entries written before the stat signature existed are confirmed by hash once,
+    then rewritten with mtime_ns/ctime_ns/inode so later runs skip on stat alone."""
+    root = tmp_path / "docs"
+    root.mkdir()
+    f = root / "a.txt"
+    f.write_text("hello", encoding="utf-8")
+    stat = f.resolve().stat()
+
+    db_path = tmp_path / "db"
+    _seed_silo_manifest(
+        db_path,
+        "silo-fixed",
+        root,
+        {str(f.resolve()): {"mtime": stat.st_mtime, "size": stat.st_size, "hash": "h1"}},
+    )
+
+    coll = _FakeCollection()
+    _patch_runtime(monkeypatch, coll)
+    monkeypatch.setattr("state.resolve_silo_by_path", lambda _db, _path: None)
+    monkeypatch.setattr("state.slugify", lambda _name, _path=None: "silo-fixed")
+    monkeypatch.setattr("ingest.collect_files", lambda *a, **k: [(f, "code")])
+    monkeypatch.setattr("ingest.get_file_hash", lambda _p: "h1")
+
+    run_add(root, db_path=db_path, allow_cloud=True, incremental=True)
+
+    manifest = _read_file_manifest(db_path)
+    entry = manifest["silos"]["silo-fixed"]["files"][str(f.resolve())]
+    assert entry["hash"] == "h1"
+    assert entry["ino"] == stat.st_ino
+    assert entry["mtime_ns"] == stat.st_mtime_ns
+
 def test_run_add_incremental_skips_unchanged_files(monkeypatch, tmp_path):
     root = tmp_path / "docs"
     root.mkdir()
@@ -438,6 +558,35 @@ def test_run_add_incremental_skips_unchanged_files(monkeypatch, tmp_path):
     assert called["process"] == 0
 
 
+
+def test_run_add_incremental_summary_reads_chunk_counters(monkeypatch, tmp_path):
+    from chunk_counts import open_chunk_counts
+
+    root = tmp_path / "docs"
+    root.mkdir()
+    f = root / "a.txt"
+    f.write_text("hello", encoding="utf-8")
+    db_path = tmp_path / "db"
+    db_path.mkdir()
+    counts = open_chunk_counts(db_path)
+    counts.rebuild_silo("silo-fixed", [{"silo": "silo-fixed", "source": str(f.resolve())}] * 3)
+
+    class _NoScanCollection(_FakeCollection):
+        def get(self, **kwargs):
+            if kwargs.get("ids") is None:
+                raise AssertionError(f"unexpected silo scan: {kwargs}")
+            return super().get(**kwargs)
+
+    _patch_runtime(monkeypatch, _NoScanCollection())
+    monkeypatch.setattr("state.resolve_silo_by_path", lambda _db, _path: None)
+    monkeypatch.setattr("state.slugify", lambda _name, _path=None: "silo-fixed")
+    monkeypatch.setattr("ingest.collect_files", lambda *a, **k: [])
+
+    run_add(root, db_path=db_path, allow_cloud=True, incremental=True)
+    (entry,) = [e for e in list_silos(db_path) if e.get("slug") == "silo-fixed"]
+    assert entry["chunks_count"] == 3
+
+
 def test_run_add_prints_effective_worker_settings(monkeypatch, tmp_path, capsys):
     root = tmp_path / "docs"
     root.mkdir()
@@ -533,3 +682,197 @@ def test_run_add_prints_image_preflight_and_progress(monkeypatch, tmp_path, caps
     assert "Image progress: 1/1" in captured.out
     assert "deferred summaries=1" in captured.out
     assert "image embeddings complete=1" in captured.out
+
+
+def test_run_add_stream_writes_batches_under_pending_marker(monkeypatch, tmp_path):
+    """Streaming writes as batches fill, so the journal marker must already be on
+    disk when the first add() lands — not only once extraction has finished."""
+    root = tmp_path / "docs"
+    root.mkdir()
+    files = []
+    for i in range(5):
+        f = root / f"n{i}.txt"
+        f.write_text(f"note {i}", encoding="utf-8")
+        files.append(f)
+    db_path = tmp_path / "db"
+    coll = _FakeCollection()
+    _patch_runtime(monkeypatch, coll)
+    monkeypatch.setattr("state.resolve_silo_by_path", lambda _db, _path: None)
+    monkeypatch.setattr("state.slugify", lambda _name, _path=None: "silo-fixed")
+    monkeypatch.setattr("ingest.collect_files", lambda *a, **k: [(f, "code") for f in files])
+    monkeypatch.setenv("LLMLIBRARIAN_ADD_BATCH_SIZE", "2")
+
+    import ingest_journal
+
+    markers_seen: list[list[str]] = []
+    real_add = coll.add
+
+    def _add(**kwargs):
+        markers_seen.append(ingest_journal.check_pending(str(db_path)))
+        real_add(**kwargs)
+
+    coll.add = _add
+    files_indexed, failures = run_add(root, db_path=db_path, allow_cloud=True, stream=True)
+
+    assert (files_indexed, failures) == (5, 0)
+    assert len(coll.add_calls) == 3  # 2 + 2 + trailing 1
+    assert all(seen == ["silo-fixed"] for seen in markers_seen)
+    assert ingest_journal.check_pending(str(db_path)) == []
+
+
+def test_run_add_stream_flushes_at_inflight_ceiling(monkeypatch, tmp_path):
+    root = tmp_path / "docs"
+    root.mkdir()
+    files = [root / "a.txt", root / "b.txt"]
+    for f in files:
+        f.write_text("x" * 10, encoding="utf-8")
+    coll = _FakeCollection()
+    _patch_runtime(monkeypatch, coll)
+    monkeypatch.setattr("ingest.collect_files", lambda *a, **k: [(f, "code") for f in files])
+    monkeypatch.setattr("ingest._ingest_max_inflight_bytes", lambda: 5)
+
+    run_add(root, db_path=tmp_path / "db", allow_cloud=True, stream=True)
+
+    # Each file's text alone passes the 5-byte ceiling, so nothing waits for a full batch.
+    assert [len(call["ids"]) for call in coll.add_calls] == [1, 1]
+
+
+def test_run_add_buffered_mode_writes_once_after_extraction(monkeypatch, tmp_path):
+    root = tmp_path / "docs"
+    root.mkdir()
+    files = [root / "a.txt", root / "b.txt", root / "c.txt"]
+    for f in files:
+        f.write_text("hello", encoding="utf-8")
+    coll = _FakeCollection()
+    _patch_runtime(monkeypatch, coll)
+    monkeypatch.setattr("ingest.collect_files", lambda *a, **k: [(f, "code") for f in files])
+    monkeypatch.delenv("LLMLIBRARIAN_INGEST_STREAM", raising=False)
+
+    run_add(root, db_path=tmp_path / "db", allow_cloud=True)
+
+    assert len(coll.add_calls) == 1
+    assert len(coll.add_calls[0]["ids"]) == 3
+
+
+def test_compact_chunks_round_trips_per_file_metadata():
+    from ingest import _compact_chunks, _expand_chunks
+
+    chunks = [
+        ("c0", "first", {"source": "/a.txt", "mtime": 1.0, "line_start": 1}),
+        ("c1", "second", {"source": "/a.txt", "mtime": 1.0, "line_start": 9, "section": "Intro"}),
+    ]
+    shared, rows = _compact_chunks(chunks)
+    assert shared == {"source": "/a.txt", "mtime": 1.0}
+    assert rows[1] == ("c1", "second", {"line_start": 9, "section": "Intro"})
+    assert _expand_chunks(shared, rows) == chunks
+    assert _compact_chunks([]) == ({}, [])
+
+
+def test_extract_executor_rejects_unknown_kind(monkeypatch):
+    from ingest import _resolve_extract_executor
+
+    monkeypatch.delenv("LLMLIBRARIAN_EXTRACT_EXECUTOR", raising=False)
+    assert _resolve_extract_executor(None) == "thread"
+    monkeypatch.setenv("LLMLIBRARIAN_EXTRACT_EXECUTOR", "process")
+    assert _resolve_extract_executor(None) == "process"
+    with pytest.raises(ValueError):
+        _resolve_extract_executor("fibers")
+
+
+def test_run_add_process_executor_extracts_in_worker_processes(monkeypatch, tmp_path):
+    root = tmp_path / "docs"
+    root.mkdir()
+    (root / "a.txt").write_text("alpha notes", encoding="utf-8")
+    (root / "b.md").write_text("# Beta\n\nbeta notes", encoding="utf-8")
+    coll = _FakeCollection()
+    _patch_runtime(monkeypatch, coll)
+
+    files_indexed, failures = run_add(
+        root, db_path=tmp_path / "db", allow_cloud=True, workers=2, extract_executor="process"
+    )
+
+    assert (files_indexed, failures) == (2, 0)
+    docs = [doc for call in coll.add_calls for doc in call["documents"]]
+    assert any("alpha notes" in doc for doc in docs)
+    metas = [meta for call in coll.add_calls for meta in call["metadatas"]]
+    assert {Path(m["source"]).name for m in metas} == {"a.txt", "b.md"}
+    assert all(m["file_id"] == Path(m["source"]).name for m in metas)
+
+
+def test_run_add_writes_placeholders_then_backfills_queued_summaries(monkeypatch, tmp_path):
+    root = tmp_path / "photos"
+    root.mkdir()
+    image = root / "badge.png"
+    image.write_bytes(b"badge-bytes")
+    key = hashlib.sha256(b"badge-bytes").hexdigest()
+    db = tmp_path / "db"
+    coll = _FakeCollection()
+    _patch_runtime(monkeypatch, coll)
+    monkeypatch.setattr("ingest.ensure_vision_model_ready", lambda: "llava:test")
+    monkeypatch.setattr("ingest.ensure_image_embedding_adapter_ready", lambda: object())
+    vector_rows = []
+
+    def _add_vectors(_coll, rows, **_k):
+        vector_rows.extend(rows)
+        coll._added_ids.update(row[0] for row in rows)
+
+    monkeypatch.setattr("ingest._batch_add_image_vectors", _add_vectors)
+    written = threading.Event()
+    real_add = coll.add
+
+    def _add(**kwargs):
+        real_add(**kwargs)
+        written.set()
+
+    coll.add = _add
+    returned = threading.Event()
+
+    def _summarize(*_a, **_k):
+        assert written.wait(5), "summary must not hold back the placeholder write"
+        assert returned.wait(5), "run_add must not wait for the summary"
+        return "A conference badge.", "llava:test"
+
+    monkeypatch.setattr("processors._summarize_image_with_vision_model", _summarize)
+    deferred_flags = []
+
+    def _fake_process(path, kind, file_hash, *args):
+        deferred_flags.append(args[-1])
+        resolved = path.resolve()
+        relpath = _write_image_artifact(
+            db, file_hash, {"visible_text": "MANDALAY BAY", "summary_status": "deferred", "regions": []}
+        )
+        meta = {
+            "source": str(resolved),
+            "mtime": resolved.stat().st_mtime,
+            "file_hash": file_hash,
+            "source_modality": "image",
+            "parent_image_id": "img-1",
+            "image_artifact_relpath": relpath,
+            "summary_status": "deferred",
+            "needs_vision_enrichment": True,
+            "vision_summary_key": key,
+        }
+        return [
+            ("s", "Image summary: placeholder", {**meta, "record_type": "image_summary"}),
+            ("r", "Image region: ocr_block\nMANDALAY BAY", {**meta, "record_type": "image_region", "region_role": "ocr_block"}),
+        ]
+
+    monkeypatch.setattr("ingest.process_one_file", _fake_process)
+
+    assert run_add(root, db_path=db, allow_cloud=True, image_vision_enabled=True) == (1, 0)
+    assert coll.update_calls == []
+    returned.set()
+    assert wait_for_image_summaries(timeout=5)
+
+    assert deferred_flags == [True]
+    added = coll.add_calls[0]
+    assert added["documents"][0] == "Image summary: placeholder"
+    assert all(m["summary_status"] == "deferred" and "vision_summary_key" not in m for m in added["metadatas"])
+    chunk_update, vector_update = coll.update_calls
+    assert chunk_update["ids"] == added["ids"]
+    assert chunk_update["documents"][0] == "Image summary: A conference badge.\nVisible text:\nMANDALAY BAY"
+    assert all(m["summary_status"] == "eager" for m in chunk_update["metadatas"])
+    assert vector_update["ids"] == [vector_rows[0][0]]
+    assert vector_update["metadatas"][0]["vision_model"] == "llava:test"
+    artifact = _read_image_artifact(db, added["metadatas"][0]["image_artifact_relpath"])
+    assert (artifact["summary"], artifact["summary_status"]) == ("A conference badge.", "eager")
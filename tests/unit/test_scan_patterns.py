@@ -24,6 +24,7 @@ from ingest.watch_scan import (
 
 _DB_ARTIFACTS = [
     "llmli_file_manifest.json",
+    "llmli_file_manifest.sqlite3",
     "llmli_file_registry.json",
     "llmli_query_health.json",
     "llmli_last_failures.json",
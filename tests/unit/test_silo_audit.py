@@ -94,3 +94,82 @@ def test_format_report_orphans_count_in_header(tmp_path):
     orphans = [{"slug": "x", "path": "/x"}]
     report = format_report([], [], [], [], orphans=orphans)
     assert "Orphans: 1" in report
+
+
+def _chroma_like_db(root: Path, rows: list[tuple[str, str]], *, hnsw: list[str], queued: list[str]) -> None:
+    import pickle
+    import sqlite3
+
+    root.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(root / "chroma.sqlite3")
+    con.executescript(
+        """
+        CREATE TABLE collections (id TEXT PRIMARY KEY, name TEXT);
+        CREATE TABLE segments (id TEXT PRIMARY KEY, type TEXT, scope TEXT, collection TEXT);
+        CREATE TABLE embeddings (id INTEGER PRIMARY KEY, segment_id TEXT, embedding_id TEXT);
+        CREATE TABLE embedding_metadata (id INTEGER, key TEXT, string_value TEXT, PRIMARY KEY (id, key));
+        CREATE TABLE embeddings_queue (seq_id INTEGER PRIMARY KEY, id TEXT);
+        INSERT INTO collections VALUES ('c1', 'llmli'), ('c2', 'other');
+        INSERT INTO segments VALUES ('s1', 'meta', 'METADATA', 'c1'), ('s2', 'meta', 'METADATA', 'c2');
+        INSERT INTO embeddings VALUES (99, 's2', 'foreign');
+        INSERT INTO embedding_metadata VALUES (99, 'silo', 'a');
+        """
+    )
+    for i, (silo, emb_id) in enumerate(rows, start=1):
+        con.execute("INSERT INTO embeddings VALUES (?, 's1', ?)", (i, emb_id))
+        con.execute("INSERT INTO embedding_metadata VALUES (?, 'silo', ?)", (i, silo))
+    con.executemany("INSERT INTO embeddings_queue (id) VALUES (?)", [(q,) for q in queued])
+    con.commit()
+    con.close()
+    seg = root / "seg-vector"
+    seg.mkdir(exist_ok=True)
+    (seg / "index_metadata.pickle").write_bytes(pickle.dumps({"id_to_label": {h: n for n, h in enumerate(hnsw)}}))
+
+
+def test_silo_consistency_reports_group_all_silos_from_one_snapshot(tmp_path, monkeypatch):
+    import silo_audit
+
+    db = tmp_path / "db"
+    _chroma_like_db(db, [("a", "a1"), ("a", "a2"), ("b", "b1"), ("b", "b2")], hnsw=["a1", "a2", "b1"], queued=[])
+    reports = silo_audit.silo_consistency_reports(db, ["a", "b", "empty"])
+    assert [(r["slug"], r["sqlite_ids"], r["missing_count"], r["consistent"]) for r in reports] == [
+        ("a", 2, 0, True),
+        ("b", 2, 1, False),
+        ("empty", 0, 0, True),
+    ]
+    assert reports[1]["missing_ids"] == ["b2"]
+
+    loads = []
+    monkeypatch.setattr(silo_audit, "_hnsw_id_set", lambda root: loads.append(root) or set())
+    assert silo_audit.silo_consistency_reports(db, ["b"])[0]["missing_count"] == 1
+    assert loads == []
+
+
+def test_hnsw_snapshot_refreshes_when_queue_or_segments_change(tmp_path):
+    import os
+    import sqlite3
+
+    import silo_audit
+
+    db = tmp_path / "db"
+    _chroma_like_db(db, [("b", "b1"), ("b", "b2")], hnsw=["b1"], queued=[])
+    assert silo_audit.silo_consistency_reports(db, ["b"])[0]["missing_count"] == 1
+
+    con = sqlite3.connect(db / "chroma.sqlite3")
+    con.execute("INSERT INTO embeddings_queue (id) VALUES ('b2')")
+    con.commit()
+    con.close()
+    os.utime(db / "chroma.sqlite3", ns=(1, 1))
+    report = silo_audit.silo_consistency_reports(db, ["b"])[0]
+    assert (report["queued"], report["missing_count"], report["consistent"]) == (1, 0, True)
+
+
+def test_silo_consistency_reports_none_without_chroma_tables(tmp_path):
+    import sqlite3
+
+    import silo_audit
+
+    db = tmp_path / "db"
+    db.mkdir()
+    sqlite3.connect(db / "chroma.sqlite3").close()
+    assert silo_audit.silo_consistency_reports(db, ["a"]) is None
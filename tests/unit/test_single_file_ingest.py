@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from ingest import update_single_file, remove_single_file, _file_manifest_path
+from ingest import update_files, update_single_file, remove_single_file, _read_file_manifest
 from state import get_silo_exclude_patterns, update_silo
 
 
@@ -42,10 +42,8 @@ def test_update_single_file_adds_and_manifest(monkeypatch, mock_collection, db_p
     assert status == "updated"
     assert str(target.resolve()) == path_str
 
-    manifest_path = _file_manifest_path(db_path)
-    assert manifest_path.exists()
-    data = manifest_path.read_text(encoding="utf-8")
-    assert str(target.resolve()) in data
+    data = _read_file_manifest(db_path)
+    assert str(target.resolve()) in data["silos"]["__self__"]["files"]
     assert any(name == "add" for name, _kwargs in mock_collection.calls)
 
 
@@ -70,7 +68,7 @@ def test_update_single_file_returns_error_without_deleting_existing_state(monkey
 
     status, _ = update_single_file(target, db_path=db_path, silo_slug="__self__", allow_cloud=True)
     assert status == "updated"
-    manifest_before = _file_manifest_path(db_path).read_text(encoding="utf-8")
+    manifest_before = _read_file_manifest(db_path)
     delete_count_before = len([c for c in mock_collection.calls if c[0] == "delete"])
 
     target.write_text("changed content", encoding="utf-8")
@@ -79,7 +77,7 @@ def test_update_single_file_returns_error_without_deleting_existing_state(monkey
     status, path_str = update_single_file(target, db_path=db_path, silo_slug="__self__", allow_cloud=True)
     assert status == "error"
     assert path_str == str(target.resolve())
-    assert _file_manifest_path(db_path).read_text(encoding="utf-8") == manifest_before
+    assert _read_file_manifest(db_path) == manifest_before
     delete_count_after = len([c for c in mock_collection.calls if c[0] == "delete"])
     assert delete_count_after == delete_count_before
 
@@ -237,3 +235,168 @@ def test_update_single_file_honors_persisted_excludes(monkeypatch, mock_collecti
     assert status == "removed"
     assert path_str == str(target.resolve())
     assert get_silo_exclude_patterns(db_path, slug) == ["skip.txt"]
+
+
+def test_update_files_commits_batch_in_one_writer_session(monkeypatch, mock_collection, db_path: Path, tmp_path: Path):
+    from contextlib import contextmanager
+
+    _patch_ingest_runtime(monkeypatch, mock_collection)
+    sessions: list[str] = []
+
+    @contextmanager
+    def _counting_writer_client(db_path):
+        sessions.append(db_path)
+        yield _DummyClient(mock_collection)
+
+    monkeypatch.setattr("ingest.writer_client", _counting_writer_client)
+    counts: list[str] = []
+    monkeypatch.setattr("ingest.update_silo_counts", lambda _db, slug, display_name=None: counts.append(slug))
+
+    stale = tmp_path / "stale.txt"
+    stale.write_text("old", encoding="utf-8")
+    assert update_single_file(stale, db_path=db_path, silo_slug="__self__", allow_cloud=True)[0] == "updated"
+    sessions.clear()
+    counts.clear()
+    mock_collection.calls.clear()
+
+    a = tmp_path / "a.txt"
+    b = tmp_path / "b.txt"
+    a.write_text("alpha", encoding="utf-8")
+    b.write_text("beta", encoding="utf-8")
+    stale.unlink()
+
+    results = update_files([a, b, stale], db_path=db_path, silo_slug="__self__", allow_cloud=True)
+
+    assert results == [
+        ("updated", str(a.resolve())),
+        ("updated", str(b.resolve())),
+        ("removed", str(stale.resolve())),
+    ]
+    assert len(sessions) == 1
+    assert counts == ["__self__"]
+    add_calls = [kw for name, kw in mock_collection.calls if name == "add"]
+    assert len(add_calls) == 1
+    sources = {m["source"] for m in add_calls[0]["metadatas"]}
+    assert sources == {str(a.resolve()), str(b.resolve())}
+    files = _read_file_manifest(db_path)["silos"]["__self__"]["files"]
+    assert set(files) == {str(a.resolve()), str(b.resolve())}
+
+
+def test_update_files_isolates_per_file_extraction_errors(monkeypatch, mock_collection, db_path: Path, tmp_path: Path):
+    import ingest
+
+    _patch_ingest_runtime(monkeypatch, mock_collection)
+    good = tmp_path / "good.txt"
+    bad = tmp_path / "bad.txt"
+    good.write_text("fine", encoding="utf-8")
+    bad.write_text("broken", encoding="utf-8")
+    real_process = ingest.process_one_file
+
+    def _process(path, *args, **kwargs):
+        if Path(path).name == "bad.txt":
+            raise RuntimeError("parser crashed")
+        return real_process(path, *args, **kwargs)
+
+    monkeypatch.setattr("ingest.process_one_file", _process)
+
+    results = update_files([good, bad], db_path=db_path, silo_slug="__self__", allow_cloud=True)
+
+    assert results == [("updated", str(good.resolve())), ("error", str(bad.resolve()))]
+    files = _read_file_manifest(db_path)["silos"]["__self__"]["files"]
+    assert set(files) == {str(good.resolve())}
+
+
+class _StoredCollection:
+    """Keeps rows by id and answers silo/source where-filters, for chunk-diff tests."""
+
+    def __init__(self):
+        self.rows: dict[str, dict] = {}
+        self.calls: list[tuple[str, dict]] = []
+
+    @staticmethod
+    def _matches(meta: dict, where: dict) -> bool:
+        clauses = where.get("$and") or [where]
+        return all(meta.get(k) == v for clause in clauses for k, v in clause.items())
+
+    def get(self, **kwargs):
+        self.calls.append(("get", kwargs))
+        if kwargs.get("ids") is not None:
+            ids = [i for i in kwargs["ids"] if i in self.rows]
+            return {"ids": ids, "metadatas": [dict(self.rows[i]) for i in ids]}
+        where = kwargs.get("where") or {}
+        return {"ids": [i for i, meta in self.rows.items() if self._matches(meta, where)]}
+
+    def add(self, **kwargs):
+        self.calls.append(("add", kwargs))
+        for cid, meta in zip(kwargs["ids"], kwargs["metadatas"]):
+            self.rows[cid] = dict(meta)
+
+    def update(self, **kwargs):
+        self.calls.append(("update", kwargs))
+        for cid, meta in zip(kwargs["ids"], kwargs["metadatas"]):
+            self.rows[cid].update(meta)
+            for key in [k for k, v in meta.items() if v is None]:
+                del self.rows[cid][key]
+
+    def delete(self, **kwargs):
+        self.calls.append(("delete", kwargs))
+        if kwargs.get("ids") is not None:
+            for cid in kwargs["ids"]:
+                self.rows.pop(cid, None)
+            return
+        where = kwargs.get("where") or {}
+        for cid in [i for i, meta in self.rows.items() if self._matches(meta, where)]:
+            del self.rows[cid]
+
+
+def test_update_single_file_diffs_chunks_and_embeds_only_new_ones(monkeypatch, db_path: Path, tmp_path: Path):
+    collection = _StoredCollection()
+    _patch_ingest_runtime(monkeypatch, collection)
+    monkeypatch.setenv("LLMLIBRARIAN_CHUNKING", "anchored")
+    monkeypatch.setenv("LLMLIBRARIAN_CHUNK_SIZE", "200")
+    monkeypatch.setenv("LLMLIBRARIAN_CHUNK_OVERLAP", "0")
+    target = tmp_path / "journal.md"
+    days = [f"## Day {i}\n" + "\n".join(f"day {i} line {j} about the project" for j in range(4)) for i in range(12)]
+    target.write_text("\n\n".join(days), encoding="utf-8")
+
+    assert update_single_file(target, db_path=db_path, silo_slug="__self__", allow_cloud=True)[0] == "updated"
+    first_ids = set(collection.rows)
+    assert len(first_ids) > 4
+    collection.calls.clear()
+
+    target.write_text("\n\n".join(days + ["## Day 12\nday 12 a brand new entry"]), encoding="utf-8")
+    assert update_single_file(target, db_path=db_path, silo_slug="__self__", allow_cloud=True)[0] == "updated"
+
+    added = [cid for name, kw in collection.calls if name == "add" for cid in kw["ids"]]
+    deleted = [cid for name, kw in collection.calls if name == "delete" for cid in (kw.get("ids") or [])]
+    assert not any(name == "delete" and "where" in kw for name, kw in collection.calls)
+    assert 1 <= len(added) <= 2
+    assert len(deleted) <= 1
+    assert len(first_ids & set(collection.rows)) >= len(first_ids) - 1
+    mtimes = {meta["mtime"] for meta in collection.rows.values()}
+    assert mtimes == {target.resolve().stat().st_mtime}
+
+
+def test_update_single_file_refresh_clears_dropped_keys_and_restamps_counts(monkeypatch, db_path: Path, tmp_path: Path):
+    import sqlite3
+
+    collection = _StoredCollection()
+    _patch_ingest_runtime(monkeypatch, collection)
+    monkeypatch.setenv("LLMLIBRARIAN_CHUNKING", "anchored")
+    monkeypatch.setenv("LLMLIBRARIAN_CHUNK_SIZE", "200")
+    monkeypatch.setenv("LLMLIBRARIAN_CHUNK_OVERLAP", "0")
+    target = tmp_path / "journal.md"
+    days = [f"## Day {i}\n" + "\n".join(f"day {i} line {j} about the project" for j in range(4)) for i in range(6)]
+    target.write_text("\n\n".join(days), encoding="utf-8")
+    update_single_file(target, db_path=db_path, silo_slug="__self__", allow_cloud=True)
+    for meta in collection.rows.values():
+        meta["stale_key"] = "left over"
+
+    target.write_text("\n\n".join(days[:-1]), encoding="utf-8")
+    assert update_single_file(target, db_path=db_path, silo_slug="__self__", allow_cloud=True)[0] == "updated"
+
+    assert collection.rows and all("stale_key" not in meta for meta in collection.rows.values())
+    new_hash = {meta["file_hash"] for meta in collection.rows.values()}
+    with sqlite3.connect(str(db_path / "llmli_chunk_counts.sqlite3")) as conn:
+        counted = {row[0] for row in conn.execute("SELECT file_hash FROM source_counts")}
+    assert counted == new_hash
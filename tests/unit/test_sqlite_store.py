@@ -0,0 +1,29 @@
+import pytest
+
+from sqlite_store import connect_store, write_txn
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v TEXT);"
+
+
+def test_connect_store_opens_wal_and_skips_missing_store_without_create(tmp_path):
+    path = tmp_path / "sub" / "store.sqlite3"
+    with connect_store(path, _SCHEMA, create=False) as conn:
+        assert conn is None
+    assert not path.exists()
+
+    with connect_store(path, _SCHEMA) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0] == 0
+
+
+def test_write_txn_commits_and_rolls_back(tmp_path):
+    path = tmp_path / "store.sqlite3"
+    with write_txn(path, _SCHEMA) as conn:
+        conn.execute("INSERT INTO kv VALUES ('a', '1')")
+    with pytest.raises(RuntimeError):
+        with write_txn(path, _SCHEMA) as conn:
+            conn.execute("INSERT INTO kv VALUES ('b', '2')")
+            raise RuntimeError("boom")
+
+    with connect_store(path, _SCHEMA, create=False) as conn:
+        assert conn.execute("SELECT k FROM kv").fetchall() == [("a",)]
@@ -1,6 +1,6 @@
 import json
 
-from ingest import _file_manifest_path
+from ingest import _file_manifest_path, _read_file_manifest
 from state import (
     append_last_failures,
     failures_path,
@@ -169,7 +169,7 @@ def test_remove_manifest_silo_removes_only_target_slug(tmp_path):
         encoding="utf-8",
     )
     remove_manifest_silo(db, "alpha-1")
-    data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    data = _read_file_manifest(db)
     assert "alpha-1" not in data["silos"]
     assert "beta-2" in data["silos"]
 
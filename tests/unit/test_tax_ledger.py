@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from tax.ledger import has_tax_ledger_rows, ledger_path, load_tax_ledger_rows, replace_tax_rows_for_sources
+
+
+def _row(record_id: str, source: str, *, silo: str = "tax", year: int = 2025, form: str = "W2", field: str = "w2_box_1_wages"):
+    return {
+        "record_id": record_id,
+        "silo": silo,
+        "source": source,
+        "page": 1,
+        "tax_year": year,
+        "form_type": form,
+        "field_code": field,
+        "entity_tokens": ["ymca"],
+        "normalized_decimal": "100.00",
+        "confidence": 0.9,
+    }
+
+
+def test_lookup_filters_by_silo_year_form_and_field(tmp_path: Path) -> None:
+    replace_tax_rows_for_sources(
+        tmp_path,
+        silo="tax",
+        sources=set(),
+        new_rows=[
+            _row("a", "/t/w2.pdf"),
+            _row("b", "/t/w2.pdf", field="w2_box_2_federal_income_tax_withheld"),
+            _row("c", "/t/1040.pdf", form="1040", field="f1040_line_11_agi"),
+            _row("d", "/t/old.pdf", year=2024),
+            _row("e", "/o/w2.pdf", silo="other"),
+        ],
+    )
+    assert [r["record_id"] for r in load_tax_ledger_rows(tmp_path, silo="tax", tax_year=2025)] == ["a", "b", "c"]
+    assert [r["record_id"] for r in load_tax_ledger_rows(tmp_path, tax_year=2025, field_codes=["w2_box_1_wages"])] == [
+        "a",
+        "e",
+    ]
+    assert [r["record_id"] for r in load_tax_ledger_rows(tmp_path, silo="tax", form_types={"1040"})] == ["c"]
+    assert load_tax_ledger_rows(tmp_path, silo="tax", field_codes=[]) == []
+    assert load_tax_ledger_rows(tmp_path, silo="tax", tax_year=2025)[0]["entity_tokens"] == ["ymca"]
+    assert has_tax_ledger_rows(tmp_path, silo="tax", tax_year=2024) is True
+    assert has_tax_ledger_rows(tmp_path, silo="tax", tax_year=2023) is False
+
+
+def test_replace_deletes_only_named_sources_and_zip_members(tmp_path: Path) -> None:
+    replace_tax_rows_for_sources(
+        tmp_path,
+        silo="tax",
+        sources=set(),
+        new_rows=[_row("keep", "/t/keep.pdf"), _row("old", "/t/w2.pdf"), _row("zip", "/t/pack.zip > w2.pdf")],
+    )
+    replace_tax_rows_for_sources(
+        tmp_path,
+        silo="tax",
+        sources={"/t/w2.pdf", "/t/pack.zip"},
+        new_rows=[_row("new", "/t/w2.pdf")],
+    )
+    assert [r["record_id"] for r in load_tax_ledger_rows(tmp_path, silo="tax")] == ["keep", "new"]
+
+    replace_tax_rows_for_sources(tmp_path, silo="tax", sources=set(), new_rows=[], replace_all_in_silo=True)
+    assert load_tax_ledger_rows(tmp_path, silo="tax") == []
+
+
+def test_reads_do_not_create_a_store(tmp_path: Path) -> None:
+    db = tmp_path / "missing-db"
+    assert load_tax_ledger_rows(db, silo="tax") == []
+    assert has_tax_ledger_rows(db) is False
+    assert not db.exists()
+
+
+def test_legacy_json_ledger_is_imported_once(tmp_path: Path) -> None:
+    legacy = tmp_path / "tax_ledger.json"
+    legacy.write_text(json.dumps({"rows": [_row("a", "/t/w2.pdf"), "junk"]}), encoding="utf-8")
+    assert [r["record_id"] for r in load_tax_ledger_rows(tmp_path, silo="tax")] == ["a"]
+    assert not legacy.exists()
+    assert ledger_path(tmp_path).exists()
@@ -29,7 +29,7 @@ def _base_row(**overrides):
 def test_tax_resolver_returns_single_employer_value(monkeypatch):
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: [_base_row()],
+        lambda db_path, silo=None, tax_year=None, **_kw: [_base_row()],
     )
     out = run_tax_resolver(
         query="how much did i make in 2025 at ymca",
@@ -52,7 +52,7 @@ def test_tax_resolver_abstains_on_conflicting_values(monkeypatch):
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="box 1 ymca 2025",
@@ -71,7 +71,7 @@ def test_tax_resolver_abstains_on_conflicting_values(monkeypatch):
 def test_tax_resolver_employer_not_found_is_no_match(monkeypatch):
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: [
+        lambda db_path, silo=None, tax_year=None, **_kw: [
             _base_row(
                 source="/Users/x/Tax/2025/acme-w2-2025.pdf",
                 entity_tokens=["acme"],
@@ -96,7 +96,7 @@ def test_tax_resolver_employer_not_found_is_no_match(monkeypatch):
 def test_tax_resolver_no_rows_returns_none_for_compat_on_non_tax_intent(monkeypatch):
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: [],
+        lambda db_path, silo=None, tax_year=None, **_kw: [],
     )
     out = run_tax_resolver(
         query="how much did i make in 2025",
@@ -113,7 +113,7 @@ def test_tax_resolver_no_rows_returns_none_for_compat_on_non_tax_intent(monkeypa
 def test_tax_resolver_no_rows_abstains_for_tax_query_intent(monkeypatch):
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: [],
+        lambda db_path, silo=None, tax_year=None, **_kw: [],
     )
     out = run_tax_resolver(
         query="box 2 deloitte 2025",
@@ -143,7 +143,7 @@ def test_tax_resolver_matches_employer_from_source_token_with_year_suffix(monkey
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="box 2 deloitte 2025",
@@ -219,7 +219,7 @@ def test_tax_resolver_total_income_ignores_w2_box_number_artifact_conflicts(monk
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="how much did i make in total in 2025",
@@ -273,7 +273,7 @@ def test_tax_resolver_box2_conflict_uses_box1_context(monkeypatch):
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="box 2 deloitte 2025",
@@ -304,7 +304,7 @@ def test_tax_resolver_sources_emit_osc_links_when_tty(monkeypatch):
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     monkeypatch.setattr("style.sys.stdout.isatty", lambda: True)
 
@@ -351,7 +351,7 @@ def test_tax_resolver_1040_line9_artifact_values_abstain_no_match(monkeypatch):
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="how much did i make in total in 2022",
@@ -394,7 +394,7 @@ def test_tax_resolver_conflict_message_includes_candidates(monkeypatch):
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="how much did i make in total in 2021",
@@ -428,7 +428,7 @@ def test_tax_resolver_ignores_w2_box1_year_artifact(monkeypatch):
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="how much did i make in total in 2022",
@@ -471,7 +471,7 @@ def test_tax_resolver_ignores_1040_header_artifact_1040(monkeypatch):
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="how much did i make in total in 2020",
@@ -516,7 +516,7 @@ def test_tax_resolver_interest_income_uses_1099_int_rows(monkeypatch):
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="how much interest did i earn in 2025",
@@ -535,7 +535,7 @@ def test_tax_resolver_interest_income_uses_1099_int_rows(monkeypatch):
 def test_tax_resolver_1099_threshold_does_not_require_year(monkeypatch):
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: [],
+        lambda db_path, silo=None, tax_year=None, **_kw: [],
     )
     out = run_tax_resolver(
         query="what is the minimum to file form 1099-div",
@@ -578,7 +578,7 @@ def test_tax_resolver_ignores_1099_form_number_artifact(monkeypatch):
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="what were my dividends in 2025",
@@ -632,7 +632,7 @@ def test_tax_resolver_interest_filters_year_and_large_id_artifacts(monkeypatch):
     ]
     monkeypatch.setattr(
         "query.tax_resolver.load_tax_ledger_rows",
-        lambda db_path, silo=None, tax_year=None: rows,
+        lambda db_path, silo=None, tax_year=None, **_kw: rows,
     )
     out = run_tax_resolver(
         query="how much interest did i earn in 2025",
@@ -646,3 +646,33 @@ def test_tax_resolver_interest_filters_year_and_large_id_artifacts(monkeypatch):
     assert out is not None
     assert out["guardrail_no_match"] is False
     assert "Interest income (2025): 16.12" in out["response"]
+
+
+def test_tax_resolver_reads_only_the_metric_field_codes(tmp_path):
+    from tax.ledger import replace_tax_rows_for_sources
+
+    replace_tax_rows_for_sources(tmp_path, silo="tax", sources=set(), new_rows=[_base_row()])
+    out = run_tax_resolver(
+        query="what was my agi in 2025",
+        intent="MONEY_YEAR_TOTAL",
+        db_path=str(tmp_path),
+        use_unified=True,
+        silo="tax",
+        source_label="Tax Professional",
+        no_color=True,
+    )
+    # The year has ledger rows (a W-2), just no AGI line: abstain instead of falling back to RAG.
+    assert out is not None
+    assert out["guardrail_no_match"] is True
+
+    out = run_tax_resolver(
+        query="how much did i make in 2025 at ymca",
+        intent="MONEY_YEAR_TOTAL",
+        db_path=str(tmp_path),
+        use_unified=True,
+        silo="tax",
+        source_label="Tax Professional",
+        no_color=True,
+    )
+    assert out is not None
+    assert "Total income at YMCA (2025)" in out["response"]